@@ -65,6 +65,10 @@ class DefaultConfig(BaseSettings):
         default_factory=list,
     )
 
+    # JSON library used for query engine traffic, `auto` uses orjson if it is installed and
+    # falls back to the standard library
+    json_codec: str = Field(env='PRISMA_JSON_CODEC', default='auto')
+
     # Where to download nodeenv to, defaults to ~/.cache/prisma-python/nodeenv
     nodeenv_cache_dir: Path = Field(
         env='PRISMA_NODEENV_CACHE_DIR',
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import re
+import codecs
+from typing import Any
+
+from ._codec import get_codec
+
+__all__ = ('ResultStreamDecoder',)
+
+# the start of a response to a query with a list result, e.g. `find_many`
+RESULT_PREFIX = re.compile(r'\s*\{\s*"data"\s*:\s*\{\s*"result"\s*:\s*\[')
+WHITESPACE = re.compile(r'\s*')
+
+# the characters that change the nesting of a record, inside and outside of strings
+STRUCTURE = re.compile(r'["{}\[\]]')
+STRING_SPECIAL = re.compile(r'["\\]')
+SCALAR_END = re.compile(r'[\s,\]}]')
+
+# prepended to the rest of the response after the result so that it can be parsed as a whole
+EMPTY_RESULT = '{"data":{"result":[]'
+
+# the states of the decoder
+PREFIX = 0
+FIRST_ITEM = 1
+ITEM = 2
+SEPARATOR = 3
+DONE = 4
+FALLBACK = 5
+
+
+class ResultStreamDecoder:
+    """Incrementally decodes the records of a `{"data": {"result": [...]}}` engine response
+
+    Records are decoded with the configured codec as soon as the chunk containing their
+    end has been fed, so only one record and the undecoded rest of the current chunk are
+    held in memory at a time. The end of a record is found by scanning its brackets and
+    strings, and a record split over chunks is collected until then, scanning each chunk
+    once, so a large record costs the same however many chunks it arrives in.
+
+    Responses with any other structure, e.g. errors, are buffered in full and returned
+    from `close()` so that they can be handled like any other response.
+    """
+
+    __slots__ = (
+        '_utf8',
+        '_buffer',
+        '_chunks',
+        '_state',
+        '_record',
+        '_depth',
+        '_in_string',
+        '_escaped',
+    )
+
+    def __init__(self) -> None:
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._chunks: list[str] = []
+        self._state = PREFIX
+        # the chunks of a record whose end has not been fed yet, and the scan state at its end
+        self._record: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Feed the next chunk of the response and return the records it completed"""
+        text = self._utf8.decode(chunk)
+        if self._state == FALLBACK:
+            self._chunks.append(text)
+            return []
+
+        if self._state == DONE:
+            self._buffer += text
+            return []
+
+        if self._record:
+            # only the new text is scanned for the end of the record
+            end = self._scan(text, 0)
+            if end is None:
+                self._record.append(text)
+                return []
+
+            self._record.append(text[:end])
+            record = _load_record(''.join(self._record))
+            self._record = []
+            self._state = SEPARATOR
+            self._buffer = text[end:]
+            return [record, *self._decode()]
+
+        self._buffer += text
+        return self._decode()
+
+    def close(self) -> str | None:
+        """Finish decoding, returns the full response if it does not have a streamable structure"""
+        text = self._utf8.decode(b'', final=True)
+        if self._state == FALLBACK:
+            self._chunks.append(text)
+            return ''.join(self._chunks)
+
+        self._buffer += text
+        if self._state == PREFIX:
+            # the response is too short to have a list result
+            return self._buffer
+
+        if self._state != DONE:
+            raise ValueError('Query engine response ended before the result was complete')
+
+        # the rest of the response may contain whitespace and other keys, e.g. `extensions`
+        try:
+            rest = get_codec().loads(EMPTY_RESULT + self._buffer)
+        except ValueError:
+            raise ValueError(f'Unexpected data after the query engine result: {self._buffer!r}') from None
+
+        if rest.get('errors'):
+            raise ValueError(f'Query engine returned errors after the result: {rest["errors"]!r}')
+
+        return None
+
+    def _decode(self) -> list[Any]:
+        buffer = self._buffer
+        pos = 0
+        records: list[Any] = []
+
+        if self._state == PREFIX:
+            match = RESULT_PREFIX.match(buffer)
+            if match is None:
+                if not _could_be_prefix(buffer):
+                    self._state = FALLBACK
+                    self._chunks.append(buffer)
+                    self._buffer = ''
+                return records
+
+            pos = match.end()
+            self._state = FIRST_ITEM
+
+        size = len(buffer)
+        while True:
+            pos = WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+            if pos >= size:
+                break
+
+            if self._state == SEPARATOR:
+                char = buffer[pos]
+                if char == ',':
+                    self._state = ITEM
+                    pos += 1
+                    continue
+                if char == ']':
+                    self._state = DONE
+                    pos += 1
+                    break
+                raise ValueError(f'Unexpected character in query engine result: {char!r}')
+
+            if self._state == FIRST_ITEM and buffer[pos] == ']':
+                # the result is empty
+                self._state = DONE
+                pos += 1
+                break
+
+            if buffer[pos] in '{["':
+                end = self._scan(buffer, pos)
+                if end is None:
+                    # the record continues in the next chunk, which is scanned on its own
+                    self._record.append(buffer[pos:])
+                    pos = size
+                    break
+            else:
+                # numbers and literals end at the next delimiter, which a cut off one lacks
+                match = SCALAR_END.search(buffer, pos)
+                if match is None:
+                    break
+                end = match.start()
+
+            records.append(_load_record(buffer[pos:end]))
+            pos = end
+            self._state = SEPARATOR
+
+        self._buffer = buffer[pos:]
+        return records
+
+    def _scan(self, text: str, pos: int) -> int | None:
+        """Return the end of the record that is being scanned, or None if `text` does not contain it
+
+        The nesting at the end of `text` is kept so that the next chunk can be scanned from
+        where this one ended.
+        """
+        size = len(text)
+        depth = self._depth
+        in_string = self._in_string
+        if self._escaped:
+            if pos >= size:
+                return None
+            # the character escaped at the end of the previous chunk
+            pos += 1
+            self._escaped = False
+
+        while True:
+            if in_string:
+                match = STRING_SPECIAL.search(text, pos)
+                if match is None:
+                    break
+                if match.group() == '\\':
+                    if match.end() >= size:
+                        self._escaped = True
+                        break
+                    pos = match.end() + 1
+                    continue
+                in_string = False
+                pos = match.end()
+            else:
+                match = STRUCTURE.search(text, pos)
+                if match is None:
+                    break
+                char = match.group()
+                pos = match.end()
+                if char == '"':
+                    in_string = True
+                    continue
+                depth += 1 if char in '{[' else -1
+
+            if depth <= 0:
+                self._depth = 0
+                self._in_string = False
+                return pos
+
+        self._depth = depth
+        self._in_string = in_string
+        return None
+
+
+def _load_record(text: str) -> Any:
+    try:
+        return get_codec().loads(text)
+    except ValueError as exc:
+        raise ValueError(f'Could not decode a record in the query engine result: {exc}') from None
+
+
+def _could_be_prefix(buffer: str) -> bool:
+    """Whether more data could complete the buffer into the start of a list result"""
+    compact = re.sub(r'\s+', '', buffer)
+    return '{"data":{"result":['.startswith(compact)
@@ -2,6 +2,7 @@ from ._query import (
     SyncQueryEngine as SyncQueryEngine,
     AsyncQueryEngine as AsyncQueryEngine,
 )
+from ._pool import AsyncQueryEnginePool as AsyncQueryEnginePool
 from .errors import *
 from .._types import TransactionId as TransactionId
 from ._abstract import (
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import json
 import logging
-from typing import Any, NoReturn
+from typing import Any, NoReturn, Iterator, AsyncIterator
 from datetime import timedelta
 from typing_extensions import override
 
@@ -10,6 +9,8 @@ import httpx
 
 from . import utils, errors
 from ..utils import is_dict
+from .._codec import get_codec
+from .._streaming import ResultStreamDecoder
 from .._types import Method
 from ._abstract import SyncAbstractEngine, AsyncAbstractEngine
 from .._sync_http import SyncHTTP
@@ -77,7 +78,7 @@ class BaseHTTPEngine:
     ) -> Any:
         if isinstance(data, str):
             # workaround for https://github.com/prisma/prisma-engines/pull/4246
-            data = json.loads(data)
+            data = get_codec().loads(data)
 
         if not is_dict(data):
             raise TypeError(f'Expected deserialised engine response to be a dictionary, got {type(data)} - {data}')
@@ -88,6 +89,21 @@ class BaseHTTPEngine:
 
         return data
 
+    def _process_streamed_response(
+        self,
+        *,
+        decoder: ResultStreamDecoder,
+        response: AbstractResponse[httpx.Response],
+    ) -> list[Any]:
+        """Finish a streamed response, returning the records of responses that could not be streamed"""
+        body = decoder.close()
+        if body is None:
+            return []
+
+        log.debug('Response could not be streamed: %s', body)
+        data = self._process_response_data(data=get_codec().loads(body), response=response)
+        return data['data']['result']  # type: ignore[no-any-return]
+
     def _process_response_error(
         self,
         *,
@@ -167,6 +183,36 @@ class SyncHTTPEngine(BaseHTTPEngine, SyncAbstractEngine):
 
         self._process_response_error(body=response.text(), response=response)
 
+    def stream_request(
+        self,
+        method: Method,
+        path: str,
+        *,
+        content: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> Iterator[Any]:
+        """Send a request for a list result and yield its records as they are received"""
+        url, kwargs = self._build_request(
+            path=path,
+            method=method,
+            content=content,
+            headers=headers,
+            parse_response=True,
+        )
+
+        with self.session.stream(method, url, **kwargs) as response:
+            log.debug('%s %s returned status %s', method, url, response.status)
+
+            if not 300 > response.status >= 200:
+                response.read()
+                self._process_response_error(body=response.text(), response=response)
+
+            decoder = ResultStreamDecoder()
+            for chunk in response.iter_bytes():
+                yield from decoder.feed(chunk)
+
+            yield from self._process_streamed_response(decoder=decoder, response=response)
+
 
 class AsyncHTTPEngine(BaseHTTPEngine, AsyncAbstractEngine):
     session: AsyncHTTP
@@ -233,3 +279,35 @@ class AsyncHTTPEngine(BaseHTTPEngine, AsyncAbstractEngine):
             return self._process_response_data(data=data, response=response)
 
         self._process_response_error(body=await response.text(), response=response)
+
+    async def stream_request(
+        self,
+        method: Method,
+        path: str,
+        *,
+        content: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> AsyncIterator[Any]:
+        """Send a request for a list result and yield its records as they are received"""
+        url, kwargs = self._build_request(
+            path=path,
+            method=method,
+            content=content,
+            headers=headers,
+            parse_response=True,
+        )
+
+        async with self.session.stream(method, url, **kwargs) as response:
+            log.debug('%s %s returned status %s', method, url, response.status)
+
+            if not 300 > response.status >= 200:
+                await response.read()
+                self._process_response_error(body=await response.text(), response=response)
+
+            decoder = ResultStreamDecoder()
+            async for chunk in response.aiter_bytes():
+                for record in decoder.feed(chunk):
+                    yield record
+
+            for record in self._process_streamed_response(decoder=decoder, response=response):
+                yield record
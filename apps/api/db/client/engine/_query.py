@@ -5,11 +5,13 @@ import sys
 import json
 import time
 import atexit
+import shutil
 import signal
 import asyncio
 import logging
+import tempfile
 import subprocess
-from typing import TYPE_CHECKING, Any, overload
+from typing import TYPE_CHECKING, Any, Iterator, AsyncIterator, overload
 from pathlib import Path
 from datetime import timedelta
 from typing_extensions import Literal, override
@@ -45,12 +47,20 @@ class BaseQueryEngine:
         *,
         dml_path: Path,
         log_queries: bool = False,
+        unix_socket: bool = False,
     ) -> None:
         self.dml_path = dml_path
         self._log_queries = log_queries
         self.process = None
         self.file = None
 
+        if unix_socket and platform.name() == 'windows':
+            log.warning('Unix domain sockets are not supported on Windows, the query engine will use TCP')
+            unix_socket = False
+
+        self._unix_socket = unix_socket
+        self._socket_dir: str | None = None
+
     def _ensure_file(self) -> Path:
         # circular import
         from ..client import BINARY_PATHS  # noqa: TID251
@@ -63,10 +73,21 @@ class BaseQueryEngine:
         file: Path,
         datasources: list[DatasourceOverride] | None,
     ) -> tuple[str, subprocess.Popen[bytes] | subprocess.Popen[str]]:
-        port = utils.get_open_port()
-        log.debug('Running query engine on port %i', port)
+        if self._unix_socket:
+            self._socket_dir = tempfile.mkdtemp(prefix='prisma-')
+            socket_path = os.path.join(self._socket_dir, 'query-engine.sock')
+            log.debug('Running query engine on socket %s', socket_path)
+
+            # the host is only used for the Host header
+            self.url = 'http://localhost'
+            self._use_socket(socket_path)
+            address = ['--unix-path', socket_path]
+        else:
+            port = utils.get_open_port()
+            log.debug('Running query engine on port %i', port)
 
-        self.url = f'http://localhost:{port}'
+            self.url = f'http://localhost:{port}'
+            address = ['-p', str(port)]
 
         env = os.environ.copy()
         env.update(
@@ -89,8 +110,7 @@ class BaseQueryEngine:
 
         args: list[str] = [
             str(file.absolute()),
-            '-p',
-            str(port),
+            *address,
             '--enable-metrics',
             '--enable-raw-queries',
         ]
@@ -116,8 +136,20 @@ class BaseQueryEngine:
 
         return self.url, self.process
 
+    def _use_socket(self, path: str) -> None:
+        """Send requests to the query engine over the given Unix domain socket"""
+        # the HTTP session is provided by the HTTP engine this is mixed into and is only
+        # opened by the first request, which is made after the process has been spawned
+        self.session.session_kwargs['uds'] = path  # type: ignore[attr-defined]
+
+    def _remove_socket(self) -> None:
+        if self._socket_dir is not None:
+            shutil.rmtree(self._socket_dir, ignore_errors=True)
+            self._socket_dir = None
+
     def _kill_process(self, timeout: timedelta | None) -> None:
         if self.process is None:
+            self._remove_socket()
             return
 
         if timeout is not None:
@@ -136,6 +168,7 @@ class BaseQueryEngine:
                 self.process.send_signal(signal.SIGKILL)
 
         self.process = None
+        self._remove_socket()
 
 
 class SyncQueryEngine(BaseQueryEngine, SyncHTTPEngine):
@@ -150,8 +183,14 @@ class SyncQueryEngine(BaseQueryEngine, SyncHTTPEngine):
     ) -> None:
         # this is a little weird but it's needed to distinguish between
         # the different required arguments for our two base classes
-        BaseQueryEngine.__init__(self, dml_path=dml_path, log_queries=log_queries)
-        SyncHTTPEngine.__init__(self, url=None, **(http_config or {}))
+        config = dict(http_config or {})
+        BaseQueryEngine.__init__(
+            self,
+            dml_path=dml_path,
+            log_queries=log_queries,
+            unix_socket=config.pop('unix_socket', False),
+        )
+        SyncHTTPEngine.__init__(self, url=None, **config)
 
         # ensure the query engine process is terminated when we are
         atexit.register(self.stop)
@@ -246,6 +285,24 @@ class SyncQueryEngine(BaseQueryEngine, SyncHTTPEngine):
             headers=headers,
         )
 
+    @override
+    def query_stream(
+        self,
+        content: str,
+        *,
+        tx_id: TransactionId | None,
+    ) -> Iterator[Any]:
+        headers: dict[str, str] = {}
+        if tx_id is not None:
+            headers['X-transaction-id'] = tx_id
+
+        return self.stream_request(
+            'POST',
+            '/',
+            content=content,
+            headers=headers,
+        )
+
     @override
     def start_transaction(self, *, content: str) -> TransactionId:
         result = self.request(
@@ -311,8 +368,14 @@ class AsyncQueryEngine(BaseQueryEngine, AsyncHTTPEngine):
     ) -> None:
         # this is a little weird but it's needed to distinguish between
         # the different required arguments for our two base classes
-        BaseQueryEngine.__init__(self, dml_path=dml_path, log_queries=log_queries)
-        AsyncHTTPEngine.__init__(self, url=None, **(http_config or {}))
+        config = dict(http_config or {})
+        BaseQueryEngine.__init__(
+            self,
+            dml_path=dml_path,
+            log_queries=log_queries,
+            unix_socket=config.pop('unix_socket', False),
+        )
+        AsyncHTTPEngine.__init__(self, url=None, **config)
 
         # ensure the query engine process is terminated when we are
         atexit.register(self.stop)
@@ -406,6 +469,24 @@ class AsyncQueryEngine(BaseQueryEngine, AsyncHTTPEngine):
             headers=headers,
         )
 
+    @override
+    def query_stream(
+        self,
+        content: str,
+        *,
+        tx_id: TransactionId | None,
+    ) -> AsyncIterator[Any]:
+        headers: dict[str, str] = {}
+        if tx_id is not None:
+            headers['X-transaction-id'] = tx_id
+
+        return self.stream_request(
+            'POST',
+            '/',
+            content=content,
+            headers=headers,
+        )
+
     @override
     async def start_transaction(self, *, content: str) -> TransactionId:
         result = await self.request(
@@ -785,6 +785,13 @@ class Model(BaseModel):
                 return field
         return None
 
+    @property
+    def cursor_fields(self) -> Iterator['Field']:
+        """Required scalar fields that uniquely identify a record on their own"""
+        for field in self.scalar_fields:
+            if (field.is_id or field.is_unique) and field.is_required:
+                yield field
+
     @property
     def has_relational_fields(self) -> bool:
         try:
@@ -11,6 +11,7 @@ PRISMA_MODELS: set[str] = {
     'UserRole',
     'User',
     'UserSession',
+    'PasswordResetToken',
     'Candidate',
     'Job',
     'JobCandidate',
@@ -40,10 +41,14 @@ RELATIONAL_FIELD_MAPPINGS: dict[str, dict[str, str]] = {
         'tenant': 'Tenant',
         'projects': 'Project',
         'sessions': 'UserSession',
+        'resetTokens': 'PasswordResetToken',
     },
     'UserSession': {
         'user': 'User',
     },
+    'PasswordResetToken': {
+        'user': 'User',
+    },
     'Candidate': {
         'jobCandidates': 'JobCandidate',
         'tenant': 'Tenant',
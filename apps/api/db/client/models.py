@@ -450,6 +450,7 @@ class User(bases.BaseUser):
     tenant: Optional['models.Tenant'] = None
     projects: Optional[List['models.Project']] = None
     sessions: Optional[List['models.UserSession']] = None
+    resetTokens: Optional[List['models.PasswordResetToken']] = None
     createdAt: datetime.datetime
     updatedAt: datetime.datetime
     deleted: _bool
@@ -571,6 +572,7 @@ class UserSession(bases.BaseUserSession):
     userId: _str
     user: Optional['models.User'] = None
     token: _str
+    tokenId: Optional[_str] = None
     expiresAt: datetime.datetime
     ipAddress: Optional[_str] = None
     userAgent: Optional[_str] = None
@@ -688,6 +690,126 @@ class UserSession(bases.BaseUserSession):
         _created_partial_types.add(name)
 
 
+class PasswordResetToken(bases.BasePasswordResetToken):
+    """Represents a PasswordResetToken record"""
+
+    id: _str
+    userId: _str
+    user: Optional['models.User'] = None
+    tokenHash: _str
+    expiresAt: datetime.datetime
+    usedAt: Optional[datetime.datetime] = None
+    createdAt: datetime.datetime
+
+
+
+    @staticmethod
+    def create_partial(
+        name: str,
+        include: Optional[Iterable['types.PasswordResetTokenKeys']] = None,
+        exclude: Optional[Iterable['types.PasswordResetTokenKeys']] = None,
+        required: Optional[Iterable['types.PasswordResetTokenKeys']] = None,
+        optional: Optional[Iterable['types.PasswordResetTokenKeys']] = None,
+        relations: Optional[Mapping['types.PasswordResetTokenRelationalFieldKeys', str]] = None,
+        exclude_relational_fields: bool = False,
+    ) -> None:
+        if not os.environ.get('PRISMA_GENERATOR_INVOCATION'):
+            raise RuntimeError(
+                'Attempted to create a partial type outside of client generation.'
+            )
+
+        if name in _created_partial_types:
+            raise ValueError(f'Partial type "{name}" has already been created.')
+
+        if include is not None:
+            if exclude is not None:
+                raise TypeError('Exclude and include are mutually exclusive.')
+            if exclude_relational_fields is True:
+                raise TypeError('Include and exclude_relational_fields=True are mutually exclusive.')
+
+        if required and optional:
+            shared = set(required) & set(optional)
+            if shared:
+                raise ValueError(f'Cannot make the same field(s) required and optional {shared}')
+
+        if exclude_relational_fields and relations:
+            raise ValueError(
+                'exclude_relational_fields and relations are mutually exclusive'
+            )
+
+        fields: Dict['types.PasswordResetTokenKeys', PartialModelField] = OrderedDict()
+
+        try:
+            if include:
+                for field in include:
+                    fields[field] = _PasswordResetToken_fields[field].copy()
+            elif exclude:
+                for field in exclude:
+                    if field not in _PasswordResetToken_fields:
+                        raise KeyError(field)
+
+                fields = {
+                    key: data.copy()
+                    for key, data in _PasswordResetToken_fields.items()
+                    if key not in exclude
+                }
+            else:
+                fields = {
+                    key: data.copy()
+                    for key, data in _PasswordResetToken_fields.items()
+                }
+
+            if required:
+                for field in required:
+                    fields[field]['optional'] = False
+
+            if optional:
+                for field in optional:
+                    fields[field]['optional'] = True
+
+            if exclude_relational_fields:
+                fields = {
+                    key: data
+                    for key, data in fields.items()
+                    if key not in _PasswordResetToken_relational_fields
+                }
+
+            if relations:
+                for field, type_ in relations.items():
+                    if field not in _PasswordResetToken_relational_fields:
+                        raise errors.UnknownRelationalFieldError('PasswordResetToken', field)
+
+                    # TODO: this method of validating types is not ideal
+                    # as it means we cannot two create partial types that
+                    # reference each other
+                    if type_ not in _created_partial_types:
+                        raise ValueError(
+                            f'Unknown partial type: "{type_}". '
+                            f'Did you remember to generate the {type_} type before this one?'
+                        )
+
+                    # TODO: support non prisma.partials models
+                    info = fields[field]
+                    if info['is_list']:
+                        info['type'] = f'List[\'partials.{type_}\']'
+                    else:
+                        info['type'] = f'\'partials.{type_}\''
+        except KeyError as exc:
+            raise ValueError(
+                f'{exc.args[0]} is not a valid PasswordResetToken / {name} field.'
+            ) from None
+
+        models = partial_models_ctx.get()
+        models.append(
+            {
+                'name': name,
+                'fields': cast(Mapping[str, PartialModelField], fields),
+                'from_model': 'PasswordResetToken',
+            }
+        )
+        _created_partial_types.add(name)
+
+
 class Candidate(bases.BaseCandidate):
     """Represents a Candidate record"""
 
@@ -1979,6 +2101,7 @@ _User_relational_fields: Set[str] = {
         'tenant',
         'projects',
         'sessions',
+        'resetTokens',
     }
 _User_fields: Dict['types.UserKeys', PartialModelField] = OrderedDict(
     [
@@ -2086,6 +2209,14 @@ _User_fields: Dict['types.UserKeys', PartialModelField] = OrderedDict(
             'is_relational': True,
             'documentation': None,
         }),
+        ('resetTokens', {
+            'name': 'resetTokens',
+            'is_list': True,
+            'optional': True,
+            'type': 'List[\'models.PasswordResetToken\']',
+            'is_relational': True,
+            'documentation': None,
+        }),
         ('createdAt', {
             'name': 'createdAt',
             'is_list': False,
@@ -2158,6 +2289,14 @@ _UserSession_fields: Dict['types.UserSessionKeys', PartialModelField] = OrderedD
             'is_relational': False,
             'documentation': None,
         }),
+        ('tokenId', {
+            'name': 'tokenId',
+            'is_list': False,
+            'optional': True,
+            'type': '_str',
+            'is_relational': False,
+            'documentation': None,
+        }),
         ('expiresAt', {
             'name': 'expiresAt',
             'is_list': False,
@@ -2217,6 +2356,70 @@ _UserSession_fields: Dict['types.UserSessionKeys', PartialModelField] = OrderedD
     ],
 )
 
+_PasswordResetToken_relational_fields: Set[str] = {
+        'user',
+    }
+_PasswordResetToken_fields: Dict['types.PasswordResetTokenKeys', PartialModelField] = OrderedDict(
+    [
+        ('id', {
+            'name': 'id',
+            'is_list': False,
+            'optional': False,
+            'type': '_str',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('userId', {
+            'name': 'userId',
+            'is_list': False,
+            'optional': False,
+            'type': '_str',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('user', {
+            'name': 'user',
+            'is_list': False,
+            'optional': True,
+            'type': 'models.User',
+            'is_relational': True,
+            'documentation': None,
+        }),
+        ('tokenHash', {
+            'name': 'tokenHash',
+            'is_list': False,
+            'optional': False,
+            'type': '_str',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('expiresAt', {
+            'name': 'expiresAt',
+            'is_list': False,
+            'optional': False,
+            'type': 'datetime.datetime',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('usedAt', {
+            'name': 'usedAt',
+            'is_list': False,
+            'optional': True,
+            'type': 'datetime.datetime',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('createdAt', {
+            'name': 'createdAt',
+            'is_list': False,
+            'optional': False,
+            'type': 'datetime.datetime',
+            'is_relational': False,
+            'documentation': None,
+        }),
+    ],
+)
+
 _Candidate_relational_fields: Set[str] = {
         'jobCandidates',
         'tenant',
@@ -3205,6 +3408,7 @@ model_rebuild(Tenant)
 model_rebuild(UserRole)
 model_rebuild(User)
 model_rebuild(UserSession)
+model_rebuild(PasswordResetToken)
 model_rebuild(Candidate)
 model_rebuild(Job)
 model_rebuild(JobCandidate)
@@ -1346,6 +1346,7 @@ class UserIncludeFromLicense(TypedDict, total=False):
     tenant: Union[bool, 'TenantArgsFromLicense']
     projects: Union[bool, 'FindManyProjectArgsFromLicense']
     sessions: Union[bool, 'FindManyUserSessionArgsFromLicense']
+    resetTokens: Union[bool, 'FindManyPasswordResetTokenArgsFromLicense']
 
 
 class UserArgsFromLicense(TypedDict, total=False):
@@ -1385,6 +1386,27 @@ class FindManyUserSessionArgsFromLicense(TypedDict, total=False):
     include: 'UserSessionIncludeFromUserSession'
 
 
+class PasswordResetTokenIncludeFromLicense(TypedDict, total=False):
+    """Relational arguments for License"""
+    user: Union[bool, 'UserArgsFromLicense']
+
+
+class PasswordResetTokenArgsFromLicense(TypedDict, total=False):
+    """Arguments for License"""
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
+class FindManyPasswordResetTokenArgsFromLicense(TypedDict, total=False):
+    """Arguments for License"""
+    take: int
+    skip: int
+    order_by: Union['PasswordResetTokenOrderByInput', List['PasswordResetTokenOrderByInput']]
+    where: 'PasswordResetTokenWhereInput'
+    cursor: 'PasswordResetTokenWhereUniqueInput'
+    distinct: List['PasswordResetTokenScalarFieldKeys']
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
 class CandidateIncludeFromLicense(TypedDict, total=False):
     """Relational arguments for License"""
     jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromLicense']
@@ -2155,6 +2177,7 @@ class UserIncludeFromTenant(TypedDict, total=False):
     tenant: Union[bool, 'TenantArgsFromTenant']
     projects: Union[bool, 'FindManyProjectArgsFromTenant']
     sessions: Union[bool, 'FindManyUserSessionArgsFromTenant']
+    resetTokens: Union[bool, 'FindManyPasswordResetTokenArgsFromTenant']
 
 
 class UserArgsFromTenant(TypedDict, total=False):
@@ -2194,6 +2217,27 @@ class FindManyUserSessionArgsFromTenant(TypedDict, total=False):
     include: 'UserSessionIncludeFromUserSession'
 
 
+class PasswordResetTokenIncludeFromTenant(TypedDict, total=False):
+    """Relational arguments for Tenant"""
+    user: Union[bool, 'UserArgsFromTenant']
+
+
+class PasswordResetTokenArgsFromTenant(TypedDict, total=False):
+    """Arguments for Tenant"""
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
+class FindManyPasswordResetTokenArgsFromTenant(TypedDict, total=False):
+    """Arguments for Tenant"""
+    take: int
+    skip: int
+    order_by: Union['PasswordResetTokenOrderByInput', List['PasswordResetTokenOrderByInput']]
+    where: 'PasswordResetTokenWhereInput'
+    cursor: 'PasswordResetTokenWhereUniqueInput'
+    distinct: List['PasswordResetTokenScalarFieldKeys']
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
 class CandidateIncludeFromTenant(TypedDict, total=False):
     """Relational arguments for Tenant"""
     jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromTenant']
@@ -2948,6 +2992,7 @@ class UserIncludeFromUserRole(TypedDict, total=False):
     tenant: Union[bool, 'TenantArgsFromUserRole']
     projects: Union[bool, 'FindManyProjectArgsFromUserRole']
     sessions: Union[bool, 'FindManyUserSessionArgsFromUserRole']
+    resetTokens: Union[bool, 'FindManyPasswordResetTokenArgsFromUserRole']
 
 
 class UserArgsFromUserRole(TypedDict, total=False):
@@ -2987,6 +3032,27 @@ class FindManyUserSessionArgsFromUserRole(TypedDict, total=False):
     include: 'UserSessionIncludeFromUserSession'
 
 
+class PasswordResetTokenIncludeFromUserRole(TypedDict, total=False):
+    """Relational arguments for UserRole"""
+    user: Union[bool, 'UserArgsFromUserRole']
+
+
+class PasswordResetTokenArgsFromUserRole(TypedDict, total=False):
+    """Arguments for UserRole"""
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
+class FindManyPasswordResetTokenArgsFromUserRole(TypedDict, total=False):
+    """Arguments for UserRole"""
+    take: int
+    skip: int
+    order_by: Union['PasswordResetTokenOrderByInput', List['PasswordResetTokenOrderByInput']]
+    where: 'PasswordResetTokenWhereInput'
+    cursor: 'PasswordResetTokenWhereUniqueInput'
+    distinct: List['PasswordResetTokenScalarFieldKeys']
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
 class CandidateIncludeFromUserRole(TypedDict, total=False):
     """Relational arguments for UserRole"""
     jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromUserRole']
@@ -3336,6 +3402,7 @@ class UserOptionalCreateInput(TypedDict, total=False):
     tenant: 'TenantCreateNestedWithoutRelationsInput'
     projects: 'ProjectCreateManyNestedWithoutRelationsInput'
     sessions: 'UserSessionCreateManyNestedWithoutRelationsInput'
+    resetTokens: 'PasswordResetTokenCreateManyNestedWithoutRelationsInput'
     createdAt: datetime.datetime
     updatedAt: datetime.datetime
     deleted: _bool
@@ -3420,6 +3487,7 @@ class UserUpdateInput(TypedDict, total=False):
     tenant: 'TenantUpdateOneWithoutRelationsInput'
     projects: 'ProjectUpdateManyWithoutRelationsInput'
     sessions: 'UserSessionUpdateManyWithoutRelationsInput'
+    resetTokens: 'PasswordResetTokenUpdateManyWithoutRelationsInput'
     createdAt: datetime.datetime
     updatedAt: datetime.datetime
     deleted: _bool
@@ -3641,6 +3709,7 @@ class UserInclude(TypedDict, total=False):
     tenant: Union[bool, 'TenantArgsFromUser']
     projects: Union[bool, 'FindManyProjectArgsFromUser']
     sessions: Union[bool, 'FindManyUserSessionArgsFromUser']
+    resetTokens: Union[bool, 'FindManyPasswordResetTokenArgsFromUser']
 
 
 class LicenseIncludeFromUser(TypedDict, total=False):
@@ -3717,6 +3786,7 @@ class UserIncludeFromUser(TypedDict, total=False):
     tenant: Union[bool, 'TenantArgsFromUser']
     projects: Union[bool, 'FindManyProjectArgsFromUser']
     sessions: Union[bool, 'FindManyUserSessionArgsFromUser']
+    resetTokens: Union[bool, 'FindManyPasswordResetTokenArgsFromUser']
 
 
 class UserArgsFromUser(TypedDict, total=False):
@@ -3756,6 +3826,27 @@ class FindManyUserSessionArgsFromUser(TypedDict, total=False):
     include: 'UserSessionIncludeFromUserSession'
 
 
+class PasswordResetTokenIncludeFromUser(TypedDict, total=False):
+    """Relational arguments for User"""
+    user: Union[bool, 'UserArgsFromUser']
+
+
+class PasswordResetTokenArgsFromUser(TypedDict, total=False):
+    """Arguments for User"""
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
+class FindManyPasswordResetTokenArgsFromUser(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['PasswordResetTokenOrderByInput', List['PasswordResetTokenOrderByInput']]
+    where: 'PasswordResetTokenWhereInput'
+    cursor: 'PasswordResetTokenWhereUniqueInput'
+    distinct: List['PasswordResetTokenScalarFieldKeys']
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
 class CandidateIncludeFromUser(TypedDict, total=False):
     """Relational arguments for User"""
     jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromUser']
@@ -3932,6 +4023,7 @@ class UserWhereInput(TypedDict, total=False):
     tenant: 'TenantRelationFilter'
     projects: 'ProjectListRelationFilter'
     sessions: 'UserSessionListRelationFilter'
+    resetTokens: 'PasswordResetTokenListRelationFilter'
     createdAt: Union[datetime.datetime, 'types.DateTimeFilter']
     updatedAt: Union[datetime.datetime, 'types.DateTimeFilter']
     deleted: Union[_bool, 'types.BooleanFilter']
@@ -4119,6 +4211,7 @@ UserKeys = Literal[
     'tenant',
     'projects',
     'sessions',
+    'resetTokens',
     'createdAt',
     'updatedAt',
     'deleted',
@@ -4146,6 +4239,7 @@ UserRelationalFieldKeys = Literal[
         'tenant',
         'projects',
         'sessions',
+        'resetTokens',
     ]
 
 # UserSession types
@@ -4155,6 +4249,7 @@ class UserSessionOptionalCreateInput(TypedDict, total=False):
     id: _str
     userId: _str
     user: 'UserCreateNestedWithoutRelationsInput'
+    tokenId: Optional[_str]
     ipAddress: Optional[_str]
     userAgent: Optional[_str]
     createdAt: datetime.datetime
@@ -4176,6 +4271,7 @@ class UserSessionOptionalCreateWithoutRelationsInput(TypedDict, total=False):
     """Optional arguments to the UserSession create method, without relations"""
     id: _str
     userId: _str
+    tokenId: Optional[_str]
     ipAddress: Optional[_str]
     userAgent: Optional[_str]
     createdAt: datetime.datetime
@@ -4220,9 +4316,18 @@ _UserSessionWhereUnique_token_Input = TypedDict(
     total=True
 )
 
+_UserSessionWhereUnique_tokenId_Input = TypedDict(
+    '_UserSessionWhereUnique_tokenId_Input',
+    {
+        'tokenId': '_str',
+    },
+    total=True
+)
+
 UserSessionWhereUniqueInput = Union[
     '_UserSessionWhereUnique_id_Input',
     '_UserSessionWhereUnique_token_Input',
+    '_UserSessionWhereUnique_tokenId_Input',
 ]
 
 
@@ -4231,6 +4336,7 @@ class UserSessionUpdateInput(TypedDict, total=False):
     id: _str
     user: 'UserUpdateOneWithoutRelationsInput'
     token: _str
+    tokenId: Optional[_str]
     expiresAt: datetime.datetime
     ipAddress: Optional[_str]
     userAgent: Optional[_str]
@@ -4244,6 +4350,7 @@ class UserSessionUpdateManyMutationInput(TypedDict, total=False):
     """Arguments for updating many records"""
     id: _str
     token: _str
+    tokenId: Optional[_str]
     expiresAt: datetime.datetime
     ipAddress: Optional[_str]
     userAgent: Optional[_str]
@@ -4309,6 +4416,14 @@ _UserSession_token_OrderByInput = TypedDict(
     total=True
 )
 
+_UserSession_tokenId_OrderByInput = TypedDict(
+    '_UserSession_tokenId_OrderByInput',
+    {
+        'tokenId': 'SortOrder',
+    },
+    total=True
+)
+
 _UserSession_expiresAt_OrderByInput = TypedDict(
     '_UserSession_expiresAt_OrderByInput',
     {
@@ -4387,6 +4502,7 @@ UserSessionOrderByInput = Union[
     '_UserSession_id_OrderByInput',
     '_UserSession_userId_OrderByInput',
     '_UserSession_token_OrderByInput',
+    '_UserSession_tokenId_OrderByInput',
     '_UserSession_expiresAt_OrderByInput',
     '_UserSession_ipAddress_OrderByInput',
     '_UserSession_userAgent_OrderByInput',
@@ -4499,6 +4615,7 @@ class UserIncludeFromUserSession(TypedDict, total=False):
     tenant: Union[bool, 'TenantArgsFromUserSession']
     projects: Union[bool, 'FindManyProjectArgsFromUserSession']
     sessions: Union[bool, 'FindManyUserSessionArgsFromUserSession']
+    resetTokens: Union[bool, 'FindManyPasswordResetTokenArgsFromUserSession']
 
 
 class UserArgsFromUserSession(TypedDict, total=False):
@@ -4527,8 +4644,731 @@ class UserSessionArgsFromUserSession(TypedDict, total=False):
     include: 'UserSessionIncludeFromUserSession'
 
 
-class FindManyUserSessionArgsFromUserSession(TypedDict, total=False):
-    """Arguments for UserSession"""
+class FindManyUserSessionArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    take: int
+    skip: int
+    order_by: Union['UserSessionOrderByInput', List['UserSessionOrderByInput']]
+    where: 'UserSessionWhereInput'
+    cursor: 'UserSessionWhereUniqueInput'
+    distinct: List['UserSessionScalarFieldKeys']
+    include: 'UserSessionIncludeFromUserSession'
+
+
+class PasswordResetTokenIncludeFromUserSession(TypedDict, total=False):
+    """Relational arguments for UserSession"""
+    user: Union[bool, 'UserArgsFromUserSession']
+
+
+class PasswordResetTokenArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
+class FindManyPasswordResetTokenArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    take: int
+    skip: int
+    order_by: Union['PasswordResetTokenOrderByInput', List['PasswordResetTokenOrderByInput']]
+    where: 'PasswordResetTokenWhereInput'
+    cursor: 'PasswordResetTokenWhereUniqueInput'
+    distinct: List['PasswordResetTokenScalarFieldKeys']
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
+class CandidateIncludeFromUserSession(TypedDict, total=False):
+    """Relational arguments for UserSession"""
+    jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromUserSession']
+    tenant: Union[bool, 'TenantArgsFromUserSession']
+
+
+class CandidateArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    include: 'CandidateIncludeFromCandidate'
+
+
+class FindManyCandidateArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    take: int
+    skip: int
+    order_by: Union['CandidateOrderByInput', List['CandidateOrderByInput']]
+    where: 'CandidateWhereInput'
+    cursor: 'CandidateWhereUniqueInput'
+    distinct: List['CandidateScalarFieldKeys']
+    include: 'CandidateIncludeFromCandidate'
+
+
+class JobIncludeFromUserSession(TypedDict, total=False):
+    """Relational arguments for UserSession"""
+    tenant: Union[bool, 'TenantArgsFromUserSession']
+    jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromUserSession']
+
+
+class JobArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    include: 'JobIncludeFromJob'
+
+
+class FindManyJobArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    take: int
+    skip: int
+    order_by: Union['JobOrderByInput', List['JobOrderByInput']]
+    where: 'JobWhereInput'
+    cursor: 'JobWhereUniqueInput'
+    distinct: List['JobScalarFieldKeys']
+    include: 'JobIncludeFromJob'
+
+
+class JobCandidateIncludeFromUserSession(TypedDict, total=False):
+    """Relational arguments for UserSession"""
+    job: Union[bool, 'JobArgsFromUserSession']
+    candidate: Union[bool, 'CandidateArgsFromUserSession']
+
+
+class JobCandidateArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    include: 'JobCandidateIncludeFromJobCandidate'
+
+
+class FindManyJobCandidateArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    take: int
+    skip: int
+    order_by: Union['JobCandidateOrderByInput', List['JobCandidateOrderByInput']]
+    where: 'JobCandidateWhereInput'
+    cursor: 'JobCandidateWhereUniqueInput'
+    distinct: List['JobCandidateScalarFieldKeys']
+    include: 'JobCandidateIncludeFromJobCandidate'
+
+
+class ProjectIncludeFromUserSession(TypedDict, total=False):
+    """Relational arguments for UserSession"""
+    tenant: Union[bool, 'TenantArgsFromUserSession']
+    user: Union[bool, 'UserArgsFromUserSession']
+
+
+class ProjectArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    include: 'ProjectIncludeFromProject'
+
+
+class FindManyProjectArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    take: int
+    skip: int
+    order_by: Union['ProjectOrderByInput', List['ProjectOrderByInput']]
+    where: 'ProjectWhereInput'
+    cursor: 'ProjectWhereUniqueInput'
+    distinct: List['ProjectScalarFieldKeys']
+    include: 'ProjectIncludeFromProject'
+
+
+class AgentIncludeFromUserSession(TypedDict, total=False):
+    """Relational arguments for UserSession"""
+    tenant: Union[bool, 'TenantArgsFromUserSession']
+    conversations: Union[bool, 'FindManyConversationArgsFromUserSession']
+    agentTasks: Union[bool, 'FindManyAgentTaskArgsFromUserSession']
+
+
+class AgentArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    include: 'AgentIncludeFromAgent'
+
+
+class FindManyAgentArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    take: int
+    skip: int
+    order_by: Union['AgentOrderByInput', List['AgentOrderByInput']]
+    where: 'AgentWhereInput'
+    cursor: 'AgentWhereUniqueInput'
+    distinct: List['AgentScalarFieldKeys']
+    include: 'AgentIncludeFromAgent'
+
+
+class ConversationIncludeFromUserSession(TypedDict, total=False):
+    """Relational arguments for UserSession"""
+    agent: Union[bool, 'AgentArgsFromUserSession']
+    agentTasks: Union[bool, 'FindManyAgentTaskArgsFromUserSession']
+
+
+class ConversationArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    include: 'ConversationIncludeFromConversation'
+
+
+class FindManyConversationArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    take: int
+    skip: int
+    order_by: Union['ConversationOrderByInput', List['ConversationOrderByInput']]
+    where: 'ConversationWhereInput'
+    cursor: 'ConversationWhereUniqueInput'
+    distinct: List['ConversationScalarFieldKeys']
+    include: 'ConversationIncludeFromConversation'
+
+
+class AgentTaskIncludeFromUserSession(TypedDict, total=False):
+    """Relational arguments for UserSession"""
+    agent: Union[bool, 'AgentArgsFromUserSession']
+    conversation: Union[bool, 'ConversationArgsFromUserSession']
+
+
+class AgentTaskArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    include: 'AgentTaskIncludeFromAgentTask'
+
+
+class FindManyAgentTaskArgsFromUserSession(TypedDict, total=False):
+    """Arguments for UserSession"""
+    take: int
+    skip: int
+    order_by: Union['AgentTaskOrderByInput', List['AgentTaskOrderByInput']]
+    where: 'AgentTaskWhereInput'
+    cursor: 'AgentTaskWhereUniqueInput'
+    distinct: List['AgentTaskScalarFieldKeys']
+    include: 'AgentTaskIncludeFromAgentTask'
+
+
+
+
+FindManyUserSessionArgs = FindManyUserSessionArgsFromUserSession
+FindFirstUserSessionArgs = FindManyUserSessionArgsFromUserSession
+
+
+class UserSessionWhereInput(TypedDict, total=False):
+    """UserSession arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    userId: Union[_str, 'types.StringFilter']
+    user: 'UserRelationFilter'
+    token: Union[_str, 'types.StringFilter']
+    tokenId: Union[None, _str, 'types.StringFilter']
+    expiresAt: Union[datetime.datetime, 'types.DateTimeFilter']
+    ipAddress: Union[None, _str, 'types.StringFilter']
+    userAgent: Union[None, _str, 'types.StringFilter']
+    createdAt: Union[datetime.datetime, 'types.DateTimeFilter']
+    updatedAt: Union[datetime.datetime, 'types.DateTimeFilter']
+    deleted: Union[_bool, 'types.BooleanFilter']
+    deletedAt: Union[None, datetime.datetime, 'types.DateTimeFilter']
+
+    # should be noted that AND and NOT should be Union['UserSessionWhereInput', List['UserSessionWhereInput']]
+    # but this causes mypy to hang :/
+    AND: List['UserSessionWhereInput']
+    OR: List['UserSessionWhereInput']
+    NOT: List['UserSessionWhereInput']
+
+
+
+# aggregate UserSession types
+
+
+class UserSessionScalarWhereWithAggregatesInput(TypedDict, total=False):
+    """UserSession arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    userId: Union[_str, 'types.StringWithAggregatesFilter']
+    token: Union[_str, 'types.StringWithAggregatesFilter']
+    tokenId: Union[_str, 'types.StringWithAggregatesFilter']
+    expiresAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    ipAddress: Union[_str, 'types.StringWithAggregatesFilter']
+    userAgent: Union[_str, 'types.StringWithAggregatesFilter']
+    createdAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    updatedAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    deleted: Union[_bool, 'types.BooleanWithAggregatesFilter']
+    deletedAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['UserSessionScalarWhereWithAggregatesInput']
+    OR: List['UserSessionScalarWhereWithAggregatesInput']
+    NOT: List['UserSessionScalarWhereWithAggregatesInput']
+
+
+
+class UserSessionGroupByOutput(TypedDict, total=False):
+    id: _str
+    userId: _str
+    token: _str
+    tokenId: _str
+    expiresAt: datetime.datetime
+    ipAddress: _str
+    userAgent: _str
+    createdAt: datetime.datetime
+    updatedAt: datetime.datetime
+    deleted: _bool
+    deletedAt: datetime.datetime
+    _sum: 'UserSessionSumAggregateOutput'
+    _avg: 'UserSessionAvgAggregateOutput'
+    _min: 'UserSessionMinAggregateOutput'
+    _max: 'UserSessionMaxAggregateOutput'
+    _count: 'UserSessionCountAggregateOutput'
+
+
+class UserSessionAvgAggregateOutput(TypedDict, total=False):
+    """UserSession output for aggregating averages"""
+
+
+class UserSessionSumAggregateOutput(TypedDict, total=False):
+    """UserSession output for aggregating sums"""
+
+
+class UserSessionScalarAggregateOutput(TypedDict, total=False):
+    """UserSession output including scalar fields"""
+    id: _str
+    userId: _str
+    token: _str
+    tokenId: _str
+    expiresAt: datetime.datetime
+    ipAddress: _str
+    userAgent: _str
+    createdAt: datetime.datetime
+    updatedAt: datetime.datetime
+    deleted: _bool
+    deletedAt: datetime.datetime
+
+
+UserSessionMinAggregateOutput = UserSessionScalarAggregateOutput
+UserSessionMaxAggregateOutput = UserSessionScalarAggregateOutput
+
+
+class UserSessionMaxAggregateInput(TypedDict, total=False):
+    """UserSession input for aggregating by max"""
+    id: bool
+    userId: bool
+    token: bool
+    tokenId: bool
+    expiresAt: bool
+    ipAddress: bool
+    userAgent: bool
+    createdAt: bool
+    updatedAt: bool
+    deleted: bool
+    deletedAt: bool
+
+
+class UserSessionMinAggregateInput(TypedDict, total=False):
+    """UserSession input for aggregating by min"""
+    id: bool
+    userId: bool
+    token: bool
+    tokenId: bool
+    expiresAt: bool
+    ipAddress: bool
+    userAgent: bool
+    createdAt: bool
+    updatedAt: bool
+    deleted: bool
+    deletedAt: bool
+
+
+class UserSessionNumberAggregateInput(TypedDict, total=False):
+    """UserSession input for aggregating numbers"""
+
+
+UserSessionAvgAggregateInput = UserSessionNumberAggregateInput
+UserSessionSumAggregateInput = UserSessionNumberAggregateInput
+
+
+UserSessionCountAggregateInput = TypedDict(
+    'UserSessionCountAggregateInput',
+    {
+        'id': bool,
+        'userId': bool,
+        'token': bool,
+        'tokenId': bool,
+        'expiresAt': bool,
+        'ipAddress': bool,
+        'userAgent': bool,
+        'createdAt': bool,
+        'updatedAt': bool,
+        'deleted': bool,
+        'deletedAt': bool,
+        '_all': bool,
+    },
+    total=False,
+)
+
+UserSessionCountAggregateOutput = TypedDict(
+    'UserSessionCountAggregateOutput',
+    {
+        'id': int,
+        'userId': int,
+        'token': int,
+        'tokenId': int,
+        'expiresAt': int,
+        'ipAddress': int,
+        'userAgent': int,
+        'createdAt': int,
+        'updatedAt': int,
+        'deleted': int,
+        'deletedAt': int,
+        '_all': int,
+    },
+    total=False,
+)
+
+
+UserSessionKeys = Literal[
+    'id',
+    'userId',
+    'user',
+    'token',
+    'tokenId',
+    'expiresAt',
+    'ipAddress',
+    'userAgent',
+    'createdAt',
+    'updatedAt',
+    'deleted',
+    'deletedAt',
+]
+UserSessionScalarFieldKeys = Literal[
+    'id',
+    'userId',
+    'token',
+    'tokenId',
+    'expiresAt',
+    'ipAddress',
+    'userAgent',
+    'createdAt',
+    'updatedAt',
+    'deleted',
+    'deletedAt',
+]
+UserSessionScalarFieldKeysT = TypeVar('UserSessionScalarFieldKeysT', bound=UserSessionScalarFieldKeys)
+
+UserSessionRelationalFieldKeys = Literal[
+        'user',
+    ]
+
+# PasswordResetToken types
+
+class PasswordResetTokenOptionalCreateInput(TypedDict, total=False):
+    """Optional arguments to the PasswordResetToken create method"""
+    id: _str
+    userId: _str
+    user: 'UserCreateNestedWithoutRelationsInput'
+    usedAt: Optional[datetime.datetime]
+    createdAt: datetime.datetime
+
+
+class PasswordResetTokenCreateInput(PasswordResetTokenOptionalCreateInput):
+    """Required arguments to the PasswordResetToken create method"""
+    tokenHash: _str
+    expiresAt: datetime.datetime
+
+
+# TODO: remove this in favour of without explicit relations
+# e.g. PostCreateWithoutAuthorInput
+
+class PasswordResetTokenOptionalCreateWithoutRelationsInput(TypedDict, total=False):
+    """Optional arguments to the PasswordResetToken create method, without relations"""
+    id: _str
+    userId: _str
+    usedAt: Optional[datetime.datetime]
+    createdAt: datetime.datetime
+
+
+class PasswordResetTokenCreateWithoutRelationsInput(PasswordResetTokenOptionalCreateWithoutRelationsInput):
+    """Required arguments to the PasswordResetToken create method, without relations"""
+    tokenHash: _str
+    expiresAt: datetime.datetime
+
+class PasswordResetTokenConnectOrCreateWithoutRelationsInput(TypedDict):
+    create: 'PasswordResetTokenCreateWithoutRelationsInput'
+    where: 'PasswordResetTokenWhereUniqueInput'
+
+class PasswordResetTokenCreateNestedWithoutRelationsInput(TypedDict, total=False):
+    create: 'PasswordResetTokenCreateWithoutRelationsInput'
+    connect: 'PasswordResetTokenWhereUniqueInput'
+    connect_or_create: 'PasswordResetTokenConnectOrCreateWithoutRelationsInput'
+
+
+class PasswordResetTokenCreateManyNestedWithoutRelationsInput(TypedDict, total=False):
+    create: Union['PasswordResetTokenCreateWithoutRelationsInput', List['PasswordResetTokenCreateWithoutRelationsInput']]
+    connect: Union['PasswordResetTokenWhereUniqueInput', List['PasswordResetTokenWhereUniqueInput']]
+    connect_or_create: Union['PasswordResetTokenConnectOrCreateWithoutRelationsInput', List['PasswordResetTokenConnectOrCreateWithoutRelationsInput']]
+
+_PasswordResetTokenWhereUnique_id_Input = TypedDict(
+    '_PasswordResetTokenWhereUnique_id_Input',
+    {
+        'id': '_str',
+    },
+    total=True
+)
+
+_PasswordResetTokenWhereUnique_tokenHash_Input = TypedDict(
+    '_PasswordResetTokenWhereUnique_tokenHash_Input',
+    {
+        'tokenHash': '_str',
+    },
+    total=True
+)
+
+PasswordResetTokenWhereUniqueInput = Union[
+    '_PasswordResetTokenWhereUnique_id_Input',
+    '_PasswordResetTokenWhereUnique_tokenHash_Input',
+]
+
+
+class PasswordResetTokenUpdateInput(TypedDict, total=False):
+    """Optional arguments for updating a record"""
+    id: _str
+    user: 'UserUpdateOneWithoutRelationsInput'
+    tokenHash: _str
+    expiresAt: datetime.datetime
+    usedAt: Optional[datetime.datetime]
+    createdAt: datetime.datetime
+
+
+class PasswordResetTokenUpdateManyMutationInput(TypedDict, total=False):
+    """Arguments for updating many records"""
+    id: _str
+    tokenHash: _str
+    expiresAt: datetime.datetime
+    usedAt: Optional[datetime.datetime]
+    createdAt: datetime.datetime
+
+
+class PasswordResetTokenUpdateManyWithoutRelationsInput(TypedDict, total=False):
+    create: List['PasswordResetTokenCreateWithoutRelationsInput']
+    connect: List['PasswordResetTokenWhereUniqueInput']
+    connect_or_create: List['PasswordResetTokenConnectOrCreateWithoutRelationsInput']
+    set: List['PasswordResetTokenWhereUniqueInput']
+    disconnect: List['PasswordResetTokenWhereUniqueInput']
+    delete: List['PasswordResetTokenWhereUniqueInput']
+
+    # TODO
+    # update: List['PasswordResetTokenUpdateWithWhereUniqueWithoutRelationsInput']
+    # updateMany: List['PasswordResetTokenUpdateManyWithWhereUniqueWithoutRelationsInput']
+    # deleteMany: List['PasswordResetTokenScalarWhereInput']
+    # upsert: List['PasswordResetTokenUpserteWithWhereUniqueWithoutRelationsInput']
+
+
+class PasswordResetTokenUpdateOneWithoutRelationsInput(TypedDict, total=False):
+    create: 'PasswordResetTokenCreateWithoutRelationsInput'
+    connect: 'PasswordResetTokenWhereUniqueInput'
+    connect_or_create: 'PasswordResetTokenConnectOrCreateWithoutRelationsInput'
+    disconnect: bool
+    delete: bool
+
+    # TODO
+    # update: 'PasswordResetTokenUpdateInput'
+    # upsert: 'PasswordResetTokenUpsertWithoutRelationsInput'
+
+
+class PasswordResetTokenUpsertInput(TypedDict):
+    create: 'PasswordResetTokenCreateInput'
+    update: 'PasswordResetTokenUpdateInput'  # pyright: ignore[reportIncompatibleMethodOverride]
+
+
+_PasswordResetToken_id_OrderByInput = TypedDict(
+    '_PasswordResetToken_id_OrderByInput',
+    {
+        'id': 'SortOrder',
+    },
+    total=True
+)
+
+_PasswordResetToken_userId_OrderByInput = TypedDict(
+    '_PasswordResetToken_userId_OrderByInput',
+    {
+        'userId': 'SortOrder',
+    },
+    total=True
+)
+
+_PasswordResetToken_tokenHash_OrderByInput = TypedDict(
+    '_PasswordResetToken_tokenHash_OrderByInput',
+    {
+        'tokenHash': 'SortOrder',
+    },
+    total=True
+)
+
+_PasswordResetToken_expiresAt_OrderByInput = TypedDict(
+    '_PasswordResetToken_expiresAt_OrderByInput',
+    {
+        'expiresAt': 'SortOrder',
+    },
+    total=True
+)
+
+_PasswordResetToken_usedAt_OrderByInput = TypedDict(
+    '_PasswordResetToken_usedAt_OrderByInput',
+    {
+        'usedAt': 'SortOrder',
+    },
+    total=True
+)
+
+_PasswordResetToken_createdAt_OrderByInput = TypedDict(
+    '_PasswordResetToken_createdAt_OrderByInput',
+    {
+        'createdAt': 'SortOrder',
+    },
+    total=True
+)
+
+_PasswordResetToken_RelevanceInner = TypedDict(
+    '_PasswordResetToken_RelevanceInner',
+    {
+        'fields': 'List[PasswordResetTokenScalarFieldKeys]',
+        'search': 'str',
+        'sort': 'SortOrder',
+    },
+    total=True
+)
+
+_PasswordResetToken_RelevanceOrderByInput = TypedDict(
+    '_PasswordResetToken_RelevanceOrderByInput',
+    {
+        '_relevance': '_PasswordResetToken_RelevanceInner',
+    },
+    total=True
+)
+
+PasswordResetTokenOrderByInput = Union[
+    '_PasswordResetToken_id_OrderByInput',
+    '_PasswordResetToken_userId_OrderByInput',
+    '_PasswordResetToken_tokenHash_OrderByInput',
+    '_PasswordResetToken_expiresAt_OrderByInput',
+    '_PasswordResetToken_usedAt_OrderByInput',
+    '_PasswordResetToken_createdAt_OrderByInput',
+    '_PasswordResetToken_RelevanceOrderByInput',
+]
+
+
+
+# recursive PasswordResetToken types
+# TODO: cleanup these types
+
+
+
+PasswordResetTokenRelationFilter = TypedDict(
+    'PasswordResetTokenRelationFilter',
+    {
+        'is': 'PasswordResetTokenWhereInput',
+        'is_not': 'PasswordResetTokenWhereInput',
+    },
+    total=False,
+)
+
+
+class PasswordResetTokenListRelationFilter(TypedDict, total=False):
+    some: 'PasswordResetTokenWhereInput'
+    none: 'PasswordResetTokenWhereInput'
+    every: 'PasswordResetTokenWhereInput'
+
+
+class PasswordResetTokenInclude(TypedDict, total=False):
+    """PasswordResetToken relational arguments"""
+    user: Union[bool, 'UserArgsFromPasswordResetToken']
+
+
+class LicenseIncludeFromPasswordResetToken(TypedDict, total=False):
+    """Relational arguments for PasswordResetToken"""
+    tenants: Union[bool, 'FindManyTenantArgsFromPasswordResetToken']
+
+
+class LicenseArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
+    include: 'LicenseIncludeFromLicense'
+
+
+class FindManyLicenseArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
+    take: int
+    skip: int
+    order_by: Union['LicenseOrderByInput', List['LicenseOrderByInput']]
+    where: 'LicenseWhereInput'
+    cursor: 'LicenseWhereUniqueInput'
+    distinct: List['LicenseScalarFieldKeys']
+    include: 'LicenseIncludeFromLicense'
+
+
+class TenantIncludeFromPasswordResetToken(TypedDict, total=False):
+    """Relational arguments for PasswordResetToken"""
+    users: Union[bool, 'FindManyUserArgsFromPasswordResetToken']
+    projects: Union[bool, 'FindManyProjectArgsFromPasswordResetToken']
+    jobs: Union[bool, 'FindManyJobArgsFromPasswordResetToken']
+    agents: Union[bool, 'FindManyAgentArgsFromPasswordResetToken']
+    candidates: Union[bool, 'FindManyCandidateArgsFromPasswordResetToken']
+    license: Union[bool, 'LicenseArgsFromPasswordResetToken']
+
+
+class TenantArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
+    include: 'TenantIncludeFromTenant'
+
+
+class FindManyTenantArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
+    take: int
+    skip: int
+    order_by: Union['TenantOrderByInput', List['TenantOrderByInput']]
+    where: 'TenantWhereInput'
+    cursor: 'TenantWhereUniqueInput'
+    distinct: List['TenantScalarFieldKeys']
+    include: 'TenantIncludeFromTenant'
+
+
+class UserRoleIncludeFromPasswordResetToken(TypedDict, total=False):
+    """Relational arguments for PasswordResetToken"""
+    users: Union[bool, 'FindManyUserArgsFromPasswordResetToken']
+
+
+class UserRoleArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
+    include: 'UserRoleIncludeFromUserRole'
+
+
+class FindManyUserRoleArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
+    take: int
+    skip: int
+    order_by: Union['UserRoleOrderByInput', List['UserRoleOrderByInput']]
+    where: 'UserRoleWhereInput'
+    cursor: 'UserRoleWhereUniqueInput'
+    distinct: List['UserRoleScalarFieldKeys']
+    include: 'UserRoleIncludeFromUserRole'
+
+
+class UserIncludeFromPasswordResetToken(TypedDict, total=False):
+    """Relational arguments for PasswordResetToken"""
+    role: Union[bool, 'UserRoleArgsFromPasswordResetToken']
+    tenant: Union[bool, 'TenantArgsFromPasswordResetToken']
+    projects: Union[bool, 'FindManyProjectArgsFromPasswordResetToken']
+    sessions: Union[bool, 'FindManyUserSessionArgsFromPasswordResetToken']
+    resetTokens: Union[bool, 'FindManyPasswordResetTokenArgsFromPasswordResetToken']
+
+
+class UserArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
+    include: 'UserIncludeFromUser'
+
+
+class FindManyUserArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUser'
+
+
+class UserSessionIncludeFromPasswordResetToken(TypedDict, total=False):
+    """Relational arguments for PasswordResetToken"""
+    user: Union[bool, 'UserArgsFromPasswordResetToken']
+
+
+class UserSessionArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
+    include: 'UserSessionIncludeFromUserSession'
+
+
+class FindManyUserSessionArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
     take: int
     skip: int
     order_by: Union['UserSessionOrderByInput', List['UserSessionOrderByInput']]
@@ -4538,19 +5378,40 @@ class FindManyUserSessionArgsFromUserSession(TypedDict, total=False):
     include: 'UserSessionIncludeFromUserSession'
 
 
-class CandidateIncludeFromUserSession(TypedDict, total=False):
-    """Relational arguments for UserSession"""
-    jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromUserSession']
-    tenant: Union[bool, 'TenantArgsFromUserSession']
+class PasswordResetTokenIncludeFromPasswordResetToken(TypedDict, total=False):
+    """Relational arguments for PasswordResetToken"""
+    user: Union[bool, 'UserArgsFromPasswordResetToken']
 
 
-class CandidateArgsFromUserSession(TypedDict, total=False):
-    """Arguments for UserSession"""
+class PasswordResetTokenArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
+class FindManyPasswordResetTokenArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
+    take: int
+    skip: int
+    order_by: Union['PasswordResetTokenOrderByInput', List['PasswordResetTokenOrderByInput']]
+    where: 'PasswordResetTokenWhereInput'
+    cursor: 'PasswordResetTokenWhereUniqueInput'
+    distinct: List['PasswordResetTokenScalarFieldKeys']
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
+class CandidateIncludeFromPasswordResetToken(TypedDict, total=False):
+    """Relational arguments for PasswordResetToken"""
+    jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromPasswordResetToken']
+    tenant: Union[bool, 'TenantArgsFromPasswordResetToken']
+
+
+class CandidateArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
     include: 'CandidateIncludeFromCandidate'
 
 
-class FindManyCandidateArgsFromUserSession(TypedDict, total=False):
-    """Arguments for UserSession"""
+class FindManyCandidateArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
     take: int
     skip: int
     order_by: Union['CandidateOrderByInput', List['CandidateOrderByInput']]
@@ -4560,19 +5421,19 @@ class FindManyCandidateArgsFromUserSession(TypedDict, total=False):
     include: 'CandidateIncludeFromCandidate'
 
 
-class JobIncludeFromUserSession(TypedDict, total=False):
-    """Relational arguments for UserSession"""
-    tenant: Union[bool, 'TenantArgsFromUserSession']
-    jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromUserSession']
+class JobIncludeFromPasswordResetToken(TypedDict, total=False):
+    """Relational arguments for PasswordResetToken"""
+    tenant: Union[bool, 'TenantArgsFromPasswordResetToken']
+    jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromPasswordResetToken']
 
 
-class JobArgsFromUserSession(TypedDict, total=False):
-    """Arguments for UserSession"""
+class JobArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
     include: 'JobIncludeFromJob'
 
 
-class FindManyJobArgsFromUserSession(TypedDict, total=False):
-    """Arguments for UserSession"""
+class FindManyJobArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
     take: int
     skip: int
     order_by: Union['JobOrderByInput', List['JobOrderByInput']]
@@ -4582,19 +5443,19 @@ class FindManyJobArgsFromUserSession(TypedDict, total=False):
     include: 'JobIncludeFromJob'
 
 
-class JobCandidateIncludeFromUserSession(TypedDict, total=False):
-    """Relational arguments for UserSession"""
-    job: Union[bool, 'JobArgsFromUserSession']
-    candidate: Union[bool, 'CandidateArgsFromUserSession']
+class JobCandidateIncludeFromPasswordResetToken(TypedDict, total=False):
+    """Relational arguments for PasswordResetToken"""
+    job: Union[bool, 'JobArgsFromPasswordResetToken']
+    candidate: Union[bool, 'CandidateArgsFromPasswordResetToken']
 
 
-class JobCandidateArgsFromUserSession(TypedDict, total=False):
-    """Arguments for UserSession"""
+class JobCandidateArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
     include: 'JobCandidateIncludeFromJobCandidate'
 
 
-class FindManyJobCandidateArgsFromUserSession(TypedDict, total=False):
-    """Arguments for UserSession"""
+class FindManyJobCandidateArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
     take: int
     skip: int
     order_by: Union['JobCandidateOrderByInput', List['JobCandidateOrderByInput']]
@@ -4604,19 +5465,19 @@ class FindManyJobCandidateArgsFromUserSession(TypedDict, total=False):
     include: 'JobCandidateIncludeFromJobCandidate'
 
 
-class ProjectIncludeFromUserSession(TypedDict, total=False):
-    """Relational arguments for UserSession"""
-    tenant: Union[bool, 'TenantArgsFromUserSession']
-    user: Union[bool, 'UserArgsFromUserSession']
+class ProjectIncludeFromPasswordResetToken(TypedDict, total=False):
+    """Relational arguments for PasswordResetToken"""
+    tenant: Union[bool, 'TenantArgsFromPasswordResetToken']
+    user: Union[bool, 'UserArgsFromPasswordResetToken']
 
 
-class ProjectArgsFromUserSession(TypedDict, total=False):
-    """Arguments for UserSession"""
+class ProjectArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
     include: 'ProjectIncludeFromProject'
 
 
-class FindManyProjectArgsFromUserSession(TypedDict, total=False):
-    """Arguments for UserSession"""
+class FindManyProjectArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
     take: int
     skip: int
     order_by: Union['ProjectOrderByInput', List['ProjectOrderByInput']]
@@ -4626,20 +5487,20 @@ class FindManyProjectArgsFromUserSession(TypedDict, total=False):
     include: 'ProjectIncludeFromProject'
 
 
-class AgentIncludeFromUserSession(TypedDict, total=False):
-    """Relational arguments for UserSession"""
-    tenant: Union[bool, 'TenantArgsFromUserSession']
-    conversations: Union[bool, 'FindManyConversationArgsFromUserSession']
-    agentTasks: Union[bool, 'FindManyAgentTaskArgsFromUserSession']
+class AgentIncludeFromPasswordResetToken(TypedDict, total=False):
+    """Relational arguments for PasswordResetToken"""
+    tenant: Union[bool, 'TenantArgsFromPasswordResetToken']
+    conversations: Union[bool, 'FindManyConversationArgsFromPasswordResetToken']
+    agentTasks: Union[bool, 'FindManyAgentTaskArgsFromPasswordResetToken']
 
 
-class AgentArgsFromUserSession(TypedDict, total=False):
-    """Arguments for UserSession"""
+class AgentArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
     include: 'AgentIncludeFromAgent'
 
 
-class FindManyAgentArgsFromUserSession(TypedDict, total=False):
-    """Arguments for UserSession"""
+class FindManyAgentArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
     take: int
     skip: int
     order_by: Union['AgentOrderByInput', List['AgentOrderByInput']]
@@ -4649,19 +5510,19 @@ class FindManyAgentArgsFromUserSession(TypedDict, total=False):
     include: 'AgentIncludeFromAgent'
 
 
-class ConversationIncludeFromUserSession(TypedDict, total=False):
-    """Relational arguments for UserSession"""
-    agent: Union[bool, 'AgentArgsFromUserSession']
-    agentTasks: Union[bool, 'FindManyAgentTaskArgsFromUserSession']
+class ConversationIncludeFromPasswordResetToken(TypedDict, total=False):
+    """Relational arguments for PasswordResetToken"""
+    agent: Union[bool, 'AgentArgsFromPasswordResetToken']
+    agentTasks: Union[bool, 'FindManyAgentTaskArgsFromPasswordResetToken']
 
 
-class ConversationArgsFromUserSession(TypedDict, total=False):
-    """Arguments for UserSession"""
+class ConversationArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
     include: 'ConversationIncludeFromConversation'
 
 
-class FindManyConversationArgsFromUserSession(TypedDict, total=False):
-    """Arguments for UserSession"""
+class FindManyConversationArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
     take: int
     skip: int
     order_by: Union['ConversationOrderByInput', List['ConversationOrderByInput']]
@@ -4671,19 +5532,19 @@ class FindManyConversationArgsFromUserSession(TypedDict, total=False):
     include: 'ConversationIncludeFromConversation'
 
 
-class AgentTaskIncludeFromUserSession(TypedDict, total=False):
-    """Relational arguments for UserSession"""
-    agent: Union[bool, 'AgentArgsFromUserSession']
-    conversation: Union[bool, 'ConversationArgsFromUserSession']
+class AgentTaskIncludeFromPasswordResetToken(TypedDict, total=False):
+    """Relational arguments for PasswordResetToken"""
+    agent: Union[bool, 'AgentArgsFromPasswordResetToken']
+    conversation: Union[bool, 'ConversationArgsFromPasswordResetToken']
 
 
-class AgentTaskArgsFromUserSession(TypedDict, total=False):
-    """Arguments for UserSession"""
+class AgentTaskArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
     include: 'AgentTaskIncludeFromAgentTask'
 
 
-class FindManyAgentTaskArgsFromUserSession(TypedDict, total=False):
-    """Arguments for UserSession"""
+class FindManyAgentTaskArgsFromPasswordResetToken(TypedDict, total=False):
+    """Arguments for PasswordResetToken"""
     take: int
     skip: int
     order_by: Union['AgentTaskOrderByInput', List['AgentTaskOrderByInput']]
@@ -4695,199 +5556,159 @@ class FindManyAgentTaskArgsFromUserSession(TypedDict, total=False):
 
 
 
-FindManyUserSessionArgs = FindManyUserSessionArgsFromUserSession
-FindFirstUserSessionArgs = FindManyUserSessionArgsFromUserSession
+FindManyPasswordResetTokenArgs = FindManyPasswordResetTokenArgsFromPasswordResetToken
+FindFirstPasswordResetTokenArgs = FindManyPasswordResetTokenArgsFromPasswordResetToken
 
 
-class UserSessionWhereInput(TypedDict, total=False):
-    """UserSession arguments for searching"""
+class PasswordResetTokenWhereInput(TypedDict, total=False):
+    """PasswordResetToken arguments for searching"""
     id: Union[_str, 'types.StringFilter']
     userId: Union[_str, 'types.StringFilter']
     user: 'UserRelationFilter'
-    token: Union[_str, 'types.StringFilter']
+    tokenHash: Union[_str, 'types.StringFilter']
     expiresAt: Union[datetime.datetime, 'types.DateTimeFilter']
-    ipAddress: Union[None, _str, 'types.StringFilter']
-    userAgent: Union[None, _str, 'types.StringFilter']
+    usedAt: Union[None, datetime.datetime, 'types.DateTimeFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeFilter']
-    updatedAt: Union[datetime.datetime, 'types.DateTimeFilter']
-    deleted: Union[_bool, 'types.BooleanFilter']
-    deletedAt: Union[None, datetime.datetime, 'types.DateTimeFilter']
 
-    # should be noted that AND and NOT should be Union['UserSessionWhereInput', List['UserSessionWhereInput']]
+    # should be noted that AND and NOT should be Union['PasswordResetTokenWhereInput', List['PasswordResetTokenWhereInput']]
     # but this causes mypy to hang :/
-    AND: List['UserSessionWhereInput']
-    OR: List['UserSessionWhereInput']
-    NOT: List['UserSessionWhereInput']
+    AND: List['PasswordResetTokenWhereInput']
+    OR: List['PasswordResetTokenWhereInput']
+    NOT: List['PasswordResetTokenWhereInput']
 
 
 
-# aggregate UserSession types
+# aggregate PasswordResetToken types
 
 
-class UserSessionScalarWhereWithAggregatesInput(TypedDict, total=False):
-    """UserSession arguments for searching"""
+class PasswordResetTokenScalarWhereWithAggregatesInput(TypedDict, total=False):
+    """PasswordResetToken arguments for searching"""
     id: Union[_str, 'types.StringWithAggregatesFilter']
     userId: Union[_str, 'types.StringWithAggregatesFilter']
-    token: Union[_str, 'types.StringWithAggregatesFilter']
+    tokenHash: Union[_str, 'types.StringWithAggregatesFilter']
     expiresAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-    ipAddress: Union[_str, 'types.StringWithAggregatesFilter']
-    userAgent: Union[_str, 'types.StringWithAggregatesFilter']
+    usedAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-    updatedAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
-    deleted: Union[_bool, 'types.BooleanWithAggregatesFilter']
-    deletedAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
 
-    AND: List['UserSessionScalarWhereWithAggregatesInput']
-    OR: List['UserSessionScalarWhereWithAggregatesInput']
-    NOT: List['UserSessionScalarWhereWithAggregatesInput']
+    AND: List['PasswordResetTokenScalarWhereWithAggregatesInput']
+    OR: List['PasswordResetTokenScalarWhereWithAggregatesInput']
+    NOT: List['PasswordResetTokenScalarWhereWithAggregatesInput']
 
 
 
-class UserSessionGroupByOutput(TypedDict, total=False):
+class PasswordResetTokenGroupByOutput(TypedDict, total=False):
     id: _str
     userId: _str
-    token: _str
+    tokenHash: _str
     expiresAt: datetime.datetime
-    ipAddress: _str
-    userAgent: _str
+    usedAt: datetime.datetime
     createdAt: datetime.datetime
-    updatedAt: datetime.datetime
-    deleted: _bool
-    deletedAt: datetime.datetime
-    _sum: 'UserSessionSumAggregateOutput'
-    _avg: 'UserSessionAvgAggregateOutput'
-    _min: 'UserSessionMinAggregateOutput'
-    _max: 'UserSessionMaxAggregateOutput'
-    _count: 'UserSessionCountAggregateOutput'
+    _sum: 'PasswordResetTokenSumAggregateOutput'
+    _avg: 'PasswordResetTokenAvgAggregateOutput'
+    _min: 'PasswordResetTokenMinAggregateOutput'
+    _max: 'PasswordResetTokenMaxAggregateOutput'
+    _count: 'PasswordResetTokenCountAggregateOutput'
 
 
-class UserSessionAvgAggregateOutput(TypedDict, total=False):
-    """UserSession output for aggregating averages"""
+class PasswordResetTokenAvgAggregateOutput(TypedDict, total=False):
+    """PasswordResetToken output for aggregating averages"""
 
 
-class UserSessionSumAggregateOutput(TypedDict, total=False):
-    """UserSession output for aggregating sums"""
+class PasswordResetTokenSumAggregateOutput(TypedDict, total=False):
+    """PasswordResetToken output for aggregating sums"""
 
 
-class UserSessionScalarAggregateOutput(TypedDict, total=False):
-    """UserSession output including scalar fields"""
+class PasswordResetTokenScalarAggregateOutput(TypedDict, total=False):
+    """PasswordResetToken output including scalar fields"""
     id: _str
     userId: _str
-    token: _str
+    tokenHash: _str
     expiresAt: datetime.datetime
-    ipAddress: _str
-    userAgent: _str
+    usedAt: datetime.datetime
     createdAt: datetime.datetime
-    updatedAt: datetime.datetime
-    deleted: _bool
-    deletedAt: datetime.datetime
 
 
-UserSessionMinAggregateOutput = UserSessionScalarAggregateOutput
-UserSessionMaxAggregateOutput = UserSessionScalarAggregateOutput
+PasswordResetTokenMinAggregateOutput = PasswordResetTokenScalarAggregateOutput
+PasswordResetTokenMaxAggregateOutput = PasswordResetTokenScalarAggregateOutput
 
 
-class UserSessionMaxAggregateInput(TypedDict, total=False):
-    """UserSession input for aggregating by max"""
+class PasswordResetTokenMaxAggregateInput(TypedDict, total=False):
+    """PasswordResetToken input for aggregating by max"""
     id: bool
     userId: bool
-    token: bool
+    tokenHash: bool
     expiresAt: bool
-    ipAddress: bool
-    userAgent: bool
+    usedAt: bool
     createdAt: bool
-    updatedAt: bool
-    deleted: bool
-    deletedAt: bool
 
 
-class UserSessionMinAggregateInput(TypedDict, total=False):
-    """UserSession input for aggregating by min"""
+class PasswordResetTokenMinAggregateInput(TypedDict, total=False):
+    """PasswordResetToken input for aggregating by min"""
     id: bool
     userId: bool
-    token: bool
+    tokenHash: bool
     expiresAt: bool
-    ipAddress: bool
-    userAgent: bool
+    usedAt: bool
     createdAt: bool
-    updatedAt: bool
-    deleted: bool
-    deletedAt: bool
 
 
-class UserSessionNumberAggregateInput(TypedDict, total=False):
-    """UserSession input for aggregating numbers"""
+class PasswordResetTokenNumberAggregateInput(TypedDict, total=False):
+    """PasswordResetToken input for aggregating numbers"""
 
 
-UserSessionAvgAggregateInput = UserSessionNumberAggregateInput
-UserSessionSumAggregateInput = UserSessionNumberAggregateInput
+PasswordResetTokenAvgAggregateInput = PasswordResetTokenNumberAggregateInput
+PasswordResetTokenSumAggregateInput = PasswordResetTokenNumberAggregateInput
 
 
-UserSessionCountAggregateInput = TypedDict(
-    'UserSessionCountAggregateInput',
+PasswordResetTokenCountAggregateInput = TypedDict(
+    'PasswordResetTokenCountAggregateInput',
     {
         'id': bool,
         'userId': bool,
-        'token': bool,
+        'tokenHash': bool,
         'expiresAt': bool,
-        'ipAddress': bool,
-        'userAgent': bool,
+        'usedAt': bool,
         'createdAt': bool,
-        'updatedAt': bool,
-        'deleted': bool,
-        'deletedAt': bool,
         '_all': bool,
     },
     total=False,
 )
 
-UserSessionCountAggregateOutput = TypedDict(
-    'UserSessionCountAggregateOutput',
+PasswordResetTokenCountAggregateOutput = TypedDict(
+    'PasswordResetTokenCountAggregateOutput',
     {
         'id': int,
         'userId': int,
-        'token': int,
+        'tokenHash': int,
         'expiresAt': int,
-        'ipAddress': int,
-        'userAgent': int,
+        'usedAt': int,
         'createdAt': int,
-        'updatedAt': int,
-        'deleted': int,
-        'deletedAt': int,
         '_all': int,
     },
     total=False,
 )
 
 
-UserSessionKeys = Literal[
+PasswordResetTokenKeys = Literal[
     'id',
     'userId',
     'user',
-    'token',
+    'tokenHash',
     'expiresAt',
-    'ipAddress',
-    'userAgent',
+    'usedAt',
     'createdAt',
-    'updatedAt',
-    'deleted',
-    'deletedAt',
 ]
-UserSessionScalarFieldKeys = Literal[
+PasswordResetTokenScalarFieldKeys = Literal[
     'id',
     'userId',
-    'token',
+    'tokenHash',
     'expiresAt',
-    'ipAddress',
-    'userAgent',
+    'usedAt',
     'createdAt',
-    'updatedAt',
-    'deleted',
-    'deletedAt',
 ]
-UserSessionScalarFieldKeysT = TypeVar('UserSessionScalarFieldKeysT', bound=UserSessionScalarFieldKeys)
+PasswordResetTokenScalarFieldKeysT = TypeVar('PasswordResetTokenScalarFieldKeysT', bound=PasswordResetTokenScalarFieldKeys)
 
-UserSessionRelationalFieldKeys = Literal[
+PasswordResetTokenRelationalFieldKeys = Literal[
         'user',
     ]
 
@@ -5518,6 +6339,7 @@ class UserIncludeFromCandidate(TypedDict, total=False):
     tenant: Union[bool, 'TenantArgsFromCandidate']
     projects: Union[bool, 'FindManyProjectArgsFromCandidate']
     sessions: Union[bool, 'FindManyUserSessionArgsFromCandidate']
+    resetTokens: Union[bool, 'FindManyPasswordResetTokenArgsFromCandidate']
 
 
 class UserArgsFromCandidate(TypedDict, total=False):
@@ -5557,6 +6379,27 @@ class FindManyUserSessionArgsFromCandidate(TypedDict, total=False):
     include: 'UserSessionIncludeFromUserSession'
 
 
+class PasswordResetTokenIncludeFromCandidate(TypedDict, total=False):
+    """Relational arguments for Candidate"""
+    user: Union[bool, 'UserArgsFromCandidate']
+
+
+class PasswordResetTokenArgsFromCandidate(TypedDict, total=False):
+    """Arguments for Candidate"""
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
+class FindManyPasswordResetTokenArgsFromCandidate(TypedDict, total=False):
+    """Arguments for Candidate"""
+    take: int
+    skip: int
+    order_by: Union['PasswordResetTokenOrderByInput', List['PasswordResetTokenOrderByInput']]
+    where: 'PasswordResetTokenWhereInput'
+    cursor: 'PasswordResetTokenWhereUniqueInput'
+    distinct: List['PasswordResetTokenScalarFieldKeys']
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
 class CandidateIncludeFromCandidate(TypedDict, total=False):
     """Relational arguments for Candidate"""
     jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromCandidate']
@@ -6543,6 +7386,7 @@ class UserIncludeFromJob(TypedDict, total=False):
     tenant: Union[bool, 'TenantArgsFromJob']
     projects: Union[bool, 'FindManyProjectArgsFromJob']
     sessions: Union[bool, 'FindManyUserSessionArgsFromJob']
+    resetTokens: Union[bool, 'FindManyPasswordResetTokenArgsFromJob']
 
 
 class UserArgsFromJob(TypedDict, total=False):
@@ -6582,6 +7426,27 @@ class FindManyUserSessionArgsFromJob(TypedDict, total=False):
     include: 'UserSessionIncludeFromUserSession'
 
 
+class PasswordResetTokenIncludeFromJob(TypedDict, total=False):
+    """Relational arguments for Job"""
+    user: Union[bool, 'UserArgsFromJob']
+
+
+class PasswordResetTokenArgsFromJob(TypedDict, total=False):
+    """Arguments for Job"""
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
+class FindManyPasswordResetTokenArgsFromJob(TypedDict, total=False):
+    """Arguments for Job"""
+    take: int
+    skip: int
+    order_by: Union['PasswordResetTokenOrderByInput', List['PasswordResetTokenOrderByInput']]
+    where: 'PasswordResetTokenWhereInput'
+    cursor: 'PasswordResetTokenWhereUniqueInput'
+    distinct: List['PasswordResetTokenScalarFieldKeys']
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
 class CandidateIncludeFromJob(TypedDict, total=False):
     """Relational arguments for Job"""
     jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromJob']
@@ -7349,6 +8214,7 @@ class UserIncludeFromJobCandidate(TypedDict, total=False):
     tenant: Union[bool, 'TenantArgsFromJobCandidate']
     projects: Union[bool, 'FindManyProjectArgsFromJobCandidate']
     sessions: Union[bool, 'FindManyUserSessionArgsFromJobCandidate']
+    resetTokens: Union[bool, 'FindManyPasswordResetTokenArgsFromJobCandidate']
 
 
 class UserArgsFromJobCandidate(TypedDict, total=False):
@@ -7388,6 +8254,27 @@ class FindManyUserSessionArgsFromJobCandidate(TypedDict, total=False):
     include: 'UserSessionIncludeFromUserSession'
 
 
+class PasswordResetTokenIncludeFromJobCandidate(TypedDict, total=False):
+    """Relational arguments for JobCandidate"""
+    user: Union[bool, 'UserArgsFromJobCandidate']
+
+
+class PasswordResetTokenArgsFromJobCandidate(TypedDict, total=False):
+    """Arguments for JobCandidate"""
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
+class FindManyPasswordResetTokenArgsFromJobCandidate(TypedDict, total=False):
+    """Arguments for JobCandidate"""
+    take: int
+    skip: int
+    order_by: Union['PasswordResetTokenOrderByInput', List['PasswordResetTokenOrderByInput']]
+    where: 'PasswordResetTokenWhereInput'
+    cursor: 'PasswordResetTokenWhereUniqueInput'
+    distinct: List['PasswordResetTokenScalarFieldKeys']
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
 class CandidateIncludeFromJobCandidate(TypedDict, total=False):
     """Relational arguments for JobCandidate"""
     jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromJobCandidate']
@@ -8085,6 +8972,7 @@ class UserIncludeFromProject(TypedDict, total=False):
     tenant: Union[bool, 'TenantArgsFromProject']
     projects: Union[bool, 'FindManyProjectArgsFromProject']
     sessions: Union[bool, 'FindManyUserSessionArgsFromProject']
+    resetTokens: Union[bool, 'FindManyPasswordResetTokenArgsFromProject']
 
 
 class UserArgsFromProject(TypedDict, total=False):
@@ -8124,6 +9012,27 @@ class FindManyUserSessionArgsFromProject(TypedDict, total=False):
     include: 'UserSessionIncludeFromUserSession'
 
 
+class PasswordResetTokenIncludeFromProject(TypedDict, total=False):
+    """Relational arguments for Project"""
+    user: Union[bool, 'UserArgsFromProject']
+
+
+class PasswordResetTokenArgsFromProject(TypedDict, total=False):
+    """Arguments for Project"""
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
+class FindManyPasswordResetTokenArgsFromProject(TypedDict, total=False):
+    """Arguments for Project"""
+    take: int
+    skip: int
+    order_by: Union['PasswordResetTokenOrderByInput', List['PasswordResetTokenOrderByInput']]
+    where: 'PasswordResetTokenWhereInput'
+    cursor: 'PasswordResetTokenWhereUniqueInput'
+    distinct: List['PasswordResetTokenScalarFieldKeys']
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
 class CandidateIncludeFromProject(TypedDict, total=False):
     """Relational arguments for Project"""
     jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromProject']
@@ -8930,6 +9839,7 @@ class UserIncludeFromAgent(TypedDict, total=False):
     tenant: Union[bool, 'TenantArgsFromAgent']
     projects: Union[bool, 'FindManyProjectArgsFromAgent']
     sessions: Union[bool, 'FindManyUserSessionArgsFromAgent']
+    resetTokens: Union[bool, 'FindManyPasswordResetTokenArgsFromAgent']
 
 
 class UserArgsFromAgent(TypedDict, total=False):
@@ -8969,6 +9879,27 @@ class FindManyUserSessionArgsFromAgent(TypedDict, total=False):
     include: 'UserSessionIncludeFromUserSession'
 
 
+class PasswordResetTokenIncludeFromAgent(TypedDict, total=False):
+    """Relational arguments for Agent"""
+    user: Union[bool, 'UserArgsFromAgent']
+
+
+class PasswordResetTokenArgsFromAgent(TypedDict, total=False):
+    """Arguments for Agent"""
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
+class FindManyPasswordResetTokenArgsFromAgent(TypedDict, total=False):
+    """Arguments for Agent"""
+    take: int
+    skip: int
+    order_by: Union['PasswordResetTokenOrderByInput', List['PasswordResetTokenOrderByInput']]
+    where: 'PasswordResetTokenWhereInput'
+    cursor: 'PasswordResetTokenWhereUniqueInput'
+    distinct: List['PasswordResetTokenScalarFieldKeys']
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
 class CandidateIncludeFromAgent(TypedDict, total=False):
     """Relational arguments for Agent"""
     jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromAgent']
@@ -9714,6 +10645,7 @@ class UserIncludeFromConversation(TypedDict, total=False):
     tenant: Union[bool, 'TenantArgsFromConversation']
     projects: Union[bool, 'FindManyProjectArgsFromConversation']
     sessions: Union[bool, 'FindManyUserSessionArgsFromConversation']
+    resetTokens: Union[bool, 'FindManyPasswordResetTokenArgsFromConversation']
 
 
 class UserArgsFromConversation(TypedDict, total=False):
@@ -9753,6 +10685,27 @@ class FindManyUserSessionArgsFromConversation(TypedDict, total=False):
     include: 'UserSessionIncludeFromUserSession'
 
 
+class PasswordResetTokenIncludeFromConversation(TypedDict, total=False):
+    """Relational arguments for Conversation"""
+    user: Union[bool, 'UserArgsFromConversation']
+
+
+class PasswordResetTokenArgsFromConversation(TypedDict, total=False):
+    """Arguments for Conversation"""
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
+class FindManyPasswordResetTokenArgsFromConversation(TypedDict, total=False):
+    """Arguments for Conversation"""
+    take: int
+    skip: int
+    order_by: Union['PasswordResetTokenOrderByInput', List['PasswordResetTokenOrderByInput']]
+    where: 'PasswordResetTokenWhereInput'
+    cursor: 'PasswordResetTokenWhereUniqueInput'
+    distinct: List['PasswordResetTokenScalarFieldKeys']
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
 class CandidateIncludeFromConversation(TypedDict, total=False):
     """Relational arguments for Conversation"""
     jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromConversation']
@@ -10397,6 +11350,7 @@ class UserIncludeFromAgentTask(TypedDict, total=False):
     tenant: Union[bool, 'TenantArgsFromAgentTask']
     projects: Union[bool, 'FindManyProjectArgsFromAgentTask']
     sessions: Union[bool, 'FindManyUserSessionArgsFromAgentTask']
+    resetTokens: Union[bool, 'FindManyPasswordResetTokenArgsFromAgentTask']
 
 
 class UserArgsFromAgentTask(TypedDict, total=False):
@@ -10436,6 +11390,27 @@ class FindManyUserSessionArgsFromAgentTask(TypedDict, total=False):
     include: 'UserSessionIncludeFromUserSession'
 
 
+class PasswordResetTokenIncludeFromAgentTask(TypedDict, total=False):
+    """Relational arguments for AgentTask"""
+    user: Union[bool, 'UserArgsFromAgentTask']
+
+
+class PasswordResetTokenArgsFromAgentTask(TypedDict, total=False):
+    """Arguments for AgentTask"""
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
+class FindManyPasswordResetTokenArgsFromAgentTask(TypedDict, total=False):
+    """Arguments for AgentTask"""
+    take: int
+    skip: int
+    order_by: Union['PasswordResetTokenOrderByInput', List['PasswordResetTokenOrderByInput']]
+    where: 'PasswordResetTokenWhereInput'
+    cursor: 'PasswordResetTokenWhereUniqueInput'
+    distinct: List['PasswordResetTokenScalarFieldKeys']
+    include: 'PasswordResetTokenIncludeFromPasswordResetToken'
+
+
 class CandidateIncludeFromAgentTask(TypedDict, total=False):
     """Relational arguments for AgentTask"""
     jobCandidates: Union[bool, 'FindManyJobCandidateArgsFromAgentTask']
@@ -1,6 +1,6 @@
 import os
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List, Optional
 
 
 class Settings(BaseSettings):
@@ -23,18 +23,113 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = os.environ.get("JWT_ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
 
+    # Password hashing runs on its own thread pool; logins beyond the
+    # pending limit are rejected with 429. Hashes with a different cost
+    # are upgraded on the next successful login.
+    PASSWORD_HASH_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # Authenticated users are cached per token for this long; revoked
+    # sessions are picked up from the database every sync interval
+    AUTH_USER_CACHE_TTL_SECONDS: int = 60
+    AUTH_USER_CACHE_MAX_ENTRIES: int = 10_000
+    AUTH_REVOCATION_SYNC_SECONDS: float = 2.0
+    # Trust the JWT signature and expiry plus the revocation filter
+    # instead of looking up the session row on every request
+    AUTH_STATELESS_TOKENS: bool = False
+
+    # Expired sessions and reset tokens are purged in batches
+    PASSWORD_RESET_EXPIRE_HOURS: int = 24
+    SESSION_SWEEP_INTERVAL_SECONDS: int = 300
+    SESSION_SWEEP_BATCH_SIZE: int = 1000
+
+    # Tenant existence checks are cached; unknown ids for less time so
+    # a newly created tenant is usable quickly. The API never writes
+    # tenants (only the seed script does, out of process), so entries
+    # are only dropped by expiry and a deleted tenant stays usable for
+    # up to the TTL.
+    TENANT_CACHE_TTL_SECONDS: int = 30
+    TENANT_CACHE_NEGATIVE_TTL_SECONDS: int = 5
+    TENANT_CACHE_MAX_ENTRIES: int = 10_000
+
+    # Project access grants are reused across requests for this long
+    ACCESS_CACHE_TTL_SECONDS: int = 30
+    ACCESS_CACHE_MAX_ENTRIES: int = 50_000
+
     # Database
     DATABASE_URL: str = os.environ.get(
         "DATABASE_URL",
         None,  # noqa: E501
     )
+    # Query engine connection pool, unless set in DATABASE_URL
+    DATABASE_CONNECTION_LIMIT: Optional[int] = None
+    DATABASE_POOL_TIMEOUT: Optional[int] = None
+    # "validate" parses query results with full model validation,
+    # "trusted" constructs models from the engine's typed results, which
+    # only pays off for wide rows
+    DATABASE_HYDRATION: str = "validate"
+    # Coalesce concurrent find_unique lookups by id into one query
+    DATABASE_BATCH_FIND_UNIQUE: bool = False
+    # HTTP transport to the query engine. Idle connections are kept alive
+    # for DATABASE_HTTP_KEEPALIVE_EXPIRY seconds, HTTP/2 needs the h2
+    # package and Unix domain sockets are not supported on Windows
+    DATABASE_HTTP_MAX_CONNECTIONS: int = 1000
+    DATABASE_HTTP_MAX_KEEPALIVE_CONNECTIONS: Optional[int] = 100
+    DATABASE_HTTP_KEEPALIVE_EXPIRY: float = 60.0
+    DATABASE_HTTP2: bool = False
+    DATABASE_UNIX_SOCKET: bool = False
+    # Query engine processes, queries go to the least busy one. Every
+    # process opens its own connection pool of DATABASE_CONNECTION_LIMIT
+    DATABASE_ENGINE_PROCESSES: int = 1
 
     # Vector database settings
     VECTOR_DIMENSION: int = 384  # all-MiniLM-L6-v2 dimension
 
+    # Retrieval settings. Project embedding matrices are cached per worker
+    # for the TTL, least recently used projects are evicted past the max
+    RETRIEVAL_CACHE_TTL_SECONDS: int = 300
+    RETRIEVAL_CACHE_MAX_PROJECTS: int = 256
+    RETRIEVAL_MAX_BATCH_QUERIES: int = 256
+
     # LLM settings
     LLM_MODEL: str = os.environ.get("LLM_MODEL", "gpt-4o")
     LLM_TEMPERATURE: float = 0.0
+    LLM_MAX_TOKENS: int = 1000
+    # Prompt sizing: the model's context window, and a lower cap on
+    # prompt tokens to bound cost per turn
+    LLM_CONTEXT_WINDOW: int = 128_000
+    LLM_PROMPT_TOKEN_BUDGET: int = 6000
+    LLM_HISTORY_TOKEN_SHARE: float = 0.3
+    LLM_TOKEN_COUNT_CACHE_SIZE: int = 50_000
+    # The tokenizer is loaded at startup; tiktoken may download it, and
+    # counts are estimated if that takes longer than this
+    LLM_TOKENIZER_LOAD_TIMEOUT: float = 30.0
+    LLM_BASE_URL: Optional[str] = os.environ.get("LLM_BASE_URL", None)
+    LLM_TIMEOUT: float = 60.0
+    LLM_CONNECT_TIMEOUT: float = 5.0
+    LLM_MAX_RETRIES: int = 2
+    LLM_MAX_CONNECTIONS: int = 100
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_KEEPALIVE_EXPIRY: float = 30.0
+    # Concurrent completions per model, overridable per model name
+    LLM_MAX_CONCURRENCY: int = 16
+    LLM_MODEL_CONCURRENCY: Dict[str, int] = {}
+
+    # LLM response cache, used by agents that opt in
+    LLM_CACHE_TTL_SECONDS: int = 60 * 60
+    LLM_CACHE_MAX_ENTRIES: int = 10_000
+    LLM_CACHE_SEMANTIC_MAX_ENTRIES_PER_AGENT: int = 512
+    LLM_CACHE_SEMANTIC_THRESHOLD: float = 0.95
+
+    # Chat memory: recent messages sent verbatim, older ones summarised
+    # once at least CHAT_SUMMARY_BATCH of them are past the window. Needs
+    # summary, summary_cursor_at and summary_cursor_id on chat sessions
+    CHAT_HISTORY_WINDOW: int = 10
+    CHAT_SUMMARY_BATCH: int = 4
+    CHAT_SUMMARY_MAX_TOKENS: int = 300
+    # Shutdown waits this long for background chat writes and summaries
+    CHAT_SHUTDOWN_DRAIN_SECONDS: float = 10.0
 
     # Document processing
     CHUNK_SIZE: int = 500
@@ -0,0 +1,84 @@
+from typing import Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from api.core.config import settings
+from api.db.prisma_client import Prisma, get_prisma_client
+from api.services.tenant_cache import TenantCache, get_tenant_cache
+
+# Routes that don't need a tenant: auth and the API docs
+PUBLIC_PATH_PREFIXES: Tuple[str, ...] = (
+    f"{settings.API_V1_STR}/auth",
+    f"{settings.API_V1_STR}/docs",
+    f"{settings.API_V1_STR}/redoc",
+    f"{settings.API_V1_STR}/openapi.json",
+)
+
+
+class TenantMiddleware:
+    """
+    Tenant middleware.
+
+    This middleware is used to check if the tenant ID
+    is provided in the `X-Tenant-Id` request header. If not,
+    it will return a 400 error.
+
+    If the tenant ID is provided, it will check that the tenant
+    exists in the database, through a TTL cache. If the tenant
+    does not exist, it will return a 404 error. If it exists,
+    the tenant ID is stored in the request state for later use.
+
+    Auth and docs routes, and CORS preflight requests, skip the
+    tenant check.
+
+    It is a plain ASGI middleware rather than a BaseHTTPMiddleware,
+    so requests and responses, including streamed ones, pass
+    through without extra tasks or buffering.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        tenants: Optional[TenantCache] = None,
+        prisma: Optional[Prisma] = None,
+    ):
+        self.app = app
+        self.tenants = tenants or get_tenant_cache()
+        self.prisma = prisma
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Every route shares the lifespan-managed Prisma client
+        prisma = self.prisma or get_prisma_client()
+        state = scope.setdefault("state", {})
+        state["prisma"] = prisma
+
+        if scope["method"] == "OPTIONS" or scope["path"].startswith(
+            PUBLIC_PATH_PREFIXES
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # For protected routes, ensure tenant ID is provided
+        tenant_id = Headers(scope=scope).get("x-tenant-id")
+        if not tenant_id:
+            response = PlainTextResponse(
+                "X-Tenant-Id header is required", status_code=400
+            )
+            await response(scope, receive, send)
+            return
+
+        if not await self.tenants.exists(prisma, tenant_id):
+            response = PlainTextResponse("Tenant not found", status_code=404)
+            await response(scope, receive, send)
+            return
+
+        # Store tenant ID in request state for later use
+        state["tenant_id"] = tenant_id
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,42 @@
+from contextlib import contextmanager
+from typing import Dict, Iterator
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class StageTimer:
+    """Wall-clock durations of the named stages of a request.
+
+    Stages may overlap when they run concurrently; each records its own
+    elapsed time in milliseconds.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as stage `name`"""
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = (time.perf_counter() - started_at) * 1000
+
+    def total(self) -> float:
+        """Milliseconds since the timer was created"""
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def server_timing(self) -> str:
+        """Format the timings as a `Server-Timing` header value"""
+        timings = {**self.timings, "total": self.total()}
+        return ", ".join(
+            f"{name};dur={duration:.1f}" for name, duration in timings.items()
+        )
+
+    def log(self, label: str) -> None:
+        """Log the timings of every stage"""
+        logger.info(f"{label} timings (ms): {self.server_timing()}")
@@ -1,25 +1,97 @@
+import httpx
 from db.client import Prisma
+from db.client.types import HttpConfig
 from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from typing import Optional
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from api.core.config import settings
+
 _prisma_client: Optional[Prisma] = None
 
 
+def _pooled_database_url(url: str) -> str:
+    """
+    Add the configured connection pool parameters to a database URL.
+    Parameters already present in the URL take precedence.
+
+    Args:
+        url (str): The database URL
+
+    Returns:
+        str: The URL with `connection_limit` and `pool_timeout` set
+    """
+    scheme, netloc, path, query, fragment = urlsplit(url)
+    params = dict(parse_qsl(query))
+
+    if settings.DATABASE_CONNECTION_LIMIT is not None:
+        params.setdefault(
+            "connection_limit", str(settings.DATABASE_CONNECTION_LIMIT)
+        )
+    if settings.DATABASE_POOL_TIMEOUT is not None:
+        params.setdefault("pool_timeout", str(settings.DATABASE_POOL_TIMEOUT))
+
+    return urlunsplit((scheme, netloc, path, urlencode(params), fragment))
+
+
+def engine_http_config() -> HttpConfig:
+    """
+    Build the HTTP transport configuration for the query engine
+    from the settings.
+
+    Returns:
+        HttpConfig: The connection pool, protocol and socket options
+    """
+    return {
+        "limits": httpx.Limits(
+            max_connections=settings.DATABASE_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=(
+                settings.DATABASE_HTTP_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=settings.DATABASE_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        # The engine is reached over plain HTTP, so HTTP/2 is only used
+        # with prior knowledge, when HTTP/1.1 is disabled
+        "http1": not settings.DATABASE_HTTP2,
+        "http2": settings.DATABASE_HTTP2,
+        "unix_socket": settings.DATABASE_UNIX_SOCKET,
+    }
+
+
 @lru_cache()
 def get_prisma_client() -> Prisma:
     """
     Get a singleton instance of the Prisma client.
     Uses LRU cache to ensure only one instance is created.
 
+    The client is connected and disconnected by the application
+    lifespan, so every request shares its query engine and pool.
+
     Returns:
         Prisma: A singleton instance of the Prisma client
     """
     global _prisma_client
     if _prisma_client is None:
-        _prisma_client = Prisma()
+        if settings.DATABASE_URL:
+            _prisma_client = Prisma(
+                datasource={
+                    "url": _pooled_database_url(settings.DATABASE_URL)
+                },
+                hydration=settings.DATABASE_HYDRATION,
+                batch_find_unique=settings.DATABASE_BATCH_FIND_UNIQUE,
+                http=engine_http_config(),
+                engine_processes=settings.DATABASE_ENGINE_PROCESSES,
+            )
+        else:
+            _prisma_client = Prisma(
+                hydration=settings.DATABASE_HYDRATION,
+                batch_find_unique=settings.DATABASE_BATCH_FIND_UNIQUE,
+                http=engine_http_config(),
+                engine_processes=settings.DATABASE_ENGINE_PROCESSES,
+            )
     return _prisma_client
 
 
@@ -3,19 +3,23 @@ from contextlib import asynccontextmanager
 
 import uvicorn
 
-from fastapi import FastAPI, Depends, Request, Response
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
 from api.db.prisma_client import get_prisma_client
 from api.core.config import settings
+from api.core.middleware import TenantMiddleware
 from api.routes.v1.auth import router as auth_router
 from api.routes.v1.documents import router as documents_router
 from api.routes.v1.tenants import router as tenants_router
 from api.routes.v1.users import router as users_router
 from api.routes.v1.agents import router as agents_router
 from api.routes.v1.chats import router as chat_router
+from api.routes.v1.chats import drain_background_writes, llm_service
 from api.routes.v1.projects import router as projects_router
-from api.services.auth import AuthService, get_current_user
+from api.services.auth import get_current_user
+from api.services.llm_service import close_llm_http_client
+from api.services.password_hasher import get_password_hasher
+from api.services.session_sweeper import SessionSweeper
 
 # Configure logging
 logging.basicConfig(
@@ -27,10 +31,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# Initialize auth service
-auth_service = AuthService()
-
-
 def start():
     uvicorn.run("api.main:app", host="0.0.0.0", port=8000, reload=True)
 
@@ -44,61 +44,22 @@ async def lifespan(app: FastAPI):
     and connect to the database.
     """
     # Startup
+    # Load the tokenizer before the first request has to count tokens
+    await llm_service.packer.load(settings.LLM_TOKENIZER_LOAD_TIMEOUT)
     # Initialize Prisma client
     prisma = get_prisma_client()
     await prisma.connect()
+    # Purge expired sessions and reset tokens in the background
+    session_sweeper = SessionSweeper(prisma)
+    session_sweeper.start()
     yield
     # Shutdown
-    await auth_service.prisma.disconnect()
-
-
-class TenantMiddleware(BaseHTTPMiddleware):
-    """
-    Tenant middleware.
-
-    This middleware is used to check if the tenant ID
-    is provided in the request headers. If not, it will
-    return a 400 error.
-
-    If the tenant ID is provided, it will store the tenant
-    ID in the request state for later use.
-
-    If the tenant ID is not provided, it will skip the
-    tenant check and continue processing the request.
-
-    If the tenant ID is provided, it will check if the tenant
-    exists in the database. If the tenant does not exist,
-    it will return a 404 error. If the tenant exists, it will
-    continue processing the request.
-    """
-
-    async def dispatch(self, request: Request, call_next):
-        """
-        Dispatch the request.
-
-        This method is used to dispatch the request to the next middleware.
-        """
-        tenant_id = request.headers.get("X-Tenant-Id")
-
-        # Skip tenant check for auth endpoints and public routes
-        if request.url.path.startswith(
-            settings.API_V1_STR + "/auth"
-        ) or request.url.path.startswith("/docs"):
-            return await call_next(request)
-
-        # For protected routes, ensure tenant ID is provided
-        if not tenant_id:
-            return Response(
-                status_code=400,
-                content="X-Tenant-Id header is required",
-                media_type="text/plain",
-            )
-
-        # Store tenant ID in request state for later use
-        request.state.tenant_id = tenant_id
-
-        # Continue processing the request
-        return await call_next(request)
+    await session_sweeper.stop()
+    # Finish storing answers that were already sent to clients
+    await drain_background_writes()
+    await close_llm_http_client()
+    get_password_hasher().shutdown()
+    await prisma.disconnect()
 
 
 app = FastAPI(
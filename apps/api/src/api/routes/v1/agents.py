@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, Request
 from typing import List
 from api.schemas.agent import AgentCreate, AgentResponse
+from api.services.access import AccessResolver, get_access
 from api.services.auth import get_current_user
 import time
 
@@ -11,23 +12,12 @@ router = APIRouter()
 async def create_agent(
     data: AgentCreate,
     current_user=Depends(get_current_user),
+    access: AccessResolver = Depends(get_access),
     request: Request = None,
 ):
     """Create a new chat agent"""
-    tenant_id = request.state.tenant_id
-
     # Check if user has access to the project
-    project = await request.state.prisma.project.find_first(
-        where={
-            "id": data.project_id,
-            "tenant_id": tenant_id,
-            "deleted_at": None,
-        },
-        include={"users": {"where": {"user_id": current_user.id}}},
-    )
-
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    await access.project(data.project_id)
 
     # Create the agent
     current_time = int(time.time())
@@ -52,20 +42,12 @@ async def create_agent(
 @router.get("/{project_id}", response_model=List[AgentResponse])
 async def get_agents(
     project_id: str,
-    current_user=Depends(get_current_user),
+    access: AccessResolver = Depends(get_access),
     request: Request = None,
 ):
     """Get all agents for a project"""
-    tenant_id = request.state.tenant_id
-
     # Check if user has access to the project
-    project = await request.state.prisma.project.find_first(
-        where={"id": project_id, "tenant_id": tenant_id, "deleted_at": None},
-        include={"users": {"where": {"user_id": current_user.id}}},
-    )
-
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    await access.project(project_id)
 
     # Get all agents for the project
     agents = await request.state.prisma.agent.find_many(
@@ -79,31 +61,8 @@ async def get_agents(
 @router.get("/detail/{agent_id}", response_model=AgentResponse)
 async def get_agent(
     agent_id: str,
-    current_user=Depends(get_current_user),
-    request: Request = None,
+    access: AccessResolver = Depends(get_access),
 ):
     """Get a specific agent"""
-    tenant_id = request.state.tenant_id
-
-    # Get the agent with project info
-    agent = await request.state.prisma.agent.find_unique(
-        where={"id": agent_id}, include={"project": True}
-    )
-
-    if not agent or agent.deleted_at:
-        raise HTTPException(status_code=404, detail="Agent not found")
-
-    # Check if user has access to the project
-    project = await request.state.prisma.project.find_first(
-        where={
-            "id": agent.project_id,
-            "tenant_id": tenant_id,
-            "deleted_at": None,
-        },
-        include={"users": {"where": {"user_id": current_user.id}}},
-    )
-
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    return agent
+    # Get the agent, checking the user has access to its project
+    return await access.agent(agent_id)
@@ -3,18 +3,28 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from pydantic import BaseModel, EmailStr
 from typing import Optional
-from api.services.auth import AuthService, get_current_user
+from api.services.auth import get_auth_service, get_current_user
+from api.services.password_hasher import PasswordHasherBusy
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# Initialize auth service
-auth_service = AuthService()
+# Shared auth service, on the lifespan-managed Prisma client
+auth_service = get_auth_service()
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
+def _password_hasher_busy() -> HTTPException:
+    """Shed load when too many password hashes are already pending"""
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many requests, please try again later",
+        headers={"Retry-After": "1"}
+    )
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str
@@ -69,9 +79,6 @@ async def register(data: UserRegister, request: Request):
             detail="X-Tenant-Id header is required"
         )
 
-    # Connect Prisma
-    await auth_service.prisma.connect()
-
     try:
         # Check if tenant exists
         tenant = await auth_service.prisma.tenant.find_unique(
@@ -109,14 +116,14 @@ async def register(data: UserRegister, request: Request):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except PasswordHasherBusy:
+        raise _password_hasher_busy()
     except Exception as e:
         logger.error(f"Registration error: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Registration failed"
         )
-    finally:
-        await auth_service.prisma.disconnect()
 
 
 @router.post("/login", response_model=Token)
@@ -137,9 +144,6 @@ async def login(
     ip_address = request.client.host if request.client else None
     user_agent = request.headers.get("User-Agent")
 
-    # Connect Prisma
-    await auth_service.prisma.connect()
-
     try:
         # Authenticate user
         result = await auth_service.login(
@@ -161,14 +165,14 @@ async def login(
             detail=str(e),
             headers={"WWW-Authenticate": "Bearer"}
         )
+    except PasswordHasherBusy:
+        raise _password_hasher_busy()
     except Exception as e:
         logger.error(f"Login error: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Login failed"
         )
-    finally:
-        await auth_service.prisma.disconnect()
 
 
 @router.post("/logout")
@@ -177,9 +181,6 @@ async def logout(
     token: str = Depends(oauth2_scheme)
 ):
     """Logout a user"""
-    # Connect Prisma
-    await auth_service.prisma.connect()
-
     try:
         success = await auth_service.logout(token)
 
@@ -197,8 +198,6 @@ async def logout(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Logout failed"
         )
-    finally:
-        await auth_service.prisma.disconnect()
 
 
 @router.post("/refresh", response_model=Token)
@@ -206,9 +205,6 @@ async def refresh_token(
     token: str = Depends(oauth2_scheme)
 ):
     """Refresh an access token"""
-    # Connect Prisma
-    await auth_service.prisma.connect()
-
     try:
         result = await auth_service.refresh_token(token)
 
@@ -230,8 +226,6 @@ async def refresh_token(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Token refresh failed"
         )
-    finally:
-        await auth_service.prisma.disconnect()
 
 
 @router.post("/change-password")
@@ -240,9 +234,6 @@ async def change_password(
     current_user=Depends(get_current_user)
 ):
     """Change user password"""
-    # Connect Prisma
-    await auth_service.prisma.connect()
-
     try:
         success = await auth_service.change_password(
             user_id=current_user.id,
@@ -258,14 +249,14 @@ async def change_password(
 
         return {"message": "Password changed successfully"}
 
+    except PasswordHasherBusy:
+        raise _password_hasher_busy()
     except Exception as e:
         logger.error(f"Password change error: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Password change failed"
         )
-    finally:
-        await auth_service.prisma.disconnect()
 
 
 @router.post("/request-password-reset")
@@ -282,9 +273,6 @@ async def request_password_reset(
             detail="X-Tenant-Id header is required"
         )
 
-    # Connect Prisma
-    await auth_service.prisma.connect()
-
     try:
         reset_token = await auth_service.request_password_reset(
             email=data.email,
@@ -313,16 +301,11 @@ async def request_password_reset(
         logger.error(f"Password reset request error: {str(e)}")
         # Don't reveal errors for security
         return {"message": "Password reset instructions sent to your email"}
-    finally:
-        await auth_service.prisma.disconnect()
 
 
 @router.post("/reset-password")
 async def reset_password(data: PasswordReset):
     """Reset password with reset token"""
-    # Connect Prisma
-    await auth_service.prisma.connect()
-
     try:
         success = await auth_service.reset_password(
             reset_token=data.reset_token,
@@ -337,14 +320,20 @@ async def reset_password(data: PasswordReset):
 
         return {"message": "Password reset successfully"}
 
+    except PasswordHasherBusy:
+        raise _password_hasher_busy()
     except Exception as e:
         logger.error(f"Password reset error: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Password reset failed"
         )
-    finally:
-        await auth_service.prisma.disconnect()
+
+
+@router.get("/password-hash/stats")
+async def get_password_hash_stats(current_user=Depends(get_current_user)):
+    """Get cost and load metrics of password hashing"""
+    return auth_service.password_hasher.stats()
 
 
 @router.get("/me", response_model=UserResponse)
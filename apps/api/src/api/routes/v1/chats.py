@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
-from typing import List
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
 from api.schemas.chat import (
     ChatSessionCreate,
     ChatSessionResponse,
@@ -8,47 +10,41 @@ from api.schemas.chat import (
     ChatCompletionRequest,
     ChatCompletionResponse,
 )
-from api.services.retriever import DocumentRetriever
-from api.services.llm_service import LLMService
-from api.services.auth import AuthService
+from api.services.access import AccessResolver, get_access
+from api.services.conversation_memory import ConversationMemory
+from api.services.retriever import get_retriever
+from api.services.llm_cache import ResponseCachePolicy
+from api.services.llm_service import ERROR_ANSWER, LLMService
+from api.services.auth import get_auth_service
 from api.services.auth import get_current_user
+from api.services.auth import get_current_admin
+from api.core.config import settings
+from api.core.timing import StageTimer
+from collections import Counter
+import asyncio
+import json
+import logging
 import time
+import uuid
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
-retriever = DocumentRetriever()
+retriever = get_retriever()
 llm_service = LLMService()
-auth_service = AuthService()
+conversation_memory = ConversationMemory(llm_service)
+auth_service = get_auth_service()
 
 
 @router.post("/sessions", response_model=ChatSessionResponse)
 async def create_chat_session(
     data: ChatSessionCreate,
     current_user=Depends(get_current_user),
+    access: AccessResolver = Depends(get_access),
     request: Request = None,
 ):
     """Create a new chat session"""
-    tenant_id = request.state.tenant_id
-
-    # Get the agent with project info
-    agent = await request.state.prisma.agent.find_unique(
-        where={"id": data.agent_id}, include={"project": True}
-    )
-
-    if not agent or agent.deleted_at:
-        raise HTTPException(status_code=404, detail="Agent not found")
-
-    # Check if user has access to the project
-    project = await request.state.prisma.project.find_first(
-        where={
-            "id": agent.project_id,
-            "tenant_id": tenant_id,
-            "deleted_at": None,
-        },
-        include={"users": {"where": {"user_id": current_user.id}}},
-    )
-
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    # Check the agent exists and the user has access to its project
+    await access.agent(data.agent_id)
 
     # Create the chat session
     current_time = int(time.time())
@@ -73,31 +69,12 @@ async def create_chat_session(
 async def get_chat_sessions(
     agent_id: str,
     current_user=Depends(get_current_user),
+    access: AccessResolver = Depends(get_access),
     request: Request = None,  # noqa: F821
 ):
     """Get all chat sessions for an agent"""
-    tenant_id = request.state.tenant_id
-
-    # Get the agent with project info
-    agent = await request.state.prisma.agent.find_unique(
-        where={"id": agent_id}, include={"project": True}
-    )
-
-    if not agent or agent.deleted_at:
-        raise HTTPException(status_code=404, detail="Agent not found")
-
-    # Check if user has access to the project
-    project = await request.state.prisma.project.find_first(
-        where={
-            "id": agent.project_id,
-            "tenant_id": tenant_id,
-            "deleted_at": None,
-        },
-        include={"users": {"where": {"user_id": current_user.id}}},
-    )
-
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    # Check the agent exists and the user has access to its project
+    await access.agent(agent_id)
 
     # Get all chat sessions for the agent and user
     sessions = await request.state.prisma.chat_session.find_many(
@@ -116,38 +93,12 @@ async def get_chat_sessions(
 async def get_chat_messages(
     session_id: str,
     current_user=Depends(get_current_user),
+    access: AccessResolver = Depends(get_access),
     request: Request = None,  # noqa: F821
 ):
     """Get all messages for a chat session"""
-    tenant_id = request.state.tenant_id
-
-    # Get the chat session with agent and project info
-    session = await request.state.prisma.chat_session.find_unique(
-        where={
-            "id": session_id,
-        },
-        include={"agent": {"include": {"project": True}}},
-    )
-
-    if not session or session.deleted_at:
-        raise HTTPException(status_code=404, detail="Chat session not found")
-
-    # Check if user owns the session
-    if session.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
-    # Check if user has access to the project
-    project = await request.state.prisma.project.find_first(
-        where={
-            "id": session.agent.project_id,
-            "tenant_id": tenant_id,
-            "deleted_at": None,
-        },
-        include={"users": {"where": {"user_id": current_user.id}}},
-    )
-
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    # Check the user owns the session and has access to its project
+    await access.chat_session(session_id)
 
     # Get all messages for the chat session
     messages = await request.state.prisma.chat_message.find_many(
@@ -163,38 +114,12 @@ async def create_chat_message(
     session_id: str,
     data: ChatMessageCreate,
     current_user=Depends(get_current_user),
+    access: AccessResolver = Depends(get_access),
     request: Request = None,
 ):
     """Create a new chat message"""
-    tenant_id = request.state.tenant_id
-
-    # Get the chat session with agent and project info
-    session = await request.state.prisma.chat_session.find_unique(
-        where={
-            "id": session_id,
-        },
-        include={"agent": {"include": {"project": True}}},
-    )
-
-    if not session or session.deleted_at:
-        raise HTTPException(status_code=404, detail="Chat session not found")
-
-    # Check if user owns the session
-    if session.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
-    # Check if user has access to the project
-    project = await request.state.prisma.project.find_first(
-        where={
-            "id": session.agent.project_id,
-            "tenant_id": tenant_id,
-            "deleted_at": None,
-        },
-        include={"users": {"where": {"user_id": current_user.id}}},
-    )
-
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    # Check the user owns the session and has access to its project
+    await access.chat_session(session_id)
 
     # Create the message
     current_time = int(time.time())
@@ -215,86 +140,286 @@ async def create_chat_message(
     return message
 
 
-@router.post("/completion", response_model=ChatCompletionResponse)
-async def chat_completion(
+@dataclass
+class CompletionContext:
+    """Everything gathered before calling the LLM for a completion"""
+
+    conversation_history: List[Dict[str, str]]
+    conversation_summary: Optional[str]
+    context_chunks: List[Dict[str, Any]]
+    query_embedding: Any
+    cache_policy: Optional[ResponseCachePolicy]
+
+
+async def _prepare_completion(
     data: ChatCompletionRequest,
-    current_user=Depends(get_current_user),
-    request: Request = None,
-):
-    """Get a chat completion"""
-    tenant_id = request.state.tenant_id
+    access: AccessResolver,
+    timer: StageTimer,
+) -> CompletionContext:
+    """Check access to the session and gather the conversation history
+    and retrieved context for a completion.
+
+    Once the session is loaded, the history fetch and retrieval run
+    concurrently; retrieval embeds the query in a worker thread while
+    the project's chunk matrix loads.
+    """
+    # Get the chat session, checking ownership and project access
+    with timer.stage("session"):
+        session = await access.chat_session(data.chat_session_id)
+
+    project_id = session.agent.project_id
+
+    async def load_history():
+        # Get the messages the summary doesn't cover yet
+        with timer.stage("history"):
+            return await conversation_memory.load_history(session)
+
+    async def embed_query():
+        # Embed the query once, for retrieval and the response cache
+        with timer.stage("embed"):
+            return await asyncio.to_thread(
+                retriever.encode_query, data.message
+            )
+
+    async def load_matrix():
+        with timer.stage("matrix"):
+            await retriever.get_project_matrix(project_id)
+
+    async def retrieve():
+        query_embedding, _ = await asyncio.gather(
+            embed_query(), load_matrix()
+        )
+
+        # Retrieve relevant document chunks
+        with timer.stage("retrieve"):
+            context_chunks = await retriever.retrieve(
+                query=data.message,
+                project_id=project_id,
+                top_k=5,
+                query_embedding=query_embedding,
+            )
+        return query_embedding, context_chunks
+
+    conversation_history, (query_embedding, context_chunks) = (
+        await asyncio.gather(load_history(), retrieve())
+    )
 
-    # Get the chat session with agent and project info
-    session = await request.state.prisma.chat_session.find_unique(
-        where={"id": data.chat_session_id},
-        include={"agent": {"include": {"project": True}}},
+    return CompletionContext(
+        conversation_history=conversation_history,
+        conversation_summary=conversation_memory.summary_of(session),
+        context_chunks=context_chunks,
+        query_embedding=query_embedding,
+        cache_policy=ResponseCachePolicy.for_agent(session.agent),
     )
 
-    if not session or session.deleted_at:
-        raise HTTPException(status_code=404, detail="Chat session not found")
 
-    # Check if user owns the session
-    if session.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Unauthorized")
+# Pending trailing writes, kept referenced until they finish
+_pending_writes: Set[asyncio.Task] = set()
+# Outcomes of the trailing writes; a failed one is an answer the client
+# saw but that was never stored
+write_metrics: Counter = Counter()
 
-    # Check if user has access to the project
-    project = await request.state.prisma.project.find_first(
-        where={
-            "id": session.agent.project_id,
-            "tenant_id": tenant_id,
-            "deleted_at": None,
-        },
-        include={"users": {"where": {"user_id": current_user.id}}},
-    )
 
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+def _save_assistant_message(
+    data: ChatCompletionRequest, answer: str, current_user, request: Request
+) -> ChatMessageResponse:
+    """Store the assistant's answer and touch the session.
 
-    # Get conversation history
-    chat_messages = await request.state.prisma.chat_message.find_many(
-        where={"chat_session_id": data.chat_session_id, "deleted_at": None},
-        order_by={"created_at": "asc"},
-        take=10,  # Limit to last 10 messages
+    The message id is generated here so the response can be returned
+    right away; the insert and the session update are sent as one
+    batched write in the background.
+    """
+    current_time = int(time.time())
+    assistant_message = ChatMessageResponse(
+        id=str(uuid.uuid4()),
+        chat_session_id=data.chat_session_id,
+        role="assistant",
+        content=answer,
+        created_at=current_time,
     )
 
-    # Format conversation history for the LLM
-    conversation_history = [
-        {"role": msg.role, "content": msg.content} for msg in chat_messages
-    ]
-
-    # Retrieve relevant document chunks
-    context_chunks = await retriever.retrieve(
-        query=data.message, project_id=project.id, top_k=5
+    task = asyncio.create_task(
+        _write_assistant_message(
+            request.state.prisma, assistant_message, current_user.id
+        )
     )
+    _pending_writes.add(task)
+    task.add_done_callback(_pending_writes.discard)
+
+    return assistant_message
+
+
+async def _write_assistant_message(
+    prisma, message: ChatMessageResponse, user_id: str
+) -> None:
+    """Insert the assistant message and update the session in a single
+    transaction"""
+    try:
+        async with prisma.batch_() as batcher:
+            batcher.chat_message.create(
+                data={
+                    "id": message.id,
+                    "chat_session_id": message.chat_session_id,
+                    "role": message.role,
+                    "content": message.content,
+                    "created_at": message.created_at,
+                    "updated_at": message.created_at,
+                    "created_by": user_id,
+                    "updated_by": user_id,
+                }
+            )
+
+            # Update session timestamp
+            batcher.chat_session.update(
+                where={"id": message.chat_session_id},
+                data={"updated_at": message.created_at, "updated_by": user_id},
+            )
+    except Exception as e:
+        write_metrics["failed"] += 1
+        logger.error(
+            f"Lost assistant message {message.id} of chat session "
+            f"{message.chat_session_id}, {write_metrics['failed']} lost "
+            f"since startup: {str(e)}"
+        )
+        return
+
+    write_metrics["written"] += 1
+
+    # Fold messages that left the history window into the summary
+    conversation_memory.schedule_update(message.chat_session_id)
+
+
+async def drain_background_writes(
+    timeout: float = settings.CHAT_SHUTDOWN_DRAIN_SECONDS,
+) -> None:
+    """Wait for pending assistant message writes, then for the summary
+    updates they start, for at most `timeout` seconds in total.
+
+    Called on shutdown before the database is disconnected.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    if _pending_writes:
+        _, pending = await asyncio.wait(set(_pending_writes), timeout=timeout)
+        if pending:
+            logger.error(
+                f"{len(pending)} assistant messages were not saved before "
+                "shutdown"
+            )
+    await conversation_memory.drain(max(0.0, deadline - loop.time()))
+
+
+def _sse_event(event: str, data: Any) -> str:
+    """Format a Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/completion", response_model=ChatCompletionResponse)
+async def chat_completion(
+    data: ChatCompletionRequest,
+    current_user=Depends(get_current_user),
+    access: AccessResolver = Depends(get_access),
+    request: Request = None,
+    response: Response = None,
+):
+    """Get a chat completion"""
+    timer = StageTimer()
+    context = await _prepare_completion(data, access, timer)
 
     # Generate response using LLM
-    llm_response = await llm_service.generate_response(
-        query=data.message,
-        context_chunks=context_chunks,
-        conversation_history=conversation_history,
-    )
+    with timer.stage("llm"):
+        llm_response = await llm_service.generate_response(
+            query=data.message,
+            context_chunks=context.context_chunks,
+            conversation_history=context.conversation_history,
+            cache_policy=context.cache_policy,
+            query_embedding=context.query_embedding,
+            conversation_summary=context.conversation_summary,
+        )
 
     # Create the assistant message
-    current_time = int(time.time())
-    assistant_message = await request.state.prisma.chat_message.create(
-        {
-            "data": {
-                "chat_session_id": data.chat_session_id,
-                "role": "assistant",
-                "content": llm_response["answer"],
-                "created_at": current_time,
-                "updated_at": current_time,
-                "created_by": current_user.id,
-                "updated_by": current_user.id,
-            }
-        }
+    assistant_message = _save_assistant_message(
+        data, llm_response["answer"], current_user, request
     )
 
-    # Update session timestamp
-    await request.state.prisma.chat_session.update(
-        where={"id": data.chat_session_id},
-        data={"updated_at": current_time, "updated_by": current_user.id},
-    )
+    timer.log("Chat completion")
+    response.headers["Server-Timing"] = timer.server_timing()
 
     # Return the response with sources
     return {"message": assistant_message, "sources": llm_response["sources"]}
+
+
+@router.post("/completion/stream")
+async def chat_completion_stream(
+    data: ChatCompletionRequest,
+    current_user=Depends(get_current_user),
+    access: AccessResolver = Depends(get_access),
+    request: Request = None,
+):
+    """Stream a chat completion as Server-Sent Events.
+
+    Emits a `sources` event as soon as retrieval finishes, a `delta`
+    event per chunk of generated text, and a final `done` event with
+    the stored assistant message (or an `error` event).
+    """
+    timer = StageTimer()
+    context = await _prepare_completion(data, access, timer)
+
+    # Pack up front so the sources sent first are the ones the prompt
+    # uses. stream_response() takes them as they are.
+    context.context_chunks, context.conversation_history = llm_service.pack(
+        data.message,
+        context.context_chunks,
+        context.conversation_history,
+        context.conversation_summary,
+    )
+
+    # Headers go out before generation starts, so they only carry the
+    # preparation stages
+    headers = {
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+        "Server-Timing": timer.server_timing(),
+    }
+
+    async def event_stream() -> AsyncIterator[str]:
+        yield _sse_event(
+            "sources", llm_service.format_sources(context.context_chunks)
+        )
+
+        parts = []
+        try:
+            with timer.stage("llm"):
+                async for delta in llm_service.stream_response(
+                    query=data.message,
+                    context_chunks=context.context_chunks,
+                    conversation_history=context.conversation_history,
+                    cache_policy=context.cache_policy,
+                    query_embedding=context.query_embedding,
+                    conversation_summary=context.conversation_summary,
+                ):
+                    parts.append(delta)
+                    yield _sse_event("delta", {"content": delta})
+        except Exception as e:
+            logger.error(f"Error streaming response: {str(e)}")
+            yield _sse_event("error", {"detail": ERROR_ANSWER.strip()})
+            return
+
+        assistant_message = _save_assistant_message(
+            data, "".join(parts), current_user, request
+        )
+        timer.log("Chat completion stream")
+        yield _sse_event("done", {"message": assistant_message.model_dump()})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers=headers,
+    )
+
+
+@router.get("/cache/stats", response_model=Dict[str, Any])
+async def get_cache_stats(current_user=Depends(get_current_admin)):
+    """Get hit metrics for the LLM response cache, which is shared by
+    every tenant"""
+    return llm_service.cache.stats()
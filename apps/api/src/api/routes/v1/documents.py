@@ -8,9 +8,17 @@ from fastapi import (
     Request,
 )
 from typing import List, Dict, Any
-from api.schemas.document import DocumentResponse, DocumentURLUpload
+from api.core.config import settings
+from api.schemas.document import (
+    BatchRetrievalRequest,
+    BatchRetrievalResponse,
+    DocumentResponse,
+    DocumentURLUpload,
+)
 from api.services.document_processor import DocumentProcessor
-from api.services.auth import AuthService
+from api.services.retriever import RetrievalQuery, get_retriever
+from api.services.access import AccessResolver, get_access
+from api.services.auth import get_auth_service
 from api.services.auth import get_current_user
 import tempfile
 import csv
@@ -19,30 +27,19 @@ import io
 
 router = APIRouter()
 document_processor = DocumentProcessor()
-auth_service = AuthService()
+retriever = get_retriever()
+auth_service = get_auth_service()
 
 
 @router.post("/upload-url", response_model=Dict[str, Any])
 async def upload_url(
     data: DocumentURLUpload,
     current_user=Depends(get_current_user),
-    request: Request = None,
+    access: AccessResolver = Depends(get_access),
 ):
     """Upload a document from a URL"""
-    tenant_id = request.state.tenant_id
-
     # Check if user has access to the project
-    project = await request.state.prisma.project.find_first(
-        where={
-            "id": data.project_id,
-            "tenant_id": tenant_id,
-            "deleted_at": None,
-        },
-        include={"users": {"where": {"user_id": current_user.id}}},
-    )
-
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    await access.project(data.project_id)
 
     # Process the URL
     result = await document_processor.process_url(
@@ -57,19 +54,11 @@ async def upload_file(
     project_id: str = Form(...),
     file: UploadFile = File(...),
     current_user=Depends(get_current_user),
-    request: Request = None,
+    access: AccessResolver = Depends(get_access),
 ):
     """Upload a document file"""
-    tenant_id = request.state.tenant_id
-
     # Check if user has access to the project
-    project = await request.state.prisma.project.find_first(
-        where={"id": project_id, "tenant_id": tenant_id, "deleted_at": None},
-        include={"users": {"where": {"user_id": current_user.id}}},
-    )
-
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    await access.project(project_id)
 
     # Save file to temp location
     file_content = await file.read()
@@ -94,19 +83,11 @@ async def upload_csv_data(
     project_id: str = Form(...),
     file: UploadFile = File(...),
     current_user=Depends(get_current_user),
-    request: Request = None,
+    access: AccessResolver = Depends(get_access),
 ):
     """Upload and process raw CSV data for RAG"""
-    tenant_id = request.state.tenant_id
-
     # Check if user has access to the project
-    project = await request.state.prisma.project.find_first(
-        where={"id": project_id, "tenant_id": tenant_id, "deleted_at": None},
-        include={"users": {"where": {"user_id": current_user.id}}},
-    )
-
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    await access.project(project_id)
 
     # Read and parse CSV data
     file_content = await file.read()
@@ -123,23 +104,45 @@ async def upload_csv_data(
     return result
 
 
+@router.post("/retrieve/batch", response_model=BatchRetrievalResponse)
+async def retrieve_batch(
+    data: BatchRetrievalRequest,
+    access: AccessResolver = Depends(get_access),
+):
+    """Retrieve relevant chunks for many queries, possibly across projects"""
+    if len(data.queries) > settings.RETRIEVAL_MAX_BATCH_QUERIES:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                "Too many queries, the maximum is "
+                f"{settings.RETRIEVAL_MAX_BATCH_QUERIES}"
+            ),
+        )
+
+    # Check the user has access to every project in one query
+    await access.projects({q.project_id for q in data.queries})
+
+    results = await retriever.retrieve_batch(
+        [
+            RetrievalQuery(
+                query=q.query, project_id=q.project_id, top_k=q.top_k
+            )
+            for q in data.queries
+        ]
+    )
+
+    return {"results": results}
+
+
 @router.get("/{project_id}", response_model=List[DocumentResponse])
 async def get_documents(
     project_id: str,
-    current_user=Depends(get_current_user),
+    access: AccessResolver = Depends(get_access),
     request: Request = None,  # noqa: F821
 ):
     """Get all documents for a project"""
-    tenant_id = request.state.tenant_id
-
     # Check if user has access to the project
-    project = await request.state.prisma.project.find_first(
-        where={"id": project_id, "tenant_id": tenant_id, "deleted_at": None},
-        include={"users": {"where": {"user_id": current_user.id}}},
-    )
-
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    await access.project(project_id)
 
     # Get all documents for the project
     documents = await request.state.prisma.document.find_many(
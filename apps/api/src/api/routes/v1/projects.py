@@ -1,13 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
 from typing import List
 from api.schemas.project import ProjectCreate, ProjectResponse
-from api.services.auth import AuthService
+from api.services.access import get_access_cache
+from api.services.auth import get_auth_service
 from api.services.auth import get_current_user
 import time
 
 router = APIRouter()
 
-auth_service = AuthService()
+auth_service = get_auth_service()
 
 
 @router.post("/", response_model=ProjectResponse)
@@ -45,6 +46,9 @@ async def create_project(
         }
     )
 
+    # The creator is the owner, so their first access needs no lookup
+    get_access_cache().grant(current_user.id, tenant_id, project.id)
+
     return project
 
 
@@ -1,12 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
 from typing import List
 from api.schemas.auth import UserResponse
-from api.services.auth import AuthService
+from api.services.auth import get_auth_service
 from api.services.auth import get_current_user
 import time
 
 router = APIRouter()
-auth_service = AuthService()
+auth_service = get_auth_service()
 
 
 @router.post("/", response_model=UserResponse)
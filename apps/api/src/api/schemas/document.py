@@ -1,5 +1,5 @@
-from pydantic import BaseModel, HttpUrl
-from typing import Optional, Any, Dict
+from pydantic import BaseModel, Field, HttpUrl
+from typing import Optional, Any, Dict, List
 
 
 class DocumentBase(BaseModel):
@@ -34,3 +34,17 @@ class DocumentChunkResponse(BaseModel):
     content: str
     metadata: Dict[str, Any]
     created_at: int
+
+
+class RetrievalQueryRequest(BaseModel):
+    query: str
+    project_id: str
+    top_k: int = Field(default=5, ge=1, le=100)
+
+
+class BatchRetrievalRequest(BaseModel):
+    queries: List[RetrievalQueryRequest]
+
+
+class BatchRetrievalResponse(BaseModel):
+    results: List[List[Dict[str, Any]]]
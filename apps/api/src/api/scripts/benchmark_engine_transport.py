@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Query engine transport latency benchmark.
+
+Times small requests to the query engine over each transport: TCP with
+the client defaults, TCP with a tuned keep-alive pool, HTTP/2 with
+prior knowledge and a Unix domain socket. Most of our queries are tiny,
+so their latency is dominated by the transport.
+
+By default requests go to a stub engine that answers every request
+with a small result, which isolates the client side of the transport.
+The stub runs in its own process and only speaks HTTP/1.1, so HTTP/2
+is skipped. With `--engine` a real query engine is started per
+transport and `find_first()` is timed, which needs DATABASE_URL, the
+engine binary and, for HTTP/2, the h2 package.
+
+Usage:
+    python -m api.scripts.benchmark_engine_transport --requests 5000
+    python -m api.scripts.benchmark_engine_transport --engine --concurrency 16
+    python -m api.scripts.benchmark_engine_transport --output bench.json
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+from db.client import Prisma
+from db.client._async_http import AsyncHTTP
+from db.client.engine.utils import get_open_port
+from db.client.types import HttpConfig
+
+TRANSPORTS: Dict[str, HttpConfig] = {
+    "tcp": {},
+    "tcp_keepalive": {
+        "limits": httpx.Limits(
+            max_connections=1000,
+            max_keepalive_connections=100,
+            keepalive_expiry=60.0,
+        ),
+    },
+    "http2": {"http1": False, "http2": True},
+    "uds": {"unix_socket": True},
+}
+
+STUB_RESPONSE = json.dumps(
+    {"data": {"result": {"id": "tenant", "name": "Tenant"}}}
+).encode("utf-8")
+
+
+async def handle_stub_connection(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    """Answer every HTTP/1.1 request on a keep-alive connection"""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                name, _, value = line.partition(b":")
+                if name.lower() == b"content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"content-type: application/json\r\n"
+                b"content-length: %d\r\n\r\n%s"
+                % (len(STUB_RESPONSE), STUB_RESPONSE)
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve_stub(port: Optional[int], path: Optional[str]) -> None:
+    """Serve the stub engine on a TCP port or a Unix domain socket"""
+    if path is not None:
+        server = await asyncio.start_unix_server(
+            handle_stub_connection, path
+        )
+    else:
+        server = await asyncio.start_server(
+            handle_stub_connection, "127.0.0.1", port
+        )
+    async with server:
+        await server.serve_forever()
+
+
+def run_stub_process(port: Optional[int], path: Optional[str]) -> None:
+    """Entry point of the stub engine process"""
+    asyncio.run(serve_stub(port, path))
+
+
+async def measure(
+    query: Callable[[], Awaitable[Any]], requests: int, concurrency: int
+) -> Dict[str, float]:
+    """Run the query from concurrent workers and summarize latencies"""
+    latencies: List[float] = []
+
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            started_at = time.perf_counter()
+            await query()
+            latencies.append(time.perf_counter() - started_at)
+
+    # warm up the connection pool
+    await asyncio.gather(*(query() for _ in range(concurrency)))
+
+    started_at = time.perf_counter()
+    await asyncio.gather(
+        *(worker(requests // concurrency) for _ in range(concurrency))
+    )
+    elapsed = time.perf_counter() - started_at
+
+    latencies_us = np.array(latencies) * 1_000_000
+    return {
+        "p50_us": float(np.percentile(latencies_us, 50)),
+        "p99_us": float(np.percentile(latencies_us, 99)),
+        "requests_per_second": len(latencies) / elapsed,
+    }
+
+
+async def run_stub(
+    name: str, config: HttpConfig, requests: int, concurrency: int
+) -> Dict[str, Any]:
+    """Time requests to the stub engine over one transport"""
+    kwargs: Dict[str, Any] = dict(config)
+    socket_dir = None
+    port = None
+    path = None
+    if kwargs.pop("unix_socket", False):
+        socket_dir = tempfile.mkdtemp(prefix="prisma-benchmark-")
+        path = kwargs["uds"] = os.path.join(socket_dir, "engine.sock")
+        url = "http://localhost/"
+    else:
+        port = get_open_port()
+        url = f"http://localhost:{port}/"
+
+    process = multiprocessing.Process(
+        target=run_stub_process, args=(port, path), daemon=True
+    )
+    process.start()
+    http = AsyncHTTP(**kwargs)
+
+    async def query() -> Any:
+        response = await http.request("POST", url, content=b"{}")
+        return await response.json()
+
+    try:
+        # wait for the stub to start listening
+        for _ in range(100):
+            try:
+                await query()
+                break
+            except httpx.TransportError:
+                await asyncio.sleep(0.05)
+
+        return {"transport": name, **await measure(
+            query, requests, concurrency
+        )}
+    finally:
+        await http.close()
+        process.terminate()
+        process.join()
+        if socket_dir is not None:
+            shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+async def run_engine(
+    name: str, config: HttpConfig, requests: int, concurrency: int
+) -> Dict[str, Any]:
+    """Time small queries to a real query engine over one transport"""
+    prisma = Prisma(http=config)
+    await prisma.connect()
+
+    async def query() -> Any:
+        return await prisma.tenant.find_first()
+
+    try:
+        return {"transport": name, **await measure(
+            query, requests, concurrency
+        )}
+    finally:
+        await prisma.disconnect()
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Benchmark every selected transport"""
+    results = []
+    for name, config in TRANSPORTS.items():
+        if args.transports and name not in args.transports:
+            continue
+
+        if config.get("http2") and not args.engine:
+            print(f"{name:>14}: skipped, the stub engine only speaks HTTP/1.1")
+            continue
+
+        runner = run_engine if args.engine else run_stub
+        try:
+            result = await runner(
+                name, config, args.requests, args.concurrency
+            )
+        except ImportError as exc:
+            print(f"{name:>14}: skipped, {exc}")
+            continue
+
+        print(
+            f"{name:>14}: p50 {result['p50_us']:8.1f} us  "
+            f"p99 {result['p99_us']:8.1f} us  "
+            f"{result['requests_per_second']:8.0f} req/s"
+        )
+        results.append(result)
+    return results
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Benchmark query engine transports'
+    )
+    parser.add_argument(
+        '--requests',
+        type=int,
+        default=2000,
+        help='Requests per transport'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=1,
+        help='Concurrent workers sending requests'
+    )
+    parser.add_argument(
+        '--transports',
+        nargs='+',
+        choices=list(TRANSPORTS),
+        help='Only benchmark these transports'
+    )
+    parser.add_argument(
+        '--engine',
+        action='store_true',
+        help='Query a real query engine instead of the stub'
+    )
+    parser.add_argument('--output', help='Write results as JSON to this file')
+
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
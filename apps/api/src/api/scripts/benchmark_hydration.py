@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Query result hydration benchmark.
+
+Turns synthetic query engine results into Prisma models with full
+validation and with trusted hydration, checks that both produce the same
+models and reports the time per row for each. Trusted hydration pays off
+for wide rows such as embeddings, Pydantic's compiled validators are
+faster for small rows with many dates and Json fields.
+
+Usage:
+    python -m api.scripts.benchmark_hydration --rows 10000
+    python -m api.scripts.benchmark_hydration --output bench.json
+"""
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from api.core.config import settings
+from db.client import hydration, models
+from db.client._hydration import hydrate
+
+TIMESTAMP = "2024-05-01T12:30:45.123Z"
+
+
+def agent_row(i: int) -> Dict[str, Any]:
+    """An agent as returned by the query engine"""
+    return {
+        "id": f"agent-{i}",
+        "name": f"Agent {i}",
+        "description": None,
+        "type": "ASSISTANT",
+        "prompt": "You are a helpful assistant",
+        "temperature": 1,
+        "maxTokens": 1024,
+        "topP": 0.9,
+        "frequencyPenalty": None,
+        "presencePenalty": None,
+        "stopSequence": ["\n\n"],
+        "stopSequenceTokens": [],
+        "config": json.dumps({"tools": ["search"], "retries": i % 3}),
+        "tenantId": "tenant",
+        "createdAt": TIMESTAMP,
+        "updatedAt": TIMESTAMP,
+        "deleted": False,
+        "deletedAt": None,
+    }
+
+
+def user_row(i: int) -> Dict[str, Any]:
+    """A user including its sessions, as returned by the query engine"""
+    return {
+        "id": f"user-{i}",
+        "email": f"user-{i}@example.com",
+        "emailVerified": TIMESTAMP,
+        "firstName": "Ada",
+        "lastName": "Lovelace",
+        "imageUrl": None,
+        "passwordHash": "$2b$12$" + "x" * 53,
+        "roleId": "role",
+        "tenantId": "tenant",
+        "createdAt": TIMESTAMP,
+        "updatedAt": TIMESTAMP,
+        "deleted": False,
+        "deletedAt": None,
+        "sessions": [
+            {
+                "id": f"session-{i}-{j}",
+                "userId": f"user-{i}",
+                "token": "token",
+                "expiresAt": TIMESTAMP,
+                "ipAddress": None,
+                "userAgent": None,
+                "createdAt": TIMESTAMP,
+                "updatedAt": TIMESTAMP,
+                "deleted": False,
+                "deletedAt": None,
+            }
+            for j in range(3)
+        ],
+    }
+
+
+def candidate_row(i: int) -> Dict[str, Any]:
+    """A candidate carrying an embedding sized list"""
+    return {
+        "id": f"candidate-{i}",
+        "firstName": "Ada",
+        "lastName": "Lovelace",
+        "email": f"candidate-{i}@example.com",
+        "phone": None,
+        "resumeUrl": None,
+        "linkedinUrl": None,
+        "currentTitle": "Engineer",
+        "currentCompany": None,
+        "careerLevel": "SENIOR",
+        "yearsOfExperience": 10,
+        "educationLevel": "MASTER",
+        "skills": [f"skill-{j}" for j in range(settings.VECTOR_DIMENSION)],
+        "languages": ["en"],
+        "location": None,
+        "currentSalary": 100000.0,
+        "expectedSalary": None,
+        "currency": "USD",
+        "noticePeriod": 14,
+        "noticePeriodUnit": "days",
+        "visaStatus": None,
+        "immigrationStatus": None,
+        "immigrationCountry": None,
+        "status": "ACTIVE",
+        "source": "LINKEDIN",
+        "notes": None,
+        "tenantId": "tenant",
+        "createdAt": TIMESTAMP,
+        "updatedAt": TIMESTAMP,
+        "deleted": False,
+        "deletedAt": None,
+    }
+
+
+DATASETS: Dict[str, tuple] = {
+    "candidate_wide": (models.Candidate, candidate_row),
+    "agent": (models.Agent, agent_row),
+    "user_with_sessions": (models.User, user_row),
+}
+
+
+def time_hydration(
+    model: Any, rows: List[Dict[str, Any]], mode: str
+) -> float:
+    """Hydrate every row and return the elapsed seconds"""
+    with hydration(mode):
+        started_at = time.perf_counter()
+        for row in rows:
+            hydrate(model, row)
+        return time.perf_counter() - started_at
+
+
+def run_dataset(
+    name: str, model: Any, make_row: Callable[[int], Dict[str, Any]],
+    rows: int, repeats: int
+) -> Dict[str, Any]:
+    """Compare validated and trusted hydration for one dataset"""
+    data = [make_row(i) for i in range(rows)]
+
+    with hydration("validate"):
+        validated = hydrate(model, data[0])
+    with hydration("trusted"):
+        trusted = hydrate(model, data[0])
+    if validated.model_dump() != trusted.model_dump():
+        raise RuntimeError(f"Trusted hydration differs for {name}")
+
+    result: Dict[str, Any] = {"dataset": name, "rows": rows}
+    for mode in ("validate", "trusted"):
+        best = min(
+            time_hydration(model, data, mode) for _ in range(repeats)
+        )
+        result[f"{mode}_us_per_row"] = best / rows * 1_000_000
+    result["speedup"] = (
+        result["validate_us_per_row"] / result["trusted_us_per_row"]
+    )
+    return result
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Benchmark query result hydration'
+    )
+    parser.add_argument(
+        '--rows',
+        type=int,
+        default=5000,
+        help='Rows per dataset'
+    )
+    parser.add_argument(
+        '--repeats',
+        type=int,
+        default=3,
+        help='Runs per mode, the fastest is reported'
+    )
+    parser.add_argument('--output', help='Write results as JSON to this file')
+
+    args = parser.parse_args()
+
+    results = []
+    for name, (model, make_row) in DATASETS.items():
+        result = run_dataset(name, model, make_row, args.rows, args.repeats)
+        print(
+            f"{name:>18}: validate {result['validate_us_per_row']:7.1f} "
+            f"us/row  trusted {result['trusted_us_per_row']:7.1f} us/row  "
+            f"{result['speedup']:.1f}x"
+        )
+        results.append(result)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Query engine JSON codec benchmark.
+
+Encodes a large query payload (a batch of creates carrying embedding
+sized lists) and decodes a synthetic query engine response of embedding
+rows with every JSON codec that is installed, checks that each codec
+produces the same results as the standard library and reports the time
+per operation. The client uses the codec set by `PRISMA_JSON_CODEC`.
+
+Usage:
+    python -m api.scripts.benchmark_json_codec --rows 1000
+    python -m api.scripts.benchmark_json_codec --output bench.json
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from api.core.config import settings
+from db.client._builder import serializer
+from db.client._codec import CODECS, JSONCodec, create_codec
+
+
+def embedding(rng: np.random.Generator) -> List[float]:
+    """An embedding sized list of floats"""
+    return [float(value) for value in rng.random(settings.VECTOR_DIMENSION)]
+
+
+def query_payload(rows: int) -> Dict[str, Any]:
+    """A batch request as sent to the query engine"""
+    rng = np.random.default_rng(0)
+    created_at = datetime(2024, 5, 1, 12, 30, 45, tzinfo=timezone.utc)
+    return {
+        "batch": [
+            {
+                "query": "mutation { result: createOneDocumentChunk }",
+                "data": {
+                    "content": f"chunk {i} " * 20,
+                    "embedding": embedding(rng),
+                    "createdAt": created_at,
+                },
+            }
+            for i in range(rows)
+        ],
+        "transaction": True,
+    }
+
+
+def engine_response(rows: int) -> bytes:
+    """A find_many response as returned by the query engine"""
+    rng = np.random.default_rng(1)
+    return json.dumps({
+        "data": {
+            "result": [
+                {
+                    "id": f"chunk-{i}",
+                    "content": f"chunk {i} " * 20,
+                    "embedding": embedding(rng),
+                    "createdAt": "2024-05-01T12:30:45.123Z",
+                    "deleted": False,
+                }
+                for i in range(rows)
+            ]
+        }
+    }).encode("utf-8")
+
+
+def best_time(func: Callable[[], Any], repeats: int) -> float:
+    """Run the function and return the fastest elapsed seconds"""
+    timings = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+def run_codec(
+    codec: JSONCodec, payload: Dict[str, Any], response: bytes,
+    repeats: int
+) -> Dict[str, Any]:
+    """Time encoding the payload and decoding the response"""
+    reference = create_codec("stdlib")
+    encoded = codec.dumps(payload, default=serializer)
+    if json.loads(encoded) != json.loads(
+        reference.dumps(payload, default=serializer)
+    ):
+        raise RuntimeError(f"{codec.name} encodes the payload differently")
+    if codec.loads(response) != reference.loads(response):
+        raise RuntimeError(f"{codec.name} decodes the response differently")
+
+    encode = best_time(
+        lambda: codec.dumps(payload, default=serializer), repeats
+    )
+    decode = best_time(lambda: codec.loads(response), repeats)
+    return {
+        "codec": codec.name,
+        "encode_ms": encode * 1000,
+        "decode_ms": decode * 1000,
+        "encoded_bytes": len(encoded.encode("utf-8")),
+        "response_bytes": len(response),
+    }
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Benchmark JSON codecs for query engine traffic'
+    )
+    parser.add_argument(
+        '--rows',
+        type=int,
+        default=1000,
+        help='Rows in the query payload and the engine response'
+    )
+    parser.add_argument(
+        '--repeats',
+        type=int,
+        default=5,
+        help='Runs per codec, the fastest is reported'
+    )
+    parser.add_argument('--output', help='Write results as JSON to this file')
+
+    args = parser.parse_args()
+
+    payload = query_payload(args.rows)
+    response = engine_response(args.rows)
+
+    results = []
+    for name in CODECS:
+        try:
+            codec = create_codec(name)
+        except ImportError:
+            print(f"{name:>8}: not installed")
+            continue
+
+        result = run_codec(codec, payload, response, args.repeats)
+        print(
+            f"{name:>8}: encode {result['encode_ms']:8.1f} ms  "
+            f"decode {result['decode_ms']:8.1f} ms"
+        )
+        results.append(result)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Query builder rendering benchmark.
+
+Builds representative Prisma queries (a large `create` carrying an
+embedding sized list, a nested `include` and a big `in` filter) and
+reports how long rendering takes and how large the rendered query is,
+for both the compact queries sent to the engine and the pretty layout
+used for debugging. Compact queries are rendered from the template
+cached for their shape after the first build, as in the client.
+
+Usage:
+    python -m api.scripts.benchmark_query_builder --iterations 2000
+    python -m api.scripts.benchmark_query_builder --output bench.json
+"""
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from api.core.config import settings
+from db.client import models
+from db.client._builder import QueryBuilder
+from db.client.metadata import PRISMA_MODELS, RELATIONAL_FIELD_MAPPINGS
+
+
+def make_builder(
+    method: str, model: Any, arguments: Dict[str, Any]
+) -> QueryBuilder:
+    """Create a query builder the way the client does"""
+    return QueryBuilder(
+        method=method,
+        model=model,
+        arguments=arguments,
+        prisma_models=PRISMA_MODELS,
+        relational_field_mappings=RELATIONAL_FIELD_MAPPINGS,
+    )
+
+
+def large_create() -> QueryBuilder:
+    """A create carrying an embedding sized list of floats"""
+    embedding = np.random.default_rng(0).random(settings.VECTOR_DIMENSION)
+    return make_builder(
+        "create",
+        models.Candidate,
+        {
+            "data": {
+                "firstName": "Ada",
+                "lastName": "Lovelace",
+                "email": "ada@example.com",
+                "educationLevel": "MASTER",
+                "skills": [float(value) for value in embedding],
+                "languages": ["en", "fr"],
+                "tenant": {"connect": {"id": "benchmark-tenant"}},
+            }
+        },
+    )
+
+
+def nested_include() -> QueryBuilder:
+    """A find_many including relations two levels deep"""
+    return make_builder(
+        "find_many",
+        models.Tenant,
+        {
+            "where": {"deleted": False},
+            "include": {
+                "users": {
+                    "where": {"deleted": False},
+                    "include": {"sessions": {"where": {"deleted": False}}},
+                },
+                "projects": {"include": {"user": True}},
+                "agents": {"include": {"conversations": True}},
+            },
+        },
+    )
+
+
+def big_in_list() -> QueryBuilder:
+    """A find_many filtering on a thousand ids"""
+    return make_builder(
+        "find_many",
+        models.User,
+        {
+            "where": {
+                "id": {"in": [f"user-{i:08d}" for i in range(1000)]},
+                "deleted": False,
+            }
+        },
+    )
+
+
+QUERIES: Dict[str, Callable[[], QueryBuilder]] = {
+    "large_create": large_create,
+    "nested_include": nested_include,
+    "big_in_list": big_in_list,
+}
+
+
+def run_query(
+    name: str, factory: Callable[[], QueryBuilder], iterations: int
+) -> List[Dict[str, Any]]:
+    """Time building one query in both layouts"""
+    results = []
+    for pretty in (False, True):
+        builder = factory()
+        latencies = []
+        for _ in range(iterations):
+            started_at = time.perf_counter()
+            query = builder.build_query(pretty=pretty)
+            latencies.append(time.perf_counter() - started_at)
+
+        latencies_us = np.array(latencies) * 1_000_000
+        results.append({
+            "query": name,
+            "layout": "pretty" if pretty else "compact",
+            "iterations": iterations,
+            "p50_us": float(np.percentile(latencies_us, 50)),
+            "p99_us": float(np.percentile(latencies_us, 99)),
+            "bytes": len(query.encode("utf-8")),
+        })
+    return results
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Benchmark query builder rendering'
+    )
+    parser.add_argument(
+        '--iterations',
+        type=int,
+        default=1000,
+        help='Builds per query and layout'
+    )
+    parser.add_argument('--output', help='Write results as JSON to this file')
+
+    args = parser.parse_args()
+
+    results = []
+    for name, factory in QUERIES.items():
+        for result in run_query(name, factory, args.iterations):
+            print(
+                f"{result['query']:>14} {result['layout']:>7}: "
+                f"p50 {result['p50_us']:8.1f} us  "
+                f"p99 {result['p99_us']:8.1f} us  "
+                f"{result['bytes']:7d} bytes"
+            )
+            results.append(result)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
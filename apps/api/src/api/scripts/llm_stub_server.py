@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the LLM provider's chat completions API.
+
+Point the API at it with `LLM_BASE_URL=http://localhost:8001/v1` to
+exercise LLMService (connection pooling, concurrency caps, timeouts)
+without calling the real provider.
+
+Usage:
+    python -m api.scripts.llm_stub_server --port 8001 --latency 0.5
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from typing import Any, AsyncIterator, Dict
+
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+app = FastAPI(title="LLM stub")
+
+# Seconds each completion takes, set from the command line
+app.state.latency = 0.0
+
+
+async def _stream_chunks(
+    completion_id: str, model: str, answer: str
+) -> AsyncIterator[str]:
+    """Send the answer word by word in the provider's SSE format"""
+    words = answer.split(" ")
+    for i, word in enumerate(words):
+        await asyncio.sleep(app.state.latency / len(words))
+        chunk = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "delta": {"content": word if i == 0 else f" {word}"},
+                    "finish_reason": None,
+                }
+            ],
+        }
+        yield f"data: {json.dumps(chunk)}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(body: Dict[str, Any]) -> Any:
+    """Answer with an echo of the last user message"""
+    messages = body.get("messages", [])
+    query = messages[-1]["content"] if messages else ""
+    answer = f"Stub answer to: {query}"
+    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+
+    if body.get("stream"):
+        return StreamingResponse(
+            _stream_chunks(completion_id, body.get("model", "stub"), answer),
+            media_type="text/event-stream",
+        )
+
+    await asyncio.sleep(app.state.latency)
+
+    return {
+        "id": completion_id,
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "stub"),
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": answer},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "total_tokens": 0,
+        },
+    }
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Run a stub LLM provider')
+    parser.add_argument('--host', default='127.0.0.1', help='Bind host')
+    parser.add_argument('--port', type=int, default=8001, help='Bind port')
+    parser.add_argument(
+        '--latency',
+        type=float,
+        default=0.0,
+        help='Seconds to wait before answering each completion'
+    )
+
+    args = parser.parse_args()
+
+    app.state.latency = args.latency
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
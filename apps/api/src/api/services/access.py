@@ -0,0 +1,257 @@
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple
+import logging
+import time
+
+from fastapi import Depends, HTTPException, Request
+
+from api.core.config import settings
+from api.services.auth import get_current_user
+
+logger = logging.getLogger(__name__)
+
+# (user_id, tenant_id, project_id)
+GrantKey = Tuple[str, str, str]
+
+
+class AccessGrantCache:
+    """Short-lived cache of project access grants shared across requests.
+
+    Only grants are cached, never denials, so a cached entry can at
+    worst outlive a revoked membership by `ttl_seconds`. Membership
+    changes should call one of the `invalidate_*` methods so the
+    current worker forgets the grant straight away.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = settings.ACCESS_CACHE_TTL_SECONDS,
+        max_entries: int = settings.ACCESS_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._grants: "OrderedDict[GrantKey, float]" = OrderedDict()
+
+    def has_grant(self, user_id: str, tenant_id: str, project_id: str) -> bool:
+        """Check for an unexpired grant"""
+        key = (user_id, tenant_id, project_id)
+        expires_at = self._grants.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._grants[key]
+            return False
+        return True
+
+    def grant(self, user_id: str, tenant_id: str, project_id: str) -> None:
+        """Remember that a user may access a project"""
+        key = (user_id, tenant_id, project_id)
+        self._grants[key] = time.monotonic() + self.ttl_seconds
+        self._grants.move_to_end(key)
+        while len(self._grants) > self.max_entries:
+            self._grants.popitem(last=False)
+
+    def invalidate(self, user_id: str, project_id: str) -> None:
+        """Forget a user's grants to a project"""
+        for key in [
+            k for k in self._grants if k[0] == user_id and k[2] == project_id
+        ]:
+            del self._grants[key]
+
+    def invalidate_project(self, project_id: str) -> None:
+        """Forget every grant to a project, e.g. when it is deleted"""
+        for key in [k for k in self._grants if k[2] == project_id]:
+            del self._grants[key]
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Forget every grant of a user, e.g. when they are removed from
+        a tenant"""
+        for key in [k for k in self._grants if k[0] == user_id]:
+            del self._grants[key]
+
+
+@lru_cache()
+def get_access_cache() -> AccessGrantCache:
+    """Get the process-wide access grant cache"""
+    return AccessGrantCache()
+
+
+def _member_filter(user_id: str) -> Dict[str, Any]:
+    """Include only the user's own, active project membership"""
+    return {"users": {"where": {"user_id": user_id, "deleted_at": None}}}
+
+
+class AccessResolver:
+    """Resolves project, agent and chat session access for one request.
+
+    Each lookup loads the whole ownership chain in a single query, and
+    results are memoised for the rest of the request. Project checks
+    are skipped entirely while the user's grant is cached.
+    """
+
+    def __init__(
+        self,
+        prisma: Any,
+        user_id: str,
+        tenant_id: str,
+        cache: Optional[AccessGrantCache] = None,
+    ):
+        self.prisma = prisma
+        self.user_id = user_id
+        self.tenant_id = tenant_id
+        self.cache = cache or get_access_cache()
+        self._memo: Dict[Tuple[str, str], Any] = {}
+
+    async def project(self, project_id: str) -> None:
+        """Check the user has access to a project.
+
+        Raises:
+            HTTPException: 404 if the project doesn't exist in the
+                tenant or the user is not a member.
+        """
+        if ("project", project_id) in self._memo or self.cache.has_grant(
+            self.user_id, self.tenant_id, project_id
+        ):
+            return
+
+        project = await self.prisma.project.find_first(
+            where={
+                "id": project_id,
+                "tenant_id": self.tenant_id,
+                "deleted_at": None,
+                "users": {
+                    "some": {"user_id": self.user_id, "deleted_at": None}
+                },
+            }
+        )
+
+        self._check_project(project, project_id)
+
+    async def projects(self, project_ids: Iterable[str]) -> None:
+        """Check the user has access to every project, loading the ones
+        without a cached grant in a single query.
+
+        Raises:
+            HTTPException: 404 if any of the projects is not found.
+        """
+        missing = [
+            project_id
+            for project_id in set(project_ids)
+            if ("project", project_id) not in self._memo
+            and not self.cache.has_grant(
+                self.user_id, self.tenant_id, project_id
+            )
+        ]
+        if not missing:
+            return
+
+        projects = await self.prisma.project.find_many(
+            where={
+                "id": {"in": missing},
+                "tenant_id": self.tenant_id,
+                "deleted_at": None,
+                "users": {
+                    "some": {"user_id": self.user_id, "deleted_at": None}
+                },
+            }
+        )
+
+        if len(projects) != len(missing):
+            raise HTTPException(status_code=404, detail="Project not found")
+
+        for project in projects:
+            self._check_project(project, project.id)
+
+    async def agent(self, agent_id: str) -> Any:
+        """Get an agent, with its project, the user has access to.
+
+        Raises:
+            HTTPException: 404 if the agent or its project is not found.
+        """
+        key = ("agent", agent_id)
+        if key in self._memo:
+            return self._memo[key]
+
+        agent = await self.prisma.agent.find_unique(
+            where={"id": agent_id},
+            include={"project": {"include": _member_filter(self.user_id)}},
+        )
+
+        if not agent or agent.deleted_at:
+            raise HTTPException(status_code=404, detail="Agent not found")
+
+        self._check_project(agent.project, agent.project_id)
+
+        self._memo[key] = agent
+        return agent
+
+    async def chat_session(self, chat_session_id: str) -> Any:
+        """Get a chat session, with its agent and project, owned by the
+        user.
+
+        Raises:
+            HTTPException: 404 if the session or its project is not
+                found, 403 if the session belongs to another user.
+        """
+        key = ("chat_session", chat_session_id)
+        if key in self._memo:
+            return self._memo[key]
+
+        session = await self.prisma.chat_session.find_unique(
+            where={"id": chat_session_id},
+            include={
+                "agent": {
+                    "include": {
+                        "project": {"include": _member_filter(self.user_id)}
+                    }
+                }
+            },
+        )
+
+        if not session or session.deleted_at:
+            raise HTTPException(
+                status_code=404, detail="Chat session not found"
+            )
+
+        # Check if user owns the session
+        if session.user_id != self.user_id:
+            raise HTTPException(status_code=403, detail="Unauthorized")
+
+        self._check_project(session.agent.project, session.agent.project_id)
+
+        self._memo[key] = session
+        return session
+
+    def _check_project(self, project: Any, project_id: str) -> None:
+        """Check a loaded project is live, in the tenant and has the user
+        as a member, then record the grant"""
+        if ("project", project_id) in self._memo or self.cache.has_grant(
+            self.user_id, self.tenant_id, project_id
+        ):
+            return
+
+        if (
+            not project
+            or project.deleted_at
+            or project.tenant_id != self.tenant_id
+            or (project.users is not None and not project.users)
+        ):
+            raise HTTPException(status_code=404, detail="Project not found")
+
+        self._memo[("project", project_id)] = project
+        self.cache.grant(self.user_id, self.tenant_id, project_id)
+
+
+async def get_access(
+    current_user=Depends(get_current_user),
+    request: Request = None,
+) -> AccessResolver:
+    """
+    Dependency to get the access resolver of the current request.
+    FastAPI caches it per request, so routes and their dependencies
+    share one memo.
+    """
+    return AccessResolver(
+        request.state.prisma, current_user.id, request.state.tenant_id
+    )
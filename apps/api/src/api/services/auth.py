@@ -1,12 +1,21 @@
 from datetime import datetime, timedelta
-from typing import Optional
-import bcrypt
+from functools import lru_cache
+from typing import Optional, Set
+import asyncio
 from jose import JWTError, jwt
 from db.client import Prisma
+from db.client.enums import UserRoleType
 from api.core.config import settings
+from api.db.prisma_client import get_prisma_client
+from api.services.password_hasher import get_password_hasher
+from api.services.revocation import get_revocation_filter, token_id
+from api.services.user_cache import get_user_cache
+import hashlib
 import secrets
+import time
+import uuid
 import logging
-from fastapi import Depends
+from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
 logger = logging.getLogger(__name__)
@@ -15,29 +24,45 @@ logger = logging.getLogger(__name__)
 class AuthService:
     """Service for handling authentication and user management"""
 
-    def __init__(self):
-        self.prisma = Prisma()
+    def __init__(self, prisma: Optional[Prisma] = None):
+        self.prisma = prisma or get_prisma_client()
         self.JWT_SECRET_KEY = settings.JWT_SECRET_KEY
         self.algorithm = "HS256"
         self.access_token_expire_minutes = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+        self.user_cache = get_user_cache()
+        self.revocations = get_revocation_filter()
+        self.stateless_tokens = settings.AUTH_STATELESS_TOKENS
+        self.password_hasher = get_password_hasher()
+        self._rehash_tasks: Set[asyncio.Task] = set()
 
     async def hash_password(self, password: str) -> str:
-        """Hash a password using bcrypt"""
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
+        """Hash a password using bcrypt, off the event loop"""
+        return await self.password_hasher.hash(password)
 
     async def verify_password(
         self,
         plain_password: str,
         hashed_password: str
     ) -> bool:
-        """Verify a password against its hash"""
-        return bcrypt.checkpw(
-            plain_password.encode('utf-8'),
-            hashed_password.encode('utf-8')
+        """Verify a password against its hash, off the event loop"""
+        return await self.password_hasher.verify(
+            plain_password, hashed_password
         )
 
+    async def rehash_password(self, user_id: str, password: str) -> None:
+        """Upgrade a user's password hash to the configured cost"""
+        try:
+            password_hash = await self.hash_password(password)
+            await self.prisma.user.update(
+                where={"id": user_id},
+                data={"passwordHash": password_hash}
+            )
+            self.password_hasher.metrics["rehashes"] += 1
+        except Exception as e:
+            logger.warning(
+                f"Error rehashing password of user {user_id}: {str(e)}"
+            )
+
     async def create_access_token(
         self,
         data: dict,
@@ -51,7 +76,8 @@ class AuthService:
             expire = datetime.utcnow() + timedelta(
                 minutes=self.access_token_expire_minutes
             )
-        to_encode.update({"exp": expire})
+        # A unique id lets the token be revoked without storing it
+        to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
         encoded_jwt = jwt.encode(
             to_encode, self.JWT_SECRET_KEY, algorithm=self.algorithm
         )
@@ -153,6 +179,14 @@ class AuthService:
         ):
             raise ValueError("Invalid email or password")
 
+        # Migrate hashes made with an old work factor, after the response
+        if self.password_hasher.needs_rehash(user.passwordHash):
+            task = asyncio.create_task(
+                self.rehash_password(user.id, password)
+            )
+            self._rehash_tasks.add(task)
+            task.add_done_callback(self._rehash_tasks.discard)
+
         # Create access token
         access_token = await self.create_access_token(
             data={"sub": user.id, "email": user.email, "tenant_id": tenant_id}
@@ -194,6 +228,7 @@ class AuthService:
             "data": {
                 "userId": user_id,
                 "token": token,
+                "tokenId": token_id(token),
                 "expiresAt": expires_at,
                 "ipAddress": ip_address,
                 "userAgent": user_agent,
@@ -213,17 +248,33 @@ class AuthService:
         if not user_id:
             return None
 
-        # Check if session exists and is valid
-        session = await self.prisma.usersession.find_first(
-            where={
-                "token": token,
-                "deleted": False,
-                "expiresAt": {"gt": datetime.utcnow()}
-            }
-        )
+        # Pick up sessions revoked by other workers, evicting them
+        # from the user cache
+        await self.revocations.sync(self.prisma)
+
+        if self.stateless_tokens:
+            # The signature and expiry are authoritative; only revoked
+            # tokens are rejected
+            if self.revocations.is_revoked(token_id(token, payload)):
+                return None
+
+        # Serve recently validated tokens from the cache
+        user = self.user_cache.get(token)
+        if user is not None:
+            return user
+
+        if not self.stateless_tokens:
+            # Check if session exists and is valid
+            session = await self.prisma.usersession.find_first(
+                where={
+                    **self._session_lookup(token, payload),
+                    "deleted": False,
+                    "expiresAt": {"gt": datetime.utcnow()}
+                }
+            )
 
-        if not session:
-            return None
+            if not session:
+                return None
 
         # Get user
         user = await self.prisma.user.find_unique(
@@ -234,12 +285,14 @@ class AuthService:
         if not user or user.deleted:
             return None
 
+        self.user_cache.set(token, user, payload["exp"])
+
         return user
 
     async def logout(self, token: str) -> bool:
         """Logout a user by invalidating their session"""
         session = await self.prisma.usersession.find_first(
-            where={"token": token}
+            where=self._session_lookup(token)
         )
 
         if session:
@@ -250,10 +303,30 @@ class AuthService:
                     "deletedAt": datetime.utcnow()
                 }
             )
+            self.user_cache.evict_token(token)
+            self.revocations.revoke(
+                token_id(token), session.expiresAt.timestamp()
+            )
             return True
 
         return False
 
+    def _session_lookup(
+        self,
+        token: str,
+        payload: Optional[dict] = None
+    ) -> dict:
+        """Filter matching a token's session by its short token id,
+        falling back to the full token for tokens without a jti"""
+        if payload is None:
+            try:
+                payload = jwt.get_unverified_claims(token)
+            except JWTError:
+                payload = {}
+        if payload.get("jti"):
+            return {"tokenId": payload["jti"]}
+        return {"token": token}
+
     async def refresh_token(self, token: str) -> Optional[dict]:
         """Refresh an access token"""
         user = await self.get_current_user(token)
@@ -319,6 +392,11 @@ class AuthService:
             }
         )
 
+        # Evict after the write, so a concurrent request can't cache
+        # a session that is about to be revoked
+        self.user_cache.evict_user(user_id)
+        self.revocations.request_sync()
+
         return True
 
     async def request_password_reset(
@@ -341,16 +419,15 @@ class AuthService:
         # Generate reset token
         reset_token = secrets.token_urlsafe(32)
 
-        # Store reset token (you might want to create a
-        # separate table for this)
-        # TODO: Create a separate table for this
-        # For now, we'll create a special session
-        expires_at = datetime.utcnow() + timedelta(hours=24)
+        # Store only a hash of the token, in its own table
+        expires_at = datetime.utcnow() + timedelta(
+            hours=settings.PASSWORD_RESET_EXPIRE_HOURS
+        )
 
-        await self.prisma.usersession.create({
+        await self.prisma.passwordresettoken.create({
             "data": {
                 "userId": user.id,
-                "token": f"reset_{reset_token}",
+                "tokenHash": _hash_reset_token(reset_token),
                 "expiresAt": expires_at,
             }
         })
@@ -363,45 +440,70 @@ class AuthService:
         new_password: str
     ) -> bool:
         """Reset a user's password with a reset token"""
-        # Find reset session
-        session = await self.prisma.usersession.find_first(
-            where={
-                "token": f"reset_{reset_token}",
-                "deleted": False,
-                "expiresAt": {"gt": datetime.utcnow()}
-            }
+        # Find the reset token and claim it, so it can only be used once
+        stored_token = await self.prisma.passwordresettoken.find_unique(
+            where={"tokenHash": _hash_reset_token(reset_token)}
         )
 
-        if not session:
+        if (
+            not stored_token
+            or stored_token.usedAt
+            or stored_token.expiresAt.timestamp() <= time.time()
+        ):
             return False
 
-        # Hash new password
+        # Hash new password before using up the token
         new_password_hash = await self.hash_password(new_password)
 
+        claimed = await self.prisma.passwordresettoken.update_many(
+            where={"id": stored_token.id, "usedAt": None},
+            data={"usedAt": datetime.utcnow()}
+        )
+
+        if not claimed:
+            return False
+
+        user_id = stored_token.userId
+
         # Update user password
         await self.prisma.user.update(
-            where={"id": session.userId},
+            where={"id": user_id},
             data={"passwordHash": new_password_hash}
         )
 
         # Invalidate all sessions for this user
         await self.prisma.usersession.update_many(
-            where={"userId": session.userId},
+            where={"userId": user_id, "deleted": False},
             data={
                 "deleted": True,
                 "deletedAt": datetime.utcnow()
             }
         )
 
+        # Drop cached tokens only now that their sessions are revoked
+        self.user_cache.evict_user(user_id)
+        self.revocations.request_sync()
+
         return True
 
 
+def _hash_reset_token(reset_token: str) -> str:
+    """Hash a password reset token for storage and lookup"""
+    return hashlib.sha256(reset_token.encode('utf-8')).hexdigest()
+
+
 # Dependency injection for FastAPI authentication
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
+@lru_cache()
 def get_auth_service() -> AuthService:
+    """
+    Get the shared auth service.
+    It uses the application's Prisma client, which the lifespan
+    connects once at startup.
+    """
     return AuthService()
 
 
@@ -415,6 +517,22 @@ async def get_current_user(
     return await auth_service.get_current_user(token)
 
 
+async def get_current_admin(
+    user=Depends(get_current_user)
+):
+    """
+    Dependency that only lets business admins through, for endpoints
+    exposing state shared by every tenant.
+    """
+    role = getattr(user, "role", None)
+    if role is None or role.type != UserRoleType.BUSINESS_ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    return user
+
+
 async def get_current_tenant(
     user=Depends(get_current_user)
 ):
@@ -0,0 +1,178 @@
+from typing import Any, Dict, List, Optional, Set
+import asyncio
+import logging
+
+from api.core.config import settings
+from api.db.prisma_client import get_prisma_client
+from api.services.llm_service import LLMService
+
+logger = logging.getLogger(__name__)
+
+
+# Session fields holding the summary and the last message it covers
+SUMMARY_FIELDS = ("summary", "summary_cursor_at", "summary_cursor_id")
+
+
+class ConversationMemory:
+    """Bounded conversation history for chat sessions.
+
+    A session's prompt history is its rolling `summary` plus every
+    message the summary doesn't cover yet, so prompt size stays bounded
+    however long the chat runs. Once more than `window` messages are
+    past the summary, the oldest are folded into it in the background,
+    at least `summary_batch` at a time. The session's
+    `summary_cursor_at` and `summary_cursor_id` hold the `created_at`
+    and id of the last message the summary covers.
+
+    Summaries are turned off if chat sessions have no summary fields,
+    before any LLM call is made for one.
+    """
+
+    def __init__(
+        self,
+        llm_service: LLMService,
+        window: int = settings.CHAT_HISTORY_WINDOW,
+        summary_batch: int = settings.CHAT_SUMMARY_BATCH,
+    ):
+        self.llm_service = llm_service
+        self.window = window
+        self.summary_batch = summary_batch
+        self.prisma = get_prisma_client()
+        self.summaries_enabled = True
+        self._updating: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def history_limit(self) -> int:
+        """Most messages past the summary while no update is running"""
+        return self.window + self.summary_batch - 1
+
+    async def load_history(self, session: Any) -> List[Dict[str, str]]:
+        """Get the messages the session's summary doesn't cover yet,
+        oldest first"""
+        chat_messages = await self.prisma.chat_message.find_many(
+            where=self._after_summary(session),
+            order_by=[{"created_at": "desc"}, {"id": "desc"}],
+            take=self.history_limit,
+        )
+
+        return [
+            {"role": msg.role, "content": msg.content}
+            for msg in reversed(chat_messages)
+        ]
+
+    def summary_of(self, session: Any) -> Optional[str]:
+        """Get the rolling summary stored on a session"""
+        return getattr(session, "summary", None)
+
+    def schedule_update(self, chat_session_id: str) -> None:
+        """Update a session's summary in the background.
+
+        Only one update runs per session; anything it misses is picked
+        up after a later turn.
+        """
+        if not self.summaries_enabled or chat_session_id in self._updating:
+            return
+
+        self._updating.add(chat_session_id)
+        task = asyncio.create_task(self._update_summary(chat_session_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def drain(self, timeout: float) -> None:
+        """Wait up to `timeout` seconds for running summary updates"""
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+        if pending:
+            logger.warning(
+                f"{len(pending)} conversation summary updates were still "
+                "running at shutdown"
+            )
+
+    def _after_summary(self, session: Any) -> Dict[str, Any]:
+        """Filter matching the session's messages newer than the last
+        one its summary covers"""
+        where: Dict[str, Any] = {
+            "chat_session_id": session.id,
+            "deleted_at": None,
+        }
+        cursor_at = getattr(session, "summary_cursor_at", None)
+        if cursor_at is not None:
+            where["OR"] = [
+                {"created_at": {"gt": cursor_at}},
+                {
+                    "created_at": cursor_at,
+                    "id": {"gt": session.summary_cursor_id},
+                },
+            ]
+        return where
+
+    def _can_store_summary(self, session: Any) -> bool:
+        """Check the session has somewhere to store a summary, turning
+        summaries off if not"""
+        missing = [f for f in SUMMARY_FIELDS if not hasattr(session, f)]
+        if missing:
+            self.summaries_enabled = False
+            logger.warning(
+                "Chat sessions have no "
+                f"{', '.join(missing)} field, conversation summaries are "
+                "turned off"
+            )
+            return False
+        return True
+
+    async def _update_summary(self, chat_session_id: str) -> None:
+        """Fold messages that left the window into the summary"""
+        try:
+            session = await self.prisma.chat_session.find_unique(
+                where={"id": chat_session_id}
+            )
+            if not session or not self._can_store_summary(session):
+                return
+
+            where = self._after_summary(session)
+            pending = (
+                await self.prisma.chat_message.count(where=where)
+                - self.window
+            )
+            if pending < self.summary_batch:
+                return
+
+            chat_messages = await self.prisma.chat_message.find_many(
+                where=where,
+                order_by=[{"created_at": "asc"}, {"id": "asc"}],
+                take=pending,
+            )
+            if not chat_messages:
+                return
+
+            summary = await self.llm_service.summarize(
+                self.summary_of(session),
+                [
+                    {"role": msg.role, "content": msg.content}
+                    for msg in chat_messages
+                ],
+            )
+
+            last = chat_messages[-1]
+            await self.prisma.chat_session.update(
+                where={"id": chat_session_id},
+                data={
+                    "summary": summary,
+                    "summary_cursor_at": last.created_at,
+                    "summary_cursor_id": last.id,
+                },
+            )
+
+            logger.info(
+                f"Summarized {len(chat_messages)} messages of chat session "
+                f"{chat_session_id}"
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Error summarizing chat session {chat_session_id}: {str(e)}"
+            )
+        finally:
+            self._updating.discard(chat_session_id)
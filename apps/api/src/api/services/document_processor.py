@@ -12,6 +12,7 @@ import aiohttp
 import logging
 from api.core.config import settings
 from api.db.prisma_client import get_prisma_client
+from api.services.retriever import get_retriever
 import time
 
 logger = logging.getLogger(__name__)
@@ -58,7 +59,7 @@ class DocumentProcessor:
 
         # Start crawling and processing in the background
         asyncio.create_task(
-            self._process_url_async(url, document.id, user_id)
+            self._process_url_async(url, document.id, project_id, user_id)
         )
 
         return {
@@ -71,6 +72,7 @@ class DocumentProcessor:
         self,
         url: str,
         document_id: str,
+        project_id: str,
         user_id: str
     ):
         """Asynchronously process URL content"""
@@ -145,6 +147,9 @@ class DocumentProcessor:
 
         except Exception as e:
             logger.error(f"Error processing URL {url}: {str(e)}")
+        finally:
+            # Chunks written so far become visible to retrieval
+            get_retriever().invalidate_project(project_id)
 
     def _extract_text_from_html(self, soup: BeautifulSoup) -> str:
         """Extract clean text content from HTML"""
@@ -193,6 +198,7 @@ class DocumentProcessor:
                 file_path,
                 file_type,
                 document.id,
+                project_id,
                 user_id
             )
         )
@@ -204,7 +210,12 @@ class DocumentProcessor:
         }
 
     async def _process_file_async(
-        self, file_path: str, file_type: str, document_id: str, user_id: str
+        self,
+        file_path: str,
+        file_type: str,
+        document_id: str,
+        project_id: str,
+        user_id: str
     ):
         """Asynchronously process file content"""
         try:
@@ -262,6 +273,8 @@ class DocumentProcessor:
 
         except Exception as e:
             logger.error(f"Error processing file {file_path}: {str(e)}")
+        finally:
+            get_retriever().invalidate_project(project_id)
 
     async def process_csv_data(
         self, csv_data: List[Dict[str, Any]], project_id: str, user_id: str
@@ -288,7 +301,9 @@ class DocumentProcessor:
 
         # Start processing in the background
         asyncio.create_task(
-            self._process_csv_data_async(csv_data, document.id, user_id)
+            self._process_csv_data_async(
+                csv_data, document.id, project_id, user_id
+            )
         )
 
         return {
@@ -298,7 +313,11 @@ class DocumentProcessor:
         }
 
     async def _process_csv_data_async(
-        self, csv_data: List[Dict[str, Any]], document_id: str, user_id: str
+        self,
+        csv_data: List[Dict[str, Any]],
+        document_id: str,
+        project_id: str,
+        user_id: str
     ):
         """Asynchronously process CSV data"""
         try:
@@ -351,3 +370,5 @@ class DocumentProcessor:
 
         except Exception as e:
             logger.error(f"Error processing CSV data: {str(e)}")
+        finally:
+            get_retriever().invalidate_project(project_id)
@@ -0,0 +1,261 @@
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+import hashlib
+import json
+import logging
+import time
+
+import numpy as np
+
+from api.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ResponseCachePolicy:
+    """Per-agent response cache settings.
+
+    Agents opt in through their `config` JSON, e.g.
+    `{"response_cache": {"semantic": true, "semantic_threshold": 0.97}}`
+    or simply `{"response_cache": true}` for the exact tier only.
+    """
+
+    agent_id: str
+    semantic: bool = False
+    semantic_threshold: float = settings.LLM_CACHE_SEMANTIC_THRESHOLD
+    ttl_seconds: int = settings.LLM_CACHE_TTL_SECONDS
+
+    @classmethod
+    def for_agent(cls, agent: Any) -> Optional["ResponseCachePolicy"]:
+        """Build the policy for an agent, or None if it hasn't opted in"""
+        config = getattr(agent, "config", None)
+        if not isinstance(config, dict):
+            return None
+
+        options = config.get("response_cache")
+        if not options:
+            return None
+        if not isinstance(options, dict):
+            options = {}
+
+        return cls(
+            agent_id=agent.id,
+            semantic=bool(options.get("semantic", False)),
+            semantic_threshold=float(
+                options.get(
+                    "semantic_threshold",
+                    settings.LLM_CACHE_SEMANTIC_THRESHOLD,
+                )
+            ),
+            ttl_seconds=int(
+                options.get("ttl_seconds", settings.LLM_CACHE_TTL_SECONDS)
+            ),
+        )
+
+
+@dataclass
+class _ExactEntry:
+    answer: str
+    expires_at: float
+
+
+@dataclass
+class _SemanticEntry:
+    embedding: np.ndarray
+    chunk_ids: Tuple[str, ...]
+    context_key: str
+    model: str
+    temperature: float
+    answer: str
+    expires_at: float
+
+
+class LLMResponseCache:
+    """Two-tier cache of LLM answers, scoped per agent.
+
+    The exact tier is keyed on a hash of the model, temperature and the
+    full prompt (system prompt with its context, history and query).
+    The semantic tier reuses an answer when the query embedding is
+    close enough to a previous one asked with the same chunks and the
+    same prompt before the query, i.e. system prompt, summary and
+    history. A follow-up like "explain that in more detail" therefore
+    never reuses an answer given in another conversation. Both tiers
+    expire entries by TTL and are bounded in size; agent config changes
+    are only picked up as entries expire.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = settings.LLM_CACHE_MAX_ENTRIES,
+        max_semantic_entries_per_agent: int = (
+            settings.LLM_CACHE_SEMANTIC_MAX_ENTRIES_PER_AGENT
+        ),
+    ):
+        self.max_entries = max_entries
+        self.max_semantic_entries_per_agent = max_semantic_entries_per_agent
+        self._exact: "OrderedDict[str, _ExactEntry]" = OrderedDict()
+        self._semantic: Dict[str, Deque[_SemanticEntry]] = {}
+        self.metrics: Counter = Counter()
+
+    @staticmethod
+    def exact_key(
+        agent_id: str,
+        model: str,
+        temperature: float,
+        messages: List[Dict[str, str]],
+    ) -> str:
+        """Hash everything that determines the model's answer"""
+        payload = json.dumps(
+            [agent_id, model, temperature, messages], sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def context_key(messages: List[Dict[str, str]]) -> str:
+        """Hash every message before the query, which the semantic tier
+        requires to match"""
+        payload = json.dumps(messages[:-1], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        policy: ResponseCachePolicy,
+        model: str,
+        temperature: float,
+        messages: List[Dict[str, str]],
+        query_embedding: Optional[np.ndarray] = None,
+        chunk_ids: Sequence[str] = (),
+    ) -> Optional[str]:
+        """Look up an answer, trying the exact tier first"""
+        now = time.monotonic()
+
+        key = self.exact_key(policy.agent_id, model, temperature, messages)
+        entry = self._exact.get(key)
+        if entry is not None:
+            if entry.expires_at > now:
+                self._exact.move_to_end(key)
+                self.metrics["exact_hits"] += 1
+                logger.debug(f"Exact cache hit for agent {policy.agent_id}")
+                return entry.answer
+            del self._exact[key]
+            self.metrics["expired"] += 1
+
+        if policy.semantic and query_embedding is not None:
+            answer = self._get_semantic(
+                policy,
+                model,
+                temperature,
+                query_embedding,
+                chunk_ids,
+                self.context_key(messages),
+                now,
+            )
+            if answer is not None:
+                self.metrics["semantic_hits"] += 1
+                logger.debug(
+                    f"Semantic cache hit for agent {policy.agent_id}"
+                )
+                return answer
+
+        self.metrics["misses"] += 1
+        return None
+
+    def set(
+        self,
+        policy: ResponseCachePolicy,
+        model: str,
+        temperature: float,
+        messages: List[Dict[str, str]],
+        answer: str,
+        query_embedding: Optional[np.ndarray] = None,
+        chunk_ids: Sequence[str] = (),
+    ) -> None:
+        """Store an answer in the exact tier, and in the semantic tier
+        if the agent has it enabled"""
+        expires_at = time.monotonic() + policy.ttl_seconds
+
+        key = self.exact_key(policy.agent_id, model, temperature, messages)
+        self._exact[key] = _ExactEntry(answer=answer, expires_at=expires_at)
+        self._exact.move_to_end(key)
+        while len(self._exact) > self.max_entries:
+            self._exact.popitem(last=False)
+            self.metrics["evictions"] += 1
+
+        if policy.semantic and query_embedding is not None:
+            entries = self._semantic.setdefault(
+                policy.agent_id,
+                deque(maxlen=self.max_semantic_entries_per_agent),
+            )
+            entries.append(
+                _SemanticEntry(
+                    embedding=self._normalize(query_embedding),
+                    chunk_ids=tuple(chunk_ids),
+                    context_key=self.context_key(messages),
+                    model=model,
+                    temperature=temperature,
+                    answer=answer,
+                    expires_at=expires_at,
+                )
+            )
+
+        self.metrics["stores"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit, miss and size metrics"""
+        lookups = (
+            self.metrics["exact_hits"]
+            + self.metrics["semantic_hits"]
+            + self.metrics["misses"]
+        )
+        hits = self.metrics["exact_hits"] + self.metrics["semantic_hits"]
+        return {
+            **self.metrics,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "exact_entries": len(self._exact),
+            "semantic_entries": sum(
+                len(entries) for entries in self._semantic.values()
+            ),
+        }
+
+    def _get_semantic(
+        self,
+        policy: ResponseCachePolicy,
+        model: str,
+        temperature: float,
+        query_embedding: np.ndarray,
+        chunk_ids: Sequence[str],
+        context_key: str,
+        now: float,
+    ) -> Optional[str]:
+        """Find the closest previous query over the same chunks and
+        conversation"""
+        entries = self._semantic.get(policy.agent_id)
+        if not entries:
+            return None
+
+        chunk_ids = tuple(chunk_ids)
+        query = self._normalize(query_embedding)
+
+        best_answer, best_similarity = None, policy.semantic_threshold
+        for entry in entries:
+            if (
+                entry.expires_at <= now
+                or entry.chunk_ids != chunk_ids
+                or entry.context_key != context_key
+                or entry.model != model
+                or entry.temperature != temperature
+            ):
+                continue
+            similarity = float(np.dot(entry.embedding, query))
+            if similarity >= best_similarity:
+                best_answer, best_similarity = entry.answer, similarity
+
+        return best_answer
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        embedding = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(embedding)
+        return embedding / norm if norm else embedding
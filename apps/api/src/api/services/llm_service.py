@@ -1,76 +1,330 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
+from functools import lru_cache
+import asyncio
 import os
 import logging
-from openai import OpenAI
+import httpx
+import numpy as np
+from openai import AsyncOpenAI
 from api.core.config import settings
+from api.services.llm_cache import LLMResponseCache, ResponseCachePolicy
+from api.services.token_budget import TokenBudgetPacker
 
 
 logger = logging.getLogger(__name__)
 
+ERROR_ANSWER = """
+                    I'm sorry, I encountered an error while generating
+                    a response. Please try again later. If the problem
+                    persists, please contact support.
+                """
+
+
+@lru_cache()
+def get_llm_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client used to talk to the LLM provider.
+    Every LLMService reuses its connection pool, so completions
+    don't pay for a new TCP/TLS handshake.
+
+    Returns:
+        httpx.AsyncClient: A singleton pooled HTTP client
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            settings.LLM_TIMEOUT, connect=settings.LLM_CONNECT_TIMEOUT
+        ),
+    )
+
+
+async def close_llm_http_client() -> None:
+    """Close the shared LLM HTTP client, if it was ever created"""
+    if get_llm_http_client.cache_info().currsize:
+        await get_llm_http_client().aclose()
+        get_llm_http_client.cache_clear()
+
 
 class LLMService:
-    def __init__(self):
-        self.client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+    def __init__(
+        self,
+        client: Optional[AsyncOpenAI] = None,
+        cache: Optional[LLMResponseCache] = None,
+    ):
+        self.client = client or AsyncOpenAI(
+            api_key=os.environ.get("OPENAI_API_KEY"),
+            base_url=settings.LLM_BASE_URL,
+            max_retries=settings.LLM_MAX_RETRIES,
+            http_client=get_llm_http_client(),
+        )
         self.model = settings.LLM_MODEL
         self.temperature = settings.LLM_TEMPERATURE
+        self._model_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.cache = cache or LLMResponseCache()
+        self.packer = TokenBudgetPacker(self.model)
+
+    def _model_semaphore(self, model: str) -> asyncio.Semaphore:
+        """Get the semaphore capping concurrent completions for a model"""
+        semaphore = self._model_semaphores.get(model)
+        if semaphore is None:
+            limit = settings.LLM_MODEL_CONCURRENCY.get(
+                model, settings.LLM_MAX_CONCURRENCY
+            )
+            semaphore = asyncio.Semaphore(limit)
+            self._model_semaphores[model] = semaphore
+        return semaphore
 
     async def generate_response(
         self,
         query: str,
         context_chunks: List[Dict[str, Any]],
-        conversation_history: List[Dict[str, str]] = None
+        conversation_history: List[Dict[str, str]] = None,
+        cache_policy: Optional[ResponseCachePolicy] = None,
+        query_embedding: Optional[np.ndarray] = None,
+        conversation_summary: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Generate a response using the LLM"""
+        """Generate a response using the LLM.
+
+        When a `cache_policy` is given, answers are served from and
+        stored in the response cache; `query_embedding` enables its
+        semantic tier. `conversation_summary` stands in for messages
+        older than `conversation_history`.
+        """
         logger.info(f"Generating response for query: {query}")
 
+        # Fit context and history into the prompt budget
+        context_chunks, conversation_history = self.pack(
+            query, context_chunks, conversation_history, conversation_summary
+        )
+
         # Format context for the prompt
         formatted_context = self._format_context(context_chunks)
 
         # Build conversation history
         messages = self._build_messages(
-            query, formatted_context, conversation_history
+            query,
+            formatted_context,
+            conversation_history,
+            conversation_summary
+        )
+
+        cached = self._get_cached(
+            cache_policy, messages, context_chunks, query_embedding
         )
+        if cached is not None:
+            return {
+                "answer": cached,
+                "sources": self.format_sources(context_chunks)
+            }
 
         try:
-            # Generate completion
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=1000
-            )
+            # Generate completion without blocking the event loop
+            async with self._model_semaphore(self.model):
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=self.temperature,
+                    max_tokens=settings.LLM_MAX_TOKENS
+                )
 
             # Extract the response content
             answer = response.choices[0].message.content
 
+            self._set_cached(
+                cache_policy, messages, context_chunks, query_embedding,
+                answer
+            )
+
             return {
                 "answer": answer,
-                "sources": [
-                    {
-                        "id": chunk["id"],
-                        "content": (
-                            chunk["content"][:200] + "..."
-                            if len(chunk["content"]) > 200
-                            else chunk["content"]
-                        ),
-                        "metadata": chunk["metadata"],
-                        "document_title": chunk["document_title"]
-                    }
-                    for chunk in context_chunks
-                ]
+                "sources": self.format_sources(context_chunks)
             }
 
         except Exception as e:
             logger.error(f"Error generating response: {str(e)}")
             return {
-                "answer": """
-                    I'm sorry, I encountered an error while generating
-                    a response. Please try again later. If the problem
-                    persists, please contact support.
-                """,
+                "answer": ERROR_ANSWER,
                 "sources": []
             }
 
+    async def stream_response(
+        self,
+        query: str,
+        context_chunks: List[Dict[str, Any]],
+        conversation_history: List[Dict[str, str]] = None,
+        cache_policy: Optional[ResponseCachePolicy] = None,
+        query_embedding: Optional[np.ndarray] = None,
+        conversation_summary: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Generate a response using the LLM, yielding content deltas
+        as the model produces them. A cached answer is yielded whole.
+
+        `context_chunks` and `conversation_history` must already be
+        fitted with `pack()`, since the caller sends the sources before
+        generation starts.
+
+        Errors raised by the provider propagate to the caller, which
+        has already started sending the response and must report
+        them in-stream.
+        """
+        logger.info(f"Streaming response for query: {query}")
+
+        formatted_context = self._format_context(context_chunks)
+        messages = self._build_messages(
+            query,
+            formatted_context,
+            conversation_history,
+            conversation_summary
+        )
+
+        cached = self._get_cached(
+            cache_policy, messages, context_chunks, query_embedding
+        )
+        if cached is not None:
+            yield cached
+            return
+
+        parts = []
+        async with self._model_semaphore(self.model):
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+                max_tokens=settings.LLM_MAX_TOKENS,
+                stream=True
+            )
+            # Closed even when the client disconnects mid-stream, so the
+            # connection goes back to the pool
+            try:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+            finally:
+                await stream.close()
+
+        self._set_cached(
+            cache_policy, messages, context_chunks, query_embedding,
+            "".join(parts)
+        )
+
+    async def summarize(
+        self,
+        previous_summary: Optional[str],
+        messages: List[Dict[str, str]]
+    ) -> str:
+        """Fold messages into a running conversation summary.
+
+        Errors propagate so the caller can keep the previous summary
+        and retry on a later turn.
+        """
+        transcript = "\n".join(
+            f"{message['role']}: {message['content']}"
+            for message in messages
+        )
+        prompt = f"""
+        Update the summary of a conversation between a user and an AI
+        assistant with the new messages below. Keep facts, names,
+        decisions and open questions the assistant may need later. Reply
+        with the updated summary only.
+
+        Current summary:
+        {previous_summary or "(empty)"}
+
+        New messages:
+        {transcript}"""
+
+        async with self._model_semaphore(self.model):
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0,
+                max_tokens=settings.CHAT_SUMMARY_MAX_TOKENS
+            )
+
+        return response.choices[0].message.content or previous_summary or ""
+
+    def pack(
+        self,
+        query: str,
+        context_chunks: List[Dict[str, Any]],
+        conversation_history: List[Dict[str, str]] = None,
+        conversation_summary: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+        """Select the chunks and history that fit the prompt budget"""
+        # The system prompt without context, the summary and the query
+        fixed_messages = self._build_messages(
+            query, "", conversation_summary=conversation_summary
+        )
+        return self.packer.pack(
+            fixed_messages, context_chunks, conversation_history
+        )
+
+    def _get_cached(
+        self,
+        cache_policy: Optional[ResponseCachePolicy],
+        messages: List[Dict[str, str]],
+        context_chunks: List[Dict[str, Any]],
+        query_embedding: Optional[np.ndarray]
+    ) -> Optional[str]:
+        """Look up a cached answer if the agent opted in"""
+        if cache_policy is None:
+            return None
+        return self.cache.get(
+            cache_policy,
+            self.model,
+            self.temperature,
+            messages,
+            query_embedding=query_embedding,
+            chunk_ids=[chunk["id"] for chunk in context_chunks]
+        )
+
+    def _set_cached(
+        self,
+        cache_policy: Optional[ResponseCachePolicy],
+        messages: List[Dict[str, str]],
+        context_chunks: List[Dict[str, Any]],
+        query_embedding: Optional[np.ndarray],
+        answer: Optional[str]
+    ) -> None:
+        """Cache an answer if the agent opted in"""
+        if cache_policy is None or not answer:
+            return
+        self.cache.set(
+            cache_policy,
+            self.model,
+            self.temperature,
+            messages,
+            answer,
+            query_embedding=query_embedding,
+            chunk_ids=[chunk["id"] for chunk in context_chunks]
+        )
+
+    def format_sources(
+        self, context_chunks: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Format context chunks as the sources returned to the client"""
+        return [
+            {
+                "id": chunk["id"],
+                "content": (
+                    chunk["content"][:200] + "..."
+                    if len(chunk["content"]) > 200
+                    else chunk["content"]
+                ),
+                "metadata": chunk["metadata"],
+                "document_title": chunk["document_title"]
+            }
+            for chunk in context_chunks
+        ]
+
     def _format_context(self, context_chunks: List[Dict[str, Any]]) -> str:
         """Format context chunks for the prompt"""
         formatted_chunks = []
@@ -86,7 +340,8 @@ class LLMService:
         self,
         query: str,
         context: str,
-        conversation_history: List[Dict[str, str]] = None
+        conversation_history: List[Dict[str, str]] = None,
+        conversation_summary: Optional[str] = None
     ) -> List[Dict[str, str]]:
         """Build messages for the chat completion API"""
 
@@ -114,6 +369,16 @@ class LLMService:
         # Start with the system prompt
         messages = [{"role": "system", "content": system_prompt}]
 
+        # Summarise the conversation before the recent history
+        if conversation_summary:
+            messages.append({
+                "role": "system",
+                "content": (
+                    "Summary of the earlier conversation:\n"
+                    f"{conversation_summary}"
+                )
+            })
+
         # Add conversation history if available
         if conversation_history:
             messages.extend(conversation_history)
@@ -0,0 +1,130 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple
+import asyncio
+import logging
+import time
+
+import bcrypt
+
+from api.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many password operations are already pending"""
+
+
+class PasswordHasher:
+    """Runs bcrypt off the event loop on a bounded thread pool.
+
+    bcrypt releases the GIL, so up to `max_workers` hashes run in
+    parallel while the loop keeps serving other requests. At most
+    `max_pending` operations may be queued or running; beyond that
+    callers get `PasswordHasherBusy` instead of waiting, which keeps a
+    credential-stuffing burst from building an unbounded backlog.
+    """
+
+    def __init__(
+        self,
+        rounds: int = settings.PASSWORD_HASH_ROUNDS,
+        max_workers: int = settings.PASSWORD_HASH_WORKERS,
+        max_pending: int = settings.PASSWORD_HASH_MAX_PENDING,
+    ):
+        self.rounds = rounds
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hash"
+        )
+        self._pending = 0
+        self.metrics: Counter = Counter()
+        self._seconds: Counter = Counter()
+        self._max_seconds: Dict[str, float] = {}
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with the configured cost"""
+        hashed = await self._run(
+            "hash",
+            lambda: bcrypt.hashpw(
+                password.encode("utf-8"), bcrypt.gensalt(self.rounds)
+            ),
+        )
+        return hashed.decode("utf-8")
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash"""
+        return await self._run(
+            "verify",
+            lambda: bcrypt.checkpw(
+                password.encode("utf-8"), hashed_password.encode("utf-8")
+            ),
+        )
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Check whether a hash was made with a different cost"""
+        # $2b$<rounds>$<salt and hash>
+        try:
+            return int(hashed_password.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        """Operation counts, hash cost and load metrics"""
+        stats: Dict[str, Any] = {
+            **self.metrics,
+            "rounds": self.rounds,
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+        }
+        for operation in ("hash", "verify"):
+            count = self.metrics[operation]
+            stats[f"{operation}_avg_ms"] = (
+                self._seconds[operation] / count * 1000 if count else 0.0
+            )
+            stats[f"{operation}_max_ms"] = (
+                self._max_seconds.get(operation, 0.0) * 1000
+            )
+        return stats
+
+    def shutdown(self) -> None:
+        """Stop the worker threads"""
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, operation: str, func: Callable[[], Any]) -> Any:
+        """Run a bcrypt call on the pool, recording its cost"""
+        if self._pending >= self.max_pending:
+            self.metrics["rejected"] += 1
+            raise PasswordHasherBusy(
+                f"{self._pending} password operations already pending"
+            )
+
+        def timed() -> Tuple[Any, float]:
+            # Time the work itself, not the wait for a free thread
+            started_at = time.perf_counter()
+            result = func()
+            return result, time.perf_counter() - started_at
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result, elapsed = await loop.run_in_executor(
+                self._executor, timed
+            )
+        finally:
+            self._pending -= 1
+
+        # Metrics are only updated on the event loop
+        self.metrics[operation] += 1
+        self._seconds[operation] += elapsed
+        self._max_seconds[operation] = max(
+            self._max_seconds.get(operation, 0.0), elapsed
+        )
+        return result
+
+
+@lru_cache()
+def get_password_hasher() -> PasswordHasher:
+    """Get the process-wide password hasher"""
+    return PasswordHasher()
@@ -1,5 +1,10 @@
-from typing import List, Dict, Any
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Sequence
+import asyncio
 import logging
+import time
 
 import numpy as np
 from sentence_transformers.SentenceTransformer import SentenceTransformer
@@ -10,23 +15,208 @@ from ..db.prisma_client import get_prisma_client
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ProjectMatrix:
+    """Embedding matrix for every chunk in a project.
+
+    Rows of `matrix` are L2-normalised so a dot product with a
+    normalised query is its cosine similarity.
+    """
+
+    chunks: List[Any]
+    matrix: np.ndarray
+    built_at: float
+
+
+@dataclass
+class RetrievalQuery:
+    """A single query in a batch retrieval call"""
+
+    query: str
+    project_id: str
+    top_k: int = 5
+    # Precomputed query embedding, skips encoding when provided
+    embedding: Optional[np.ndarray] = None
+
+
 class DocumentRetriever:
-    def __init__(self):
-        self.embedding_model = SentenceTransformer(settings.EMBEDDING_MODEL)
+    def __init__(self, embedding_model: Optional[SentenceTransformer] = None):
+        self.embedding_model = embedding_model or SentenceTransformer(
+            settings.EMBEDDING_MODEL
+        )
         self.prisma = get_prisma_client()
+        # Least recently used first
+        self._project_matrices: "OrderedDict[str, ProjectMatrix]" = (
+            OrderedDict()
+        )
+        self._builds: Dict[str, "asyncio.Future[Optional[ProjectMatrix]]"] = {}
 
     async def retrieve(
         self,
         query: str,
         project_id: str,
         top_k: int = 5,
+        query_embedding: Optional[np.ndarray] = None,
     ) -> List[Dict[str, Any]]:
         """Retrieve relevant document chunks for a query"""
         logger.info(f"Retrieving documents for query: {query}")
 
-        # Generate embedding for the query
-        query_embedding = self.embedding_model.encode(query).tolist()
+        results = await self.retrieve_batch(
+            [
+                RetrievalQuery(
+                    query=query,
+                    project_id=project_id,
+                    top_k=top_k,
+                    embedding=query_embedding,
+                )
+            ]
+        )
+        return results[0]
+
+    def encode_query(self, query: str) -> np.ndarray:
+        """Embed a query with the retrieval embedding model"""
+        return np.asarray(self.embedding_model.encode(query), dtype=np.float32)
+
+    async def retrieve_batch(
+        self, queries: Sequence[RetrievalQuery]
+    ) -> List[List[Dict[str, Any]]]:
+        """Retrieve relevant document chunks for many queries at once.
 
+        All queries are encoded in a single model call, and the queries
+        for each project are scored with one matrix-matrix product
+        against that project's cached embedding matrix.
+
+        Args:
+            queries (Sequence[RetrievalQuery]): Queries to run, possibly
+                spanning several projects.
+
+        Returns:
+            List[List[Dict[str, Any]]]: Top-k results for each query, in
+            the same order as `queries`.
+        """
+        if not queries:
+            return []
+
+        logger.info(f"Retrieving documents for {len(queries)} queries")
+
+        # Encode every query without an embedding in one batch
+        query_matrix = np.empty(
+            (len(queries), settings.VECTOR_DIMENSION), dtype=np.float32
+        )
+        to_encode = [i for i, q in enumerate(queries) if q.embedding is None]
+        if to_encode:
+            query_matrix[to_encode] = self.embedding_model.encode(
+                [queries[i].query for i in to_encode]
+            )
+        for i, q in enumerate(queries):
+            if q.embedding is not None:
+                query_matrix[i] = q.embedding
+        query_matrix = self._normalize(query_matrix)
+
+        # Group query positions by project
+        positions_by_project: Dict[str, List[int]] = {}
+        for i, q in enumerate(queries):
+            positions_by_project.setdefault(q.project_id, []).append(i)
+
+        results: List[List[Dict[str, Any]]] = [[] for _ in queries]
+        for project_id, positions in positions_by_project.items():
+            project_matrix = await self.get_project_matrix(project_id)
+            if project_matrix is None:
+                continue
+
+            # (n_queries, dim) @ (dim, n_chunks) -> (n_queries, n_chunks)
+            scores = query_matrix[positions] @ project_matrix.matrix.T
+
+            for row, position in enumerate(positions):
+                results[position] = self._top_k(
+                    project_matrix.chunks,
+                    scores[row],
+                    queries[position].top_k,
+                )
+
+        return results
+
+    async def get_project_matrix(
+        self, project_id: str
+    ) -> Optional[ProjectMatrix]:
+        """Get the cached embedding matrix for a project, building it if
+        it is missing or older than `RETRIEVAL_CACHE_TTL_SECONDS`.
+
+        Concurrent requests for a project that isn't cached share a
+        single build.
+        """
+        cached = self._project_matrices.get(project_id)
+        if (
+            cached is not None
+            and time.monotonic() - cached.built_at
+            < settings.RETRIEVAL_CACHE_TTL_SECONDS
+        ):
+            self._project_matrices.move_to_end(project_id)
+            return cached
+
+        build = self._builds.get(project_id)
+        if build is None:
+            build = asyncio.ensure_future(
+                self._build_project_matrix(project_id)
+            )
+            self._builds[project_id] = build
+            build.add_done_callback(
+                lambda done: self._finish_build(project_id, done)
+            )
+        # Shielded, the build is shared with every other waiter
+        return await asyncio.shield(build)
+
+    def set_project_chunks(
+        self, project_id: str, chunks: List[Any]
+    ) -> Optional[ProjectMatrix]:
+        """Build and cache the embedding matrix for already loaded chunks"""
+        project_matrix = self.build_project_matrix(chunks)
+        self._store(project_id, project_matrix)
+        return project_matrix
+
+    def invalidate_project(self, project_id: str) -> None:
+        """Drop the cached embedding matrix for a project, call it once
+        the chunks of the project change.
+
+        A build that is still running is not cached when it finishes,
+        since it may have read the chunks from before the change.
+        """
+        self._project_matrices.pop(project_id, None)
+        self._builds.pop(project_id, None)
+
+    def _finish_build(
+        self,
+        project_id: str,
+        build: "asyncio.Future[Optional[ProjectMatrix]]",
+    ) -> None:
+        """Cache the result of a build unless it was invalidated"""
+        if self._builds.get(project_id) is not build:
+            return
+        del self._builds[project_id]
+        if build.cancelled() or build.exception() is not None:
+            return
+        self._store(project_id, build.result())
+
+    def _store(
+        self, project_id: str, project_matrix: Optional[ProjectMatrix]
+    ) -> None:
+        """Cache a matrix, evicting the least recently used projects"""
+        if project_matrix is None:
+            self._project_matrices.pop(project_id, None)
+            return
+
+        self._project_matrices[project_id] = project_matrix
+        self._project_matrices.move_to_end(project_id)
+        while (
+            len(self._project_matrices)
+            > settings.RETRIEVAL_CACHE_MAX_PROJECTS
+        ):
+            self._project_matrices.popitem(last=False)
+
+    async def _build_project_matrix(
+        self, project_id: str
+    ) -> Optional[ProjectMatrix]:
+        """Load every chunk of a project and stack its embeddings"""
         # Get all documents for the project
         documents = await self.prisma.document.find_many(
             where={"project_id": project_id, "deleted_at": None}
@@ -34,69 +224,84 @@ class DocumentRetriever:
 
         if not documents:
             logger.warning(f"No documents found for project {project_id}")
-            return []
+            return None
 
         # Get document IDs
         document_ids = [doc.id for doc in documents]
 
-        # Perform vector search in the database
-        # Note: This uses pgvector's cosine similarity search
-        # The actual SQL would be something like:
-        # SELECT * FROM document_chunks
-        # WHERE document_id IN (...) AND deleted_at IS NULL
-        # ORDER BY embedding <=> [query_embedding] LIMIT [top_k]
-
-        # For simplicity in this prototype, we'll get all chunks
-        # and sort in Python. In production, this should use
-        # pgvector's cosine similarity directly
-
         # Get all chunks for these documents
         chunks = await self.prisma.document_chunk.find_many(
             where={"document_id": {"in": document_ids}, "deleted_at": None},
             include={"document": True},
         )
+        project_matrix = self.build_project_matrix(chunks)
 
-        if not chunks:
+        if project_matrix is None:
             logger.warning(f"No chunks found for documents {document_ids}")
+
+        return project_matrix
+
+    @classmethod
+    def build_project_matrix(
+        cls, chunks: List[Any]
+    ) -> Optional[ProjectMatrix]:
+        """Stack the embeddings of chunks into a normalised matrix.
+
+        Chunks without an embedding are skipped. Returns None when no
+        chunk has an embedding.
+        """
+        chunks = [
+            chunk
+            for chunk in chunks
+            if chunk.embedding is not None and len(chunk.embedding)
+        ]
+        if not chunks:
+            return None
+
+        matrix = cls._normalize(
+            np.asarray([chunk.embedding for chunk in chunks], dtype=np.float32)
+        )
+        return ProjectMatrix(
+            chunks=chunks, matrix=matrix, built_at=time.monotonic()
+        )
+
+    def _top_k(
+        self, chunks: List[Any], scores: np.ndarray, top_k: int
+    ) -> List[Dict[str, Any]]:
+        """Format the `top_k` highest scoring chunks, best first"""
+        top_k = min(top_k, len(chunks))
+        if top_k <= 0:
             return []
 
-        # Calculate cosine similarity and rank chunks
-        results = []
-        for chunk in chunks:
-            if chunk.embedding:
-                chunk_embedding = chunk.embedding
-                # Calculate cosine similarity
-                similarity = self._cosine_similarity(
-                    query_embedding, chunk_embedding
-                )  # noqa: E501
-
-                results.append({"chunk": chunk, "similarity": similarity})
-
-        # Sort by similarity (highest first)
-        results = sorted(results, key=lambda x: x["similarity"], reverse=True)
-
-        # Take top-k results
-        top_results = results[:top_k]
-
-        # Format the results
-        formatted_results = []
-        for result in top_results:
-            chunk = result["chunk"]
-            formatted_results.append(
-                {
-                    "id": chunk.id,
-                    "content": chunk.content,
-                    "metadata": chunk.metadata,
-                    "similarity": result["similarity"],
-                    "document_id": chunk.document_id,
-                    "document_title": (
-                        chunk.document.title if chunk.document else ""
-                    ),  # chunk.document is not always present
-                    "source": chunk.metadata.get("source", ""),
-                }
-            )
+        # argpartition is O(n); only the k winners are fully sorted
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        ranked = candidates[np.argsort(-scores[candidates])]
+
+        return [
+            self._format_result(chunks[i], float(scores[i])) for i in ranked
+        ]
+
+    def _format_result(self, chunk: Any, similarity: float) -> Dict[str, Any]:
+        """Format a chunk as a retrieval result"""
+        return {
+            "id": chunk.id,
+            "content": chunk.content,
+            "metadata": chunk.metadata,
+            "similarity": similarity,
+            "document_id": chunk.document_id,
+            "document_title": (
+                chunk.document.title if chunk.document else ""
+            ),  # chunk.document is not always present
+            "source": chunk.metadata.get("source", ""),
+        }
 
-        return formatted_results
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        """L2-normalise rows, leaving all-zero rows as zeros"""
+        matrix = np.atleast_2d(matrix)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return matrix / norms
 
     def _cosine_similarity(
         self, embedding1: List[float], embedding2: List[float]
@@ -113,3 +318,16 @@ class DocumentRetriever:
             return 0
 
         return np.dot(arr1, arr2) / (norm1 * norm2)
+
+
+@lru_cache()
+def get_retriever() -> DocumentRetriever:
+    """
+    Get a singleton instance of the document retriever.
+    Sharing one instance shares the embedding model and
+    the cached project matrices between routers.
+
+    Returns:
+        DocumentRetriever: A singleton instance of the retriever
+    """
+    return DocumentRetriever()
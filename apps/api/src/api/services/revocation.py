@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import hashlib
+import logging
+import time
+
+from jose import JWTError, jwt
+
+from api.core.config import settings
+from api.services.user_cache import get_user_cache
+
+logger = logging.getLogger(__name__)
+
+# Revocations are re-read with this much overlap, so clock skew between
+# workers can't hide one
+REVOCATION_OVERLAP = timedelta(seconds=5)
+
+
+def token_id(token: str, claims: Optional[dict] = None) -> str:
+    """Get the identifier a token is revoked by: its `jti` claim, or a
+    hash of the whole token for tokens issued without one"""
+    if claims is None:
+        try:
+            claims = jwt.get_unverified_claims(token)
+        except JWTError:
+            claims = {}
+    jti = claims.get("jti")
+    if jti:
+        return jti
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class RevocationFilter:
+    """In-memory set of revoked token ids, synced from user_sessions.
+
+    The first sync loads every revoked session whose token hasn't
+    expired yet; later syncs only read sessions revoked since the
+    previous one, at most once every `sync_seconds`. Ids are dropped
+    once their token expires, since the signature check rejects it
+    from then on anyway.
+    """
+
+    def __init__(
+        self,
+        sync_seconds: float = settings.AUTH_REVOCATION_SYNC_SECONDS,
+        on_revoke: Optional[Callable[[str], None]] = None,
+    ):
+        self.sync_seconds = sync_seconds
+        self.on_revoke = on_revoke
+        # Token id -> expiry of the token, as a Unix timestamp
+        self._revoked: Dict[str, float] = {}
+        self._revoked_since: Optional[datetime] = None
+        self._next_sync = 0.0
+        self._sync_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def is_revoked(self, jti: str) -> bool:
+        """Check whether a token id was revoked"""
+        return jti in self._revoked
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        """Record a revocation made by this worker"""
+        self._revoked[jti] = expires_at
+
+    def request_sync(self) -> None:
+        """Sync on the next call to `sync`, e.g. after revoking every
+        session of a user"""
+        self._next_sync = 0.0
+
+    async def sync(self, prisma: Any) -> None:
+        """Read the sessions revoked since the last sync. Concurrent
+        callers wait for the sync in progress."""
+        if time.monotonic() < self._next_sync:
+            return
+
+        async with self._sync_lock:
+            if time.monotonic() < self._next_sync:
+                return
+
+            synced_at = datetime.utcnow()
+            if self._revoked_since is None:
+                where = {"deleted": True, "expiresAt": {"gt": synced_at}}
+            else:
+                where = {
+                    "deleted": True,
+                    "deletedAt": {
+                        "gte": self._revoked_since - REVOCATION_OVERLAP
+                    },
+                }
+
+            try:
+                revoked = await prisma.usersession.find_many(where=where)
+            except Exception as e:
+                # Tokens already known to be revoked stay revoked
+                logger.error(f"Error syncing revoked sessions: {str(e)}")
+                self._next_sync = time.monotonic() + self.sync_seconds
+                return
+
+            for session in revoked:
+                jti = session.tokenId or token_id(session.token)
+                self._revoked[jti] = session.expiresAt.timestamp()
+                if self.on_revoke is not None:
+                    self.on_revoke(session.token)
+
+            self._prune()
+            self._revoked_since = synced_at
+            self._next_sync = time.monotonic() + self.sync_seconds
+
+    def _prune(self) -> None:
+        """Drop the ids of tokens that have expired"""
+        now = time.time()
+        for jti in [
+            jti
+            for jti, expires_at in self._revoked.items()
+            if expires_at <= now
+        ]:
+            del self._revoked[jti]
+
+
+@lru_cache()
+def get_revocation_filter() -> RevocationFilter:
+    """Get the process-wide revocation filter. Revoked tokens are also
+    evicted from the authenticated user cache."""
+    return RevocationFilter(on_revoke=get_user_cache().evict_token)
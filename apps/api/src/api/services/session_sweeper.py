@@ -0,0 +1,137 @@
+from datetime import datetime
+from typing import Any, Optional
+import asyncio
+import logging
+
+from api.core.config import settings
+from api.services.revocation import token_id
+
+logger = logging.getLogger(__name__)
+
+
+class SessionSweeper:
+    """Periodically purges expired user sessions and reset tokens.
+
+    Rows are deleted in batches of `batch_size` so a large backlog
+    never holds long locks. A revoked session is kept until its token
+    expires, because revocation filters still need to see it; after
+    that the signature check rejects the token on its own. Running a
+    sweeper in every worker is safe, deletes are idempotent.
+
+    Sessions created before the tokenId column existed are backfilled
+    from their token, since sessions are looked up by tokenId.
+    """
+
+    def __init__(
+        self,
+        prisma: Any,
+        interval_seconds: int = settings.SESSION_SWEEP_INTERVAL_SECONDS,
+        batch_size: int = settings.SESSION_SWEEP_BATCH_SIZE,
+    ):
+        self.prisma = prisma
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start sweeping in the background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sweeping"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def sweep(self) -> int:
+        """Purge every expired session and reset token.
+
+        Returns:
+            int: The number of rows deleted
+        """
+        now = datetime.utcnow()
+        deleted = await self._purge(
+            self.prisma.usersession, {"expiresAt": {"lt": now}}
+        )
+        deleted += await self._purge(
+            self.prisma.passwordresettoken,
+            {"OR": [{"expiresAt": {"lt": now}}, {"usedAt": {"not": None}}]},
+        )
+        return deleted
+
+    async def backfill_token_ids(self) -> int:
+        """Set tokenId on live sessions that don't have one yet.
+
+        Returns:
+            int: The number of sessions updated
+        """
+        updated = 0
+        while True:
+            batch = await self.prisma.usersession.find_many(
+                where={
+                    "tokenId": None,
+                    "expiresAt": {"gt": datetime.utcnow()},
+                },
+                take=self.batch_size,
+            )
+            if not batch:
+                return updated
+
+            for session in batch:
+                await self.prisma.usersession.update(
+                    where={"id": session.id},
+                    data={"tokenId": token_id(session.token)},
+                )
+            updated += len(batch)
+            if len(batch) < self.batch_size:
+                return updated
+
+            # Let requests in between batches
+            await asyncio.sleep(0)
+
+    async def _purge(self, actions: Any, where: dict) -> int:
+        """Delete matching rows one batch at a time"""
+        deleted = 0
+        while True:
+            batch = await actions.find_many(
+                where=where, take=self.batch_size
+            )
+            if not batch:
+                return deleted
+
+            deleted += await actions.delete_many(
+                where={"id": {"in": [row.id for row in batch]}}
+            )
+            if len(batch) < self.batch_size:
+                return deleted
+
+            # Let requests in between batches
+            await asyncio.sleep(0)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                backfilled = await self.backfill_token_ids()
+                if backfilled:
+                    logger.info(f"Backfilled tokenId of {backfilled} sessions")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error backfilling session token ids: {str(e)}")
+
+            try:
+                deleted = await self.sweep()
+                if deleted:
+                    logger.info(f"Purged {deleted} expired session rows")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error sweeping sessions: {str(e)}")
+
+            await asyncio.sleep(self.interval_seconds)
@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Tuple
+import logging
+import time
+
+from api.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TenantCache:
+    """TTL cache of whether tenant ids exist and are not deleted.
+
+    Known tenants are remembered for `ttl_seconds`, unknown ids only for
+    `negative_ttl_seconds`, which still stops a flood of bogus ids from
+    reaching the database on every request.
+
+    Tenants are not created or deleted through the API, so nothing in
+    this process calls `invalidate()` yet; a route that writes tenants
+    must call it.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = settings.TENANT_CACHE_TTL_SECONDS,
+        negative_ttl_seconds: int = settings.TENANT_CACHE_NEGATIVE_TTL_SECONDS,
+        max_entries: int = settings.TENANT_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        # Tenant id -> (exists, expires at)
+        self._entries: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()
+
+    async def exists(self, prisma: Any, tenant_id: str) -> bool:
+        """Check a tenant exists, from the cache when possible"""
+        entry = self._entries.get(tenant_id)
+        if entry is not None and entry[1] > time.monotonic():
+            self._entries.move_to_end(tenant_id)
+            return entry[0]
+
+        tenant = await prisma.tenant.find_unique(where={"id": tenant_id})
+        exists = bool(tenant) and not tenant.deleted
+
+        ttl = self.ttl_seconds if exists else self.negative_ttl_seconds
+        self._entries[tenant_id] = (exists, time.monotonic() + ttl)
+        self._entries.move_to_end(tenant_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        return exists
+
+    def invalidate(self, tenant_id: str) -> None:
+        """Forget a tenant after it is created or deleted"""
+        self._entries.pop(tenant_id, None)
+
+
+@lru_cache()
+def get_tenant_cache() -> TenantCache:
+    """Get the process-wide tenant cache"""
+    return TenantCache()
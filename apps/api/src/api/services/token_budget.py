@@ -0,0 +1,195 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import asyncio
+import logging
+
+from api.core.config import settings
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Tokens the chat format adds around each message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def _get_encoder(model: str) -> Callable[[str], int]:
+    """Get a token counting function for a model.
+
+    Falls back to a rough four-characters-per-token estimate when
+    tiktoken or the model's encoding is unavailable.
+    """
+    if tiktoken is None:
+        logger.warning("tiktoken is not installed, estimating token counts")
+        return _estimate_tokens
+
+    try:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # Encodings are downloaded on first use
+        logger.warning(
+            f"Could not load tokenizer for {model}, estimating token "
+            f"counts: {str(e)}"
+        )
+        return _estimate_tokens
+
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+class TokenBudgetPacker:
+    """Fits retrieved chunks and conversation history into the prompt
+    token budget of a model.
+
+    Chunks are packed greedily by retrieval score and history by
+    recency. Token counts of chunks are cached by chunk id, since chunk
+    content never changes once stored.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        max_answer_tokens: int = settings.LLM_MAX_TOKENS,
+        context_window: int = settings.LLM_CONTEXT_WINDOW,
+        prompt_token_budget: int = settings.LLM_PROMPT_TOKEN_BUDGET,
+        history_token_share: float = settings.LLM_HISTORY_TOKEN_SHARE,
+        cache_size: int = settings.LLM_TOKEN_COUNT_CACHE_SIZE,
+    ):
+        self.model = model
+        self._count: Optional[Callable[[str], int]] = None
+        self.max_answer_tokens = max_answer_tokens
+        self.context_window = context_window
+        self.prompt_token_budget = prompt_token_budget
+        self.history_token_share = history_token_share
+        self.cache_size = cache_size
+        self._chunk_tokens: "OrderedDict[str, int]" = OrderedDict()
+
+    async def load(self, timeout: float) -> None:
+        """Load the tokenizer in a thread, so startup doesn't block the
+        event loop while tiktoken downloads its encoding.
+
+        If loading takes longer than `timeout`, token counts are
+        estimated until it finishes.
+        """
+        try:
+            await asyncio.wait_for(
+                asyncio.to_thread(self._load_encoder), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Loading the tokenizer for {self.model} took over "
+                f"{timeout}s, estimating token counts until it loads"
+            )
+            if self._count is None:
+                self._count = _estimate_tokens
+
+    def _load_encoder(self) -> None:
+        self._count = _get_encoder(self.model)
+
+    def count(self, text: str) -> int:
+        """Count the tokens in a text.
+
+        The tokenizer is loaded here if `load()` wasn't awaited first,
+        e.g. in scripts.
+        """
+        if self._count is None:
+            self._load_encoder()
+        return self._count(text)
+
+    def chunk_tokens(self, chunk: Dict[str, Any]) -> int:
+        """Count the tokens a chunk adds to the context, cached by id"""
+        tokens = self._chunk_tokens.get(chunk["id"])
+        if tokens is not None:
+            self._chunk_tokens.move_to_end(chunk["id"])
+            return tokens
+
+        source = chunk["metadata"].get("source", "Unknown source")
+        # "[n] Source: ...\n<content>\n" plus the separating newline
+        tokens = self.count(f"[00] Source: {source}\n{chunk['content']}\n\n")
+
+        self._chunk_tokens[chunk["id"]] = tokens
+        if len(self._chunk_tokens) > self.cache_size:
+            self._chunk_tokens.popitem(last=False)
+        return tokens
+
+    def message_tokens(self, message: Dict[str, str]) -> int:
+        """Count the tokens of a chat message"""
+        return self.count(message["content"]) + MESSAGE_OVERHEAD_TOKENS
+
+    def pack(
+        self,
+        fixed_messages: List[Dict[str, str]],
+        context_chunks: List[Dict[str, Any]],
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+        """Select the chunks and history messages that fit the budget.
+
+        Args:
+            fixed_messages (List[Dict[str, str]]): Messages always sent,
+                i.e. the system prompt without context and the query.
+            context_chunks (List[Dict[str, Any]]): Retrieved chunks.
+            conversation_history (List[Dict[str, str]]): Previous
+                messages, oldest first.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], List[Dict[str, str]]]: The chunks
+            to use, best first, and the history to use, oldest first.
+        """
+        conversation_history = conversation_history or []
+
+        available = min(
+            self.context_window - self.max_answer_tokens,
+            self.prompt_token_budget,
+        ) - sum(self.message_tokens(m) for m in fixed_messages)
+
+        if available <= 0:
+            logger.warning("Prompt budget exhausted by the fixed messages")
+            return [], []
+
+        history_budget = int(available * self.history_token_share)
+        context_budget = available - history_budget
+
+        # Chunks by score, skipping any that no longer fit
+        packed_chunks = []
+        for chunk in sorted(
+            context_chunks,
+            key=lambda c: c.get("similarity", 0),
+            reverse=True,
+        ):
+            tokens = self.chunk_tokens(chunk)
+            if tokens <= context_budget:
+                packed_chunks.append(chunk)
+                context_budget -= tokens
+
+        # Unused context budget goes to history, newest first, keeping
+        # the kept messages contiguous
+        history_budget += context_budget
+        packed_history = []
+        for message in reversed(conversation_history):
+            tokens = self.message_tokens(message)
+            if tokens > history_budget:
+                break
+            packed_history.append(message)
+            history_budget -= tokens
+        packed_history.reverse()
+
+        truncated = len(packed_chunks) < len(context_chunks) or (
+            len(packed_history) < len(conversation_history)
+        )
+        if truncated:
+            logger.info(
+                f"Packed {len(packed_chunks)}/{len(context_chunks)} chunks "
+                f"and {len(packed_history)}/{len(conversation_history)} "
+                "history messages into the prompt budget"
+            )
+
+        return packed_chunks, packed_history
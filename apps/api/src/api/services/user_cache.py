@@ -0,0 +1,90 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional
+import logging
+import time
+
+from api.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _CachedUser:
+    user: Any
+    expires_at: float
+
+
+class AuthenticatedUserCache:
+    """Bounded TTL cache of validated tokens to user snapshots.
+
+    A hit skips the session and user queries of `get_current_user`.
+    The user is cached with its tenant and role as they were when the
+    token was validated, for at most `ttl_seconds` and never past the
+    token's own expiry.
+
+    Revocations (logout, password change or reset) evict entries in the
+    worker that handles them. Other workers evict them when their
+    revocation filter syncs, at most `AUTH_REVOCATION_SYNC_SECONDS`
+    later.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = settings.AUTH_USER_CACHE_TTL_SECONDS,
+        max_entries: int = settings.AUTH_USER_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, _CachedUser]" = OrderedDict()
+
+    def get(self, token: str) -> Optional[Any]:
+        """Get the cached user for a token"""
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[token]
+            return None
+        self._entries.move_to_end(token)
+        return entry.user
+
+    def set(self, token: str, user: Any, token_expires_at: float) -> None:
+        """Cache a validated user.
+
+        Args:
+            token (str): The access token.
+            user (Any): The user, with its tenant and role.
+            token_expires_at (float): The token's `exp` claim, a Unix
+                timestamp.
+        """
+        ttl = min(self.ttl_seconds, token_expires_at - time.time())
+        if ttl <= 0:
+            return
+
+        self._entries[token] = _CachedUser(
+            user=user, expires_at=time.monotonic() + ttl
+        )
+        self._entries.move_to_end(token)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def evict_token(self, token: str) -> None:
+        """Forget a token"""
+        self._entries.pop(token, None)
+
+    def evict_user(self, user_id: str) -> None:
+        """Forget every token of a user"""
+        for token in [
+            token
+            for token, entry in self._entries.items()
+            if entry.user.id == user_id
+        ]:
+            del self._entries[token]
+
+
+@lru_cache()
+def get_user_cache() -> AuthenticatedUserCache:
+    """Get the process-wide authenticated user cache"""
+    return AuthenticatedUserCache()
@@ -17,6 +17,10 @@ from ._metrics import (
     Metrics as Metrics,
     MetricHistogram as MetricHistogram,
 )
+from ._hydration import (
+    HydrationMode as HydrationMode,
+    hydration as hydration,
+)
 from .validator import *
 
 # the import ordering is important here because
@@ -1,9 +1,11 @@
 import json
-from typing import Any
+from typing import Any, AsyncIterator
+from contextlib import asynccontextmanager
 from typing_extensions import override
 
 import httpx
 
+from ._codec import get_codec
 from ._types import Method
 from .http_abstract import AbstractHTTP, AbstractResponse
 
@@ -25,9 +27,15 @@ class AsyncHTTP(AbstractHTTP[httpx.AsyncClient, httpx.Response]):
     async def request(self, method: Method, url: str, **kwargs: Any) -> 'Response':
         return Response(await self.session.request(method, url, **kwargs))
 
+    @asynccontextmanager
+    async def stream(self, method: Method, url: str, **kwargs: Any) -> AsyncIterator['Response']:
+        """Send a request without reading the response body up front"""
+        async with self.session.stream(method, url, **kwargs) as response:
+            yield Response(response)
+
     @override
     def open(self) -> None:
-        self.session = httpx.AsyncClient(**self.session_kwargs)
+        self.session = httpx.AsyncClient(**self._client_kwargs(httpx.AsyncHTTPTransport))
 
     @override
     async def close(self) -> None:
@@ -61,8 +69,16 @@ class Response(AbstractResponse[httpx.Response]):
 
     @override
     async def json(self, **kwargs: Any) -> Any:
-        return json.loads(await self.original.aread(), **kwargs)
+        if kwargs:
+            return json.loads(await self.original.aread(), **kwargs)
+        return get_codec().loads(await self.original.aread())
 
     @override
     async def text(self, **kwargs: Any) -> str:
         return ''.join([part async for part in self.original.aiter_text(**kwargs)])
+
+    async def read(self) -> bytes:
+        return await self.original.aread()
+
+    def aiter_bytes(self) -> AsyncIterator[bytes]:
+        return self.original.aiter_bytes()
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import warnings
 from types import TracebackType
-from typing import Any, Generic, TypeVar, overload
+from typing import Any, Generic, Iterator, TypeVar, AsyncIterator, overload
 from pathlib import Path
 from datetime import timedelta
 from typing_extensions import Self, Literal
@@ -17,10 +17,13 @@ from .engine import (
     BaseAbstractEngine,
     SyncAbstractEngine,
     AsyncAbstractEngine,
+    AsyncQueryEnginePool,
 )
 from .errors import ClientNotConnectedError, ClientNotRegisteredError
 from ._compat import model_parse, removeprefix
 from ._builder import QueryBuilder
+from ._loader import FindUniqueLoader, unique_lookup
+from ._hydration import HydrationMode, hydrate
 from ._metrics import Metrics
 from ._registry import get_client
 from .generator.models import EngineType
@@ -66,6 +69,7 @@ def load_env(*, override: bool = False, **kwargs: Any) -> None:
 
 
 _EngineT = TypeVar('_EngineT', bound=BaseAbstractEngine)
+_ModelT = TypeVar('_ModelT', bound=BaseModel)
 
 
 class BasePrisma(Generic[_EngineT]):
@@ -74,6 +78,7 @@ class BasePrisma(Generic[_EngineT]):
     _connect_timeout: int | timedelta
     _tx_id: TransactionId | None
     _http_config: HttpConfig
+    _hydration: HydrationMode
     _internal_engine: _EngineT | None
     _copied: bool
 
@@ -92,6 +97,10 @@ class BasePrisma(Generic[_EngineT]):
         '_datasource',
         '_log_queries',
         '_http_config',
+        '_hydration',
+        '_loader',
+        '_batch_find_unique',
+        '_engine_processes',
         '_schema_path',
         '_engine_type',
         '_prisma_models',
@@ -112,6 +121,9 @@ class BasePrisma(Generic[_EngineT]):
         datasource: DatasourceOverride | None,
         connect_timeout: int | timedelta,
         http: HttpConfig | None,
+        hydration: HydrationMode = 'validate',
+        batch_find_unique: bool = False,
+        engine_processes: int = 1,
     ) -> None:
         # NOTE: if you add any more properties here then you may also need to forward
         # them in the `_copy()` method.
@@ -130,6 +142,10 @@ class BasePrisma(Generic[_EngineT]):
 
         self._connect_timeout = connect_timeout
         self._http_config: HttpConfig = http or {}
+        self._hydration = hydration
+        self._batch_find_unique = batch_find_unique
+        self._loader: FindUniqueLoader | None = None
+        self._engine_processes = engine_processes
         self._tx_id: TransactionId | None = None
         self._copied: bool = False
 
@@ -214,6 +230,9 @@ class BasePrisma(Generic[_EngineT]):
             datasource=self._datasource,
             log_queries=self._log_queries,
             connect_timeout=self._connect_timeout,
+            hydration=self._hydration,
+            batch_find_unique=self._batch_find_unique,
+            engine_processes=self._engine_processes,
         )
         new._copied = True
 
@@ -286,6 +305,20 @@ class BasePrisma(Generic[_EngineT]):
         log.debug('datasources: %s', datasources)
         return timeout, datasources
 
+    def find_unique_batch_stats(self) -> dict[str, dict[str, int | float]]:
+        """Return metrics on how `find_unique()` calls were batched, for each model.
+
+        This is only populated if the client was created with `batch_find_unique=True`.
+        """
+        if self._loader is None:
+            return {}
+        return self._loader.stats()
+
+    def _hydrate(self, model: type[_ModelT], data: Any) -> _ModelT:
+        """Turn a query result into a model using the client's hydration mode,
+        unless it is overridden with `hydration()`"""
+        return hydrate(model, data, default=self._hydration)
+
     def _make_query_builder(
         self,
         *,
@@ -393,6 +426,9 @@ class SyncBasePrisma(BasePrisma[SyncAbstractEngine]):
         return model_parse(Metrics, response)
 
     def _create_engine(self, dml_path: Path | None = None) -> SyncAbstractEngine:
+        if self._engine_processes != 1:
+            raise NotImplementedError('Multiple query engine processes are only supported by the asyncio client')
+
         if self._engine_type == EngineType.binary:
             return SyncQueryEngine(
                 dml_path=dml_path or self._packaged_schema_path,
@@ -422,6 +458,36 @@ class SyncBasePrisma(BasePrisma[SyncAbstractEngine]):
         )
         return self._engine.query(builder.build(), tx_id=self._tx_id)
 
+    def _execute_find_unique(
+        self,
+        *,
+        model: type[BaseModel],
+        where: Any,
+        include: Any,
+    ) -> Any:
+        # lookups are made one at a time by the synchronous client so there is nothing to batch
+        return self._execute(
+            method='find_unique',
+            model=model,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+        )
+
+    def _execute_stream(
+        self,
+        method: PrismaMethod,
+        arguments: dict[str, Any],
+        model: type[BaseModel] | None = None,
+        root_selection: list[str] | None = None,
+    ) -> Iterator[Any]:
+        """Execute a query with a list result, yielding its records as they are received"""
+        builder = self._make_query_builder(
+            method=method, model=model, arguments=arguments, root_selection=root_selection
+        )
+        return self._engine.query_stream(builder.build(), tx_id=self._tx_id)
+
 
 class AsyncBasePrisma(BasePrisma[AsyncAbstractEngine]):
     __slots__ = ()
@@ -512,6 +578,14 @@ class AsyncBasePrisma(BasePrisma[AsyncAbstractEngine]):
         return model_parse(Metrics, response)
 
     def _create_engine(self, dml_path: Path | None = None) -> AsyncAbstractEngine:
+        if self._engine_type == EngineType.binary and self._engine_processes > 1:
+            return AsyncQueryEnginePool(
+                size=self._engine_processes,
+                dml_path=dml_path or self._packaged_schema_path,
+                log_queries=self._log_queries,
+                http_config=self._http_config,
+            )
+
         if self._engine_type == EngineType.binary:
             return AsyncQueryEngine(
                 dml_path=dml_path or self._packaged_schema_path,
@@ -541,3 +615,44 @@ class AsyncBasePrisma(BasePrisma[AsyncAbstractEngine]):
             method=method, model=model, arguments=arguments, root_selection=root_selection
         )
         return await self._engine.query(builder.build(), tx_id=self._tx_id)
+
+    async def _execute_find_unique(
+        self,
+        *,
+        model: type[BaseModel],
+        where: Any,
+        include: Any,
+    ) -> Any:
+        """Execute a `find_unique()` query, batched with concurrent lookups if enabled"""
+        if self._batch_find_unique:
+            lookup = unique_lookup(where)
+            if lookup is not None:
+                if self._loader is None:
+                    self._loader = FindUniqueLoader(self._execute)
+
+                field, value = lookup
+                record = await self._loader.load(model, field, value, include)
+                return {'data': {'result': record}}
+
+        return await self._execute(
+            method='find_unique',
+            model=model,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+        )
+
+    def _execute_stream(
+        self,
+        *,
+        method: PrismaMethod,
+        arguments: dict[str, Any],
+        model: type[BaseModel] | None = None,
+        root_selection: list[str] | None = None,
+    ) -> AsyncIterator[Any]:
+        """Execute a query with a list result, yielding its records as they are received"""
+        builder = self._make_query_builder(
+            method=method, model=model, arguments=arguments, root_selection=root_selection
+        )
+        return self._engine.query_stream(builder.build(), tx_id=self._tx_id)
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import re
 import json
 import decimal
 import inspect
 import logging
 import datetime
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Union, Mapping, Iterable, ForwardRef, cast
+from typing import TYPE_CHECKING, Any, Union, Mapping, Hashable, Iterable, ForwardRef, cast
+from types import MappingProxyType
+from collections import OrderedDict
 from datetime import timezone
-from textwrap import indent
 from functools import singledispatch
 from typing_extensions import Literal, TypeGuard, override
 
@@ -20,6 +22,7 @@ from ._types import PrismaMethod
 from .errors import InvalidModelError, UnknownModelError, UnknownRelationalFieldError
 from ._compat import get_args, is_union, get_origin, model_fields, model_field_type
 from ._typing import is_list_type
+from ._codec import get_codec
 from ._constants import QUERY_BUILDER_ALIASES
 
 if TYPE_CHECKING:
@@ -73,6 +76,23 @@ METHOD_FORMAT_MAPPING: dict[PrismaMethod, str] = {
     'find_unique_or_raise': 'findUnique{model}OrThrow',
 }
 
+# How separators are rendered in compact queries, the engine only needs
+# tokens to be separated where they would otherwise run together
+COMPACT_SEPARATORS: dict[str, str] = {
+    '\n': ' ',
+    ',\n': ',',
+    ': ': ':',
+    ' ': '',
+}
+
+RAW_METHODS: set[PrismaMethod] = {'query_raw', 'query_first', 'execute_raw'}
+
+QUERY_TEMPLATE_CACHE_SIZE = 1024
+
+# Slots are rendered as JSON strings of the slot index wrapped in NUL characters,
+# which json.dumps always escapes
+SLOT_PATTERN = re.compile(r'"\\u0000(\d+)\\u0000"')
+
 MISSING = object()
 Operation = Literal['query', 'mutation']
 
@@ -162,10 +182,12 @@ class QueryBuilder:
         }
         return dumps(data)
 
-    def build_query(self) -> str:
+    def build_query(self, *, pretty: bool = False) -> str:
         """Build the GraphQL query
 
-        Example query:
+        The query is rendered compactly, on a single line, unless `pretty` is True.
+
+        Example pretty query:
 
         query {
           result: findUniqueUser
@@ -184,19 +206,66 @@ class QueryBuilder:
             }
           }
         }
+
+
+        Example compact query:
+
+        query {result: findUniqueUser(where:{id:"ckq23ky3003510r8zll5m2hma"}) {id name profile{id user_id bio}}}
         """
-        query = self._create_root_node().render()
-        log.debug('Generated query: \n%s', query)
+        if pretty or self.method in RAW_METHODS:
+            query = self._create_root_node(self.arguments, self.include).render(pretty=pretty)
+        else:
+            query = self._build_from_template()
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                'Generated query: \n%s',
+                query if pretty else self._create_root_node(self.arguments, self.include).render(pretty=True),
+            )
         return query
 
-    def _create_root_node(self) -> 'RootNode':
+    def _build_from_template(self) -> str:
+        """Build the compact query from the cached template for its shape
+
+        Queries that only differ in their values share a shape, so the node tree is only
+        created and rendered the first time a shape is seen. After that, building a query
+        just serializes its values into the template.
+        """
+        values: list[Any] = []
+        arguments_shape, arguments = _parameterize(self.arguments, values)
+        if self.include is None:
+            include_shape, include = None, None
+        else:
+            include_shape, include = _parameterize_include(self.include, values)
+
+        root_selection = self.root_selection
+        key = (
+            self.method,
+            self.model,
+            tuple(root_selection) if root_selection is not None else None,
+            arguments_shape,
+            include_shape,
+        )
+        template = _query_templates.get(key)
+        if template is None:
+            template = QueryTemplate.parse(self._create_root_node(arguments, include).render(pretty=False))
+            _query_templates[key] = template
+            # evict the least recently used template
+            if len(_query_templates) > QUERY_TEMPLATE_CACHE_SIZE:
+                _query_templates.popitem(last=False)
+        else:
+            _query_templates.move_to_end(key)
+
+        return template.render(values)
+
+    def _create_root_node(self, arguments: dict[str, Any], include: dict[str, Any] | None) -> 'RootNode':
         root = RootNode(builder=self)
-        root.add(ResultNode.create(self))
+        root.add(ResultNode.create(self, arguments=arguments))
         root.add(
             Selection.create(
                 self,
                 model=self.model,
-                include=self.include,
+                include=include,
                 root_selection=self.root_selection,
             )
         )
@@ -215,13 +284,7 @@ class QueryBuilder:
         if name not in self.prisma_models:
             raise UnknownModelError(name)
 
-        # by default we exclude every field that points to a PrismaModel as that indicates that it is a relational field
-        # we explicitly keep fields that point to anything else, even other pydantic.BaseModel types, as they can be used to deserialize JSON
-        return [
-            field
-            for field, info in model_fields(model).items()
-            if not _field_is_prisma_model(info, name=field, parent=model)
-        ]
+        return list(ModelMetadata.of(model).scalar_fields)
 
     def get_relational_model(self, current_model: type[PrismaModel], field: str) -> type[PrismaModel]:
         """Returns the model that the field is related to.
@@ -244,11 +307,10 @@ class QueryBuilder:
             raise UnknownRelationalFieldError(model=current_model.__name__, field=field)
 
         try:
-            info = model_fields(current_model)[field]
+            model = ModelMetadata.of(current_model).relations[field]
         except KeyError as exc:
             raise UnknownRelationalFieldError(model=current_model.__name__, field=field) from exc
 
-        model = _prisma_model_for_field(info, name=field, parent=current_model)
         if not model:
             raise RuntimeError(
                 f"The `{field}` field doesn't appear to be a Prisma Model type. "
@@ -279,6 +341,151 @@ class QueryBuilder:
         return transformed
 
 
+class ModelMetadata:
+    """Field information about a model that is computed once and never changes at runtime
+
+    `scalar_fields` are the fields selected by default, `relations` maps every field to the
+    Prisma model it points to, or None if it doesn't point to one.
+    """
+
+    scalar_fields: tuple[str, ...]
+    relations: Mapping[str, type[PrismaModel] | None]
+
+    __slots__ = (
+        'scalar_fields',
+        'relations',
+    )
+
+    def __init__(self, scalar_fields: tuple[str, ...], relations: Mapping[str, type[PrismaModel] | None]) -> None:
+        self.scalar_fields = scalar_fields
+        self.relations = relations
+
+    @classmethod
+    def of(cls, model: type[BaseModel]) -> ModelMetadata:
+        """Get the metadata for a model, computing it on first use"""
+        metadata = _model_metadata.get(model)
+        if metadata is None:
+            metadata = _model_metadata[model] = cls.compute(model)
+        return metadata
+
+    @classmethod
+    def compute(cls, model: type[BaseModel]) -> ModelMetadata:
+        relations = {
+            field: _prisma_model_for_field(info, name=field, parent=model) for field, info in model_fields(model).items()
+        }
+
+        # by default we exclude every field that points to a PrismaModel as that indicates that it is a relational field
+        # we explicitly keep fields that point to anything else, even other pydantic.BaseModel types, as they can be used to deserialize JSON
+        return cls(
+            scalar_fields=tuple(field for field, relation in relations.items() if relation is None),
+            relations=MappingProxyType(relations),
+        )
+
+
+_model_metadata: dict[type[BaseModel], ModelMetadata] = {}
+
+
+class Slot:
+    """Placeholder for a value in the arguments that a query template is rendered from"""
+
+    index: int
+
+    __slots__ = ('index',)
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+
+class QueryTemplate:
+    """A compact query split around the slots its values are serialized into"""
+
+    fragments: tuple[str, ...]
+    slots: tuple[int, ...]
+
+    __slots__ = (
+        'fragments',
+        'slots',
+    )
+
+    def __init__(self, fragments: tuple[str, ...], slots: tuple[int, ...]) -> None:
+        self.fragments = fragments
+        self.slots = slots
+
+    @classmethod
+    def parse(cls, query: str) -> QueryTemplate:
+        """Create a template from a query rendered with `Slot` values"""
+        parts = SLOT_PATTERN.split(query)
+        return cls(fragments=tuple(parts[::2]), slots=tuple(int(index) for index in parts[1::2]))
+
+    def render(self, values: list[Any]) -> str:
+        """Render the query for the given slot values"""
+        fragments = self.fragments
+        parts = [fragments[0]]
+        for slot, fragment in zip(self.slots, fragments[1:]):
+            value = values[slot]
+            if isinstance(value, ITERABLES):
+                # matches how ListNode renders lists of scalars
+                parts.append(dumps(list(value)))
+            else:
+                parts.append(dumps(value))
+            parts.append(fragment)
+        return ''.join(parts)
+
+
+_query_templates: OrderedDict[Hashable, QueryTemplate] = OrderedDict()
+
+
+def _parameterize(value: Any, values: list[Any]) -> tuple[Hashable, Any]:
+    """Split a value into its shape and a copy with every value replaced by a slot
+
+    Replaced values are appended to `values`. Lists of scalars are replaced as a whole
+    and None is kept as it changes how arguments are rendered.
+    """
+    if isinstance(value, dict):
+        shape: list[Hashable] = []
+        skeleton: dict[str, Any] = {}
+        for key, item in value.items():
+            item_shape, skeleton[key] = _parameterize(item, values)
+            shape.append((key, item_shape))
+        return ('{', tuple(shape)), skeleton
+
+    if isinstance(value, ITERABLES) and any(isinstance(item, dict) for item in value):
+        shapes: list[Hashable] = []
+        items: list[Any] = []
+        for item in value:
+            item_shape, item = _parameterize(item, values)
+            shapes.append(item_shape)
+            items.append(item)
+        return ('[', tuple(shapes)), items
+
+    if value is None:
+        return None, None
+
+    values.append(value)
+    return '?', Slot(len(values) - 1)
+
+
+def _parameterize_include(include: dict[str, Any], values: list[Any]) -> tuple[Hashable, dict[str, Any]]:
+    """Split an include mapping into its shape and a copy with every argument replaced by a slot"""
+    shape: list[Hashable] = []
+    skeleton: dict[str, Any] = {}
+    for key, value in include.items():
+        if isinstance(value, dict):
+            args = value.copy()
+            nested_include = args.pop('include', None)
+            args_shape, skeleton[key] = _parameterize(args, values)
+            if nested_include is not None:
+                nested_shape, skeleton[key]['include'] = _parameterize_include(nested_include, values)
+            else:
+                nested_shape = None
+            shape.append((key, args_shape, nested_shape))
+        else:
+            # invalid values are rejected when the template is rendered
+            shape.append((key, type(value), value is True))
+            skeleton[key] = value
+    return tuple(shape), skeleton
+
+
 def _prisma_model_for_field(
     field: FieldInfo,
     *,
@@ -311,30 +518,69 @@ def _prisma_model_for_field(
     return None
 
 
-def _field_is_prisma_model(field: FieldInfo, *, name: str, parent: type[BaseModel]) -> bool:
-    """Whether or not the given field info represents a model at the database level.
+def _is_prisma_model_type(type_: type[BaseModel]) -> TypeGuard[type[PrismaModel]]:
+    from .bases import _PrismaModel  # noqa: TID251
+
+    return issubclass(type_, _PrismaModel)
+
+
+class QueryWriter:
+    """Buffer that a tree of nodes is rendered into in a single pass
 
-    This will return `True` for cases where the field represents a list of models or a single model.
+    In compact mode separators are shortened and nothing is indented. In pretty mode
+    every line is prefixed with the indentation of all the nodes it is nested in.
     """
-    return _prisma_model_for_field(field, name=name, parent=parent) is not None
 
+    parts: list[str]
+    pretty: bool
+    prefix: str
 
-def _is_prisma_model_type(type_: type[BaseModel]) -> TypeGuard[type[PrismaModel]]:
-    from .bases import _PrismaModel  # noqa: TID251
+    __slots__ = (
+        'parts',
+        'pretty',
+        'prefix',
+    )
 
-    return issubclass(type_, _PrismaModel)
+    def __init__(self, *, pretty: bool = False) -> None:
+        self.parts = []
+        self.pretty = pretty
+        self.prefix = ''
+
+    def write(self, string: str) -> None:
+        """Write a string that does not contain a separator"""
+        self.parts.append(string)
+
+    def separate(self, separator: str) -> None:
+        """Write a separator, continuing onto a new, indented line if it contains one"""
+        if self.pretty:
+            self.parts.append(separator.replace('\n', '\n' + self.prefix))
+        else:
+            self.parts.append(COMPACT_SEPARATORS.get(separator, separator))
+
+    def getvalue(self) -> str:
+        return ''.join(self.parts)
 
 
 class AbstractNode(ABC):
     __slots__ = ()
 
     @abstractmethod
-    def render(self) -> str | None:
+    def write(self, writer: QueryWriter) -> bool:
+        """Write the node to the given writer
+
+        False is returned if nothing was written.
+        """
+        ...
+
+    def render(self, *, pretty: bool = True) -> str | None:
         """Render the node to a string
 
         None is returned if the node should not be rendered.
         """
-        ...
+        writer = QueryWriter(pretty=pretty)
+        if not self.write(writer):
+            return None
+        return writer.getvalue()
 
     def should_render(self) -> bool:
         """If True, rendering of the node is skipped
@@ -383,40 +629,62 @@ class Node(AbstractNode):
         return None
 
     @override
-    def render(self) -> str | None:
-        """Render the node and it's children and to string.
+    def write(self, writer: QueryWriter) -> bool:
+        """Write the node and it's children.
 
-        Rendering a node involves 4 steps:
+        Writing a node involves 3 steps:
 
         1. Entering the node
-        2. Rendering it's children
+        2. Writing it's children, indented by `indent`
         3. Departing the node
-        4. Joining the previous steps together into a single string
+
+        In pretty mode every step is separated by `joiner`, in compact
+        mode only the children are.
         """
         if not self.should_render():
-            return None
+            return False
+
+        parts = writer.parts
+        pretty = writer.pretty
+        joiner = self.joiner
 
-        strings: list[str] = []
         entered = self.enter()
         if entered is not None:
-            strings.append(entered)
+            writer.write(entered)
+
+        written = entered is not None
+        has_children = False
+        outer_prefix = writer.prefix
+        writer.prefix = outer_prefix + self.indent
 
         for child in self.children:
-            content: str | None = None
+            mark = len(parts)
+            if has_children or (pretty and written):
+                writer.separate(joiner)
+            elif pretty:
+                writer.write(self.indent)
 
             if isinstance(child, str):
-                content = child
-            else:
-                content = child.render()
+                if not child:
+                    del parts[mark:]
+                    continue
+                writer.write(child)
+            elif not child.write(writer):
+                del parts[mark:]
+                continue
+
+            written = has_children = True
 
-            if content:
-                strings.append(indent(content, self.indent))
+        writer.prefix = outer_prefix
 
         departed = self.depart()
         if departed is not None:
-            strings.append(departed)
+            if pretty and written:
+                writer.separate(joiner)
+            writer.write(departed)
+            written = True
 
-        return self.joiner.join(strings)
+        return written
 
     def add(self, child: ChildType) -> None:
         """Add a child"""
@@ -468,8 +736,8 @@ class RootNode(Node):
         return '}'
 
     @override
-    def render(self) -> str:
-        content = super().render()
+    def render(self, *, pretty: bool = True) -> str:
+        content = super().render(pretty=pretty)
         if not content:  # pragma: no cover
             # this should never happen.
             # render() is typed to return None if the node
@@ -492,10 +760,13 @@ class ResultNode(Node):
         <children>
     """
 
-    __slots__ = ()
+    arguments: dict[str, Any]
+
+    __slots__ = ('arguments',)
 
-    def __init__(self, indent: str = '', **kwargs: Any) -> None:
+    def __init__(self, arguments: dict[str, Any], indent: str = '', **kwargs: Any) -> None:
         super().__init__(indent=indent, **kwargs)
+        self.arguments = arguments
 
     @override
     def enter(self) -> str:
@@ -517,7 +788,7 @@ class ResultNode(Node):
         return [
             Arguments.create(
                 self.builder,
-                arguments=self.builder.arguments,
+                arguments=self.arguments,
             )
         ]
 
@@ -571,12 +842,12 @@ class Arguments(Node):
                 # here as prisma expects parameters to be passed as a json string
                 # value like "[\"John\",\"123\"]", and we encode twice to ensure
                 # that only the inner quotes are escaped
-                if self.builder.method in {'query_raw', 'query_first', 'execute_raw'}:
-                    children.append(f'{arg}: {dumps(dumps(value))}')
+                if self.builder.method in RAW_METHODS:
+                    children.append(Key(arg, node=dumps(dumps(value))))
                 else:
                     children.append(Key(arg, node=ListNode.create(self.builder, data=value)))
             else:
-                children.append(f'{arg}: {dumps(value)}')
+                children.append(Key(arg, node=dumps(value)))
 
         return children
 
@@ -619,12 +890,24 @@ class Data(Node):
             elif isinstance(value, (list, tuple, set)):
                 children.append(Key(key, node=ListNode.create(self.builder, data=value)))
             else:
-                children.append(f'{key}: {dumps(value)}')
+                children.append(Key(key, node=dumps(value)))
 
         return children
 
 
 class ListNode(Node):
+    """Rendered node examples:
+
+    [
+        "a",
+        "b"
+    ]
+
+    or, for a list of scalars in compact mode
+
+    ["a","b"]
+    """
+
     data: Iterable[Any]
 
     __slots__ = ('data',)
@@ -633,6 +916,23 @@ class ListNode(Node):
         super().__init__(joiner=joiner, **kwargs)
         self.data = data
 
+    @override
+    def write(self, writer: QueryWriter) -> bool:
+        if not self.children and not writer.pretty:
+            # scalars are valid JSON literals, so the whole list is dumped at once
+            # instead of being rendered item by item
+            writer.write(dumps(list(self.data)))
+            return True
+
+        if not self.children:
+            self.children = [dumps(item) for item in self.data]
+            try:
+                return super().write(writer)
+            finally:
+                self.children = []
+
+        return super().write(writer)
+
     @override
     def enter(self) -> str:
         return '['
@@ -643,6 +943,10 @@ class ListNode(Node):
 
     @override
     def create_children(self) -> list[ChildType]:
+        # lists of scalars have no children, they are dumped when written
+        if not any(isinstance(item, dict) for item in self.data):
+            return []
+
         children: list[ChildType] = []
 
         for item in self.data:
@@ -790,11 +1094,11 @@ class Selection(Node):
 
 
 class Key(AbstractNode):
-    """Node for rendering a child node with a prefixed key"""
+    """Node for rendering a child node, or an already rendered value, with a prefixed key"""
 
     key: str
     sep: str
-    node: Node
+    node: Node | str
 
     __slots__ = (
         'key',
@@ -802,17 +1106,21 @@ class Key(AbstractNode):
         'node',
     )
 
-    def __init__(self, key: str, node: Node, sep: str = ': ') -> None:
+    def __init__(self, key: str, node: Node | str, sep: str = ': ') -> None:
         self.key = key
         self.node = node
         self.sep = sep
 
     @override
-    def render(self) -> str:
-        content = self.node.render()
-        if content:
-            return f'{self.key}{self.sep}{content}'
-        return f'{self.key}{self.sep}'
+    def write(self, writer: QueryWriter) -> bool:
+        writer.write(self.key)
+        writer.separate(self.sep)
+        node = self.node
+        if isinstance(node, str):
+            writer.write(node)
+        else:
+            node.write(writer)
+        return True
 
 
 @singledispatch
@@ -862,6 +1170,12 @@ def serialize_base64(obj: fields.Base64) -> str:
     return str(obj)
 
 
+@serializer.register(Slot)
+def serialize_slot(obj: Slot) -> str:
+    """Serialize a template slot to the marker that QueryTemplate.parse splits on"""
+    return f'\x00{obj.index}\x00'
+
+
 @serializer.register(decimal.Decimal)
 def serialize_decimal(obj: decimal.Decimal) -> str:
     """Serialize a Decimal object to a string"""
@@ -869,6 +1183,13 @@ def serialize_decimal(obj: decimal.Decimal) -> str:
 
 
 def dumps(obj: Any, **kwargs: Any) -> str:
+    """Encode an object to compact JSON with the configured codec
+
+    Passing any `json.dumps()` keyword arguments, e.g. `indent`, uses the standard library instead.
+    """
+    if not kwargs:
+        return get_codec().dumps(obj, default=serializer)
+
     kwargs.setdefault('default', serializer)
     kwargs.setdefault('ensure_ascii', False)
     return json.dumps(obj, **kwargs)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import re
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+from ._config import config
+
+__all__ = (
+    'JSONCodec',
+    'StdlibCodec',
+    'OrjsonCodec',
+    'get_codec',
+    'set_codec',
+    'create_codec',
+)
+
+Default = Callable[[Any], Any]
+
+# orjson decodes integers outside of the 64 bit range as floats, these have at least this many digits
+LONG_NUMBER = re.compile(r'[0-9]{19}')
+LONG_NUMBER_BYTES = re.compile(rb'[0-9]{19}')
+
+
+class JSONCodec(ABC):
+    """Encodes queries to and decodes responses from the query engine"""
+
+    name: str
+
+    __slots__ = ()
+
+    @abstractmethod
+    def dumps(self, obj: Any, *, default: Default) -> str:
+        """Encode an object to compact JSON
+
+        `default` is called for objects that the codec cannot encode itself, and
+        must also be called for datetimes so they are always sent in UTC.
+        """
+        ...
+
+    @abstractmethod
+    def loads(self, data: str | bytes) -> Any:
+        """Decode JSON"""
+        ...
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}()'
+
+
+class StdlibCodec(JSONCodec):
+    """Codec using the standard library `json` module"""
+
+    name = 'stdlib'
+
+    __slots__ = ()
+
+    def dumps(self, obj: Any, *, default: Default) -> str:
+        return json.dumps(obj, default=default, ensure_ascii=False, separators=(',', ':'))
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec using `orjson`
+
+    Values orjson cannot encode, such as integers outside of the 64 bit range,
+    are encoded with the standard library instead. orjson would decode such integers
+    to floats, so documents containing any number that could be outside of the range
+    are decoded with the standard library as well.
+    """
+
+    name = 'orjson'
+
+    __slots__ = (
+        '_orjson',
+        '_options',
+        '_fallback',
+    )
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        self._fallback = StdlibCodec()
+
+    def dumps(self, obj: Any, *, default: Default) -> str:
+        try:
+            return self._orjson.dumps(obj, default=default, option=self._options).decode('utf-8')
+        except TypeError:
+            return self._fallback.dumps(obj, default=default)
+
+    def loads(self, data: str | bytes) -> Any:
+        pattern = LONG_NUMBER_BYTES if isinstance(data, bytes) else LONG_NUMBER
+        if pattern.search(data) is not None:  # type: ignore[arg-type]
+            return self._fallback.loads(data)
+        return self._orjson.loads(data)
+
+
+CODECS: dict[str, type[JSONCodec]] = {
+    'stdlib': StdlibCodec,
+    'orjson': OrjsonCodec,
+}
+
+_codec: JSONCodec | None = None
+
+
+def create_codec(name: str) -> JSONCodec:
+    """Create a codec by name, `auto` picks the fastest one that is installed"""
+    if name == 'auto':
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            return StdlibCodec()
+
+    try:
+        codec_cls = CODECS[name]
+    except KeyError:
+        raise ValueError(f'Unknown JSON codec: {name}, expected one of auto, {", ".join(CODECS)}') from None
+
+    return codec_cls()
+
+
+def get_codec() -> JSONCodec:
+    """Get the codec used for query engine traffic, set by the `json_codec` config option"""
+    global _codec
+    if _codec is None:
+        _codec = create_codec(config.json_codec)
+    return _codec
+
+
+def set_codec(codec: JSONCodec | str) -> None:
+    """Replace the codec used for query engine traffic"""
+    global _codec
+    _codec = create_codec(codec) if isinstance(codec, str) else codec
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import json
+import decimal
+import datetime
+from enum import Enum
+from typing import Any, Callable, Iterator, TypeVar
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing_extensions import Literal
+
+from pydantic import BaseModel
+
+from . import fields
+from ._compat import (
+    PYDANTIC_V2,
+    get_args,
+    is_union,
+    get_origin,
+    model_parse,
+    model_fields,
+    model_field_type,
+    is_field_required,
+)
+from ._typing import is_list_type
+
+__all__ = (
+    'HydrationMode',
+    'hydration',
+    'hydrate',
+)
+
+HydrationMode = Literal['validate', 'trusted']
+"""How query results are turned into models
+
+- `validate`: the default, results are parsed with full Pydantic validation
+- `trusted`: results are trusted to match the model as the query engine has already
+  typed them, models are constructed without validation and only the values the
+  engine sends as strings (DateTime, Json, BigInt, Decimal, Bytes) are converted
+
+Trusted hydration is faster for wide rows, e.g. with long lists, but Pydantic's compiled
+validators beat it on small rows with many DateTime or Json fields.
+"""
+
+_ModelT = TypeVar('_ModelT', bound=BaseModel)
+
+Converter = Callable[[Any], Any]
+Hydrator = Callable[[Any], Any]
+
+# the validator that prisma models are generated with, its behaviour is replicated
+# by the list converters
+GENERATED_VALIDATORS = {'_transform_required_list_fields'}
+
+UNSUPPORTED = object()
+
+_object_setattr = object.__setattr__
+
+_hydration_mode: ContextVar[HydrationMode | None] = ContextVar('_hydration_mode', default=None)
+_hydrators: dict[type[BaseModel], Hydrator | None] = {}
+
+
+@contextmanager
+def hydration(mode: HydrationMode) -> Iterator[None]:
+    """Override how query results are turned into models within the block
+
+    ```py
+    with hydration('trusted'):
+        chunks = await prisma.documentchunk.find_many()
+    ```
+    """
+    token = _hydration_mode.set(mode)
+    try:
+        yield
+    finally:
+        _hydration_mode.reset(token)
+
+
+def hydrate(model: type[_ModelT], data: Any, *, default: HydrationMode = 'validate') -> _ModelT:
+    """Turn a query result into a model using the active hydration mode
+
+    Models that cannot be constructed safely, e.g. because they define their own
+    validators, are always validated.
+    """
+    mode = _hydration_mode.get() or default
+    if mode == 'trusted':
+        hydrator = _get_hydrator(model)
+        if hydrator is not None:
+            return hydrator(data)  # type: ignore[no-any-return]
+
+    return model_parse(model, data)
+
+
+def _get_hydrator(model: type[BaseModel]) -> Hydrator | None:
+    try:
+        return _hydrators[model]
+    except KeyError:
+        hydrator = _hydrators[model] = _create_hydrator(model)
+        return hydrator
+
+
+def _create_hydrator(model: type[BaseModel]) -> Hydrator | None:
+    """Create a function constructing the model without validation
+
+    None is returned if the model cannot be constructed safely.
+    """
+    if _has_custom_validators(model):
+        return None
+
+    use_enum_values = _uses_enum_values(model)
+    converters: dict[str, Converter] = {}
+    # every optional field, mapped to its default
+    defaults: dict[str, Any] = {}
+    for name, info in model_fields(model).items():
+        converter = _create_converter(model_field_type(info), use_enum_values=use_enum_values)
+        if converter is UNSUPPORTED:
+            return None
+        if converter is not None:
+            converters[name] = converter
+
+        if info.default_factory is not None:
+            return None
+        if not is_field_required(info):
+            defaults[name] = info.default
+
+    construct = model.model_construct if PYDANTIC_V2 else model.construct  # type: ignore
+    items = tuple(converters.items())
+    size = len(model_fields(model))
+
+    def construct_model(data: Any) -> Any:
+        values = dict(data)
+        for name, converter in items:
+            if name in values:
+                values[name] = converter(values[name])
+        return construct(**values)
+
+    if not _can_set_dict(model):
+        return construct_model
+
+    def hydrator(data: Any) -> Any:
+        values = defaults.copy()
+        values.update(data)
+        if len(values) != size:
+            # the engine only ever sends model fields, so a required field is missing
+            return construct_model(data)
+
+        for name, converter in items:
+            values[name] = converter(values[name])
+
+        # this is what `model_construct()` does once defaults have been resolved
+        instance = model.__new__(model)
+        _object_setattr(instance, '__dict__', values)
+        _object_setattr(instance, '__pydantic_fields_set__', set(data))
+        _object_setattr(instance, '__pydantic_extra__', None)
+        _object_setattr(instance, '__pydantic_private__', None)
+        return instance
+
+    return hydrator
+
+
+def _create_converter(type_: Any, *, use_enum_values: bool) -> Converter | None | object:
+    """Create a function converting a value from the query engine to the given type
+
+    None is returned if the value can be used as is and `UNSUPPORTED` if the type is not
+    one that the query engine returns.
+    """
+    if type_ is None:
+        return UNSUPPORTED
+
+    if is_union(get_origin(type_)):
+        args = [arg for arg in get_args(type_) if arg is not type(None)]
+        if len(args) != 1:
+            return UNSUPPORTED
+
+        if is_list_type(args[0]):
+            return _create_list_converter(args[0], optional=True, use_enum_values=use_enum_values)
+
+        # every converter passes None through
+        return _create_converter(args[0], use_enum_values=use_enum_values)
+
+    if is_list_type(type_):
+        return _create_list_converter(type_, optional=False, use_enum_values=use_enum_values)
+
+    if isinstance(type_, type):
+        if hasattr(type_, '__prisma_model__'):
+            return _relation(type_)
+
+        if type_ in (str, bool):
+            return None
+
+        if issubclass(type_, Enum):
+            return None if use_enum_values else _optional(type_)
+
+        if issubclass(type_, fields.Json):
+            return _json
+
+        if issubclass(type_, fields.Base64):
+            return _optional(fields.Base64.fromb64)
+
+        if type_ in SCALAR_CONVERTERS:
+            return SCALAR_CONVERTERS[type_]
+
+    return UNSUPPORTED
+
+
+def _optional(converter: Converter) -> Converter:
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        return converter(value)
+
+    return convert
+
+
+def _create_list_converter(type_: Any, *, optional: bool, use_enum_values: bool) -> Converter | None | object:
+    args = get_args(type_)
+    converter = _create_converter(args[0], use_enum_values=use_enum_values) if args else None
+    if converter is UNSUPPORTED:
+        return converter
+
+    if optional:
+        if converter is None:
+            return None
+
+        def convert_optional(value: Any) -> Any:
+            if value is None:
+                return None
+            return [converter(item) for item in value]
+
+        return convert_optional
+
+    # some databases return None for list fields that have not been set yet in raw queries,
+    # the generated models validate this to an empty list
+    def convert(value: Any) -> Any:
+        if value is None:
+            return []
+        if converter is None:
+            return value
+        return [converter(item) for item in value]
+
+    return convert
+
+
+def _relation(model: type[BaseModel]) -> Converter:
+    # resolved on first use as relations are often cyclic
+    def convert(value: Any) -> Any:
+        if value is None or isinstance(value, BaseModel):
+            return value
+        hydrator = _get_hydrator(model)
+        if hydrator is None:
+            return model_parse(model, value)
+        return hydrator(value)
+
+    return convert
+
+
+def _json(value: Any) -> Any:
+    if isinstance(value, str):
+        return json.loads(value)
+    return value
+
+
+def _int(value: Any) -> Any:
+    # BigInt values are sent as strings
+    if isinstance(value, str):
+        return int(value)
+    return value
+
+
+def _decimal(value: Any) -> Any:
+    if value is None or isinstance(value, decimal.Decimal):
+        return value
+    return decimal.Decimal(str(value))
+
+
+def _datetime(value: Any) -> Any:
+    if isinstance(value, str):
+        # Python < 3.11 does not support the `Z` suffix
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.datetime.fromisoformat(value)
+    return value
+
+
+SCALAR_CONVERTERS: dict[type, Converter | None] = {
+    int: _int,
+    float: None,
+    decimal.Decimal: _decimal,
+    datetime.datetime: _datetime,
+}
+
+
+def _has_custom_validators(model: type[BaseModel]) -> bool:
+    if PYDANTIC_V2:
+        decorators = model.__pydantic_decorators__
+        names = {
+            *decorators.validators,
+            *decorators.field_validators,
+            *decorators.root_validators,
+            *decorators.model_validators,
+        }
+    else:
+        names = {
+            validator.func.__name__
+            for validators in model.__validators__.values()  # type: ignore
+            for validator in validators
+        }
+        if model.__pre_root_validators__ or model.__post_root_validators__:  # type: ignore
+            return True
+
+    return bool(names - GENERATED_VALIDATORS)
+
+
+def _can_set_dict(model: type[BaseModel]) -> bool:
+    """Whether instances can be created by setting their `__dict__` directly"""
+    if not PYDANTIC_V2:
+        return False
+    return (
+        model.__pydantic_post_init__ is None
+        and not model.__private_attributes__
+        and not model.__pydantic_root_model__
+        and model.model_config.get('extra') != 'allow'
+    )
+
+
+def _uses_enum_values(model: type[BaseModel]) -> bool:
+    if PYDANTIC_V2:
+        return bool(model.model_config.get('use_enum_values'))
+    return bool(getattr(model.__config__, 'use_enum_values', False))  # type: ignore
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, Tuple, Callable, Awaitable
+from collections import defaultdict
+
+from pydantic import BaseModel
+
+from ._builder import dumps
+
+__all__ = (
+    'FindUniqueLoader',
+    'unique_lookup',
+)
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# the model, the unique field and the serialized include
+BatchKey = Tuple['type[BaseModel]', str, 'str | None']
+
+Execute = Callable[..., Awaitable[Any]]
+
+
+def unique_lookup(where: Any) -> tuple[str, str | int] | None:
+    """Return the field and value of a `find_unique()` filter on a single scalar field
+
+    None is returned for filters that cannot be batched, e.g. compound unique filters.
+    """
+    if not isinstance(where, dict) or len(where) != 1:
+        return None
+
+    field, value = next(iter(where.items()))
+    if isinstance(value, bool) or not isinstance(value, (str, int)):
+        return None
+
+    return field, value
+
+
+class _Batch:
+    __slots__ = ('model', 'field', 'include', 'futures')
+
+    def __init__(self, model: type[BaseModel], field: str, include: Any) -> None:
+        self.model = model
+        self.field = field
+        self.include = include
+        self.futures: dict[str | int, asyncio.Future[Any]] = {}
+
+    def cancel_pending(self, _task: asyncio.Future[None]) -> None:
+        for future in self.futures.values():
+            future.cancel()
+
+
+class _Stats:
+    __slots__ = ('loads', 'deduplicated', 'batches', 'keys', 'max_batch_size')
+
+    def __init__(self) -> None:
+        self.loads = 0
+        self.deduplicated = 0
+        self.batches = 0
+        self.keys = 0
+        self.max_batch_size = 0
+
+    def to_dict(self) -> dict[str, int | float]:
+        return {
+            'loads': self.loads,
+            'deduplicated': self.deduplicated,
+            'batches': self.batches,
+            'keys': self.keys,
+            'max_batch_size': self.max_batch_size,
+            'mean_batch_size': self.keys / self.batches if self.batches else 0.0,
+        }
+
+
+class FindUniqueLoader:
+    """Coalesces `find_unique()` calls into batched `find_many()` queries
+
+    Lookups of the same model by the same unique field that are made within one event loop
+    iteration are sent as a single `find_many(where={field: {'in': [...]}})` query and the
+    records are fanned back out to each caller. Identical lookups within the same iteration
+    share a result. A lookup never joins a query that has already been sent, so it always
+    sees writes that completed before it was made.
+
+    Records are matched to lookups by comparing the string form of the field value, so a
+    lookup by a field with a case or accent insensitive collation, e.g. a `citext` email,
+    returns None when the stored value differs from the looked up one. Only enable batching
+    if lookups by such fields use the exact stored value.
+    """
+
+    __slots__ = (
+        '_execute',
+        '_batches',
+        '_stats',
+        '_scheduled',
+        '_tasks',
+    )
+
+    def __init__(self, execute: Execute) -> None:
+        self._execute = execute
+        self._batches: dict[BatchKey, _Batch] = {}
+        self._stats: Dict[str, _Stats] = defaultdict(_Stats)
+        self._scheduled = False
+        self._tasks: set[asyncio.Future[None]] = set()
+
+    async def load(self, model: type[BaseModel], field: str, value: str | int, include: Any = None) -> Any:
+        """Return the raw record with the given unique field value or None if it does not exist"""
+        key: BatchKey = (model, field, None if include is None else dumps(include))
+        stats = self._stats[model.__name__]
+        stats.loads += 1
+
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch(model, field, include)
+
+        future = batch.futures.get(value)
+        if future is not None:
+            stats.deduplicated += 1
+        else:
+            future = batch.futures[value] = asyncio.get_running_loop().create_future()
+
+            if not self._scheduled:
+                self._scheduled = True
+                asyncio.get_running_loop().call_soon(self._dispatch)
+
+        # shielded as the future is shared with every other caller looking up the same record
+        return await asyncio.shield(future)
+
+    def stats(self) -> dict[str, dict[str, int | float]]:
+        """Batch size metrics for each model"""
+        return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+    def _dispatch(self) -> None:
+        self._scheduled = False
+        batches = self._batches
+        self._batches = {}
+        for batch in batches.values():
+            stats = self._stats[batch.model.__name__]
+            stats.batches += 1
+            stats.keys += len(batch.futures)
+            stats.max_batch_size = max(stats.max_batch_size, len(batch.futures))
+            # a reference is kept so that the task is not garbage collected while it runs
+            task = asyncio.ensure_future(self._load_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            # the task can be cancelled before it starts running, so callers are released here
+            task.add_done_callback(batch.cancel_pending)
+
+    async def _load_batch(self, batch: _Batch) -> None:
+        try:
+            resp = await self._execute(
+                method='find_many',
+                model=batch.model,
+                arguments={
+                    'where': {batch.field: {'in': list(batch.futures)}},
+                    'include': batch.include,
+                },
+            )
+        except Exception as exc:
+            for future in batch.futures.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        # BigInt values are returned as strings, so records are matched on their string form
+        records = {str(record[batch.field]): record for record in resp['data']['result']}
+        for value, future in batch.futures.items():
+            if not future.done():
+                future.set_result(records.get(str(value)))
+
+        log.debug('Loaded %s %s records in one batch', len(batch.futures), batch.model.__name__)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, TypeVar, Callable, Iterator, Awaitable, AsyncIterator
+
+__all__ = (
+    'iter_pages',
+    'aiter_pages',
+)
+
+_T = TypeVar('_T')
+
+Arguments = Dict[str, Any]
+
+
+def iter_pages(
+    fetch: Callable[[Arguments], List[_T]],
+    *,
+    key: str,
+    page_size: int,
+    where: Any = None,
+    include: Any = None,
+) -> Iterator[List[_T]]:
+    """Walk every record matching `where` in pages, ordered by the unique field `key`
+
+    Pages are selected by the last key of the previous page instead of an offset, so every
+    page is as fast to find as the first one.
+    """
+    _validate_page_size(page_size)
+    return _iter_pages(fetch, key=key, page_size=page_size, where=where, include=include)
+
+
+def _iter_pages(
+    fetch: Callable[[Arguments], List[_T]],
+    *,
+    key: str,
+    page_size: int,
+    where: Any,
+    include: Any,
+) -> Iterator[List[_T]]:
+    page = fetch(_page_arguments(key=key, page_size=page_size, where=where, include=include))
+    while len(page) == page_size:
+        arguments = _page_arguments(
+            key=key,
+            page_size=page_size,
+            where=where,
+            include=include,
+            after=getattr(page[-1], key),
+        )
+        yield page
+        page = fetch(arguments)
+
+    if page:
+        yield page
+
+
+def aiter_pages(
+    fetch: Callable[[Arguments], Awaitable[List[_T]]],
+    *,
+    key: str,
+    page_size: int,
+    where: Any = None,
+    include: Any = None,
+    prefetch: bool = True,
+) -> AsyncIterator[List[_T]]:
+    """Walk every record matching `where` in pages, ordered by the unique field `key`
+
+    Pages are selected by the last key of the previous page instead of an offset, so every
+    page is as fast to find as the first one. If `prefetch` is True the next page is queried
+    while the current one is being processed.
+    """
+    _validate_page_size(page_size)
+    return _aiter_pages(
+        fetch,
+        key=key,
+        page_size=page_size,
+        where=where,
+        include=include,
+        prefetch=prefetch,
+    )
+
+
+async def _aiter_pages(
+    fetch: Callable[[Arguments], Awaitable[List[_T]]],
+    *,
+    key: str,
+    page_size: int,
+    where: Any,
+    include: Any,
+    prefetch: bool,
+) -> AsyncIterator[List[_T]]:
+    pending: asyncio.Future[List[_T]] | None = None
+    try:
+        page = await fetch(_page_arguments(key=key, page_size=page_size, where=where, include=include))
+        while len(page) == page_size:
+            arguments = _page_arguments(
+                key=key,
+                page_size=page_size,
+                where=where,
+                include=include,
+                after=getattr(page[-1], key),
+            )
+            if not prefetch:
+                yield page
+                page = await fetch(arguments)
+                continue
+
+            pending = asyncio.ensure_future(fetch(arguments))
+            yield page
+            page = await pending
+            pending = None
+
+        if page:
+            yield page
+    finally:
+        # the iteration was stopped early, the next page is no longer needed
+        if pending is not None:
+            if pending.done():
+                if not pending.cancelled():
+                    pending.exception()
+            else:
+                pending.cancel()
+
+
+def _page_arguments(
+    *,
+    key: str,
+    page_size: int,
+    where: Any,
+    include: Any,
+    after: Any = None,
+) -> Arguments:
+    if after is not None:
+        condition = {key: {'gt': after}}
+        where = condition if where is None else {'AND': [where, condition]}
+
+    return {
+        'take': page_size,
+        'where': where,
+        'include': include,
+        'order_by': {key: 'asc'},
+    }
+
+
+def _validate_page_size(page_size: int) -> None:
+    if page_size < 1:
+        raise ValueError(f'Expected page_size to be a positive integer, got {page_size}')
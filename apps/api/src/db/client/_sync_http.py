@@ -1,8 +1,10 @@
-from typing import Any
+from typing import Any, Iterator
+from contextlib import contextmanager
 from typing_extensions import override
 
 import httpx
 
+from ._codec import get_codec
 from ._types import Method
 from .http_abstract import AbstractHTTP, AbstractResponse
 
@@ -24,9 +26,15 @@ class SyncHTTP(AbstractHTTP[httpx.Client, httpx.Response]):
     def request(self, method: Method, url: str, **kwargs: Any) -> 'Response':
         return Response(self.session.request(method, url, **kwargs))
 
+    @contextmanager
+    def stream(self, method: Method, url: str, **kwargs: Any) -> Iterator['Response']:
+        """Send a request without reading the response body up front"""
+        with self.session.stream(method, url, **kwargs) as response:
+            yield Response(response)
+
     @override
     def open(self) -> None:
-        self.session = httpx.Client(**self.session_kwargs)
+        self.session = httpx.Client(**self._client_kwargs(httpx.HTTPTransport))
 
     @override
     def close(self) -> None:
@@ -58,8 +66,16 @@ class Response(AbstractResponse[httpx.Response]):
 
     @override
     def json(self, **kwargs: Any) -> Any:
-        return self.original.json(**kwargs)
+        if kwargs:
+            return self.original.json(**kwargs)
+        return get_codec().loads(self.original.content)
 
     @override
     def text(self, **kwargs: Any) -> str:
         return self.original.content.decode(**kwargs)
+
+    def read(self) -> bytes:
+        return self.original.read()
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        return self.original.iter_bytes()
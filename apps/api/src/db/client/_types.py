@@ -67,6 +67,9 @@ class HttpConfig(TypedDict, total=False):
     timeout: None | float | httpx.Timeout
     trust_env: bool
     max_redirects: int
+    # connect to the query engine over a Unix domain socket instead of a TCP port,
+    # not supported on Windows
+    unix_socket: bool
 
 
 SortMode = Literal['default', 'insensitive']
@@ -39,12 +39,12 @@ from typing_extensions import TypedDict, Literal
 
 from typing_extensions import LiteralString
 # -- template actions.py.jinja --
-from typing import TypeVar
+from typing import TypeVar, AsyncIterator
 import warnings
 
 from . import types, errors, bases
-from ._compat import model_parse
 from ._constants import CREATE_MANY_SKIP_DUPLICATES_UNSUPPORTED
+from ._pagination import iter_pages, aiter_pages
 
 if TYPE_CHECKING:
     from .client import Prisma
@@ -187,7 +187,7 @@ class LicenseActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -302,7 +302,7 @@ class LicenseActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -342,18 +342,15 @@ class LicenseActions(Generic[_PrismaModelT]):
         )
         ```
         """
-        resp = await self._client._execute(
-            method='find_unique',
+        resp = await self._client._execute_find_unique(
             model=self._model,
-            arguments={
-                'where': where,
-                'include': include,
-            },
+            where=where,
+            include=include,
         )
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -401,7 +398,7 @@ class LicenseActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -472,7 +469,135 @@ class LicenseActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return [self._client._hydrate(self._model, r) for r in resp['data']['result']]
+
+    async def find_many_iter(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.LicenseWhereInput] = None,
+        cursor: Optional[types.LicenseWhereUniqueInput] = None,
+        include: Optional[types.LicenseInclude] = None,
+        order: Optional[Union[types.LicenseOrderByInput, List[types.LicenseOrderByInput]]] = None,
+        distinct: Optional[List[types.LicenseScalarFieldKeys]] = None,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Find multiple License records, yielding them as they are received.
+
+        Unlike `find_many()` the response is decoded incrementally, so memory use does not
+        grow with the number of records found.
+
+        Parameters
+        ----------
+        take
+            Limit the maximum number of License records returned
+        skip
+            Ignore the first N results
+        where
+            License filter to select records
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned License model
+        order
+            Order the returned License records by any field
+        distinct
+            Filter License records by either a single distinct field or distinct combinations of fields
+
+        Yields
+        ------
+        prisma.models.License
+            Each License record that could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for license in License.prisma().find_many_iter():
+            print(license)
+        ```
+        """
+        async for record in self._client._execute_stream(
+            method='find_many',
+            model=self._model,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        ):
+            yield self._client._hydrate(self._model, record)
+
+    def paginate(
+        self,
+        page_size: int = 1000,
+        where: Optional[types.LicenseWhereInput] = None,
+        include: Optional[types.LicenseInclude] = None,
+        key: Literal['id'] = 'id',
+        prefetch: bool = True,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        """Walk through every License record in pages, ordered by a unique field.
+
+        Each page is selected by the last key of the previous one instead of an offset, so
+        deep pages are as fast to find as the first one and records that are deleted while
+        walking are simply skipped.
+
+        Parameters
+        ----------
+        page_size
+            Maximum number of License records in each page
+        where
+            License filter to select records
+        include
+            Specifies which relations should be loaded on the returned License model
+        key
+            Unique field that the records are ordered and paginated by
+        prefetch
+            Whether the next page is queried while the current one is being processed
+
+        Yields
+        ------
+        List[prisma.models.License]
+            Each page of License records
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for licenses in License.prisma().paginate(page_size=500):
+            print(len(licenses))
+        ```
+        """
+
+        async def fetch(arguments: Dict[str, Any]) -> List[_PrismaModelT]:
+            return [
+                self._client._hydrate(self._model, record)
+                async for record in self._client._execute_stream(
+                    method='find_many',
+                    model=self._model,
+                    arguments=arguments,
+                )
+            ]
+
+        return aiter_pages(
+            fetch,
+            key=key,
+            page_size=page_size,
+            where=where,
+            include=include,
+            prefetch=prefetch,
+        )
 
     async def find_first(
         self,
@@ -540,7 +665,7 @@ class LicenseActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -604,7 +729,7 @@ class LicenseActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -661,7 +786,7 @@ class LicenseActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -719,7 +844,7 @@ class LicenseActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -1207,7 +1332,7 @@ class TenantActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -1326,7 +1451,7 @@ class TenantActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -1366,18 +1491,15 @@ class TenantActions(Generic[_PrismaModelT]):
         )
         ```
         """
-        resp = await self._client._execute(
-            method='find_unique',
+        resp = await self._client._execute_find_unique(
             model=self._model,
-            arguments={
-                'where': where,
-                'include': include,
-            },
+            where=where,
+            include=include,
         )
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -1425,7 +1547,7 @@ class TenantActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -1496,7 +1618,135 @@ class TenantActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return [self._client._hydrate(self._model, r) for r in resp['data']['result']]
+
+    async def find_many_iter(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.TenantWhereInput] = None,
+        cursor: Optional[types.TenantWhereUniqueInput] = None,
+        include: Optional[types.TenantInclude] = None,
+        order: Optional[Union[types.TenantOrderByInput, List[types.TenantOrderByInput]]] = None,
+        distinct: Optional[List[types.TenantScalarFieldKeys]] = None,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Find multiple Tenant records, yielding them as they are received.
+
+        Unlike `find_many()` the response is decoded incrementally, so memory use does not
+        grow with the number of records found.
+
+        Parameters
+        ----------
+        take
+            Limit the maximum number of Tenant records returned
+        skip
+            Ignore the first N results
+        where
+            Tenant filter to select records
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned Tenant model
+        order
+            Order the returned Tenant records by any field
+        distinct
+            Filter Tenant records by either a single distinct field or distinct combinations of fields
+
+        Yields
+        ------
+        prisma.models.Tenant
+            Each Tenant record that could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for tenant in Tenant.prisma().find_many_iter():
+            print(tenant)
+        ```
+        """
+        async for record in self._client._execute_stream(
+            method='find_many',
+            model=self._model,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        ):
+            yield self._client._hydrate(self._model, record)
+
+    def paginate(
+        self,
+        page_size: int = 1000,
+        where: Optional[types.TenantWhereInput] = None,
+        include: Optional[types.TenantInclude] = None,
+        key: Literal['id', 'slug'] = 'id',
+        prefetch: bool = True,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        """Walk through every Tenant record in pages, ordered by a unique field.
+
+        Each page is selected by the last key of the previous one instead of an offset, so
+        deep pages are as fast to find as the first one and records that are deleted while
+        walking are simply skipped.
+
+        Parameters
+        ----------
+        page_size
+            Maximum number of Tenant records in each page
+        where
+            Tenant filter to select records
+        include
+            Specifies which relations should be loaded on the returned Tenant model
+        key
+            Unique field that the records are ordered and paginated by
+        prefetch
+            Whether the next page is queried while the current one is being processed
+
+        Yields
+        ------
+        List[prisma.models.Tenant]
+            Each page of Tenant records
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for tenants in Tenant.prisma().paginate(page_size=500):
+            print(len(tenants))
+        ```
+        """
+
+        async def fetch(arguments: Dict[str, Any]) -> List[_PrismaModelT]:
+            return [
+                self._client._hydrate(self._model, record)
+                async for record in self._client._execute_stream(
+                    method='find_many',
+                    model=self._model,
+                    arguments=arguments,
+                )
+            ]
+
+        return aiter_pages(
+            fetch,
+            key=key,
+            page_size=page_size,
+            where=where,
+            include=include,
+            prefetch=prefetch,
+        )
 
     async def find_first(
         self,
@@ -1564,7 +1814,7 @@ class TenantActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -1628,7 +1878,7 @@ class TenantActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -1685,7 +1935,7 @@ class TenantActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -1747,7 +1997,7 @@ class TenantActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -2234,7 +2484,7 @@ class UserRoleActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -2351,7 +2601,7 @@ class UserRoleActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -2391,18 +2641,15 @@ class UserRoleActions(Generic[_PrismaModelT]):
         )
         ```
         """
-        resp = await self._client._execute(
-            method='find_unique',
+        resp = await self._client._execute_find_unique(
             model=self._model,
-            arguments={
-                'where': where,
-                'include': include,
-            },
+            where=where,
+            include=include,
         )
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -2450,7 +2697,7 @@ class UserRoleActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -2521,25 +2768,31 @@ class UserRoleActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return [self._client._hydrate(self._model, r) for r in resp['data']['result']]
 
-    async def find_first(
+    async def find_many_iter(
         self,
+        take: Optional[int] = None,
         skip: Optional[int] = None,
         where: Optional[types.UserRoleWhereInput] = None,
         cursor: Optional[types.UserRoleWhereUniqueInput] = None,
         include: Optional[types.UserRoleInclude] = None,
         order: Optional[Union[types.UserRoleOrderByInput, List[types.UserRoleOrderByInput]]] = None,
         distinct: Optional[List[types.UserRoleScalarFieldKeys]] = None,
-    ) -> Optional[_PrismaModelT]:
-        """Find a single UserRole record.
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Find multiple UserRole records, yielding them as they are received.
+
+        Unlike `find_many()` the response is decoded incrementally, so memory use does not
+        grow with the number of records found.
 
         Parameters
         ----------
+        take
+            Limit the maximum number of UserRole records returned
         skip
-            Ignore the first N records
+            Ignore the first N results
         where
-            UserRole filter to select the record
+            UserRole filter to select records
         cursor
             Specifies the position in the list to start returning results from, (typically an ID field)
         include
@@ -2549,12 +2802,10 @@ class UserRoleActions(Generic[_PrismaModelT]):
         distinct
             Filter UserRole records by either a single distinct field or distinct combinations of fields
 
-        Returns
-        -------
+        Yields
+        ------
         prisma.models.UserRole
-            The first UserRole record found, matching the given arguments
-        None
-            No record could be found
+            Each UserRole record that could be found
 
         Raises
         ------
@@ -2564,19 +2815,15 @@ class UserRoleActions(Generic[_PrismaModelT]):
         Example
         -------
         ```py
-        # find the second UserRole record ordered by the permissions field
-        userrole = await UserRole.prisma().find_first(
-            skip=1,
-            order={
-                'permissions': 'desc',
-            },
-        )
+        async for userrole in UserRole.prisma().find_many_iter():
+            print(userrole)
         ```
         """
-        resp = await self._client._execute(
-            method='find_first',
+        async for record in self._client._execute_stream(
+            method='find_many',
             model=self._model,
             arguments={
+                'take': take,
                 'skip': skip,
                 'where': where,
                 'order_by': order,
@@ -2584,14 +2831,74 @@ class UserRoleActions(Generic[_PrismaModelT]):
                 'include': include,
                 'distinct': distinct,
             },
-        )
-        result = resp['data']['result']
-        if result is None:
-            return None
+        ):
+            yield self._client._hydrate(self._model, record)
+
+    def paginate(
+        self,
+        page_size: int = 1000,
+        where: Optional[types.UserRoleWhereInput] = None,
+        include: Optional[types.UserRoleInclude] = None,
+        key: Literal['id'] = 'id',
+        prefetch: bool = True,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        """Walk through every UserRole record in pages, ordered by a unique field.
 
-        return model_parse(self._model, result)
+        Each page is selected by the last key of the previous one instead of an offset, so
+        deep pages are as fast to find as the first one and records that are deleted while
+        walking are simply skipped.
 
-    async def find_first_or_raise(
+        Parameters
+        ----------
+        page_size
+            Maximum number of UserRole records in each page
+        where
+            UserRole filter to select records
+        include
+            Specifies which relations should be loaded on the returned UserRole model
+        key
+            Unique field that the records are ordered and paginated by
+        prefetch
+            Whether the next page is queried while the current one is being processed
+
+        Yields
+        ------
+        List[prisma.models.UserRole]
+            Each page of UserRole records
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for userroles in UserRole.prisma().paginate(page_size=500):
+            print(len(userroles))
+        ```
+        """
+
+        async def fetch(arguments: Dict[str, Any]) -> List[_PrismaModelT]:
+            return [
+                self._client._hydrate(self._model, record)
+                async for record in self._client._execute_stream(
+                    method='find_many',
+                    model=self._model,
+                    arguments=arguments,
+                )
+            ]
+
+        return aiter_pages(
+            fetch,
+            key=key,
+            page_size=page_size,
+            where=where,
+            include=include,
+            prefetch=prefetch,
+        )
+
+    async def find_first(
         self,
         skip: Optional[int] = None,
         where: Optional[types.UserRoleWhereInput] = None,
@@ -2599,8 +2906,8 @@ class UserRoleActions(Generic[_PrismaModelT]):
         include: Optional[types.UserRoleInclude] = None,
         order: Optional[Union[types.UserRoleOrderByInput, List[types.UserRoleOrderByInput]]] = None,
         distinct: Optional[List[types.UserRoleScalarFieldKeys]] = None,
-    ) -> _PrismaModelT:
-        """Find a single UserRole record. Raises `RecordNotFoundError` if no record was found.
+    ) -> Optional[_PrismaModelT]:
+        """Find a single UserRole record.
 
         Parameters
         ----------
@@ -2621,22 +2928,90 @@ class UserRoleActions(Generic[_PrismaModelT]):
         -------
         prisma.models.UserRole
             The first UserRole record found, matching the given arguments
+        None
+            No record could be found
 
         Raises
         ------
-        prisma.errors.RecordNotFoundError
-            No record was found
         prisma.errors.PrismaError
             Catch all for every exception raised by Prisma Client Python
 
         Example
         -------
         ```py
-        # find the second UserRole record ordered by the createdAt field
-        userrole = await UserRole.prisma().find_first_or_raise(
+        # find the second UserRole record ordered by the permissions field
+        userrole = await UserRole.prisma().find_first(
             skip=1,
             order={
-                'createdAt': 'desc',
+                'permissions': 'desc',
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='find_first',
+            model=self._model,
+            arguments={
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        )
+        result = resp['data']['result']
+        if result is None:
+            return None
+
+        return self._client._hydrate(self._model, result)
+
+    async def find_first_or_raise(
+        self,
+        skip: Optional[int] = None,
+        where: Optional[types.UserRoleWhereInput] = None,
+        cursor: Optional[types.UserRoleWhereUniqueInput] = None,
+        include: Optional[types.UserRoleInclude] = None,
+        order: Optional[Union[types.UserRoleOrderByInput, List[types.UserRoleOrderByInput]]] = None,
+        distinct: Optional[List[types.UserRoleScalarFieldKeys]] = None,
+    ) -> _PrismaModelT:
+        """Find a single UserRole record. Raises `RecordNotFoundError` if no record was found.
+
+        Parameters
+        ----------
+        skip
+            Ignore the first N records
+        where
+            UserRole filter to select the record
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned UserRole model
+        order
+            Order the returned UserRole records by any field
+        distinct
+            Filter UserRole records by either a single distinct field or distinct combinations of fields
+
+        Returns
+        -------
+        prisma.models.UserRole
+            The first UserRole record found, matching the given arguments
+
+        Raises
+        ------
+        prisma.errors.RecordNotFoundError
+            No record was found
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # find the second UserRole record ordered by the createdAt field
+        userrole = await UserRole.prisma().find_first_or_raise(
+            skip=1,
+            order={
+                'createdAt': 'desc',
             },
         )
         ```
@@ -2653,7 +3028,7 @@ class UserRoleActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -2710,7 +3085,7 @@ class UserRoleActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -2770,7 +3145,7 @@ class UserRoleActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -3257,7 +3632,7 @@ class UserActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -3374,7 +3749,7 @@ class UserActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -3414,18 +3789,15 @@ class UserActions(Generic[_PrismaModelT]):
         )
         ```
         """
-        resp = await self._client._execute(
-            method='find_unique',
+        resp = await self._client._execute_find_unique(
             model=self._model,
-            arguments={
-                'where': where,
-                'include': include,
-            },
+            where=where,
+            include=include,
         )
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -3473,7 +3845,7 @@ class UserActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -3544,7 +3916,135 @@ class UserActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return [self._client._hydrate(self._model, r) for r in resp['data']['result']]
+
+    async def find_many_iter(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.UserWhereInput] = None,
+        cursor: Optional[types.UserWhereUniqueInput] = None,
+        include: Optional[types.UserInclude] = None,
+        order: Optional[Union[types.UserOrderByInput, List[types.UserOrderByInput]]] = None,
+        distinct: Optional[List[types.UserScalarFieldKeys]] = None,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Find multiple User records, yielding them as they are received.
+
+        Unlike `find_many()` the response is decoded incrementally, so memory use does not
+        grow with the number of records found.
+
+        Parameters
+        ----------
+        take
+            Limit the maximum number of User records returned
+        skip
+            Ignore the first N results
+        where
+            User filter to select records
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned User model
+        order
+            Order the returned User records by any field
+        distinct
+            Filter User records by either a single distinct field or distinct combinations of fields
+
+        Yields
+        ------
+        prisma.models.User
+            Each User record that could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for user in User.prisma().find_many_iter():
+            print(user)
+        ```
+        """
+        async for record in self._client._execute_stream(
+            method='find_many',
+            model=self._model,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        ):
+            yield self._client._hydrate(self._model, record)
+
+    def paginate(
+        self,
+        page_size: int = 1000,
+        where: Optional[types.UserWhereInput] = None,
+        include: Optional[types.UserInclude] = None,
+        key: Literal['id', 'email'] = 'id',
+        prefetch: bool = True,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        """Walk through every User record in pages, ordered by a unique field.
+
+        Each page is selected by the last key of the previous one instead of an offset, so
+        deep pages are as fast to find as the first one and records that are deleted while
+        walking are simply skipped.
+
+        Parameters
+        ----------
+        page_size
+            Maximum number of User records in each page
+        where
+            User filter to select records
+        include
+            Specifies which relations should be loaded on the returned User model
+        key
+            Unique field that the records are ordered and paginated by
+        prefetch
+            Whether the next page is queried while the current one is being processed
+
+        Yields
+        ------
+        List[prisma.models.User]
+            Each page of User records
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for users in User.prisma().paginate(page_size=500):
+            print(len(users))
+        ```
+        """
+
+        async def fetch(arguments: Dict[str, Any]) -> List[_PrismaModelT]:
+            return [
+                self._client._hydrate(self._model, record)
+                async for record in self._client._execute_stream(
+                    method='find_many',
+                    model=self._model,
+                    arguments=arguments,
+                )
+            ]
+
+        return aiter_pages(
+            fetch,
+            key=key,
+            page_size=page_size,
+            where=where,
+            include=include,
+            prefetch=prefetch,
+        )
 
     async def find_first(
         self,
@@ -3612,7 +4112,7 @@ class UserActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -3676,7 +4176,7 @@ class UserActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -3733,7 +4233,7 @@ class UserActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -3793,7 +4293,7 @@ class UserActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -4282,7 +4782,7 @@ class UserSessionActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -4403,7 +4903,7 @@ class UserSessionActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -4443,18 +4943,15 @@ class UserSessionActions(Generic[_PrismaModelT]):
         )
         ```
         """
-        resp = await self._client._execute(
-            method='find_unique',
+        resp = await self._client._execute_find_unique(
             model=self._model,
-            arguments={
-                'where': where,
-                'include': include,
-            },
+            where=where,
+            include=include,
         )
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -4502,7 +4999,7 @@ class UserSessionActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -4573,7 +5070,135 @@ class UserSessionActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return [self._client._hydrate(self._model, r) for r in resp['data']['result']]
+
+    async def find_many_iter(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.UserSessionWhereInput] = None,
+        cursor: Optional[types.UserSessionWhereUniqueInput] = None,
+        include: Optional[types.UserSessionInclude] = None,
+        order: Optional[Union[types.UserSessionOrderByInput, List[types.UserSessionOrderByInput]]] = None,
+        distinct: Optional[List[types.UserSessionScalarFieldKeys]] = None,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Find multiple UserSession records, yielding them as they are received.
+
+        Unlike `find_many()` the response is decoded incrementally, so memory use does not
+        grow with the number of records found.
+
+        Parameters
+        ----------
+        take
+            Limit the maximum number of UserSession records returned
+        skip
+            Ignore the first N results
+        where
+            UserSession filter to select records
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned UserSession model
+        order
+            Order the returned UserSession records by any field
+        distinct
+            Filter UserSession records by either a single distinct field or distinct combinations of fields
+
+        Yields
+        ------
+        prisma.models.UserSession
+            Each UserSession record that could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for usersession in UserSession.prisma().find_many_iter():
+            print(usersession)
+        ```
+        """
+        async for record in self._client._execute_stream(
+            method='find_many',
+            model=self._model,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        ):
+            yield self._client._hydrate(self._model, record)
+
+    def paginate(
+        self,
+        page_size: int = 1000,
+        where: Optional[types.UserSessionWhereInput] = None,
+        include: Optional[types.UserSessionInclude] = None,
+        key: Literal['id', 'token'] = 'id',
+        prefetch: bool = True,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        """Walk through every UserSession record in pages, ordered by a unique field.
+
+        Each page is selected by the last key of the previous one instead of an offset, so
+        deep pages are as fast to find as the first one and records that are deleted while
+        walking are simply skipped.
+
+        Parameters
+        ----------
+        page_size
+            Maximum number of UserSession records in each page
+        where
+            UserSession filter to select records
+        include
+            Specifies which relations should be loaded on the returned UserSession model
+        key
+            Unique field that the records are ordered and paginated by
+        prefetch
+            Whether the next page is queried while the current one is being processed
+
+        Yields
+        ------
+        List[prisma.models.UserSession]
+            Each page of UserSession records
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for usersessions in UserSession.prisma().paginate(page_size=500):
+            print(len(usersessions))
+        ```
+        """
+
+        async def fetch(arguments: Dict[str, Any]) -> List[_PrismaModelT]:
+            return [
+                self._client._hydrate(self._model, record)
+                async for record in self._client._execute_stream(
+                    method='find_many',
+                    model=self._model,
+                    arguments=arguments,
+                )
+            ]
+
+        return aiter_pages(
+            fetch,
+            key=key,
+            page_size=page_size,
+            where=where,
+            include=include,
+            prefetch=prefetch,
+        )
 
     async def find_first(
         self,
@@ -4616,11 +5241,11 @@ class UserSessionActions(Generic[_PrismaModelT]):
         Example
         -------
         ```py
-        # find the second UserSession record ordered by the expiresAt field
+        # find the second UserSession record ordered by the tokenId field
         usersession = await UserSession.prisma().find_first(
             skip=1,
             order={
-                'expiresAt': 'desc',
+                'tokenId': 'desc',
             },
         )
         ```
@@ -4641,7 +5266,7 @@ class UserSessionActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -4684,11 +5309,11 @@ class UserSessionActions(Generic[_PrismaModelT]):
         Example
         -------
         ```py
-        # find the second UserSession record ordered by the ipAddress field
+        # find the second UserSession record ordered by the expiresAt field
         usersession = await UserSession.prisma().find_first_or_raise(
             skip=1,
             order={
-                'ipAddress': 'desc',
+                'expiresAt': 'desc',
             },
         )
         ```
@@ -4705,7 +5330,7 @@ class UserSessionActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -4762,7 +5387,7 @@ class UserSessionActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -4826,7 +5451,7 @@ class UserSessionActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -4858,7 +5483,7 @@ class UserSessionActions(Generic[_PrismaModelT]):
         # update all UserSession records
         total = await UserSession.prisma().update_many(
             data={
-                'userAgent': 'fcbichhci'
+                'ipAddress': 'fcbichhci'
             },
             where={}
         )
@@ -4922,7 +5547,7 @@ class UserSessionActions(Generic[_PrismaModelT]):
         results = await UserSession.prisma().count(
             select={
                 '_all': True,
-                'createdAt': True,
+                'userAgent': True,
             },
         )
         ```
@@ -4989,7 +5614,7 @@ class UserSessionActions(Generic[_PrismaModelT]):
         results = await UserSession.prisma().count(
             select={
                 '_all': True,
-                'updatedAt': True,
+                'createdAt': True,
             },
         )
         ```
@@ -5129,10 +5754,10 @@ class UserSessionActions(Generic[_PrismaModelT]):
         Example
         -------
         ```py
-        # group UserSession records by deleted values
+        # group UserSession records by updatedAt values
         # and count how many records are in each group
         results = await UserSession.prisma().group_by(
-            ['deleted'],
+            ['updatedAt'],
             count=True,
         )
         ```
@@ -5179,7 +5804,7 @@ class UserSessionActions(Generic[_PrismaModelT]):
         return resp['data']['result']  # type: ignore[no-any-return]
 
 
-class CandidateActions(Generic[_PrismaModelT]):
+class PasswordResetTokenActions(Generic[_PrismaModelT]):
     __slots__ = (
         '_client',
         '_model',
@@ -5206,7 +5831,7 @@ class CandidateActions(Generic[_PrismaModelT]):
 
         Returns
         -------
-        List[prisma.models.Candidate]
+        List[prisma.models.PasswordResetToken]
             The records returned by the SQL query
 
         Raises
@@ -5219,8 +5844,8 @@ class CandidateActions(Generic[_PrismaModelT]):
         Example
         -------
         ```py
-        users = await Candidate.prisma().query_raw(
-            'SELECT * FROM Candidate WHERE id = $1',
+        users = await PasswordResetToken.prisma().query_raw(
+            'SELECT * FROM PasswordResetToken WHERE id = $1',
             'bcggadccgf',
         )
         ```
@@ -5244,7 +5869,7 @@ class CandidateActions(Generic[_PrismaModelT]):
 
         Returns
         -------
-        prisma.models.Candidate
+        prisma.models.PasswordResetToken
             The first record returned by the SQL query
         None
             The raw SQL query did not return any records
@@ -5259,14 +5884,1172 @@ class CandidateActions(Generic[_PrismaModelT]):
         Example
         -------
         ```py
-        user = await Candidate.prisma().query_first(
-            'SELECT * FROM Candidate WHERE firstName = $1',
+        user = await PasswordResetToken.prisma().query_first(
+            'SELECT * FROM PasswordResetToken WHERE userId = $1',
             'jdcfdcgc',
         )
         ```
         """
         return await self._client.query_first(query, *args, model=self._model)
 
+    async def create(
+        self,
+        data: types.PasswordResetTokenCreateInput,
+        include: Optional[types.PasswordResetTokenInclude] = None
+    ) -> _PrismaModelT:
+        """Create a new PasswordResetToken record.
+
+        Parameters
+        ----------
+        data
+            PasswordResetToken record data
+        include
+            Specifies which relations should be loaded on the returned PasswordResetToken model
+
+        Returns
+        -------
+        prisma.models.PasswordResetToken
+            The created PasswordResetToken record
+
+        Raises
+        ------
+        prisma.errors.MissingRequiredValueError
+            Value is required but was not found
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # create a PasswordResetToken record from just the required fields
+        passwordresettoken = await PasswordResetToken.prisma().create(
+            data={
+                # data to create a PasswordResetToken record
+                'userId': 'cafdaehjid',
+                'tokenHash': 'gifdddbia',
+                'expiresAt': datetime.datetime.utcnow(),
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='create',
+            model=self._model,
+            arguments={
+                'data': data,
+                'include': include,
+            },
+        )
+        return self._client._hydrate(self._model, resp['data']['result'])
+
+    async def create_many(
+        self,
+        data: List[types.PasswordResetTokenCreateWithoutRelationsInput],
+        *,
+        skip_duplicates: Optional[bool] = None,
+    ) -> int:
+        """Create multiple PasswordResetToken records at once.
+
+        This function is *not* available when using SQLite.
+
+        Parameters
+        ----------
+        data
+            List of PasswordResetToken record data
+        skip_duplicates
+            Boolean flag for ignoring unique constraint errors
+
+        Returns
+        -------
+        int
+            The total number of records created
+
+        Raises
+        ------
+        prisma.errors.UnsupportedDatabaseError
+            Attempting to query when using SQLite
+        prisma.errors.UniqueViolationError
+            A unique constraint check has failed, these can be ignored with the `skip_duplicates` argument
+        prisma.errors.MissingRequiredValueError
+            Value is required but was not found
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        total = await PasswordResetToken.prisma().create_many(
+            data=[
+                {
+                    # data to create a PasswordResetToken record
+                    'userId': 'bchehecef',
+                    'tokenHash': 'jeijcbhfe',
+                    'expiresAt': datetime.datetime.utcnow(),
+                },
+                {
+                    # data to create a PasswordResetToken record
+                    'userId': 'bjgejjabff',
+                    'tokenHash': 'bcciijbibg',
+                    'expiresAt': datetime.datetime.utcnow(),
+                },
+            ],
+            skip_duplicates=True,
+        )
+        ```
+        """
+        if skip_duplicates and self._client._active_provider in CREATE_MANY_SKIP_DUPLICATES_UNSUPPORTED:
+            raise errors.UnsupportedDatabaseError(self._client._active_provider, 'create_many_skip_duplicates')
+
+        resp = await self._client._execute(
+            method='create_many',
+            model=self._model,
+            arguments={
+                'data': data,
+                'skipDuplicates': skip_duplicates,
+            },
+            root_selection=['count'],
+        )
+        return int(resp['data']['result']['count'])
+
+    async def delete(
+        self,
+        where: types.PasswordResetTokenWhereUniqueInput,
+        include: Optional[types.PasswordResetTokenInclude] = None
+    ) -> Optional[_PrismaModelT]:
+        """Delete a single PasswordResetToken record.
+
+        Parameters
+        ----------
+        where
+            PasswordResetToken filter to select the record to be deleted, must be unique
+        include
+            Specifies which relations should be loaded on the returned PasswordResetToken model
+
+        Returns
+        -------
+        prisma.models.PasswordResetToken
+            The deleted PasswordResetToken record
+        None
+            Could not find a record to delete
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+        prisma.errors.MissingRequiredValueError
+            Value is required but was not found
+
+        Example
+        -------
+        ```py
+        passwordresettoken = await PasswordResetToken.prisma().delete(
+            where={
+                'id': 'cffcachfd',
+            },
+        )
+        ```
+        """
+        try:
+            resp = await self._client._execute(
+                method='delete',
+                model=self._model,
+                arguments={
+                    'where': where,
+                    'include': include,
+                },
+            )
+        except errors.RecordNotFoundError:
+            return None
+
+        return self._client._hydrate(self._model, resp['data']['result'])
+
+    async def find_unique(
+        self,
+        where: types.PasswordResetTokenWhereUniqueInput,
+        include: Optional[types.PasswordResetTokenInclude] = None
+    ) -> Optional[_PrismaModelT]:
+        """Find a unique PasswordResetToken record.
+
+        Parameters
+        ----------
+        where
+            PasswordResetToken filter to find the record, must be unique
+        include
+            Specifies which relations should be loaded on the returned PasswordResetToken model
+
+        Returns
+        -------
+        prisma.models.PasswordResetToken
+            The found PasswordResetToken record
+        None
+            No record matching the given input could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+        prisma.errors.MissingRequiredValueError
+            Value is required but was not found
+
+        Example
+        -------
+        ```py
+        passwordresettoken = await PasswordResetToken.prisma().find_unique(
+            where={
+                'id': 'bccdfhdigc',
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute_find_unique(
+            model=self._model,
+            where=where,
+            include=include,
+        )
+        result = resp['data']['result']
+        if result is None:
+            return None
+        return self._client._hydrate(self._model, result)
+
+    async def find_unique_or_raise(
+        self,
+        where: types.PasswordResetTokenWhereUniqueInput,
+        include: Optional[types.PasswordResetTokenInclude] = None
+    ) -> _PrismaModelT:
+        """Find a unique PasswordResetToken record. Raises `RecordNotFoundError` if no record is found.
+
+        Parameters
+        ----------
+        where
+            PasswordResetToken filter to find the record, must be unique
+        include
+            Specifies which relations should be loaded on the returned PasswordResetToken model
+
+        Returns
+        -------
+        prisma.models.PasswordResetToken
+            The found PasswordResetToken record
+
+        Raises
+        ------
+        prisma.errors.RecordNotFoundError
+            No record was found
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+        prisma.errors.MissingRequiredValueError
+            Value is required but was not found
+
+        Example
+        -------
+        ```py
+        passwordresettoken = await PasswordResetToken.prisma().find_unique_or_raise(
+            where={
+                'id': 'febcgjbfj',
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='find_unique_or_raise',
+            model=self._model,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+        )
+        return self._client._hydrate(self._model, resp['data']['result'])
+
+    async def find_many(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.PasswordResetTokenWhereInput] = None,
+        cursor: Optional[types.PasswordResetTokenWhereUniqueInput] = None,
+        include: Optional[types.PasswordResetTokenInclude] = None,
+        order: Optional[Union[types.PasswordResetTokenOrderByInput, List[types.PasswordResetTokenOrderByInput]]] = None,
+        distinct: Optional[List[types.PasswordResetTokenScalarFieldKeys]] = None,
+    ) -> List[_PrismaModelT]:
+        """Find multiple PasswordResetToken records.
+
+        An empty list is returned if no records could be found.
+
+        Parameters
+        ----------
+        take
+            Limit the maximum number of PasswordResetToken records returned
+        skip
+            Ignore the first N results
+        where
+            PasswordResetToken filter to select records
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned PasswordResetToken model
+        order
+            Order the returned PasswordResetToken records by any field
+        distinct
+            Filter PasswordResetToken records by either a single distinct field or distinct combinations of fields
+
+        Returns
+        -------
+        List[prisma.models.PasswordResetToken]
+            The list of all PasswordResetToken records that could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # find the first 10 PasswordResetToken records
+        passwordresettokens = await PasswordResetToken.prisma().find_many(take=10)
+
+        # find the first 5 PasswordResetToken records ordered by the tokenHash field
+        passwordresettokens = await PasswordResetToken.prisma().find_many(
+            take=5,
+            order={
+                'tokenHash': 'desc',
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='find_many',
+            model=self._model,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        )
+        return [self._client._hydrate(self._model, r) for r in resp['data']['result']]
+
+    async def find_many_iter(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.PasswordResetTokenWhereInput] = None,
+        cursor: Optional[types.PasswordResetTokenWhereUniqueInput] = None,
+        include: Optional[types.PasswordResetTokenInclude] = None,
+        order: Optional[Union[types.PasswordResetTokenOrderByInput, List[types.PasswordResetTokenOrderByInput]]] = None,
+        distinct: Optional[List[types.PasswordResetTokenScalarFieldKeys]] = None,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Find multiple PasswordResetToken records, yielding them as they are received.
+
+        Unlike `find_many()` the response is decoded incrementally, so memory use does not
+        grow with the number of records found.
+
+        Parameters
+        ----------
+        take
+            Limit the maximum number of PasswordResetToken records returned
+        skip
+            Ignore the first N results
+        where
+            PasswordResetToken filter to select records
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned PasswordResetToken model
+        order
+            Order the returned PasswordResetToken records by any field
+        distinct
+            Filter PasswordResetToken records by either a single distinct field or distinct combinations of fields
+
+        Yields
+        ------
+        prisma.models.PasswordResetToken
+            Each PasswordResetToken record that could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for passwordresettoken in PasswordResetToken.prisma().find_many_iter():
+            print(passwordresettoken)
+        ```
+        """
+        async for record in self._client._execute_stream(
+            method='find_many',
+            model=self._model,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        ):
+            yield self._client._hydrate(self._model, record)
+
+    def paginate(
+        self,
+        page_size: int = 1000,
+        where: Optional[types.PasswordResetTokenWhereInput] = None,
+        include: Optional[types.PasswordResetTokenInclude] = None,
+        key: Literal['id', 'tokenHash'] = 'id',
+        prefetch: bool = True,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        """Walk through every PasswordResetToken record in pages, ordered by a unique field.
+
+        Each page is selected by the last key of the previous one instead of an offset, so
+        deep pages are as fast to find as the first one and records that are deleted while
+        walking are simply skipped.
+
+        Parameters
+        ----------
+        page_size
+            Maximum number of PasswordResetToken records in each page
+        where
+            PasswordResetToken filter to select records
+        include
+            Specifies which relations should be loaded on the returned PasswordResetToken model
+        key
+            Unique field that the records are ordered and paginated by
+        prefetch
+            Whether the next page is queried while the current one is being processed
+
+        Yields
+        ------
+        List[prisma.models.PasswordResetToken]
+            Each page of PasswordResetToken records
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for passwordresettokens in PasswordResetToken.prisma().paginate(page_size=500):
+            print(len(passwordresettokens))
+        ```
+        """
+
+        async def fetch(arguments: Dict[str, Any]) -> List[_PrismaModelT]:
+            return [
+                self._client._hydrate(self._model, record)
+                async for record in self._client._execute_stream(
+                    method='find_many',
+                    model=self._model,
+                    arguments=arguments,
+                )
+            ]
+
+        return aiter_pages(
+            fetch,
+            key=key,
+            page_size=page_size,
+            where=where,
+            include=include,
+            prefetch=prefetch,
+        )
+
+    async def find_first(
+        self,
+        skip: Optional[int] = None,
+        where: Optional[types.PasswordResetTokenWhereInput] = None,
+        cursor: Optional[types.PasswordResetTokenWhereUniqueInput] = None,
+        include: Optional[types.PasswordResetTokenInclude] = None,
+        order: Optional[Union[types.PasswordResetTokenOrderByInput, List[types.PasswordResetTokenOrderByInput]]] = None,
+        distinct: Optional[List[types.PasswordResetTokenScalarFieldKeys]] = None,
+    ) -> Optional[_PrismaModelT]:
+        """Find a single PasswordResetToken record.
+
+        Parameters
+        ----------
+        skip
+            Ignore the first N records
+        where
+            PasswordResetToken filter to select the record
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned PasswordResetToken model
+        order
+            Order the returned PasswordResetToken records by any field
+        distinct
+            Filter PasswordResetToken records by either a single distinct field or distinct combinations of fields
+
+        Returns
+        -------
+        prisma.models.PasswordResetToken
+            The first PasswordResetToken record found, matching the given arguments
+        None
+            No record could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # find the second PasswordResetToken record ordered by the expiresAt field
+        passwordresettoken = await PasswordResetToken.prisma().find_first(
+            skip=1,
+            order={
+                'expiresAt': 'desc',
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='find_first',
+            model=self._model,
+            arguments={
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        )
+        result = resp['data']['result']
+        if result is None:
+            return None
+
+        return self._client._hydrate(self._model, result)
+
+    async def find_first_or_raise(
+        self,
+        skip: Optional[int] = None,
+        where: Optional[types.PasswordResetTokenWhereInput] = None,
+        cursor: Optional[types.PasswordResetTokenWhereUniqueInput] = None,
+        include: Optional[types.PasswordResetTokenInclude] = None,
+        order: Optional[Union[types.PasswordResetTokenOrderByInput, List[types.PasswordResetTokenOrderByInput]]] = None,
+        distinct: Optional[List[types.PasswordResetTokenScalarFieldKeys]] = None,
+    ) -> _PrismaModelT:
+        """Find a single PasswordResetToken record. Raises `RecordNotFoundError` if no record was found.
+
+        Parameters
+        ----------
+        skip
+            Ignore the first N records
+        where
+            PasswordResetToken filter to select the record
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned PasswordResetToken model
+        order
+            Order the returned PasswordResetToken records by any field
+        distinct
+            Filter PasswordResetToken records by either a single distinct field or distinct combinations of fields
+
+        Returns
+        -------
+        prisma.models.PasswordResetToken
+            The first PasswordResetToken record found, matching the given arguments
+
+        Raises
+        ------
+        prisma.errors.RecordNotFoundError
+            No record was found
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # find the second PasswordResetToken record ordered by the usedAt field
+        passwordresettoken = await PasswordResetToken.prisma().find_first_or_raise(
+            skip=1,
+            order={
+                'usedAt': 'desc',
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='find_first_or_raise',
+            model=self._model,
+            arguments={
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        )
+        return self._client._hydrate(self._model, resp['data']['result'])
+
+    async def update(
+        self,
+        data: types.PasswordResetTokenUpdateInput,
+        where: types.PasswordResetTokenWhereUniqueInput,
+        include: Optional[types.PasswordResetTokenInclude] = None
+    ) -> Optional[_PrismaModelT]:
+        """Update a single PasswordResetToken record.
+
+        Parameters
+        ----------
+        data
+            PasswordResetToken record data specifying what to update
+        where
+            PasswordResetToken filter to select the unique record to create / update
+        include
+            Specifies which relations should be loaded on the returned PasswordResetToken model
+
+        Returns
+        -------
+        prisma.models.PasswordResetToken
+            The updated PasswordResetToken record
+        None
+            No record could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        passwordresettoken = await PasswordResetToken.prisma().update(
+            where={
+                'id': 'bageiegghg',
+            },
+            data={
+                # data to update the PasswordResetToken record to
+            },
+        )
+        ```
+        """
+        try:
+            resp = await self._client._execute(
+                method='update',
+                model=self._model,
+                arguments={
+                    'data': data,
+                    'where': where,
+                    'include': include,
+                },
+            )
+        except errors.RecordNotFoundError:
+            return None
+
+        return self._client._hydrate(self._model, resp['data']['result'])
+
+    async def upsert(
+        self,
+        where: types.PasswordResetTokenWhereUniqueInput,
+        data: types.PasswordResetTokenUpsertInput,
+        include: Optional[types.PasswordResetTokenInclude] = None,
+    ) -> _PrismaModelT:
+        """Updates an existing record or create a new one
+
+        Parameters
+        ----------
+        where
+            PasswordResetToken filter to select the unique record to create / update
+        data
+            Data specifying what fields to set on create and update
+        include
+            Specifies which relations should be loaded on the returned PasswordResetToken model
+
+        Returns
+        -------
+        prisma.models.PasswordResetToken
+            The created or updated PasswordResetToken record
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+        prisma.errors.MissingRequiredValueError
+            Value is required but was not found
+
+        Example
+        -------
+        ```py
+        passwordresettoken = await PasswordResetToken.prisma().upsert(
+            where={
+                'id': 'faidicegb',
+            },
+            data={
+                'create': {
+                    'id': 'faidicegb',
+                    'userId': 'bjgejjabff',
+                    'tokenHash': 'bcciijbibg',
+                    'expiresAt': datetime.datetime.utcnow(),
+                },
+                'update': {
+                    'userId': 'bjgejjabff',
+                    'tokenHash': 'bcciijbibg',
+                    'expiresAt': datetime.datetime.utcnow(),
+                },
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='upsert',
+            model=self._model,
+            arguments={
+                'where': where,
+                'include': include,
+                'create': data.get('create'),
+                'update': data.get('update'),
+            },
+        )
+        return self._client._hydrate(self._model, resp['data']['result'])
+
+    async def update_many(
+        self,
+        data: types.PasswordResetTokenUpdateManyMutationInput,
+        where: types.PasswordResetTokenWhereInput,
+    ) -> int:
+        """Update multiple PasswordResetToken records
+
+        Parameters
+        ----------
+        data
+            PasswordResetToken data to update the selected PasswordResetToken records to
+        where
+            Filter to select the PasswordResetToken records to update
+
+        Returns
+        -------
+        int
+            The total number of PasswordResetToken records that were updated
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # update all PasswordResetToken records
+        total = await PasswordResetToken.prisma().update_many(
+            data={
+                'createdAt': datetime.datetime.utcnow()
+            },
+            where={}
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='update_many',
+            model=self._model,
+            arguments={'data': data, 'where': where,},
+            root_selection=['count'],
+        )
+        return int(resp['data']['result']['count'])
+
+    @overload
+    async def count(
+        self,
+        select: None = None,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.PasswordResetTokenWhereInput] = None,
+        cursor: Optional[types.PasswordResetTokenWhereUniqueInput] = None,
+    ) -> int:
+        """Count the number of PasswordResetToken records present in the database
+
+        Parameters
+        ----------
+        select
+            Select the PasswordResetToken fields to be counted
+        take
+            Limit the maximum result
+        skip
+            Ignore the first N records
+        where
+            PasswordResetToken filter to find records
+        cursor
+            Specifies the position in the list to start counting results from, (typically an ID field)
+        order
+            This parameter is deprecated and will be removed in a future release
+
+        Returns
+        -------
+        int
+            The total number of records found, returned if `select` is not given
+
+        prisma.types.PasswordResetTokenCountAggregateOutput
+            Data returned when `select` is used, the fields present in this dictionary will
+            match the fields passed in the `select` argument
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # total: int
+        total = await PasswordResetToken.prisma().count()
+
+        # results: prisma.types.PasswordResetTokenCountAggregateOutput
+        results = await PasswordResetToken.prisma().count(
+            select={
+                '_all': True,
+                'id': True,
+            },
+        )
+        ```
+        """
+
+
+    @overload
+    async def count(
+        self,
+        select: types.PasswordResetTokenCountAggregateInput,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.PasswordResetTokenWhereInput] = None,
+        cursor: Optional[types.PasswordResetTokenWhereUniqueInput] = None,
+    ) -> types.PasswordResetTokenCountAggregateOutput:
+        ...
+
+    async def count(
+        self,
+        select: Optional[types.PasswordResetTokenCountAggregateInput] = None,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.PasswordResetTokenWhereInput] = None,
+        cursor: Optional[types.PasswordResetTokenWhereUniqueInput] = None,
+    ) -> Union[int, types.PasswordResetTokenCountAggregateOutput]:
+        """Count the number of PasswordResetToken records present in the database
+
+        Parameters
+        ----------
+        select
+            Select the PasswordResetToken fields to be counted
+        take
+            Limit the maximum result
+        skip
+            Ignore the first N records
+        where
+            PasswordResetToken filter to find records
+        cursor
+            Specifies the position in the list to start counting results from, (typically an ID field)
+        order
+            This parameter is deprecated and will be removed in a future release
+
+        Returns
+        -------
+        int
+            The total number of records found, returned if `select` is not given
+
+        prisma.types.PasswordResetTokenCountAggregateOutput
+            Data returned when `select` is used, the fields present in this dictionary will
+            match the fields passed in the `select` argument
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # total: int
+        total = await PasswordResetToken.prisma().count()
+
+        # results: prisma.types.PasswordResetTokenCountAggregateOutput
+        results = await PasswordResetToken.prisma().count(
+            select={
+                '_all': True,
+                'userId': True,
+            },
+        )
+        ```
+        """
+
+        # TODO: this selection building should be moved to the QueryBuilder
+        #
+        # note the distinction between checking for `not select` here and `select is None`
+        # later is to handle the case that the given select dictionary is empty, this
+        # is a limitation of our types.
+        if not select:
+            root_selection = ['_count { _all }']
+        else:
+
+            root_selection = [
+                '_count {{ {0} }}'.format(' '.join(k for k, v in select.items() if v is True))
+            ]
+
+        resp = await self._client._execute(
+            method='count',
+            model=self._model,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'cursor': cursor,
+            },
+            root_selection=root_selection,
+        )
+
+        if select is None:
+            return cast(int, resp['data']['result']['_count']['_all'])
+        else:
+            return cast(types.PasswordResetTokenCountAggregateOutput, resp['data']['result']['_count'])
+
+    async def delete_many(
+        self,
+        where: Optional[types.PasswordResetTokenWhereInput] = None
+    ) -> int:
+        """Delete multiple PasswordResetToken records.
+
+        Parameters
+        ----------
+        where
+            Optional PasswordResetToken filter to find the records to be deleted
+
+        Returns
+        -------
+        int
+            The total number of PasswordResetToken records that were deleted
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # delete all PasswordResetToken records
+        total = await PasswordResetToken.prisma().delete_many()
+        ```
+        """
+        resp = await self._client._execute(
+            method='delete_many',
+            model=self._model,
+            arguments={'where': where},
+            root_selection=['count'],
+        )
+        return int(resp['data']['result']['count'])
+
+    # TODO: make this easier to work with safely, currently output fields are typed as
+    #       not required, we should refactor the return type
+    # TODO: consider returning a Dict where the keys are a Tuple of the `by` selection
+    # TODO: statically type that the order argument is required when take or skip are present
+    async def group_by(
+        self,
+        by: List['types.PasswordResetTokenScalarFieldKeysT'],
+        *,
+        where: Optional['types.PasswordResetTokenWhereInput'] = None,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        avg: Optional['types.PasswordResetTokenAvgAggregateInput'] = None,
+        sum: Optional['types.PasswordResetTokenSumAggregateInput'] = None,
+        min: Optional['types.PasswordResetTokenMinAggregateInput'] = None,
+        max: Optional['types.PasswordResetTokenMaxAggregateInput'] = None,
+        having: Optional['types.PasswordResetTokenScalarWhereWithAggregatesInput'] = None,
+        count: Optional[Union[bool, 'types.PasswordResetTokenCountAggregateInput']] = None,
+        order: Optional[Union[Mapping['types.PasswordResetTokenScalarFieldKeysT', 'types.SortOrder'], List[Mapping['types.PasswordResetTokenScalarFieldKeysT', 'types.SortOrder']]]] = None,
+    ) -> List['types.PasswordResetTokenGroupByOutput']:
+        """Group PasswordResetToken records by one or more field values and perform aggregations
+        each group such as finding the average.
+
+        Parameters
+        ----------
+        by
+            List of scalar PasswordResetToken fields to group records by
+        where
+            PasswordResetToken filter to select records
+        take
+            Limit the maximum number of PasswordResetToken records returned
+        skip
+            Ignore the first N records
+        avg
+            Adds the average of all values of the specified fields to the `_avg` field
+            in the returned data.
+        sum
+            Adds the sum of all values of the specified fields to the `_sum` field
+            in the returned data.
+        min
+            Adds the smallest available value for the specified fields to the `_min` field
+            in the returned data.
+        max
+            Adds the largest available value for the specified fields to the `_max` field
+            in the returned data.
+        count
+            Adds a count of non-fields to the `_count` field in the returned data.
+        having
+            Allows you to filter groups by an aggregate value - for example only return
+            groups having an average age less than 50.
+        order
+            Lets you order the returned list by any property that is also present in `by`.
+            Only **one** field is allowed at a time.
+
+        Returns
+        -------
+        List[prisma.types.PasswordResetTokenGroupByOutput]
+            A list of dictionaries representing the PasswordResetToken record,
+            this will also have additional fields present if aggregation arguments
+            are used (see the above parameters)
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # group PasswordResetToken records by tokenHash values
+        # and count how many records are in each group
+        results = await PasswordResetToken.prisma().group_by(
+            ['tokenHash'],
+            count=True,
+        )
+        ```
+        """
+        if order is None:
+            if take is not None:
+                raise TypeError('Missing argument: \'order\' which is required when \'take\' is present')
+
+            if skip is not None:
+                raise TypeError('Missing argument: \'order\' which is required when \'skip\' is present')
+
+        root_selection: List[str] = [*by]
+        if avg is not None:
+            root_selection.append(_select_fields('_avg', avg))
+
+        if min is not None:
+            root_selection.append(_select_fields('_min', min))
+
+        if sum is not None:
+            root_selection.append(_select_fields('_sum', sum))
+
+        if max is not None:
+            root_selection.append(_select_fields('_max', max))
+
+        if count is not None:
+            if count is True:
+                root_selection.append('_count { _all }')
+            elif isinstance(count, dict):
+                root_selection.append(_select_fields('_count', count))
+
+        resp = await self._client._execute(
+            method='group_by',
+            model=self._model,
+            arguments={
+                'by': by,
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'having': having,
+                'orderBy': order,
+            },
+            root_selection=root_selection,
+        )
+        return resp['data']['result']  # type: ignore[no-any-return]
+
+
+class CandidateActions(Generic[_PrismaModelT]):
+    __slots__ = (
+        '_client',
+        '_model',
+    )
+
+    def __init__(self, client: Prisma, model: Type[_PrismaModelT]) -> None:
+        self._client = client
+        self._model = model
+
+    async def query_raw(
+        self,
+        query: LiteralString,
+        *args: Any,
+    ) -> List[_PrismaModelT]:
+        """Execute a raw SQL query
+
+        Parameters
+        ----------
+        query
+            The raw SQL query string to be executed
+        *args
+            Parameters to be passed to the SQL query, these MUST be used over
+            string formatting to avoid an SQL injection vulnerability
+
+        Returns
+        -------
+        List[prisma.models.Candidate]
+            The records returned by the SQL query
+
+        Raises
+        ------
+        prisma_errors.RawQueryError
+            This could be due to invalid syntax, mismatched number of parameters or any other error
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        users = await Candidate.prisma().query_raw(
+            'SELECT * FROM Candidate WHERE id = $1',
+            'bacecgfhbe',
+        )
+        ```
+        """
+        return await self._client.query_raw(query, *args, model=self._model)
+
+    async def query_first(
+        self,
+        query: LiteralString,
+        *args: Any,
+    ) -> Optional[_PrismaModelT]:
+        """Execute a raw SQL query, returning the first result
+
+        Parameters
+        ----------
+        query
+            The raw SQL query string to be executed
+        *args
+            Parameters to be passed to the SQL query, these MUST be used over
+            string formatting to avoid an SQL injection vulnerability
+
+        Returns
+        -------
+        prisma.models.Candidate
+            The first record returned by the SQL query
+        None
+            The raw SQL query did not return any records
+
+        Raises
+        ------
+        prisma_errors.RawQueryError
+            This could be due to invalid syntax, mismatched number of parameters or any other error
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        user = await Candidate.prisma().query_first(
+            'SELECT * FROM Candidate WHERE firstName = $1',
+            'ihcahiead',
+        )
+        ```
+        """
+        return await self._client.query_first(query, *args, model=self._model)
+
     async def create(
         self,
         data: types.CandidateCreateInput,
@@ -5300,9 +7083,9 @@ class CandidateActions(Generic[_PrismaModelT]):
         candidate = await Candidate.prisma().create(
             data={
                 # data to create a Candidate record
-                'firstName': 'cafdaehjid',
-                'lastName': 'gifdddbia',
-                'email': 'bchehecef',
+                'firstName': 'biheheiajg',
+                'lastName': 'jbgijghgb',
+                'email': 'hgjcghfbi',
                 'educationLevel': enums.EducationLevel.HIGH_SCHOOL,
             },
         )
@@ -5316,7 +7099,7 @@ class CandidateActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -5358,16 +7141,16 @@ class CandidateActions(Generic[_PrismaModelT]):
             data=[
                 {
                     # data to create a Candidate record
-                    'firstName': 'jeijcbhfe',
-                    'lastName': 'bjgejjabff',
-                    'email': 'bcciijbibg',
+                    'firstName': 'icadbcehj',
+                    'lastName': 'jchciaee',
+                    'email': 'deeificjd',
                     'educationLevel': enums.EducationLevel.HIGH_SCHOOL,
                 },
                 {
                     # data to create a Candidate record
-                    'firstName': 'cffcachfd',
-                    'lastName': 'bccdfhdigc',
-                    'email': 'febcgjbfj',
+                    'firstName': 'bbcbhebbda',
+                    'lastName': 'bejfijgcfb',
+                    'email': 'caifcbgii',
                     'educationLevel': enums.EducationLevel.HIGH_SCHOOL,
                 },
             ],
@@ -5422,7 +7205,7 @@ class CandidateActions(Generic[_PrismaModelT]):
         ```py
         candidate = await Candidate.prisma().delete(
             where={
-                'id': 'bageiegghg',
+                'id': 'igaibbfgj',
             },
         )
         ```
@@ -5439,7 +7222,7 @@ class CandidateActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -5474,23 +7257,20 @@ class CandidateActions(Generic[_PrismaModelT]):
         ```py
         candidate = await Candidate.prisma().find_unique(
             where={
-                'id': 'faidicegb',
+                'id': 'bggajdcbbi',
             },
         )
         ```
         """
-        resp = await self._client._execute(
-            method='find_unique',
+        resp = await self._client._execute_find_unique(
             model=self._model,
-            arguments={
-                'where': where,
-                'include': include,
-            },
+            where=where,
+            include=include,
         )
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -5525,7 +7305,7 @@ class CandidateActions(Generic[_PrismaModelT]):
         ```py
         candidate = await Candidate.prisma().find_unique_or_raise(
             where={
-                'id': 'bacecgfhbe',
+                'id': 'fcfhgbjed',
             },
         )
         ```
@@ -5538,7 +7318,7 @@ class CandidateActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -5609,7 +7389,135 @@ class CandidateActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return [self._client._hydrate(self._model, r) for r in resp['data']['result']]
+
+    async def find_many_iter(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.CandidateWhereInput] = None,
+        cursor: Optional[types.CandidateWhereUniqueInput] = None,
+        include: Optional[types.CandidateInclude] = None,
+        order: Optional[Union[types.CandidateOrderByInput, List[types.CandidateOrderByInput]]] = None,
+        distinct: Optional[List[types.CandidateScalarFieldKeys]] = None,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Find multiple Candidate records, yielding them as they are received.
+
+        Unlike `find_many()` the response is decoded incrementally, so memory use does not
+        grow with the number of records found.
+
+        Parameters
+        ----------
+        take
+            Limit the maximum number of Candidate records returned
+        skip
+            Ignore the first N results
+        where
+            Candidate filter to select records
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned Candidate model
+        order
+            Order the returned Candidate records by any field
+        distinct
+            Filter Candidate records by either a single distinct field or distinct combinations of fields
+
+        Yields
+        ------
+        prisma.models.Candidate
+            Each Candidate record that could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for candidate in Candidate.prisma().find_many_iter():
+            print(candidate)
+        ```
+        """
+        async for record in self._client._execute_stream(
+            method='find_many',
+            model=self._model,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        ):
+            yield self._client._hydrate(self._model, record)
+
+    def paginate(
+        self,
+        page_size: int = 1000,
+        where: Optional[types.CandidateWhereInput] = None,
+        include: Optional[types.CandidateInclude] = None,
+        key: Literal['id', 'email'] = 'id',
+        prefetch: bool = True,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        """Walk through every Candidate record in pages, ordered by a unique field.
+
+        Each page is selected by the last key of the previous one instead of an offset, so
+        deep pages are as fast to find as the first one and records that are deleted while
+        walking are simply skipped.
+
+        Parameters
+        ----------
+        page_size
+            Maximum number of Candidate records in each page
+        where
+            Candidate filter to select records
+        include
+            Specifies which relations should be loaded on the returned Candidate model
+        key
+            Unique field that the records are ordered and paginated by
+        prefetch
+            Whether the next page is queried while the current one is being processed
+
+        Yields
+        ------
+        List[prisma.models.Candidate]
+            Each page of Candidate records
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for candidates in Candidate.prisma().paginate(page_size=500):
+            print(len(candidates))
+        ```
+        """
+
+        async def fetch(arguments: Dict[str, Any]) -> List[_PrismaModelT]:
+            return [
+                self._client._hydrate(self._model, record)
+                async for record in self._client._execute_stream(
+                    method='find_many',
+                    model=self._model,
+                    arguments=arguments,
+                )
+            ]
+
+        return aiter_pages(
+            fetch,
+            key=key,
+            page_size=page_size,
+            where=where,
+            include=include,
+            prefetch=prefetch,
+        )
 
     async def find_first(
         self,
@@ -5677,7 +7585,7 @@ class CandidateActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -5741,7 +7649,7 @@ class CandidateActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -5777,7 +7685,7 @@ class CandidateActions(Generic[_PrismaModelT]):
         ```py
         candidate = await Candidate.prisma().update(
             where={
-                'id': 'ihcahiead',
+                'id': 'hdgcajhjg',
             },
             data={
                 # data to update the Candidate record to
@@ -5798,7 +7706,7 @@ class CandidateActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -5834,20 +7742,20 @@ class CandidateActions(Generic[_PrismaModelT]):
         ```py
         candidate = await Candidate.prisma().upsert(
             where={
-                'id': 'biheheiajg',
+                'id': 'ejdjahicb',
             },
             data={
                 'create': {
-                    'id': 'biheheiajg',
-                    'firstName': 'cffcachfd',
-                    'lastName': 'bccdfhdigc',
-                    'email': 'febcgjbfj',
+                    'id': 'ejdjahicb',
+                    'firstName': 'bbcbhebbda',
+                    'lastName': 'bejfijgcfb',
+                    'email': 'caifcbgii',
                     'educationLevel': enums.EducationLevel.HIGH_SCHOOL,
                 },
                 'update': {
-                    'firstName': 'cffcachfd',
-                    'lastName': 'bccdfhdigc',
-                    'email': 'febcgjbfj',
+                    'firstName': 'bbcbhebbda',
+                    'lastName': 'bejfijgcfb',
+                    'email': 'caifcbgii',
                     'educationLevel': enums.EducationLevel.HIGH_SCHOOL,
                 },
             },
@@ -5864,7 +7772,7 @@ class CandidateActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -5896,7 +7804,7 @@ class CandidateActions(Generic[_PrismaModelT]):
         # update all Candidate records
         total = await Candidate.prisma().update_many(
             data={
-                'resumeUrl': 'jbgijghgb'
+                'resumeUrl': 'gdjgigfgc'
             },
             where={}
         )
@@ -6259,7 +8167,7 @@ class JobActions(Generic[_PrismaModelT]):
         ```py
         users = await Job.prisma().query_raw(
             'SELECT * FROM Job WHERE id = $1',
-            'hgjcghfbi',
+            'gfeaahdeh',
         )
         ```
         """
@@ -6299,7 +8207,7 @@ class JobActions(Generic[_PrismaModelT]):
         ```py
         user = await Job.prisma().query_first(
             'SELECT * FROM Job WHERE title = $1',
-            'icadbcehj',
+            'bjafcgbffc',
         )
         ```
         """
@@ -6338,8 +8246,8 @@ class JobActions(Generic[_PrismaModelT]):
         job = await Job.prisma().create(
             data={
                 # data to create a Job record
-                'title': 'jchciaee',
-                'tenantId': 'deeificjd',
+                'title': 'hihegjif',
+                'tenantId': 'bdjidcidac',
             },
         )
         ```
@@ -6352,7 +8260,7 @@ class JobActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -6394,13 +8302,13 @@ class JobActions(Generic[_PrismaModelT]):
             data=[
                 {
                     # data to create a Job record
-                    'title': 'bbcbhebbda',
-                    'tenantId': 'bejfijgcfb',
+                    'title': 'ifgaaagff',
+                    'tenantId': 'befcddgjce',
                 },
                 {
                     # data to create a Job record
-                    'title': 'caifcbgii',
-                    'tenantId': 'igaibbfgj',
+                    'title': 'bfhdbjjgfd',
+                    'tenantId': 'cabdjadaji',
                 },
             ],
             skip_duplicates=True,
@@ -6454,7 +8362,7 @@ class JobActions(Generic[_PrismaModelT]):
         ```py
         job = await Job.prisma().delete(
             where={
-                'id': 'bggajdcbbi',
+                'id': 'faajgfadf',
             },
         )
         ```
@@ -6471,7 +8379,7 @@ class JobActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -6506,23 +8414,20 @@ class JobActions(Generic[_PrismaModelT]):
         ```py
         job = await Job.prisma().find_unique(
             where={
-                'id': 'fcfhgbjed',
+                'id': 'biaagcedjc',
             },
         )
         ```
         """
-        resp = await self._client._execute(
-            method='find_unique',
+        resp = await self._client._execute_find_unique(
             model=self._model,
-            arguments={
-                'where': where,
-                'include': include,
-            },
+            where=where,
+            include=include,
         )
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -6557,7 +8462,7 @@ class JobActions(Generic[_PrismaModelT]):
         ```py
         job = await Job.prisma().find_unique_or_raise(
             where={
-                'id': 'hdgcajhjg',
+                'id': 'cahhaghecf',
             },
         )
         ```
@@ -6570,7 +8475,7 @@ class JobActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -6641,7 +8546,135 @@ class JobActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return [self._client._hydrate(self._model, r) for r in resp['data']['result']]
+
+    async def find_many_iter(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.JobWhereInput] = None,
+        cursor: Optional[types.JobWhereUniqueInput] = None,
+        include: Optional[types.JobInclude] = None,
+        order: Optional[Union[types.JobOrderByInput, List[types.JobOrderByInput]]] = None,
+        distinct: Optional[List[types.JobScalarFieldKeys]] = None,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Find multiple Job records, yielding them as they are received.
+
+        Unlike `find_many()` the response is decoded incrementally, so memory use does not
+        grow with the number of records found.
+
+        Parameters
+        ----------
+        take
+            Limit the maximum number of Job records returned
+        skip
+            Ignore the first N results
+        where
+            Job filter to select records
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned Job model
+        order
+            Order the returned Job records by any field
+        distinct
+            Filter Job records by either a single distinct field or distinct combinations of fields
+
+        Yields
+        ------
+        prisma.models.Job
+            Each Job record that could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for job in Job.prisma().find_many_iter():
+            print(job)
+        ```
+        """
+        async for record in self._client._execute_stream(
+            method='find_many',
+            model=self._model,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        ):
+            yield self._client._hydrate(self._model, record)
+
+    def paginate(
+        self,
+        page_size: int = 1000,
+        where: Optional[types.JobWhereInput] = None,
+        include: Optional[types.JobInclude] = None,
+        key: Literal['id'] = 'id',
+        prefetch: bool = True,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        """Walk through every Job record in pages, ordered by a unique field.
+
+        Each page is selected by the last key of the previous one instead of an offset, so
+        deep pages are as fast to find as the first one and records that are deleted while
+        walking are simply skipped.
+
+        Parameters
+        ----------
+        page_size
+            Maximum number of Job records in each page
+        where
+            Job filter to select records
+        include
+            Specifies which relations should be loaded on the returned Job model
+        key
+            Unique field that the records are ordered and paginated by
+        prefetch
+            Whether the next page is queried while the current one is being processed
+
+        Yields
+        ------
+        List[prisma.models.Job]
+            Each page of Job records
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for jobs in Job.prisma().paginate(page_size=500):
+            print(len(jobs))
+        ```
+        """
+
+        async def fetch(arguments: Dict[str, Any]) -> List[_PrismaModelT]:
+            return [
+                self._client._hydrate(self._model, record)
+                async for record in self._client._execute_stream(
+                    method='find_many',
+                    model=self._model,
+                    arguments=arguments,
+                )
+            ]
+
+        return aiter_pages(
+            fetch,
+            key=key,
+            page_size=page_size,
+            where=where,
+            include=include,
+            prefetch=prefetch,
+        )
 
     async def find_first(
         self,
@@ -6709,7 +8742,7 @@ class JobActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -6773,7 +8806,7 @@ class JobActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -6809,7 +8842,7 @@ class JobActions(Generic[_PrismaModelT]):
         ```py
         job = await Job.prisma().update(
             where={
-                'id': 'ejdjahicb',
+                'id': 'bghcbbcidi',
             },
             data={
                 # data to update the Job record to
@@ -6830,7 +8863,7 @@ class JobActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -6866,17 +8899,17 @@ class JobActions(Generic[_PrismaModelT]):
         ```py
         job = await Job.prisma().upsert(
             where={
-                'id': 'gdjgigfgc',
+                'id': 'jcgghhgdj',
             },
             data={
                 'create': {
-                    'id': 'gdjgigfgc',
-                    'title': 'caifcbgii',
-                    'tenantId': 'igaibbfgj',
+                    'id': 'jcgghhgdj',
+                    'title': 'bfhdbjjgfd',
+                    'tenantId': 'cabdjadaji',
                 },
                 'update': {
-                    'title': 'caifcbgii',
-                    'tenantId': 'igaibbfgj',
+                    'title': 'bfhdbjjgfd',
+                    'tenantId': 'cabdjadaji',
                 },
             },
         )
@@ -6892,7 +8925,7 @@ class JobActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -6924,7 +8957,7 @@ class JobActions(Generic[_PrismaModelT]):
         # update all Job records
         total = await Job.prisma().update_many(
             data={
-                'keywords': ['gfeaahdeh']
+                'keywords': ['beehgcebbg']
             },
             where={}
         )
@@ -7287,7 +9320,7 @@ class JobCandidateActions(Generic[_PrismaModelT]):
         ```py
         users = await JobCandidate.prisma().query_raw(
             'SELECT * FROM JobCandidate WHERE id = $1',
-            'bjafcgbffc',
+            'bhdiaidiaf',
         )
         ```
         """
@@ -7327,7 +9360,7 @@ class JobCandidateActions(Generic[_PrismaModelT]):
         ```py
         user = await JobCandidate.prisma().query_first(
             'SELECT * FROM JobCandidate WHERE status = $1',
-            'hihegjif',
+            'deajegcfi',
         )
         ```
         """
@@ -7366,8 +9399,8 @@ class JobCandidateActions(Generic[_PrismaModelT]):
         jobcandidate = await JobCandidate.prisma().create(
             data={
                 # data to create a JobCandidate record
-                'jobId': 'bdjidcidac',
-                'candidateId': 'ifgaaagff',
+                'jobId': 'gabahhhjf',
+                'candidateId': 'cjagadcjg',
             },
         )
         ```
@@ -7380,7 +9413,7 @@ class JobCandidateActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -7422,13 +9455,13 @@ class JobCandidateActions(Generic[_PrismaModelT]):
             data=[
                 {
                     # data to create a JobCandidate record
-                    'jobId': 'befcddgjce',
-                    'candidateId': 'bfhdbjjgfd',
+                    'jobId': 'bifficggej',
+                    'candidateId': 'bgbbaajbic',
                 },
                 {
                     # data to create a JobCandidate record
-                    'jobId': 'cabdjadaji',
-                    'candidateId': 'faajgfadf',
+                    'jobId': 'eegghdhjb',
+                    'candidateId': 'daafgidjg',
                 },
             ],
             skip_duplicates=True,
@@ -7482,7 +9515,7 @@ class JobCandidateActions(Generic[_PrismaModelT]):
         ```py
         jobcandidate = await JobCandidate.prisma().delete(
             where={
-                'id': 'biaagcedjc',
+                'id': 'gdcgcgagj',
             },
         )
         ```
@@ -7499,7 +9532,7 @@ class JobCandidateActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -7534,23 +9567,20 @@ class JobCandidateActions(Generic[_PrismaModelT]):
         ```py
         jobcandidate = await JobCandidate.prisma().find_unique(
             where={
-                'id': 'cahhaghecf',
+                'id': 'bhceabbgja',
             },
         )
         ```
         """
-        resp = await self._client._execute(
-            method='find_unique',
+        resp = await self._client._execute_find_unique(
             model=self._model,
-            arguments={
-                'where': where,
-                'include': include,
-            },
+            where=where,
+            include=include,
         )
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -7568,39 +9598,110 @@ class JobCandidateActions(Generic[_PrismaModelT]):
 
         Returns
         -------
-        prisma.models.JobCandidate
-            The found JobCandidate record
+        prisma.models.JobCandidate
+            The found JobCandidate record
+
+        Raises
+        ------
+        prisma.errors.RecordNotFoundError
+            No record was found
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+        prisma.errors.MissingRequiredValueError
+            Value is required but was not found
+
+        Example
+        -------
+        ```py
+        jobcandidate = await JobCandidate.prisma().find_unique_or_raise(
+            where={
+                'id': 'ehabfhegh',
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='find_unique_or_raise',
+            model=self._model,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+        )
+        return self._client._hydrate(self._model, resp['data']['result'])
+
+    async def find_many(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.JobCandidateWhereInput] = None,
+        cursor: Optional[types.JobCandidateWhereUniqueInput] = None,
+        include: Optional[types.JobCandidateInclude] = None,
+        order: Optional[Union[types.JobCandidateOrderByInput, List[types.JobCandidateOrderByInput]]] = None,
+        distinct: Optional[List[types.JobCandidateScalarFieldKeys]] = None,
+    ) -> List[_PrismaModelT]:
+        """Find multiple JobCandidate records.
+
+        An empty list is returned if no records could be found.
+
+        Parameters
+        ----------
+        take
+            Limit the maximum number of JobCandidate records returned
+        skip
+            Ignore the first N results
+        where
+            JobCandidate filter to select records
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned JobCandidate model
+        order
+            Order the returned JobCandidate records by any field
+        distinct
+            Filter JobCandidate records by either a single distinct field or distinct combinations of fields
+
+        Returns
+        -------
+        List[prisma.models.JobCandidate]
+            The list of all JobCandidate records that could be found
 
         Raises
         ------
-        prisma.errors.RecordNotFoundError
-            No record was found
         prisma.errors.PrismaError
             Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
 
         Example
         -------
         ```py
-        jobcandidate = await JobCandidate.prisma().find_unique_or_raise(
-            where={
-                'id': 'bghcbbcidi',
+        # find the first 10 JobCandidate records
+        jobcandidates = await JobCandidate.prisma().find_many(take=10)
+
+        # find the first 5 JobCandidate records ordered by the stage field
+        jobcandidates = await JobCandidate.prisma().find_many(
+            take=5,
+            order={
+                'stage': 'desc',
             },
         )
         ```
         """
         resp = await self._client._execute(
-            method='find_unique_or_raise',
+            method='find_many',
             model=self._model,
             arguments={
+                'take': take,
+                'skip': skip,
                 'where': where,
+                'order_by': order,
+                'cursor': cursor,
                 'include': include,
+                'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return [self._client._hydrate(self._model, r) for r in resp['data']['result']]
 
-    async def find_many(
+    async def find_many_iter(
         self,
         take: Optional[int] = None,
         skip: Optional[int] = None,
@@ -7609,10 +9710,11 @@ class JobCandidateActions(Generic[_PrismaModelT]):
         include: Optional[types.JobCandidateInclude] = None,
         order: Optional[Union[types.JobCandidateOrderByInput, List[types.JobCandidateOrderByInput]]] = None,
         distinct: Optional[List[types.JobCandidateScalarFieldKeys]] = None,
-    ) -> List[_PrismaModelT]:
-        """Find multiple JobCandidate records.
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Find multiple JobCandidate records, yielding them as they are received.
 
-        An empty list is returned if no records could be found.
+        Unlike `find_many()` the response is decoded incrementally, so memory use does not
+        grow with the number of records found.
 
         Parameters
         ----------
@@ -7631,10 +9733,10 @@ class JobCandidateActions(Generic[_PrismaModelT]):
         distinct
             Filter JobCandidate records by either a single distinct field or distinct combinations of fields
 
-        Returns
-        -------
-        List[prisma.models.JobCandidate]
-            The list of all JobCandidate records that could be found
+        Yields
+        ------
+        prisma.models.JobCandidate
+            Each JobCandidate record that could be found
 
         Raises
         ------
@@ -7644,19 +9746,11 @@ class JobCandidateActions(Generic[_PrismaModelT]):
         Example
         -------
         ```py
-        # find the first 10 JobCandidate records
-        jobcandidates = await JobCandidate.prisma().find_many(take=10)
-
-        # find the first 5 JobCandidate records ordered by the stage field
-        jobcandidates = await JobCandidate.prisma().find_many(
-            take=5,
-            order={
-                'stage': 'desc',
-            },
-        )
+        async for jobcandidate in JobCandidate.prisma().find_many_iter():
+            print(jobcandidate)
         ```
         """
-        resp = await self._client._execute(
+        async for record in self._client._execute_stream(
             method='find_many',
             model=self._model,
             arguments={
@@ -7668,8 +9762,72 @@ class JobCandidateActions(Generic[_PrismaModelT]):
                 'include': include,
                 'distinct': distinct,
             },
+        ):
+            yield self._client._hydrate(self._model, record)
+
+    def paginate(
+        self,
+        page_size: int = 1000,
+        where: Optional[types.JobCandidateWhereInput] = None,
+        include: Optional[types.JobCandidateInclude] = None,
+        key: Literal['id'] = 'id',
+        prefetch: bool = True,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        """Walk through every JobCandidate record in pages, ordered by a unique field.
+
+        Each page is selected by the last key of the previous one instead of an offset, so
+        deep pages are as fast to find as the first one and records that are deleted while
+        walking are simply skipped.
+
+        Parameters
+        ----------
+        page_size
+            Maximum number of JobCandidate records in each page
+        where
+            JobCandidate filter to select records
+        include
+            Specifies which relations should be loaded on the returned JobCandidate model
+        key
+            Unique field that the records are ordered and paginated by
+        prefetch
+            Whether the next page is queried while the current one is being processed
+
+        Yields
+        ------
+        List[prisma.models.JobCandidate]
+            Each page of JobCandidate records
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for jobcandidates in JobCandidate.prisma().paginate(page_size=500):
+            print(len(jobcandidates))
+        ```
+        """
+
+        async def fetch(arguments: Dict[str, Any]) -> List[_PrismaModelT]:
+            return [
+                self._client._hydrate(self._model, record)
+                async for record in self._client._execute_stream(
+                    method='find_many',
+                    model=self._model,
+                    arguments=arguments,
+                )
+            ]
+
+        return aiter_pages(
+            fetch,
+            key=key,
+            page_size=page_size,
+            where=where,
+            include=include,
+            prefetch=prefetch,
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
 
     async def find_first(
         self,
@@ -7737,7 +9895,7 @@ class JobCandidateActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -7801,7 +9959,7 @@ class JobCandidateActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -7837,7 +9995,7 @@ class JobCandidateActions(Generic[_PrismaModelT]):
         ```py
         jobcandidate = await JobCandidate.prisma().update(
             where={
-                'id': 'jcgghhgdj',
+                'id': 'bcajcajjbc',
             },
             data={
                 # data to update the JobCandidate record to
@@ -7858,7 +10016,7 @@ class JobCandidateActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -7894,17 +10052,17 @@ class JobCandidateActions(Generic[_PrismaModelT]):
         ```py
         jobcandidate = await JobCandidate.prisma().upsert(
             where={
-                'id': 'beehgcebbg',
+                'id': 'bfdgheeegf',
             },
             data={
                 'create': {
-                    'id': 'beehgcebbg',
-                    'jobId': 'cabdjadaji',
-                    'candidateId': 'faajgfadf',
+                    'id': 'bfdgheeegf',
+                    'jobId': 'eegghdhjb',
+                    'candidateId': 'daafgidjg',
                 },
                 'update': {
-                    'jobId': 'cabdjadaji',
-                    'candidateId': 'faajgfadf',
+                    'jobId': 'eegghdhjb',
+                    'candidateId': 'daafgidjg',
                 },
             },
         )
@@ -7920,7 +10078,7 @@ class JobCandidateActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -7952,7 +10110,7 @@ class JobCandidateActions(Generic[_PrismaModelT]):
         # update all JobCandidate records
         total = await JobCandidate.prisma().update_many(
             data={
-                'candidateId': 'bhdiaidiaf'
+                'candidateId': 'ececbijji'
             },
             where={}
         )
@@ -8315,7 +10473,7 @@ class ProjectActions(Generic[_PrismaModelT]):
         ```py
         users = await Project.prisma().query_raw(
             'SELECT * FROM Project WHERE id = $1',
-            'deajegcfi',
+            'cbcfgdcdhf',
         )
         ```
         """
@@ -8355,7 +10513,7 @@ class ProjectActions(Generic[_PrismaModelT]):
         ```py
         user = await Project.prisma().query_first(
             'SELECT * FROM Project WHERE name = $1',
-            'gabahhhjf',
+            'fdgjfbhia',
         )
         ```
         """
@@ -8394,9 +10552,9 @@ class ProjectActions(Generic[_PrismaModelT]):
         project = await Project.prisma().create(
             data={
                 # data to create a Project record
-                'name': 'cjagadcjg',
-                'tenantId': 'bifficggej',
-                'userId': 'bgbbaajbic',
+                'name': 'jcehcdchh',
+                'tenantId': 'bgcbjdhjcc',
+                'userId': 'bieiidcabj',
             },
         )
         ```
@@ -8409,7 +10567,7 @@ class ProjectActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -8451,15 +10609,15 @@ class ProjectActions(Generic[_PrismaModelT]):
             data=[
                 {
                     # data to create a Project record
-                    'name': 'eegghdhjb',
-                    'tenantId': 'daafgidjg',
-                    'userId': 'gdcgcgagj',
+                    'name': 'bjcbfcieaa',
+                    'tenantId': 'cbaaechiej',
+                    'userId': 'iejbeaaeg',
                 },
                 {
                     # data to create a Project record
-                    'name': 'bhceabbgja',
-                    'tenantId': 'ehabfhegh',
-                    'userId': 'bcajcajjbc',
+                    'name': 'jcibfcbhf',
+                    'tenantId': 'chdadcaga',
+                    'userId': 'jicieifbh',
                 },
             ],
             skip_duplicates=True,
@@ -8513,7 +10671,7 @@ class ProjectActions(Generic[_PrismaModelT]):
         ```py
         project = await Project.prisma().delete(
             where={
-                'id': 'bfdgheeegf',
+                'id': 'fbahdheji',
             },
         )
         ```
@@ -8530,7 +10688,7 @@ class ProjectActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -8565,23 +10723,20 @@ class ProjectActions(Generic[_PrismaModelT]):
         ```py
         project = await Project.prisma().find_unique(
             where={
-                'id': 'ececbijji',
+                'id': 'cbbheiicgh',
             },
         )
         ```
         """
-        resp = await self._client._execute(
-            method='find_unique',
+        resp = await self._client._execute_find_unique(
             model=self._model,
-            arguments={
-                'where': where,
-                'include': include,
-            },
+            where=where,
+            include=include,
         )
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -8616,7 +10771,7 @@ class ProjectActions(Generic[_PrismaModelT]):
         ```py
         project = await Project.prisma().find_unique_or_raise(
             where={
-                'id': 'cbcfgdcdhf',
+                'id': 'beabjeejdg',
             },
         )
         ```
@@ -8629,7 +10784,7 @@ class ProjectActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -8700,7 +10855,135 @@ class ProjectActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return [self._client._hydrate(self._model, r) for r in resp['data']['result']]
+
+    async def find_many_iter(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.ProjectWhereInput] = None,
+        cursor: Optional[types.ProjectWhereUniqueInput] = None,
+        include: Optional[types.ProjectInclude] = None,
+        order: Optional[Union[types.ProjectOrderByInput, List[types.ProjectOrderByInput]]] = None,
+        distinct: Optional[List[types.ProjectScalarFieldKeys]] = None,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Find multiple Project records, yielding them as they are received.
+
+        Unlike `find_many()` the response is decoded incrementally, so memory use does not
+        grow with the number of records found.
+
+        Parameters
+        ----------
+        take
+            Limit the maximum number of Project records returned
+        skip
+            Ignore the first N results
+        where
+            Project filter to select records
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned Project model
+        order
+            Order the returned Project records by any field
+        distinct
+            Filter Project records by either a single distinct field or distinct combinations of fields
+
+        Yields
+        ------
+        prisma.models.Project
+            Each Project record that could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for project in Project.prisma().find_many_iter():
+            print(project)
+        ```
+        """
+        async for record in self._client._execute_stream(
+            method='find_many',
+            model=self._model,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        ):
+            yield self._client._hydrate(self._model, record)
+
+    def paginate(
+        self,
+        page_size: int = 1000,
+        where: Optional[types.ProjectWhereInput] = None,
+        include: Optional[types.ProjectInclude] = None,
+        key: Literal['id'] = 'id',
+        prefetch: bool = True,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        """Walk through every Project record in pages, ordered by a unique field.
+
+        Each page is selected by the last key of the previous one instead of an offset, so
+        deep pages are as fast to find as the first one and records that are deleted while
+        walking are simply skipped.
+
+        Parameters
+        ----------
+        page_size
+            Maximum number of Project records in each page
+        where
+            Project filter to select records
+        include
+            Specifies which relations should be loaded on the returned Project model
+        key
+            Unique field that the records are ordered and paginated by
+        prefetch
+            Whether the next page is queried while the current one is being processed
+
+        Yields
+        ------
+        List[prisma.models.Project]
+            Each page of Project records
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for projects in Project.prisma().paginate(page_size=500):
+            print(len(projects))
+        ```
+        """
+
+        async def fetch(arguments: Dict[str, Any]) -> List[_PrismaModelT]:
+            return [
+                self._client._hydrate(self._model, record)
+                async for record in self._client._execute_stream(
+                    method='find_many',
+                    model=self._model,
+                    arguments=arguments,
+                )
+            ]
+
+        return aiter_pages(
+            fetch,
+            key=key,
+            page_size=page_size,
+            where=where,
+            include=include,
+            prefetch=prefetch,
+        )
 
     async def find_first(
         self,
@@ -8768,7 +11051,7 @@ class ProjectActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -8832,7 +11115,7 @@ class ProjectActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -8868,7 +11151,7 @@ class ProjectActions(Generic[_PrismaModelT]):
         ```py
         project = await Project.prisma().update(
             where={
-                'id': 'fdgjfbhia',
+                'id': 'bcjhgahffd',
             },
             data={
                 # data to update the Project record to
@@ -8889,7 +11172,7 @@ class ProjectActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -8925,19 +11208,19 @@ class ProjectActions(Generic[_PrismaModelT]):
         ```py
         project = await Project.prisma().upsert(
             where={
-                'id': 'jcehcdchh',
+                'id': 'fbjeiiffa',
             },
             data={
                 'create': {
-                    'id': 'jcehcdchh',
-                    'name': 'bhceabbgja',
-                    'tenantId': 'ehabfhegh',
-                    'userId': 'bcajcajjbc',
+                    'id': 'fbjeiiffa',
+                    'name': 'jcibfcbhf',
+                    'tenantId': 'chdadcaga',
+                    'userId': 'jicieifbh',
                 },
                 'update': {
-                    'name': 'bhceabbgja',
-                    'tenantId': 'ehabfhegh',
-                    'userId': 'bcajcajjbc',
+                    'name': 'jcibfcbhf',
+                    'tenantId': 'chdadcaga',
+                    'userId': 'jicieifbh',
                 },
             },
         )
@@ -8953,7 +11236,7 @@ class ProjectActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -8985,7 +11268,7 @@ class ProjectActions(Generic[_PrismaModelT]):
         # update all Project records
         total = await Project.prisma().update_many(
             data={
-                'userId': 'bgcbjdhjcc'
+                'userId': 'jhgidcgbf'
             },
             where={}
         )
@@ -9348,7 +11631,7 @@ class AgentActions(Generic[_PrismaModelT]):
         ```py
         users = await Agent.prisma().query_raw(
             'SELECT * FROM Agent WHERE id = $1',
-            'bieiidcabj',
+            'bgjgecfejc',
         )
         ```
         """
@@ -9388,7 +11671,7 @@ class AgentActions(Generic[_PrismaModelT]):
         ```py
         user = await Agent.prisma().query_first(
             'SELECT * FROM Agent WHERE name = $1',
-            'bjcbfcieaa',
+            'bgjcgchib',
         )
         ```
         """
@@ -9427,8 +11710,8 @@ class AgentActions(Generic[_PrismaModelT]):
         agent = await Agent.prisma().create(
             data={
                 # data to create a Agent record
-                'name': 'cbaaechiej',
-                'tenantId': 'iejbeaaeg',
+                'name': 'bacdaibgfa',
+                'tenantId': 'dchgibach',
             },
         )
         ```
@@ -9441,7 +11724,7 @@ class AgentActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -9483,13 +11766,13 @@ class AgentActions(Generic[_PrismaModelT]):
             data=[
                 {
                     # data to create a Agent record
-                    'name': 'jcibfcbhf',
-                    'tenantId': 'chdadcaga',
+                    'name': 'fchheijjc',
+                    'tenantId': 'cacjdfhejh',
                 },
                 {
                     # data to create a Agent record
-                    'name': 'jicieifbh',
-                    'tenantId': 'fbahdheji',
+                    'name': 'bdbifjhbbi',
+                    'tenantId': 'cbccbbcdfb',
                 },
             ],
             skip_duplicates=True,
@@ -9543,7 +11826,7 @@ class AgentActions(Generic[_PrismaModelT]):
         ```py
         agent = await Agent.prisma().delete(
             where={
-                'id': 'cbbheiicgh',
+                'id': 'bacejedaca',
             },
         )
         ```
@@ -9560,7 +11843,7 @@ class AgentActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -9595,23 +11878,20 @@ class AgentActions(Generic[_PrismaModelT]):
         ```py
         agent = await Agent.prisma().find_unique(
             where={
-                'id': 'beabjeejdg',
+                'id': 'bhbhdahfaj',
             },
         )
         ```
         """
-        resp = await self._client._execute(
-            method='find_unique',
+        resp = await self._client._execute_find_unique(
             model=self._model,
-            arguments={
-                'where': where,
-                'include': include,
-            },
+            where=where,
+            include=include,
         )
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -9634,34 +11914,105 @@ class AgentActions(Generic[_PrismaModelT]):
 
         Raises
         ------
-        prisma.errors.RecordNotFoundError
-            No record was found
+        prisma.errors.RecordNotFoundError
+            No record was found
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+        prisma.errors.MissingRequiredValueError
+            Value is required but was not found
+
+        Example
+        -------
+        ```py
+        agent = await Agent.prisma().find_unique_or_raise(
+            where={
+                'id': 'bfjibceaec',
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='find_unique_or_raise',
+            model=self._model,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+        )
+        return self._client._hydrate(self._model, resp['data']['result'])
+
+    async def find_many(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.AgentWhereInput] = None,
+        cursor: Optional[types.AgentWhereUniqueInput] = None,
+        include: Optional[types.AgentInclude] = None,
+        order: Optional[Union[types.AgentOrderByInput, List[types.AgentOrderByInput]]] = None,
+        distinct: Optional[List[types.AgentScalarFieldKeys]] = None,
+    ) -> List[_PrismaModelT]:
+        """Find multiple Agent records.
+
+        An empty list is returned if no records could be found.
+
+        Parameters
+        ----------
+        take
+            Limit the maximum number of Agent records returned
+        skip
+            Ignore the first N results
+        where
+            Agent filter to select records
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned Agent model
+        order
+            Order the returned Agent records by any field
+        distinct
+            Filter Agent records by either a single distinct field or distinct combinations of fields
+
+        Returns
+        -------
+        List[prisma.models.Agent]
+            The list of all Agent records that could be found
+
+        Raises
+        ------
         prisma.errors.PrismaError
             Catch all for every exception raised by Prisma Client Python
-        prisma.errors.MissingRequiredValueError
-            Value is required but was not found
 
         Example
         -------
         ```py
-        agent = await Agent.prisma().find_unique_or_raise(
-            where={
-                'id': 'bcjhgahffd',
+        # find the first 10 Agent records
+        agents = await Agent.prisma().find_many(take=10)
+
+        # find the first 5 Agent records ordered by the description field
+        agents = await Agent.prisma().find_many(
+            take=5,
+            order={
+                'description': 'desc',
             },
         )
         ```
         """
         resp = await self._client._execute(
-            method='find_unique_or_raise',
+            method='find_many',
             model=self._model,
             arguments={
+                'take': take,
+                'skip': skip,
                 'where': where,
+                'order_by': order,
+                'cursor': cursor,
                 'include': include,
+                'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return [self._client._hydrate(self._model, r) for r in resp['data']['result']]
 
-    async def find_many(
+    async def find_many_iter(
         self,
         take: Optional[int] = None,
         skip: Optional[int] = None,
@@ -9670,10 +12021,11 @@ class AgentActions(Generic[_PrismaModelT]):
         include: Optional[types.AgentInclude] = None,
         order: Optional[Union[types.AgentOrderByInput, List[types.AgentOrderByInput]]] = None,
         distinct: Optional[List[types.AgentScalarFieldKeys]] = None,
-    ) -> List[_PrismaModelT]:
-        """Find multiple Agent records.
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Find multiple Agent records, yielding them as they are received.
 
-        An empty list is returned if no records could be found.
+        Unlike `find_many()` the response is decoded incrementally, so memory use does not
+        grow with the number of records found.
 
         Parameters
         ----------
@@ -9692,10 +12044,10 @@ class AgentActions(Generic[_PrismaModelT]):
         distinct
             Filter Agent records by either a single distinct field or distinct combinations of fields
 
-        Returns
-        -------
-        List[prisma.models.Agent]
-            The list of all Agent records that could be found
+        Yields
+        ------
+        prisma.models.Agent
+            Each Agent record that could be found
 
         Raises
         ------
@@ -9705,19 +12057,11 @@ class AgentActions(Generic[_PrismaModelT]):
         Example
         -------
         ```py
-        # find the first 10 Agent records
-        agents = await Agent.prisma().find_many(take=10)
-
-        # find the first 5 Agent records ordered by the description field
-        agents = await Agent.prisma().find_many(
-            take=5,
-            order={
-                'description': 'desc',
-            },
-        )
+        async for agent in Agent.prisma().find_many_iter():
+            print(agent)
         ```
         """
-        resp = await self._client._execute(
+        async for record in self._client._execute_stream(
             method='find_many',
             model=self._model,
             arguments={
@@ -9729,8 +12073,72 @@ class AgentActions(Generic[_PrismaModelT]):
                 'include': include,
                 'distinct': distinct,
             },
+        ):
+            yield self._client._hydrate(self._model, record)
+
+    def paginate(
+        self,
+        page_size: int = 1000,
+        where: Optional[types.AgentWhereInput] = None,
+        include: Optional[types.AgentInclude] = None,
+        key: Literal['id'] = 'id',
+        prefetch: bool = True,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        """Walk through every Agent record in pages, ordered by a unique field.
+
+        Each page is selected by the last key of the previous one instead of an offset, so
+        deep pages are as fast to find as the first one and records that are deleted while
+        walking are simply skipped.
+
+        Parameters
+        ----------
+        page_size
+            Maximum number of Agent records in each page
+        where
+            Agent filter to select records
+        include
+            Specifies which relations should be loaded on the returned Agent model
+        key
+            Unique field that the records are ordered and paginated by
+        prefetch
+            Whether the next page is queried while the current one is being processed
+
+        Yields
+        ------
+        List[prisma.models.Agent]
+            Each page of Agent records
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for agents in Agent.prisma().paginate(page_size=500):
+            print(len(agents))
+        ```
+        """
+
+        async def fetch(arguments: Dict[str, Any]) -> List[_PrismaModelT]:
+            return [
+                self._client._hydrate(self._model, record)
+                async for record in self._client._execute_stream(
+                    method='find_many',
+                    model=self._model,
+                    arguments=arguments,
+                )
+            ]
+
+        return aiter_pages(
+            fetch,
+            key=key,
+            page_size=page_size,
+            where=where,
+            include=include,
+            prefetch=prefetch,
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
 
     async def find_first(
         self,
@@ -9798,7 +12206,7 @@ class AgentActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -9862,7 +12270,7 @@ class AgentActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -9898,7 +12306,7 @@ class AgentActions(Generic[_PrismaModelT]):
         ```py
         agent = await Agent.prisma().update(
             where={
-                'id': 'fbjeiiffa',
+                'id': 'ibhgcdbgd',
             },
             data={
                 # data to update the Agent record to
@@ -9919,7 +12327,7 @@ class AgentActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -9955,17 +12363,17 @@ class AgentActions(Generic[_PrismaModelT]):
         ```py
         agent = await Agent.prisma().upsert(
             where={
-                'id': 'jhgidcgbf',
+                'id': 'badaffhddg',
             },
             data={
                 'create': {
-                    'id': 'jhgidcgbf',
-                    'name': 'jicieifbh',
-                    'tenantId': 'fbahdheji',
+                    'id': 'badaffhddg',
+                    'name': 'bdbifjhbbi',
+                    'tenantId': 'cbccbbcdfb',
                 },
                 'update': {
-                    'name': 'jicieifbh',
-                    'tenantId': 'fbahdheji',
+                    'name': 'bdbifjhbbi',
+                    'tenantId': 'cbccbbcdfb',
                 },
             },
         )
@@ -9981,7 +12389,7 @@ class AgentActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -10013,7 +12421,7 @@ class AgentActions(Generic[_PrismaModelT]):
         # update all Agent records
         total = await Agent.prisma().update_many(
             data={
-                'temperature': 1696425492.16926
+                'temperature': 1131525873.21066
             },
             where={}
         )
@@ -10376,7 +12784,7 @@ class ConversationActions(Generic[_PrismaModelT]):
         ```py
         users = await Conversation.prisma().query_raw(
             'SELECT * FROM Conversation WHERE id = $1',
-            'bacdaibgfa',
+            'bchgafhjed',
         )
         ```
         """
@@ -10416,7 +12824,7 @@ class ConversationActions(Generic[_PrismaModelT]):
         ```py
         user = await Conversation.prisma().query_first(
             'SELECT * FROM Conversation WHERE agentId = $1',
-            'dchgibach',
+            'heffgjdei',
         )
         ```
         """
@@ -10455,7 +12863,7 @@ class ConversationActions(Generic[_PrismaModelT]):
         conversation = await Conversation.prisma().create(
             data={
                 # data to create a Conversation record
-                'agentId': 'fchheijjc',
+                'agentId': 'dahihgbeb',
             },
         )
         ```
@@ -10468,7 +12876,7 @@ class ConversationActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -10510,11 +12918,11 @@ class ConversationActions(Generic[_PrismaModelT]):
             data=[
                 {
                     # data to create a Conversation record
-                    'agentId': 'cacjdfhejh',
+                    'agentId': 'bgheaejbcc',
                 },
                 {
                     # data to create a Conversation record
-                    'agentId': 'bdbifjhbbi',
+                    'agentId': 'bfcgifeged',
                 },
             ],
             skip_duplicates=True,
@@ -10568,7 +12976,7 @@ class ConversationActions(Generic[_PrismaModelT]):
         ```py
         conversation = await Conversation.prisma().delete(
             where={
-                'id': 'cbccbbcdfb',
+                'id': 'jfiahhbae',
             },
         )
         ```
@@ -10585,7 +12993,7 @@ class ConversationActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -10620,23 +13028,20 @@ class ConversationActions(Generic[_PrismaModelT]):
         ```py
         conversation = await Conversation.prisma().find_unique(
             where={
-                'id': 'bacejedaca',
+                'id': 'bfbdafajcb',
             },
         )
         ```
         """
-        resp = await self._client._execute(
-            method='find_unique',
+        resp = await self._client._execute_find_unique(
             model=self._model,
-            arguments={
-                'where': where,
-                'include': include,
-            },
+            where=where,
+            include=include,
         )
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -10671,7 +13076,7 @@ class ConversationActions(Generic[_PrismaModelT]):
         ```py
         conversation = await Conversation.prisma().find_unique_or_raise(
             where={
-                'id': 'bhbhdahfaj',
+                'id': 'caeghehde',
             },
         )
         ```
@@ -10684,7 +13089,7 @@ class ConversationActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -10755,7 +13160,135 @@ class ConversationActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return [self._client._hydrate(self._model, r) for r in resp['data']['result']]
+
+    async def find_many_iter(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.ConversationWhereInput] = None,
+        cursor: Optional[types.ConversationWhereUniqueInput] = None,
+        include: Optional[types.ConversationInclude] = None,
+        order: Optional[Union[types.ConversationOrderByInput, List[types.ConversationOrderByInput]]] = None,
+        distinct: Optional[List[types.ConversationScalarFieldKeys]] = None,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Find multiple Conversation records, yielding them as they are received.
+
+        Unlike `find_many()` the response is decoded incrementally, so memory use does not
+        grow with the number of records found.
+
+        Parameters
+        ----------
+        take
+            Limit the maximum number of Conversation records returned
+        skip
+            Ignore the first N results
+        where
+            Conversation filter to select records
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned Conversation model
+        order
+            Order the returned Conversation records by any field
+        distinct
+            Filter Conversation records by either a single distinct field or distinct combinations of fields
+
+        Yields
+        ------
+        prisma.models.Conversation
+            Each Conversation record that could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for conversation in Conversation.prisma().find_many_iter():
+            print(conversation)
+        ```
+        """
+        async for record in self._client._execute_stream(
+            method='find_many',
+            model=self._model,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        ):
+            yield self._client._hydrate(self._model, record)
+
+    def paginate(
+        self,
+        page_size: int = 1000,
+        where: Optional[types.ConversationWhereInput] = None,
+        include: Optional[types.ConversationInclude] = None,
+        key: Literal['id'] = 'id',
+        prefetch: bool = True,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        """Walk through every Conversation record in pages, ordered by a unique field.
+
+        Each page is selected by the last key of the previous one instead of an offset, so
+        deep pages are as fast to find as the first one and records that are deleted while
+        walking are simply skipped.
+
+        Parameters
+        ----------
+        page_size
+            Maximum number of Conversation records in each page
+        where
+            Conversation filter to select records
+        include
+            Specifies which relations should be loaded on the returned Conversation model
+        key
+            Unique field that the records are ordered and paginated by
+        prefetch
+            Whether the next page is queried while the current one is being processed
+
+        Yields
+        ------
+        List[prisma.models.Conversation]
+            Each page of Conversation records
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for conversations in Conversation.prisma().paginate(page_size=500):
+            print(len(conversations))
+        ```
+        """
+
+        async def fetch(arguments: Dict[str, Any]) -> List[_PrismaModelT]:
+            return [
+                self._client._hydrate(self._model, record)
+                async for record in self._client._execute_stream(
+                    method='find_many',
+                    model=self._model,
+                    arguments=arguments,
+                )
+            ]
+
+        return aiter_pages(
+            fetch,
+            key=key,
+            page_size=page_size,
+            where=where,
+            include=include,
+            prefetch=prefetch,
+        )
 
     async def find_first(
         self,
@@ -10823,7 +13356,7 @@ class ConversationActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -10887,7 +13420,7 @@ class ConversationActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -10923,7 +13456,7 @@ class ConversationActions(Generic[_PrismaModelT]):
         ```py
         conversation = await Conversation.prisma().update(
             where={
-                'id': 'bfjibceaec',
+                'id': 'caghgfbggd',
             },
             data={
                 # data to update the Conversation record to
@@ -10944,7 +13477,7 @@ class ConversationActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -10980,15 +13513,15 @@ class ConversationActions(Generic[_PrismaModelT]):
         ```py
         conversation = await Conversation.prisma().upsert(
             where={
-                'id': 'ibhgcdbgd',
+                'id': 'bbidjbbjaa',
             },
             data={
                 'create': {
-                    'id': 'ibhgcdbgd',
-                    'agentId': 'bdbifjhbbi',
+                    'id': 'bbidjbbjaa',
+                    'agentId': 'bfcgifeged',
                 },
                 'update': {
-                    'agentId': 'bdbifjhbbi',
+                    'agentId': 'bfcgifeged',
                 },
             },
         )
@@ -11004,7 +13537,7 @@ class ConversationActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -11399,7 +13932,7 @@ class AgentTaskActions(Generic[_PrismaModelT]):
         ```py
         users = await AgentTask.prisma().query_raw(
             'SELECT * FROM AgentTask WHERE id = $1',
-            'badaffhddg',
+            'bfijhaejdd',
         )
         ```
         """
@@ -11439,7 +13972,7 @@ class AgentTaskActions(Generic[_PrismaModelT]):
         ```py
         user = await AgentTask.prisma().query_first(
             'SELECT * FROM AgentTask WHERE agentId = $1',
-            'bbdbfcfihd',
+            'bcedehfiji',
         )
         ```
         """
@@ -11478,9 +14011,9 @@ class AgentTaskActions(Generic[_PrismaModelT]):
         agenttask = await AgentTask.prisma().create(
             data={
                 # data to create a AgentTask record
-                'agentId': 'cbagggbji',
-                'name': 'bchgafhjed',
-                'conversationId': 'heffgjdei',
+                'agentId': 'bdgjicijhb',
+                'name': 'bghifjdeia',
+                'conversationId': 'eadfcbbcb',
             },
         )
         ```
@@ -11493,7 +14026,7 @@ class AgentTaskActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -11535,15 +14068,15 @@ class AgentTaskActions(Generic[_PrismaModelT]):
             data=[
                 {
                     # data to create a AgentTask record
-                    'agentId': 'dahihgbeb',
-                    'name': 'bgheaejbcc',
-                    'conversationId': 'bfcgifeged',
+                    'agentId': 'geihgahba',
+                    'name': 'gahdcdhbj',
+                    'conversationId': 'begiijahea',
                 },
                 {
                     # data to create a AgentTask record
-                    'agentId': 'jfiahhbae',
-                    'name': 'bfbdafajcb',
-                    'conversationId': 'caeghehde',
+                    'agentId': 'gcjadjaaf',
+                    'name': 'bcbebgiaic',
+                    'conversationId': 'ijigbdcbj',
                 },
             ],
             skip_duplicates=True,
@@ -11597,7 +14130,7 @@ class AgentTaskActions(Generic[_PrismaModelT]):
         ```py
         agenttask = await AgentTask.prisma().delete(
             where={
-                'id': 'caghgfbggd',
+                'id': 'gfidhicai',
             },
         )
         ```
@@ -11614,7 +14147,7 @@ class AgentTaskActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -11649,23 +14182,20 @@ class AgentTaskActions(Generic[_PrismaModelT]):
         ```py
         agenttask = await AgentTask.prisma().find_unique(
             where={
-                'id': 'bbidjbbjaa',
+                'id': 'jfegcaafh',
             },
         )
         ```
         """
-        resp = await self._client._execute(
-            method='find_unique',
+        resp = await self._client._execute_find_unique(
             model=self._model,
-            arguments={
-                'where': where,
-                'include': include,
-            },
+            where=where,
+            include=include,
         )
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -11700,7 +14230,7 @@ class AgentTaskActions(Generic[_PrismaModelT]):
         ```py
         agenttask = await AgentTask.prisma().find_unique_or_raise(
             where={
-                'id': 'bfijhaejdd',
+                'id': 'bcbeiajjfa',
             },
         )
         ```
@@ -11713,7 +14243,7 @@ class AgentTaskActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -11784,7 +14314,135 @@ class AgentTaskActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return [self._client._hydrate(self._model, r) for r in resp['data']['result']]
+
+    async def find_many_iter(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.AgentTaskWhereInput] = None,
+        cursor: Optional[types.AgentTaskWhereUniqueInput] = None,
+        include: Optional[types.AgentTaskInclude] = None,
+        order: Optional[Union[types.AgentTaskOrderByInput, List[types.AgentTaskOrderByInput]]] = None,
+        distinct: Optional[List[types.AgentTaskScalarFieldKeys]] = None,
+    ) -> AsyncIterator[_PrismaModelT]:
+        """Find multiple AgentTask records, yielding them as they are received.
+
+        Unlike `find_many()` the response is decoded incrementally, so memory use does not
+        grow with the number of records found.
+
+        Parameters
+        ----------
+        take
+            Limit the maximum number of AgentTask records returned
+        skip
+            Ignore the first N results
+        where
+            AgentTask filter to select records
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned AgentTask model
+        order
+            Order the returned AgentTask records by any field
+        distinct
+            Filter AgentTask records by either a single distinct field or distinct combinations of fields
+
+        Yields
+        ------
+        prisma.models.AgentTask
+            Each AgentTask record that could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for agenttask in AgentTask.prisma().find_many_iter():
+            print(agenttask)
+        ```
+        """
+        async for record in self._client._execute_stream(
+            method='find_many',
+            model=self._model,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        ):
+            yield self._client._hydrate(self._model, record)
+
+    def paginate(
+        self,
+        page_size: int = 1000,
+        where: Optional[types.AgentTaskWhereInput] = None,
+        include: Optional[types.AgentTaskInclude] = None,
+        key: Literal['id'] = 'id',
+        prefetch: bool = True,
+    ) -> AsyncIterator[List[_PrismaModelT]]:
+        """Walk through every AgentTask record in pages, ordered by a unique field.
+
+        Each page is selected by the last key of the previous one instead of an offset, so
+        deep pages are as fast to find as the first one and records that are deleted while
+        walking are simply skipped.
+
+        Parameters
+        ----------
+        page_size
+            Maximum number of AgentTask records in each page
+        where
+            AgentTask filter to select records
+        include
+            Specifies which relations should be loaded on the returned AgentTask model
+        key
+            Unique field that the records are ordered and paginated by
+        prefetch
+            Whether the next page is queried while the current one is being processed
+
+        Yields
+        ------
+        List[prisma.models.AgentTask]
+            Each page of AgentTask records
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        async for agenttasks in AgentTask.prisma().paginate(page_size=500):
+            print(len(agenttasks))
+        ```
+        """
+
+        async def fetch(arguments: Dict[str, Any]) -> List[_PrismaModelT]:
+            return [
+                self._client._hydrate(self._model, record)
+                async for record in self._client._execute_stream(
+                    method='find_many',
+                    model=self._model,
+                    arguments=arguments,
+                )
+            ]
+
+        return aiter_pages(
+            fetch,
+            key=key,
+            page_size=page_size,
+            where=where,
+            include=include,
+            prefetch=prefetch,
+        )
 
     async def find_first(
         self,
@@ -11852,7 +14510,7 @@ class AgentTaskActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._hydrate(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -11916,7 +14574,7 @@ class AgentTaskActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -11952,7 +14610,7 @@ class AgentTaskActions(Generic[_PrismaModelT]):
         ```py
         agenttask = await AgentTask.prisma().update(
             where={
-                'id': 'bcedehfiji',
+                'id': 'baehicaajf',
             },
             data={
                 # data to update the AgentTask record to
@@ -11973,7 +14631,7 @@ class AgentTaskActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -12009,19 +14667,19 @@ class AgentTaskActions(Generic[_PrismaModelT]):
         ```py
         agenttask = await AgentTask.prisma().upsert(
             where={
-                'id': 'bdgjicijhb',
+                'id': 'bdachdeiga',
             },
             data={
                 'create': {
-                    'id': 'bdgjicijhb',
-                    'agentId': 'jfiahhbae',
-                    'name': 'bfbdafajcb',
-                    'conversationId': 'caeghehde',
+                    'id': 'bdachdeiga',
+                    'agentId': 'gcjadjaaf',
+                    'name': 'bcbebgiaic',
+                    'conversationId': 'ijigbdcbj',
                 },
                 'update': {
-                    'agentId': 'jfiahhbae',
-                    'name': 'bfbdafajcb',
-                    'conversationId': 'caeghehde',
+                    'agentId': 'gcjadjaaf',
+                    'name': 'bcbebgiaic',
+                    'conversationId': 'ijigbdcbj',
                 },
             },
         )
@@ -12037,7 +14695,7 @@ class AgentTaskActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._hydrate(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -124,6 +124,16 @@ class BaseUserSession(_PrismaModel):
         return actions.UserSessionActions[_PrismaModelT](client or get_client(), cls)
 
 
+class BasePasswordResetToken(_PrismaModel):
+    __prisma_model__: ClassVar[Literal['PasswordResetToken']] = 'PasswordResetToken'  # pyright: ignore[reportIncompatibleVariableOverride]
+
+    @classmethod
+    def prisma(cls: Type[_PrismaModelT], client: Optional['Prisma'] = None) -> 'actions.PasswordResetTokenActions[_PrismaModelT]':
+        from .client import get_client
+
+        return actions.PasswordResetTokenActions[_PrismaModelT](client or get_client(), cls)
+
+
 class BaseCandidate(_PrismaModel):
     __prisma_model__: ClassVar[Literal['Candidate']] = 'Candidate'  # pyright: ignore[reportIncompatibleVariableOverride]
 
@@ -54,6 +54,7 @@ from .types import DatasourceOverride, HttpConfig, MetricsFormat
 from ._types import BaseModelT, PrismaMethod, TransactionId, Datasource
 from .bases import _PrismaModel
 from ._builder import QueryBuilder, dumps
+from ._hydration import HydrationMode
 from .generator.models import EngineType, OptionalValueFromEnvVar, BinaryPaths
 from ._compat import removeprefix, model_parse
 from ._constants import CREATE_MANY_SKIP_DUPLICATES_UNSUPPORTED, DEFAULT_CONNECT_TIMEOUT, DEFAULT_TX_MAX_WAIT, DEFAULT_TX_TIMEOUT
@@ -99,6 +100,7 @@ class Prisma(AsyncBasePrisma):
     userrole: 'actions.UserRoleActions[models.UserRole]'
     user: 'actions.UserActions[models.User]'
     usersession: 'actions.UserSessionActions[models.UserSession]'
+    passwordresettoken: 'actions.PasswordResetTokenActions[models.PasswordResetToken]'
     candidate: 'actions.CandidateActions[models.Candidate]'
     job: 'actions.JobActions[models.Job]'
     jobcandidate: 'actions.JobCandidateActions[models.JobCandidate]'
@@ -113,6 +115,7 @@ class Prisma(AsyncBasePrisma):
         'userrole',
         'user',
         'usersession',
+        'passwordresettoken',
         'candidate',
         'job',
         'jobcandidate',
@@ -131,6 +134,9 @@ class Prisma(AsyncBasePrisma):
         datasource: DatasourceOverride | None = None,
         connect_timeout: int | timedelta = DEFAULT_CONNECT_TIMEOUT,
         http: HttpConfig | None = None,
+        hydration: HydrationMode = 'validate',
+        batch_find_unique: bool = False,
+        engine_processes: int = 1,
     ) -> None:
         super().__init__(
             http=http,
@@ -138,6 +144,9 @@ class Prisma(AsyncBasePrisma):
             log_queries=log_queries,
             datasource=datasource,
             connect_timeout=connect_timeout,
+            hydration=hydration,
+            batch_find_unique=batch_find_unique,
+            engine_processes=engine_processes,
         )
         self._set_generated_properties(
             schema_path=SCHEMA_PATH,
@@ -155,6 +164,7 @@ class Prisma(AsyncBasePrisma):
         self.userrole = actions.UserRoleActions[models.UserRole](self, models.UserRole)
         self.user = actions.UserActions[models.User](self, models.User)
         self.usersession = actions.UserSessionActions[models.UserSession](self, models.UserSession)
+        self.passwordresettoken = actions.PasswordResetTokenActions[models.PasswordResetToken](self, models.PasswordResetToken)
         self.candidate = actions.CandidateActions[models.Candidate](self, models.Candidate)
         self.job = actions.JobActions[models.Job](self, models.Job)
         self.jobcandidate = actions.JobCandidateActions[models.JobCandidate](self, models.JobCandidate)
@@ -317,6 +327,7 @@ class Batch:
     userrole: 'UserRoleBatchActions'
     user: 'UserBatchActions'
     usersession: 'UserSessionBatchActions'
+    passwordresettoken: 'PasswordResetTokenBatchActions'
     candidate: 'CandidateBatchActions'
     job: 'JobBatchActions'
     jobcandidate: 'JobCandidateBatchActions'
@@ -334,6 +345,7 @@ class Batch:
         self.userrole = UserRoleBatchActions(self)
         self.user = UserBatchActions(self)
         self.usersession = UserSessionBatchActions(self)
+        self.passwordresettoken = PasswordResetTokenBatchActions(self)
         self.candidate = CandidateBatchActions(self)
         self.job = JobBatchActions(self)
         self.jobcandidate = JobCandidateBatchActions(self)
@@ -948,6 +960,117 @@ class UserSessionBatchActions:
 
 
 
+# NOTE: some arguments are meaningless in this context but are included
+# for completeness sake
+class PasswordResetTokenBatchActions:
+    def __init__(self, batcher: Batch) -> None:
+        self._batcher = batcher
+
+    def create(
+        self,
+        data: types.PasswordResetTokenCreateInput,
+        include: Optional[types.PasswordResetTokenInclude] = None
+    ) -> None:
+        self._batcher._add(
+            method='create',
+            model=models.PasswordResetToken,
+            arguments={
+                'data': data,
+                'include': include,
+            },
+        )
+
+    def create_many(
+        self,
+        data: List[types.PasswordResetTokenCreateWithoutRelationsInput],
+        *,
+        skip_duplicates: Optional[bool] = None,
+    ) -> None:
+        if skip_duplicates and self._batcher._active_provider in CREATE_MANY_SKIP_DUPLICATES_UNSUPPORTED:
+            raise errors.UnsupportedDatabaseError(self._batcher._active_provider, 'create_many_skip_duplicates')
+
+        self._batcher._add(
+            method='create_many',
+            model=models.PasswordResetToken,
+            arguments={
+                'data': data,
+                'skipDuplicates': skip_duplicates,
+            },
+            root_selection=['count'],
+        )
+
+    def delete(
+        self,
+        where: types.PasswordResetTokenWhereUniqueInput,
+        include: Optional[types.PasswordResetTokenInclude] = None,
+    ) -> None:
+        self._batcher._add(
+            method='delete',
+            model=models.PasswordResetToken,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+        )
+
+    def update(
+        self,
+        data: types.PasswordResetTokenUpdateInput,
+        where: types.PasswordResetTokenWhereUniqueInput,
+        include: Optional[types.PasswordResetTokenInclude] = None
+    ) -> None:
+        self._batcher._add(
+            method='update',
+            model=models.PasswordResetToken,
+            arguments={
+                'data': data,
+                'where': where,
+                'include': include,
+            },
+        )
+
+    def upsert(
+        self,
+        where: types.PasswordResetTokenWhereUniqueInput,
+        data: types.PasswordResetTokenUpsertInput,
+        include: Optional[types.PasswordResetTokenInclude] = None,
+    ) -> None:
+        self._batcher._add(
+            method='upsert',
+            model=models.PasswordResetToken,
+            arguments={
+                'where': where,
+                'include': include,
+                'create': data.get('create'),
+                'update': data.get('update'),
+            },
+        )
+
+    def update_many(
+        self,
+        data: types.PasswordResetTokenUpdateManyMutationInput,
+        where: types.PasswordResetTokenWhereInput,
+    ) -> None:
+        self._batcher._add(
+            method='update_many',
+            model=models.PasswordResetToken,
+            arguments={'data': data, 'where': where,},
+            root_selection=['count'],
+        )
+
+    def delete_many(
+        self,
+        where: Optional[types.PasswordResetTokenWhereInput] = None,
+    ) -> None:
+        self._batcher._add(
+            method='delete_many',
+            model=models.PasswordResetToken,
+            arguments={'where': where},
+            root_selection=['count'],
+        )
+
+
+
 # NOTE: some arguments are meaningless in this context but are included
 # for completeness sake
 class CandidateBatchActions:
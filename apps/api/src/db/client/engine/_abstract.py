@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, overload
+from typing import TYPE_CHECKING, Any, Iterator, AsyncIterator, overload
 from datetime import timedelta
 from typing_extensions import Literal
 
@@ -70,6 +70,14 @@ class SyncAbstractEngine(BaseAbstractEngine):
         """
         ...
 
+    def query_stream(self, content: str, *, tx_id: TransactionId | None) -> Iterator[Any]:
+        """Execute a GraphQL query with a list result, yielding its records as they are received.
+
+        Engines that cannot stream responses yield the records once the whole response
+        has been received.
+        """
+        yield from self.query(content, tx_id=tx_id)['data']['result']
+
     @abstractmethod
     def start_transaction(self, *, content: str) -> TransactionId:
         """Start an interactive transaction, returns the transaction ID that can be used to perform subsequent operations"""
@@ -136,6 +144,16 @@ class AsyncAbstractEngine(BaseAbstractEngine):
         """
         ...
 
+    async def query_stream(self, content: str, *, tx_id: TransactionId | None) -> AsyncIterator[Any]:
+        """Execute a GraphQL query with a list result, yielding its records as they are received.
+
+        Engines that cannot stream responses yield the records once the whole response
+        has been received.
+        """
+        response = await self.query(content, tx_id=tx_id)
+        for record in response['data']['result']:
+            yield record
+
     @abstractmethod
     async def start_transaction(self, *, content: str) -> TransactionId:
         """Start an interactive transaction, returns the transaction ID that can be used to perform subsequent operations"""
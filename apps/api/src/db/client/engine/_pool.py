@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import atexit
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Iterator, AsyncIterator, overload
+from pathlib import Path
+from datetime import timedelta
+from contextlib import contextmanager
+from typing_extensions import Literal, override
+
+import httpx
+
+from . import errors
+from ._query import AsyncQueryEngine
+from .. import errors as prisma_errors
+from ._abstract import AsyncAbstractEngine
+from .._types import HttpConfig, TransactionId
+from .._constants import DEFAULT_CONNECT_TIMEOUT
+
+if TYPE_CHECKING:
+    from ..types import MetricsFormat, DatasourceOverride  # noqa: TID251
+
+
+__all__ = ('AsyncQueryEnginePool',)
+
+log: logging.Logger = logging.getLogger(__name__)
+
+DEFAULT_HEALTH_CHECK_INTERVAL = timedelta(seconds=5)
+DEFAULT_HEALTH_CHECK_FAILURES = 3
+DEFAULT_DRAIN_TIMEOUT = timedelta(seconds=30)
+DRAIN_POLL_INTERVAL = 0.05
+
+
+class AsyncQueryEnginePool(AsyncAbstractEngine):
+    """Spreads queries over multiple query engine processes
+
+    Every query is sent to the engine with the fewest queries in flight. Interactive
+    transactions are pinned to the engine they were started on, as transaction state
+    only exists inside that process.
+
+    Engines are checked periodically. An engine whose process has exited, or that failed
+    `health_check_failures` checks in a row, is replaced with a new process, as a single
+    slow response from a busy engine is not fatal. Queries already running on the old
+    engine are given up to `drain_timeout` to finish before it is stopped. Transactions
+    that were running on the replaced engine cannot be recovered.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int,
+        dml_path: Path,
+        log_queries: bool = False,
+        http_config: HttpConfig | None = None,
+        health_check_interval: timedelta = DEFAULT_HEALTH_CHECK_INTERVAL,
+        health_check_failures: int = DEFAULT_HEALTH_CHECK_FAILURES,
+        drain_timeout: timedelta = DEFAULT_DRAIN_TIMEOUT,
+    ) -> None:
+        if size < 1:
+            raise ValueError(f'Expected size to be a positive integer, got {size}')
+        if health_check_failures < 1:
+            raise ValueError(
+                f'Expected health_check_failures to be a positive integer, got {health_check_failures}'
+            )
+
+        self.size = size
+        self.dml_path = dml_path
+        self._log_queries = log_queries
+        self._http_config = http_config
+        self._health_check_interval = health_check_interval
+        self._health_check_failures = health_check_failures
+        self._drain_timeout = drain_timeout
+        self._engines: list[AsyncQueryEngine] = []
+        self._in_flight: dict[AsyncQueryEngine, int] = {}
+        self._transactions: dict[TransactionId, AsyncQueryEngine] = {}
+        self._respawning: set[AsyncQueryEngine] = set()
+        self._failures: dict[AsyncQueryEngine, int] = {}
+        self._tasks: set[asyncio.Future[None]] = set()
+        self._connect_args: tuple[timedelta, list[DatasourceOverride] | None] | None = None
+
+    @property
+    def engines(self) -> list[AsyncQueryEngine]:
+        """The engines currently serving queries"""
+        return list(self._engines)
+
+    def in_flight(self) -> list[int]:
+        """The number of queries in flight on each engine"""
+        return [self._in_flight[engine] for engine in self._engines]
+
+    @override
+    async def connect(
+        self,
+        timeout: timedelta = DEFAULT_CONNECT_TIMEOUT,
+        datasources: list[DatasourceOverride] | None = None,
+    ) -> None:
+        if self._engines:
+            raise errors.AlreadyConnectedError('Already connected to the query engine')
+
+        log.debug('Starting %s query engine processes', self.size)
+        engines = [self._create_engine() for _ in range(self.size)]
+        results = await asyncio.gather(
+            *(engine.connect(timeout=timeout, datasources=datasources) for engine in engines),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                for engine in engines:
+                    await self._discard_engine(engine)
+                raise result
+
+        self._connect_args = (timeout, datasources)
+        self._engines = engines
+        self._in_flight = {engine: 0 for engine in engines}
+        self._spawn_task(self._check_health())
+
+    @override
+    def close(self, *, timeout: timedelta | None = None) -> None:
+        self._cancel_tasks()
+        for engine in self._owned_engines():
+            engine.close(timeout=timeout)
+
+    @override
+    async def aclose(self, *, timeout: timedelta | None = None) -> None:
+        self._cancel_tasks()
+        engines = self._owned_engines()
+        self._engines = []
+        self._in_flight = {}
+        self._transactions.clear()
+        self._respawning.clear()
+        self._failures.clear()
+        for engine in engines:
+            await self._discard_engine(engine, timeout=timeout)
+
+    @override
+    async def query(
+        self,
+        content: str,
+        *,
+        tx_id: TransactionId | None,
+    ) -> Any:
+        engine = self._engine_for(tx_id)
+        try:
+            with self._track(engine):
+                return await engine.query(content, tx_id=tx_id)
+        except httpx.ConnectError:
+            # the request never reached the engine so it is safe to send it elsewhere,
+            # unless it belongs to a transaction that only exists on this engine
+            if tx_id is not None or len(self._engines) == 1:
+                raise
+
+            self._schedule_respawn(engine)
+            log.debug('Could not connect to query engine %s; retrying on another engine', engine.url)
+            retry = self._pick(exclude=engine)
+            with self._track(retry):
+                return await retry.query(content, tx_id=tx_id)
+
+    @override
+    async def query_stream(
+        self,
+        content: str,
+        *,
+        tx_id: TransactionId | None,
+    ) -> AsyncIterator[Any]:
+        engine = self._engine_for(tx_id)
+        started = False
+        try:
+            with self._track(engine):
+                async for record in engine.query_stream(content, tx_id=tx_id):
+                    started = True
+                    yield record
+            return
+        except httpx.ConnectError:
+            # records that were already yielded cannot be taken back, so the stream is only
+            # restarted elsewhere if the request never reached the engine
+            if started or tx_id is not None or len(self._engines) == 1:
+                raise
+
+            self._schedule_respawn(engine)
+            log.debug('Could not connect to query engine %s; retrying the stream on another engine', engine.url)
+
+        retry = self._pick(exclude=engine)
+        with self._track(retry):
+            async for record in retry.query_stream(content, tx_id=tx_id):
+                yield record
+
+    @override
+    async def start_transaction(self, *, content: str) -> TransactionId:
+        engine = self._pick()
+        with self._track(engine):
+            tx_id = await engine.start_transaction(content=content)
+
+        self._transactions[tx_id] = engine
+        return tx_id
+
+    @override
+    async def commit_transaction(self, tx_id: TransactionId) -> None:
+        engine = self._engine_for(tx_id)
+        try:
+            with self._track(engine):
+                await engine.commit_transaction(tx_id)
+        finally:
+            self._transactions.pop(tx_id, None)
+
+    @override
+    async def rollback_transaction(self, tx_id: TransactionId) -> None:
+        engine = self._engine_for(tx_id)
+        try:
+            with self._track(engine):
+                await engine.rollback_transaction(tx_id)
+        finally:
+            self._transactions.pop(tx_id, None)
+
+    @overload
+    async def metrics(
+        self,
+        *,
+        format: Literal['json'],
+        global_labels: dict[str, str] | None,
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def metrics(
+        self,
+        *,
+        format: Literal['prometheus'],
+        global_labels: dict[str, str] | None,
+    ) -> str: ...
+
+    @override
+    async def metrics(
+        self,
+        *,
+        format: MetricsFormat,
+        global_labels: dict[str, str] | None,
+    ) -> str | dict[str, Any]:
+        # every engine has its own connection pool and counters, these are the metrics
+        # of a single process
+        engine = self._pick()
+        with self._track(engine):
+            return await engine.metrics(format=format, global_labels=global_labels)  # type: ignore[no-any-return]
+
+    def _create_engine(self) -> AsyncQueryEngine:
+        return AsyncQueryEngine(
+            dml_path=self.dml_path,
+            log_queries=self._log_queries,
+            http_config=self._http_config,
+        )
+
+    def _owned_engines(self) -> list[AsyncQueryEngine]:
+        # replaced engines are still running until their in flight queries have finished
+        return self._engines + [engine for engine in self._respawning if engine not in self._engines]
+
+    def _engine_for(self, tx_id: TransactionId | None) -> AsyncQueryEngine:
+        if tx_id is None:
+            return self._pick()
+
+        engine = self._transactions.get(tx_id)
+        if engine is None:
+            raise prisma_errors.TransactionError(
+                f'Transaction {tx_id} is not running on any query engine, '
+                + 'it may have been finished or its query engine was restarted'
+            )
+        return engine
+
+    def _pick(self, *, exclude: AsyncQueryEngine | None = None) -> AsyncQueryEngine:
+        if not self._engines:
+            raise errors.NotConnectedError('Not connected to the query engine')
+
+        # engines that are being replaced are only used if there is nothing else
+        candidates = [
+            engine for engine in self._engines if engine is not exclude and engine not in self._respawning
+        ] or self._engines
+        return min(candidates, key=self._in_flight.__getitem__)
+
+    @contextmanager
+    def _track(self, engine: AsyncQueryEngine) -> Iterator[None]:
+        in_flight = self._in_flight
+        if engine in in_flight:
+            in_flight[engine] += 1
+        try:
+            yield
+        finally:
+            # the engine may have been replaced while the query was running
+            if engine in in_flight:
+                in_flight[engine] -= 1
+
+    def _spawn_task(self, coro: Any) -> None:
+        # a reference is kept so that the task is not garbage collected while it runs
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _cancel_tasks(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    async def _check_health(self) -> None:
+        interval = self._health_check_interval.total_seconds()
+        while True:
+            await asyncio.sleep(interval)
+            for engine in list(self._engines):
+                if engine in self._respawning:
+                    continue
+
+                if await self._is_healthy(engine):
+                    self._failures.pop(engine, None)
+                    continue
+
+                failures = self._failures[engine] = self._failures.get(engine, 0) + 1
+                if failures < self._health_check_failures and not self._has_exited(engine):
+                    log.debug(
+                        'Query engine %s failed %s of %s health checks',
+                        engine.url,
+                        failures,
+                        self._health_check_failures,
+                    )
+                    continue
+
+                self._schedule_respawn(engine)
+
+    def _has_exited(self, engine: AsyncQueryEngine) -> bool:
+        process = engine.process
+        return process is None or process.poll() is not None
+
+    async def _is_healthy(self, engine: AsyncQueryEngine) -> bool:
+        if self._has_exited(engine):
+            return False
+
+        try:
+            await engine.request('GET', '/status')
+        except Exception as exc:
+            log.debug('Query engine %s failed its health check due to %s', engine.url, exc)
+            return False
+
+        return True
+
+    def _schedule_respawn(self, engine: AsyncQueryEngine) -> None:
+        if engine in self._respawning or engine not in self._in_flight:
+            return
+
+        self._respawning.add(engine)
+        self._spawn_task(self._respawn(engine))
+
+    async def _respawn(self, engine: AsyncQueryEngine) -> None:
+        log.warning('Query engine %s is unhealthy, starting a new process to replace it', engine.url)
+        assert self._connect_args is not None
+        timeout, datasources = self._connect_args
+
+        lost = [tx_id for tx_id, tx_engine in self._transactions.items() if tx_engine is engine]
+        for tx_id in lost:
+            del self._transactions[tx_id]
+
+        replacement = self._create_engine()
+        try:
+            await replacement.connect(timeout=timeout, datasources=datasources)
+        except Exception:
+            # the engine will be checked again on the next health check
+            log.exception('Could not start a replacement query engine')
+            self._respawning.discard(engine)
+            await self._discard_engine(replacement)
+            return
+        except asyncio.CancelledError:
+            self._respawning.discard(engine)
+            await self._discard_engine(replacement)
+            raise
+
+        if engine not in self._engines:
+            # the pool was closed while the replacement was starting
+            await self._discard_engine(replacement)
+            return
+
+        index = self._engines.index(engine)
+        self._engines[index] = replacement
+        self._in_flight[replacement] = 0
+        log.debug('Replaced query engine %s with %s', engine.url, replacement.url)
+
+        # the old engine no longer receives queries but the ones it is running are still tracked
+        try:
+            await self._drain(engine)
+        finally:
+            self._in_flight.pop(engine, None)
+            self._respawning.discard(engine)
+            self._failures.pop(engine, None)
+            await self._discard_engine(engine)
+
+    async def _drain(self, engine: AsyncQueryEngine) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._drain_timeout.total_seconds()
+        while self._in_flight.get(engine, 0) and loop.time() < deadline:
+            await asyncio.sleep(DRAIN_POLL_INTERVAL)
+
+        remaining = self._in_flight.get(engine, 0)
+        if remaining:
+            log.warning(
+                'Stopping query engine %s with %s queries still in flight after %s',
+                engine.url,
+                remaining,
+                self._drain_timeout,
+            )
+
+    async def _discard_engine(self, engine: AsyncQueryEngine, *, timeout: timedelta | None = None) -> None:
+        await engine.aclose(timeout=timeout)
+        # the engine registers itself to be stopped at exit, which would keep it alive otherwise
+        atexit.unregister(engine.stop)
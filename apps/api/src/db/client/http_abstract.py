@@ -6,6 +6,7 @@ from typing import (
     Union,
     Generic,
     TypeVar,
+    Callable,
     Optional,
     Coroutine,
     cast,
@@ -58,6 +59,23 @@ class AbstractHTTP(ABC, Generic[Session, Response]):
     @abstractmethod
     def open(self) -> None: ...
 
+    def _client_kwargs(self, transport_cls: Callable[..., Any]) -> Dict[str, Any]:
+        """The arguments for the httpx client.
+
+        A Unix domain socket, set with `uds`, can only be configured on the transport,
+        so the connection options are passed to the transport instead.
+        """
+        kwargs = dict(self.session_kwargs)
+        uds = kwargs.pop('uds', None)
+        if uds is not None:
+            kwargs['transport'] = transport_cls(
+                uds=uds,
+                http1=kwargs.pop('http1', True),
+                http2=kwargs.pop('http2', False),
+                limits=kwargs.pop('limits', DEFAULT_CONFIG['limits']),
+            )
+        return kwargs
+
     @abstractmethod
     def close(self) -> MaybeCoroutine[None]: ...
 
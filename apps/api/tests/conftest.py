@@ -0,0 +1,6 @@
+import os
+
+# Settings are read on import; give the required ones test values
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/test")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
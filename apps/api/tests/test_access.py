@@ -0,0 +1,142 @@
+from types import SimpleNamespace
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from api.services import access
+from api.services.access import AccessGrantCache, AccessResolver
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def _project(id, tenant_id="t", members=("u",), deleted_at=None):
+    return SimpleNamespace(
+        id=id,
+        tenant_id=tenant_id,
+        deleted_at=deleted_at,
+        users=[SimpleNamespace(user_id=user) for user in members],
+    )
+
+
+class FakeProjects:
+    def __init__(self, projects):
+        self.projects = {p.id: p for p in projects}
+        self.queries = 0
+
+    def _visible(self, id, where):
+        project = self.projects.get(id)
+        if project is None or project.deleted_at:
+            return None
+        if project.tenant_id != where["tenant_id"]:
+            return None
+        user_id = where["users"]["some"]["user_id"]
+        if not any(m.user_id == user_id for m in project.users):
+            return None
+        return project
+
+    async def find_first(self, where):
+        self.queries += 1
+        return self._visible(where["id"], where)
+
+    async def find_many(self, where):
+        self.queries += 1
+        projects = (self._visible(id, where) for id in where["id"]["in"])
+        return [p for p in projects if p is not None]
+
+
+def _resolver(projects, cache):
+    prisma = SimpleNamespace(project=FakeProjects(projects))
+    return AccessResolver(prisma, "u", "t", cache=cache)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(access, "time", clock)
+    return clock
+
+
+def test_grants_expire_after_the_ttl(clock):
+    cache = AccessGrantCache(ttl_seconds=30, max_entries=10)
+    cache.grant("u", "t", "p")
+
+    assert cache.has_grant("u", "t", "p")
+    assert not cache.has_grant("u", "other", "p")
+
+    clock.now += 31
+    assert not cache.has_grant("u", "t", "p")
+    assert len(cache._grants) == 0
+
+
+def test_least_recently_granted_entries_are_evicted(clock):
+    cache = AccessGrantCache(ttl_seconds=30, max_entries=2)
+    for project_id in ("a", "b", "a", "c"):
+        cache.grant("u", "t", project_id)
+
+    assert list(cache._grants) == [("u", "t", "a"), ("u", "t", "c")]
+
+
+def test_invalidation(clock):
+    cache = AccessGrantCache(ttl_seconds=30, max_entries=10)
+    for user_id, project_id in [("u", "a"), ("u", "b"), ("v", "a")]:
+        cache.grant(user_id, "t", project_id)
+
+    cache.invalidate("u", "a")
+    assert not cache.has_grant("u", "t", "a")
+    assert cache.has_grant("v", "t", "a")
+
+    cache.invalidate_project("a")
+    assert not cache.has_grant("v", "t", "a")
+
+    cache.invalidate_user("u")
+    assert not cache._grants
+
+
+def test_cached_grants_skip_the_project_query(clock):
+    cache = AccessGrantCache(ttl_seconds=30, max_entries=10)
+    first = _resolver([_project("p")], cache)
+    asyncio.run(first.project("p"))
+
+    second = _resolver([_project("p")], cache)
+    asyncio.run(second.project("p"))
+    assert second.prisma.project.queries == 0
+
+    clock.now += 31
+    asyncio.run(second.project("p"))
+    assert second.prisma.project.queries == 1
+
+
+def test_denials_are_not_cached(clock):
+    cache = AccessGrantCache(ttl_seconds=30, max_entries=10)
+    resolver = _resolver([_project("p", members=("v",))], cache)
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as raised:
+            asyncio.run(resolver.project("p"))
+        assert raised.value.status_code == 404
+
+    assert resolver.prisma.project.queries == 2
+    assert not cache._grants
+
+
+def test_projects_only_queries_uncached_grants(clock):
+    cache = AccessGrantCache(ttl_seconds=30, max_entries=10)
+    cache.grant("u", "t", "a")
+    resolver = _resolver(
+        [_project("a"), _project("b"), _project("c", tenant_id="other")],
+        cache,
+    )
+
+    asyncio.run(resolver.projects(["a", "b", "b"]))
+    assert resolver.prisma.project.queries == 1
+    assert cache.has_grant("u", "t", "b")
+
+    with pytest.raises(HTTPException):
+        asyncio.run(resolver.projects(["a", "c"]))
@@ -0,0 +1,38 @@
+from types import SimpleNamespace
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from api.routes.v1 import chats
+from api.services.auth import get_current_admin
+
+
+def _user(role_type):
+    role = None if role_type is None else SimpleNamespace(type=role_type)
+    return SimpleNamespace(id="u", role=role)
+
+
+def test_admins_are_let_through():
+    user = _user("BUSINESS_ADMIN")
+
+    assert asyncio.run(get_current_admin(user)) is user
+
+
+@pytest.mark.parametrize(
+    "role_type", [None, "BUSINESS_USER", "CUSTOMER_ADMIN", "CUSTOMER_USER"]
+)
+def test_other_users_are_forbidden(role_type):
+    with pytest.raises(HTTPException) as raised:
+        asyncio.run(get_current_admin(_user(role_type)))
+
+    assert raised.value.status_code == 403
+
+
+def test_cache_stats_require_an_admin():
+    route = next(
+        r for r in chats.router.routes if r.path == "/cache/stats"
+    )
+    dependencies = [d.call for d in route.dependant.dependencies]
+
+    assert get_current_admin in dependencies
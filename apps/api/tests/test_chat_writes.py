@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+from api.routes.v1 import chats
+from api.schemas.chat import ChatMessageResponse
+
+
+class FailingPrisma:
+    def batch_(self):
+        raise ConnectionError("engine is gone")
+
+
+def _message():
+    return ChatMessageResponse(
+        id="m",
+        chat_session_id="s",
+        role="assistant",
+        content="answer",
+        created_at=0,
+    )
+
+
+def test_failed_write_is_counted():
+    failed = chats.write_metrics["failed"]
+
+    asyncio.run(
+        chats._write_assistant_message(FailingPrisma(), _message(), "u")
+    )
+
+    assert chats.write_metrics["failed"] == failed + 1
+
+
+def test_drain_waits_for_pending_writes_and_summaries(monkeypatch):
+    async def main():
+        done = []
+
+        async def write(delay):
+            await asyncio.sleep(delay)
+            done.append(delay)
+
+        writes = {asyncio.ensure_future(write(0.01))}
+        monkeypatch.setattr(chats, "_pending_writes", writes)
+        summary = asyncio.ensure_future(write(0.02))
+        chats.conversation_memory._tasks.add(summary)
+        try:
+            await chats.drain_background_writes(timeout=1.0)
+        finally:
+            chats.conversation_memory._tasks.discard(summary)
+        return done
+
+    assert asyncio.run(main()) == [0.01, 0.02]
+
+
+def test_drain_is_bounded(monkeypatch):
+    async def main():
+        stuck = asyncio.ensure_future(asyncio.sleep(60))
+        monkeypatch.setattr(chats, "_pending_writes", {stuck})
+        started = time.monotonic()
+        await chats.drain_background_writes(timeout=0.05)
+        stuck.cancel()
+        return time.monotonic() - started
+
+    assert asyncio.run(main()) < 1.0
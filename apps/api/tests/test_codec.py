@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from db.client._codec import OrjsonCodec, StdlibCodec, create_codec
+
+pytest.importorskip("orjson")
+
+DOCUMENTS = [
+    '{"a": 1, "b": [1.5, null, true], "c": "caf\\u00e9"}',
+    '{"max": 18446744073709551615, "min": -9223372036854775808}',
+    '{"above": 18446744073709551616, "below": -9223372036854775809}',
+    '{"huge": 123456789012345678901234567890}',
+    '{"id": "1234567890123456789012", "ratio": 0.12345678901234567890}',
+]
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_orjson_decodes_like_the_standard_library(document):
+    codec = OrjsonCodec()
+
+    assert codec.loads(document) == json.loads(document)
+    assert codec.loads(document.encode()) == json.loads(document)
+
+
+def test_integers_outside_of_64_bits_stay_integers():
+    value = OrjsonCodec().loads(b'{"value": 123456789012345678901234567890}')
+
+    assert value["value"] == 123456789012345678901234567890
+    assert isinstance(value["value"], int)
+
+
+def test_integers_outside_of_64_bits_are_encoded():
+    codec = OrjsonCodec()
+    data = {"value": 2**70}
+
+    assert json.loads(codec.dumps(data, default=str)) == data
+
+
+def test_create_codec():
+    assert isinstance(create_codec("stdlib"), StdlibCodec)
+    assert isinstance(create_codec("auto"), OrjsonCodec)
+    with pytest.raises(ValueError):
+        create_codec("yaml")
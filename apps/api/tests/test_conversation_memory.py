@@ -0,0 +1,136 @@
+from types import SimpleNamespace
+import asyncio
+
+from api.services.conversation_memory import ConversationMemory
+
+
+def _matches(row, where):
+    for key, condition in where.items():
+        if key == "OR":
+            if not any(_matches(row, c) for c in condition):
+                return False
+        elif isinstance(condition, dict):
+            if not getattr(row, key) > condition["gt"]:
+                return False
+        elif getattr(row, key) != condition:
+            return False
+    return True
+
+
+class FakeMessages:
+    def __init__(self):
+        self.rows = []
+
+    def add(self, id, created_at):
+        self.rows.append(SimpleNamespace(
+            id=id,
+            chat_session_id="s",
+            role="user",
+            content=id,
+            created_at=created_at,
+            deleted_at=None,
+        ))
+
+    async def find_many(self, where, order_by, take):
+        rows = sorted(
+            (r for r in self.rows if _matches(r, where)),
+            key=lambda r: (r.created_at, r.id),
+            reverse=order_by[0]["created_at"] == "desc",
+        )
+        return rows[:take]
+
+    async def count(self, where):
+        return len([r for r in self.rows if _matches(r, where)])
+
+
+class FakeSessions:
+    def __init__(self, session):
+        self.session = session
+
+    async def find_unique(self, where):
+        return self.session
+
+    async def update(self, where, data):
+        for key, value in data.items():
+            setattr(self.session, key, value)
+
+
+class FakeLLM:
+    def __init__(self):
+        self.calls = []
+
+    async def summarize(self, previous, messages):
+        self.calls.append([m["content"] for m in messages])
+        return (previous or "") + "".join(m["content"] for m in messages)
+
+
+def _memory(session):
+    llm = FakeLLM()
+    memory = ConversationMemory(llm, window=3, summary_batch=2)
+    memory.prisma = SimpleNamespace(
+        chat_message=FakeMessages(), chat_session=FakeSessions(session)
+    )
+    return memory, llm
+
+
+def _session():
+    return SimpleNamespace(
+        id="s", summary=None, summary_cursor_at=None, summary_cursor_id=None
+    )
+
+
+def _history(memory, session):
+    history = asyncio.run(memory.load_history(session))
+    return [m["content"] for m in history]
+
+
+def test_history_covers_messages_until_they_are_summarized():
+    session = _session()
+    memory, llm = _memory(session)
+    for i in range(4):
+        memory.prisma.chat_message.add(f"m{i}", created_at=i)
+
+    # One message past the window isn't enough to summarize, so it stays
+    # in the prompt instead of falling through the gap
+    asyncio.run(memory._update_summary("s"))
+    assert llm.calls == []
+    assert _history(memory, session) == ["m0", "m1", "m2", "m3"]
+
+
+def test_summary_advances_a_cursor():
+    session = _session()
+    memory, llm = _memory(session)
+    messages = memory.prisma.chat_message
+    for i in range(5):
+        messages.add(f"m{i}", created_at=0)
+
+    asyncio.run(memory._update_summary("s"))
+    assert llm.calls == [["m0", "m1"]]
+    assert session.summary == "m0m1"
+    assert (session.summary_cursor_at, session.summary_cursor_id) == (
+        0, "m1"
+    )
+    assert _history(memory, session) == ["m2", "m3", "m4"]
+
+    # Deleting summarized messages doesn't shift what is covered
+    messages.rows[0].deleted_at = 1
+    messages.add("m5", created_at=1)
+    messages.add("m6", created_at=1)
+    asyncio.run(memory._update_summary("s"))
+    assert llm.calls[-1] == ["m2", "m3"]
+    assert _history(memory, session) == ["m4", "m5", "m6"]
+
+
+def test_summaries_turn_off_without_session_fields():
+    session = SimpleNamespace(id="s")
+    memory, llm = _memory(session)
+    for i in range(10):
+        memory.prisma.chat_message.add(f"m{i}", created_at=i)
+
+    asyncio.run(memory._update_summary("s"))
+
+    assert llm.calls == []
+    assert not memory.summaries_enabled
+    memory.schedule_update("s")
+    assert not memory._tasks
+    assert _history(memory, session) == [f"m{i}" for i in range(6, 10)]
@@ -0,0 +1,254 @@
+from datetime import timedelta
+from pathlib import Path
+import asyncio
+import itertools
+
+import httpx
+import pytest
+
+from db.client.engine import AsyncQueryEnginePool
+
+_ids = itertools.count()
+
+
+class FakeProcess:
+    def __init__(self):
+        self.returncode = None
+
+    def poll(self):
+        return self.returncode
+
+
+class FakeEngine:
+    def __init__(self):
+        self.url = f"engine-{next(_ids)}"
+        self.process = None
+        self.closed = False
+        self.failing_checks = 0
+        self.release = None
+        self.unreachable = False
+        self.records = ["a", "b"]
+        self.drop_after = None
+
+    async def connect(self, timeout, datasources):
+        self.process = FakeProcess()
+
+    async def aclose(self, *, timeout=None):
+        self.closed = True
+
+    def close(self, *, timeout=None):
+        self.closed = True
+
+    def stop(self):
+        pass
+
+    async def request(self, method, path):
+        if self.failing_checks:
+            self.failing_checks -= 1
+            raise TimeoutError("engine is busy")
+
+    async def query(self, content, *, tx_id):
+        if self.unreachable:
+            raise httpx.ConnectError("connection refused")
+        if self.release is not None:
+            await self.release.wait()
+        return self.url
+
+    async def query_stream(self, content, *, tx_id):
+        if self.unreachable:
+            raise httpx.ConnectError("connection refused")
+        for index, record in enumerate(self.records):
+            if index == self.drop_after:
+                raise httpx.ConnectError("connection reset")
+            yield (self.url, record)
+
+
+class FakePool(AsyncQueryEnginePool):
+    def _create_engine(self):
+        return FakeEngine()
+
+
+def _pool(**kwargs):
+    return FakePool(
+        size=2,
+        dml_path=Path("schema.prisma"),
+        health_check_interval=timedelta(seconds=0.01),
+        **kwargs,
+    )
+
+
+async def _wait_for(condition):
+    for _ in range(500):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition was never met")
+
+
+def test_queries_go_to_the_least_busy_engine():
+    async def main():
+        pool = _pool()
+        await pool.connect()
+        first, second = pool.engines
+        first.release = asyncio.Event()
+        busy = asyncio.ensure_future(pool.query("q", tx_id=None))
+        await asyncio.sleep(0)
+
+        assert pool.in_flight() == [1, 0]
+        assert await pool.query("q", tx_id=None) == second.url
+
+        first.release.set()
+        assert await busy == first.url
+        await pool.aclose()
+
+    asyncio.run(main())
+
+
+def test_query_is_retried_on_another_engine_if_unreachable():
+    async def main():
+        pool = _pool()
+        await pool.connect()
+        dead, live = pool.engines
+        dead.unreachable = True
+
+        assert await pool.query("q", tx_id=None) == live.url
+        await _wait_for(lambda: dead not in pool.engines)
+        await pool.aclose()
+
+    asyncio.run(main())
+
+
+def _stream(pool):
+    async def collect():
+        return [r async for r in pool.query_stream("q", tx_id=None)]
+
+    return collect()
+
+
+def test_stream_is_restarted_on_another_engine_if_unreachable():
+    async def main():
+        pool = _pool()
+        await pool.connect()
+        dead, live = pool.engines
+        dead.unreachable = True
+
+        assert await _stream(pool) == [(live.url, "a"), (live.url, "b")]
+        await _wait_for(lambda: dead not in pool.engines)
+        assert pool.in_flight() == [0, 0]
+        await pool.aclose()
+
+    asyncio.run(main())
+
+
+def test_stream_is_not_restarted_after_records_were_yielded():
+    async def main():
+        pool = _pool()
+        await pool.connect()
+        pool.engines[0].drop_after = 1
+
+        with pytest.raises(httpx.ConnectError):
+            await _stream(pool)
+        await pool.aclose()
+
+    asyncio.run(main())
+
+
+def test_a_few_failed_checks_do_not_replace_an_engine():
+    async def main():
+        pool = _pool(health_check_failures=3)
+        await pool.connect()
+        engine = pool.engines[0]
+        engine.failing_checks = 2
+        await _wait_for(lambda: engine.failing_checks == 0)
+        await asyncio.sleep(0.05)
+
+        assert pool.engines[0] is engine
+        await pool.aclose()
+
+    asyncio.run(main())
+
+
+def test_consecutive_failed_checks_replace_an_engine():
+    async def main():
+        pool = _pool(health_check_failures=3)
+        await pool.connect()
+        engine = pool.engines[0]
+        engine.failing_checks = 3
+        await _wait_for(lambda: pool.engines[0] is not engine)
+
+        assert engine.closed
+        await pool.aclose()
+
+    asyncio.run(main())
+
+
+def test_exited_engines_are_replaced_immediately():
+    async def main():
+        pool = _pool(health_check_failures=100)
+        await pool.connect()
+        engine = pool.engines[1]
+        engine.process.returncode = 1
+        await _wait_for(lambda: pool.engines[1] is not engine)
+        await pool.aclose()
+
+    asyncio.run(main())
+
+
+def test_replaced_engine_finishes_its_queries_before_closing():
+    async def main():
+        pool = _pool(health_check_failures=1)
+        await pool.connect()
+        engine = pool.engines[0]
+        engine.release = asyncio.Event()
+        running = asyncio.ensure_future(pool.query("q", tx_id=None))
+        await asyncio.sleep(0)
+
+        engine.failing_checks = 1
+        await _wait_for(lambda: pool.engines[0] is not engine)
+        await asyncio.sleep(0.05)
+        assert not engine.closed
+
+        engine.release.set()
+        assert await running == engine.url
+        await _wait_for(lambda: engine.closed)
+        await pool.aclose()
+
+    asyncio.run(main())
+
+
+def test_draining_is_bounded():
+    async def main():
+        pool = _pool(
+            health_check_failures=1, drain_timeout=timedelta(seconds=0.05)
+        )
+        await pool.connect()
+        engine = pool.engines[0]
+        engine.release = asyncio.Event()
+        stuck = asyncio.ensure_future(pool.query("q", tx_id=None))
+        await asyncio.sleep(0)
+
+        engine.failing_checks = 1
+        await _wait_for(lambda: engine.closed)
+        stuck.cancel()
+        await pool.aclose()
+
+    asyncio.run(main())
+
+
+def test_closing_the_pool_stops_draining_engines():
+    async def main():
+        pool = _pool(health_check_failures=1)
+        await pool.connect()
+        engine = pool.engines[0]
+        engine.release = asyncio.Event()
+        running = asyncio.ensure_future(pool.query("q", tx_id=None))
+        await asyncio.sleep(0)
+
+        engine.failing_checks = 1
+        await _wait_for(lambda: pool.engines[0] is not engine)
+        await pool.aclose()
+
+        assert engine.closed
+        running.cancel()
+
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from db.client._loader import FindUniqueLoader, unique_lookup
+
+
+class User(BaseModel):
+    id: str
+
+
+class FakeEngine:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+        self.error = None
+        self.release = None
+
+    async def execute(self, method, model, arguments):
+        values = arguments["where"]["id"]["in"]
+        self.queries.append(values)
+        snapshot = [dict(r) for r in self.rows if r["id"] in values]
+        if self.release is not None:
+            await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return {"data": {"result": snapshot}}
+
+
+def test_unique_lookup_only_accepts_single_scalar_filters():
+    assert unique_lookup({"id": "a"}) == ("id", "a")
+    assert unique_lookup({"id": 1}) == ("id", 1)
+    assert unique_lookup({"id": True}) is None
+    assert unique_lookup({"a": 1, "b": 2}) is None
+    assert unique_lookup({"a_b": {"a": 1, "b": 2}}) is None
+
+
+def test_concurrent_lookups_are_batched_and_deduplicated():
+    async def main():
+        engine = FakeEngine([{"id": "a"}, {"id": "b"}])
+        loader = FindUniqueLoader(engine.execute)
+        results = await asyncio.gather(
+            loader.load(User, "id", "a"),
+            loader.load(User, "id", "b"),
+            loader.load(User, "id", "a"),
+            loader.load(User, "id", "missing"),
+        )
+        return engine, loader, results
+
+    engine, loader, results = asyncio.run(main())
+    assert engine.queries == [["a", "b", "missing"]]
+    assert results == [{"id": "a"}, {"id": "b"}, {"id": "a"}, None]
+    stats = loader.stats()["User"]
+    assert stats["loads"] == 4
+    assert stats["deduplicated"] == 1
+    assert stats["batches"] == 1
+
+
+def test_lookup_after_dispatch_does_not_join_sent_query():
+    async def main():
+        engine = FakeEngine([])
+        engine.release = asyncio.Event()
+        loader = FindUniqueLoader(engine.execute)
+        before = asyncio.ensure_future(loader.load(User, "id", "a"))
+        while not engine.queries:
+            await asyncio.sleep(0)
+
+        # written after the first query read the table
+        engine.rows.append({"id": "a"})
+        after = asyncio.ensure_future(loader.load(User, "id", "a"))
+        await asyncio.sleep(0)
+        engine.release.set()
+        return engine, await before, await after
+
+    engine, before, after = asyncio.run(main())
+    assert len(engine.queries) == 2
+    assert before is None
+    assert after == {"id": "a"}
+
+
+def test_errors_are_raised_to_every_caller():
+    async def main():
+        engine = FakeEngine([])
+        engine.error = ConnectionError("engine is gone")
+        loader = FindUniqueLoader(engine.execute)
+        return await asyncio.gather(
+            loader.load(User, "id", "a"),
+            loader.load(User, "id", "b"),
+            loader.load(User, "id", "a"),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, ConnectionError) for r in results)
+
+
+def test_cancelled_caller_does_not_cancel_shared_lookup():
+    async def main():
+        engine = FakeEngine([{"id": "a"}])
+        engine.release = asyncio.Event()
+        loader = FindUniqueLoader(engine.execute)
+        cancelled = asyncio.ensure_future(loader.load(User, "id", "a"))
+        kept = asyncio.ensure_future(loader.load(User, "id", "a"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        engine.release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        return await kept
+
+    assert asyncio.run(main()) == {"id": "a"}
+
+
+def test_cancelled_query_cancels_its_callers():
+    async def main():
+        engine = FakeEngine([{"id": "a"}])
+        engine.release = asyncio.Event()
+        loader = FindUniqueLoader(engine.execute)
+        waiter = asyncio.ensure_future(loader.load(User, "id", "a"))
+        while not loader._tasks:
+            await asyncio.sleep(0)
+        for task in loader._tasks:
+            task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(main())
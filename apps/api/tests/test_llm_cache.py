@@ -0,0 +1,79 @@
+import numpy as np
+
+from api.services.llm_cache import LLMResponseCache, ResponseCachePolicy
+
+POLICY = ResponseCachePolicy(agent_id="a", semantic=True, ttl_seconds=60)
+
+
+def _messages(query, history=(), summary=None):
+    messages = [{"role": "system", "content": "context"}]
+    if summary:
+        messages.append({"role": "system", "content": summary})
+    messages.extend(history)
+    messages.append({"role": "user", "content": query})
+    return messages
+
+
+def _get(cache, messages, embedding, chunk_ids=("c1",)):
+    return cache.get(
+        POLICY,
+        "model",
+        0.0,
+        messages,
+        query_embedding=np.array(embedding),
+        chunk_ids=chunk_ids,
+    )
+
+
+def _set(cache, messages, embedding, answer, chunk_ids=("c1",)):
+    cache.set(
+        POLICY,
+        "model",
+        0.0,
+        messages,
+        answer,
+        query_embedding=np.array(embedding),
+        chunk_ids=chunk_ids,
+    )
+
+
+def test_exact_hits_need_the_same_prompt():
+    cache = LLMResponseCache()
+    _set(cache, _messages("q"), [1.0, 0.0], "answer")
+
+    assert _get(cache, _messages("q"), [0.0, 1.0]) == "answer"
+    assert cache.metrics["exact_hits"] == 1
+
+
+def test_similar_queries_hit_the_semantic_tier():
+    cache = LLMResponseCache()
+    _set(cache, _messages("what is x"), [1.0, 0.0], "answer")
+
+    assert _get(cache, _messages("what's x"), [1.0, 0.01]) == "answer"
+    assert _get(cache, _messages("what is y"), [0.0, 1.0]) is None
+    assert _get(
+        cache, _messages("what's x"), [1.0, 0.01], chunk_ids=("c2",)
+    ) is None
+
+
+def test_follow_ups_in_other_conversations_miss_the_semantic_tier():
+    cache = LLMResponseCache()
+    first = [
+        {"role": "user", "content": "tell me about x"},
+        {"role": "assistant", "content": "x is ..."},
+    ]
+    other = [
+        {"role": "user", "content": "tell me about y"},
+        {"role": "assistant", "content": "y is ..."},
+    ]
+    _set(cache, _messages("explain that", first), [1.0, 0.0], "about x")
+
+    assert _get(
+        cache, _messages("explain that more", other), [1.0, 0.0]
+    ) is None
+    assert _get(
+        cache, _messages("explain that more", first, summary="s"), [1.0, 0.0]
+    ) is None
+    assert _get(
+        cache, _messages("explain that more", first), [1.0, 0.0]
+    ) == "about x"
@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+import asyncio
+
+from api.services.llm_service import LLMService
+
+
+class FakeStream:
+    def __init__(self, deltas):
+        self.deltas = deltas
+        self.closed = False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for delta in self.deltas:
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))]
+            )
+
+    async def close(self):
+        self.closed = True
+
+
+def _service(stream):
+    async def create(**kwargs):
+        return stream
+
+    client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+    return LLMService(client=client)
+
+
+def test_stream_is_closed_when_the_consumer_stops_early():
+    stream = FakeStream(["a", "b", "c"])
+    service = _service(stream)
+
+    async def main():
+        deltas = service.stream_response("q", [], [])
+        first = await deltas.__anext__()
+        await deltas.aclose()
+        return first
+
+    assert asyncio.run(main()) == "a"
+    assert stream.closed
+
+
+def test_stream_response_does_not_repack(monkeypatch):
+    stream = FakeStream(["a", "b"])
+    service = _service(stream)
+
+    def pack(*args):
+        raise AssertionError("the caller already packed the prompt")
+
+    monkeypatch.setattr(service, "pack", pack)
+
+    async def main():
+        return [d async for d in service.stream_response("q", [], [])]
+
+    assert asyncio.run(main()) == ["a", "b"]
+    assert stream.closed
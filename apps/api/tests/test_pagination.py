@@ -0,0 +1,164 @@
+from types import SimpleNamespace
+import asyncio
+
+import pytest
+
+from db.client._pagination import aiter_pages, iter_pages
+
+
+def _matches(row, where):
+    if where is None:
+        return True
+    for key, condition in where.items():
+        if key == "AND":
+            if not all(_matches(row, c) for c in condition):
+                return False
+        elif isinstance(condition, dict):
+            if not getattr(row, key) > condition["gt"]:
+                return False
+        elif getattr(row, key) != condition:
+            return False
+    return True
+
+
+class Table:
+    def __init__(self, count):
+        self.rows = {
+            f"r{i:02}": SimpleNamespace(id=f"r{i:02}", even=i % 2 == 0)
+            for i in range(count)
+        }
+        self.queries = []
+
+    def fetch(self, arguments):
+        self.queries.append(arguments)
+        (key, direction), = arguments["order_by"].items()
+        assert direction == "asc"
+        rows = sorted(
+            (r for r in self.rows.values() if _matches(r, arguments["where"])),
+            key=lambda r: getattr(r, key),
+        )
+        return rows[:arguments["take"]]
+
+    async def afetch(self, arguments):
+        await asyncio.sleep(0)
+        return self.fetch(arguments)
+
+
+def _ids(pages):
+    return [[row.id for row in page] for page in pages]
+
+
+def _collect(pages):
+    async def main():
+        return [page async for page in pages]
+
+    return asyncio.run(main())
+
+
+def test_pages_walk_every_record_in_key_order():
+    table = Table(7)
+
+    pages = list(iter_pages(table.fetch, key="id", page_size=3))
+
+    assert _ids(pages) == [
+        ["r00", "r01", "r02"], ["r03", "r04", "r05"], ["r06"]
+    ]
+    assert table.queries[1]["where"] == {"id": {"gt": "r02"}}
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_async_pages_match_sync_pages(prefetch):
+    table = Table(7)
+
+    pages = _collect(
+        aiter_pages(table.afetch, key="id", page_size=3, prefetch=prefetch)
+    )
+
+    expected = iter_pages(Table(7).fetch, key="id", page_size=3)
+    assert _ids(pages) == _ids(expected)
+
+
+def test_filter_is_kept_on_every_page():
+    table = Table(10)
+
+    pages = list(
+        iter_pages(table.fetch, key="id", page_size=2, where={"even": True})
+    )
+
+    assert _ids(pages) == [["r00", "r02"], ["r04", "r06"], ["r08"]]
+    assert table.queries[1]["where"] == {
+        "AND": [{"even": True}, {"id": {"gt": "r02"}}]
+    }
+
+
+def test_a_full_last_page_is_not_followed_by_an_empty_one():
+    table = Table(4)
+
+    pages = list(iter_pages(table.fetch, key="id", page_size=2))
+
+    assert _ids(pages) == [["r00", "r01"], ["r02", "r03"]]
+    assert len(table.queries) == 3
+
+
+def test_deleting_records_while_walking_skips_them():
+    table = Table(9)
+    seen = []
+    for page in iter_pages(table.fetch, key="id", page_size=3):
+        seen.extend(row.id for row in page)
+        # delete the record the next page is keyed on and one ahead of it
+        del table.rows[page[-1].id]
+        table.rows.pop("r04", None)
+
+    assert seen == ["r00", "r01", "r02", "r03", "r05", "r06", "r07", "r08"]
+
+
+def test_deleting_records_while_walking_asynchronously_skips_them():
+    table = Table(9)
+
+    async def main():
+        seen = []
+        pages = aiter_pages(
+            table.afetch, key="id", page_size=3, prefetch=False
+        )
+        async for page in pages:
+            seen.extend(row.id for row in page)
+            del table.rows[page[-1].id]
+            table.rows.pop("r04", None)
+        return seen
+
+    assert asyncio.run(main()) == [
+        "r00", "r01", "r02", "r03", "r05", "r06", "r07", "r08"
+    ]
+
+
+def test_stopping_early_cancels_the_prefetched_page():
+    async def main():
+        cancelled = []
+        table = Table(10)
+
+        async def fetch(arguments):
+            if arguments["where"] is not None:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(arguments["where"])
+                    raise
+            return table.fetch(arguments)
+
+        pages = aiter_pages(fetch, key="id", page_size=3)
+        async for page in pages:
+            # let the prefetch of the next page start
+            await asyncio.sleep(0)
+            break
+        await pages.aclose()
+        await asyncio.sleep(0)
+        return cancelled
+
+    assert asyncio.run(main()) == [{"id": {"gt": "r02"}}]
+
+
+def test_page_size_must_be_positive():
+    with pytest.raises(ValueError):
+        iter_pages(Table(1).fetch, key="id", page_size=0)
+    with pytest.raises(ValueError):
+        aiter_pages(Table(1).afetch, key="id", page_size=0)
@@ -0,0 +1,46 @@
+from pathlib import Path
+import re
+
+from db.client import Prisma, models
+
+ROOT = Path(__file__).resolve().parents[3]
+SOURCE_SCHEMA = ROOT / "packages" / "db" / "schema.prisma"
+CLIENT_SCHEMAS = [
+    ROOT / "apps" / "api" / "src" / "db" / "client" / "schema.prisma",
+    ROOT / "apps" / "api" / "db" / "client" / "schema.prisma",
+]
+
+
+def _normalize(schema: str) -> list:
+    """Schema lines without comments, with whitespace and attribute order
+    ignored, so `prisma format` output compares equal to its source"""
+    lines = []
+    for line in schema.splitlines():
+        line = line.split("//")[0].strip()
+        if line:
+            name, *rest = line.split()
+            lines.append((name, tuple(sorted(rest))))
+    return lines
+
+
+def test_generated_client_matches_schema():
+    source = _normalize(SOURCE_SCHEMA.read_text())
+    for path in CLIENT_SCHEMAS:
+        assert _normalize(path.read_text()) == source, (
+            f"{path} is out of date, regenerate the client"
+        )
+
+
+def test_client_exposes_every_schema_model():
+    names = re.findall(
+        r"^model (\w+)", SOURCE_SCHEMA.read_text(), re.MULTILINE
+    )
+    prisma = Prisma()
+    for name in names:
+        assert hasattr(prisma, name.lower())
+        assert hasattr(models, name)
+
+
+def test_session_and_reset_token_fields():
+    assert "tokenId" in models.UserSession.model_fields
+    assert "tokenHash" in models.PasswordResetToken.model_fields
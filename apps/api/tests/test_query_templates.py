@@ -0,0 +1,155 @@
+from datetime import datetime, timezone
+
+from collections import OrderedDict
+
+import pytest
+
+from db.client import _builder, models
+from db.client._builder import QueryBuilder
+from db.client.metadata import PRISMA_MODELS, RELATIONAL_FIELD_MAPPINGS
+
+
+def _builder_for(method, model, arguments):
+    return QueryBuilder(
+        method=method,
+        model=model,
+        arguments=arguments,
+        prisma_models=PRISMA_MODELS,
+        relational_field_mappings=RELATIONAL_FIELD_MAPPINGS,
+    )
+
+
+def _from_tree(builder):
+    root = builder._create_root_node(builder.arguments, builder.include)
+    return root.render(pretty=False)
+
+
+QUERIES = [
+    ("find_unique", models.User, {"where": {"id": "a"}}),
+    ("find_unique", models.User, {"where": {"id": 'quote " and \\ \n'}}),
+    ("find_unique", models.User, {"where": {"email": "café@example.com"}}),
+    (
+        "find_many",
+        models.User,
+        {
+            "where": {
+                "id": {"in": ["a", "b", "c"]},
+                "deleted": False,
+                "OR": [{"firstName": "Ada"}, {"lastName": None}],
+                "createdAt": {
+                    "gt": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+                },
+            },
+            "take": 10,
+            "skip": 0,
+            "order_by": [{"createdAt": "desc"}, {"id": "asc"}],
+        },
+    ),
+    (
+        "find_many",
+        models.Tenant,
+        {
+            "where": {"deleted": False},
+            "include": {
+                "users": {
+                    "where": {"deleted": False},
+                    "include": {"sessions": {"where": {"deleted": False}}},
+                },
+                "projects": True,
+            },
+        },
+    ),
+    (
+        "create",
+        models.Candidate,
+        {
+            "data": {
+                "firstName": "Ada",
+                "lastName": "Lovelace",
+                "email": "ada@example.com",
+                "educationLevel": "MASTER",
+                "skills": ["math", "engines"],
+                "languages": [],
+                "currentSalary": 1.5,
+                "tenant": {"connect": {"id": "t"}},
+            }
+        },
+    ),
+    ("count", models.User, {"where": {"deleted": True}}),
+]
+
+
+@pytest.mark.parametrize("method, model, arguments", QUERIES)
+def test_templates_render_the_same_query_as_the_node_tree(
+    method, model, arguments
+):
+    builder = _builder_for(method, model, arguments)
+
+    assert builder.build_query() == _from_tree(builder)
+    # the second build is rendered from the cached template
+    assert builder.build_query() == _from_tree(builder)
+
+
+def test_queries_of_the_same_shape_share_a_template(monkeypatch):
+    monkeypatch.setattr(_builder, "_query_templates", OrderedDict())
+
+    first = _builder_for(
+        "find_unique", models.User, {"where": {"id": "a"}}
+    ).build_query()
+    second = _builder_for(
+        "find_unique", models.User, {"where": {"id": "b"}}
+    ).build_query()
+
+    assert len(_builder._query_templates) == 1
+    assert first.replace('"a"', '"b"') == second
+
+    _builder_for(
+        "find_unique", models.User, {"where": {"email": "b"}}
+    ).build_query()
+    assert len(_builder._query_templates) == 2
+
+
+def test_values_that_change_the_rendering_are_part_of_the_shape():
+    for arguments in [
+        {"where": {"lastName": None}},
+        {"where": {"lastName": "x"}},
+        {"where": {"id": {"in": ["a"]}}},
+        {"where": {"id": {"in": []}}},
+        {"where": {"OR": [{"id": "a"}]}},
+        {"where": {"OR": [{"id": "a"}, {"email": "b"}]}},
+    ]:
+        builder = _builder_for("find_many", models.User, arguments)
+        assert builder.build_query() == _from_tree(builder)
+
+
+def test_the_template_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(_builder, "_query_templates", OrderedDict())
+    monkeypatch.setattr(_builder, "QUERY_TEMPLATE_CACHE_SIZE", 2)
+
+    for field in ("id", "email", "firstName"):
+        _builder_for(
+            "find_first", models.User, {"where": {field: "x"}}
+        ).build_query()
+
+    assert len(_builder._query_templates) == 2
+
+
+def test_the_least_recently_used_template_is_evicted(monkeypatch):
+    monkeypatch.setattr(_builder, "_query_templates", OrderedDict())
+    monkeypatch.setattr(_builder, "QUERY_TEMPLATE_CACHE_SIZE", 2)
+
+    def build(field):
+        _builder_for(
+            "find_first", models.User, {"where": {field: "x"}}
+        ).build_query()
+
+    build("id")
+    build("email")
+    # the hit keeps the `id` template over the older `email` one
+    build("id")
+    build("firstName")
+
+    shapes = [key[3] for key in _builder._query_templates]
+    assert len(shapes) == 2
+    assert not any("email" in repr(shape) for shape in shapes)
+    assert any("'id'" in repr(shape) for shape in shapes)
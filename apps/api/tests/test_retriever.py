@@ -0,0 +1,134 @@
+from types import SimpleNamespace
+import asyncio
+
+import numpy as np
+
+from api.core.config import settings
+from api.services.retriever import DocumentRetriever, RetrievalQuery
+
+
+def _chunk(id, embedding):
+    return SimpleNamespace(
+        id=id,
+        content=id,
+        metadata={"source": "test"},
+        document_id="doc",
+        document=None,
+        embedding=embedding,
+    )
+
+
+class FakeRetriever(DocumentRetriever):
+    """Retriever whose project chunks come from a dict instead of the
+    database"""
+
+    def __init__(self, chunks):
+        super().__init__(embedding_model=SimpleNamespace())
+        self.chunks = chunks
+        self.builds = []
+        self.release = None
+
+    async def _build_project_matrix(self, project_id):
+        self.builds.append(project_id)
+        chunks = list(self.chunks[project_id])
+        if self.release is not None:
+            await self.release.wait()
+        return self.build_project_matrix(chunks)
+
+
+def test_concurrent_misses_share_one_build():
+    async def main():
+        retriever = FakeRetriever({"p": [_chunk("a", [1.0, 0.0])]})
+        retriever.release = asyncio.Event()
+        waiters = [
+            asyncio.ensure_future(retriever.get_project_matrix("p"))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        retriever.release.set()
+        matrices = await asyncio.gather(*waiters)
+
+        assert retriever.builds == ["p"]
+        assert all(m is matrices[0] for m in matrices)
+        # Cached afterwards
+        assert await retriever.get_project_matrix("p") is matrices[0]
+        assert retriever.builds == ["p"]
+
+    asyncio.run(main())
+
+
+def test_invalidate_rebuilds_with_new_chunks():
+    async def main():
+        chunks = {"p": [_chunk("a", [1.0, 0.0])]}
+        retriever = FakeRetriever(chunks)
+        await retriever.get_project_matrix("p")
+
+        chunks["p"].append(_chunk("b", [0.0, 1.0]))
+        retriever.invalidate_project("p")
+        matrix = await retriever.get_project_matrix("p")
+
+        assert [c.id for c in matrix.chunks] == ["a", "b"]
+        assert retriever.builds == ["p", "p"]
+
+    asyncio.run(main())
+
+
+def test_build_invalidated_while_running_is_not_cached():
+    async def main():
+        chunks = {"p": [_chunk("a", [1.0, 0.0])]}
+        retriever = FakeRetriever(chunks)
+        retriever.release = asyncio.Event()
+        stale = asyncio.ensure_future(retriever.get_project_matrix("p"))
+        await asyncio.sleep(0)
+
+        chunks["p"].append(_chunk("b", [0.0, 1.0]))
+        retriever.invalidate_project("p")
+        retriever.release.set()
+        await stale
+
+        retriever.release = None
+        matrix = await retriever.get_project_matrix("p")
+        assert [c.id for c in matrix.chunks] == ["a", "b"]
+
+    asyncio.run(main())
+
+
+def test_least_recently_used_projects_are_evicted(monkeypatch):
+    monkeypatch.setattr(settings, "RETRIEVAL_CACHE_MAX_PROJECTS", 2)
+
+    async def main():
+        retriever = FakeRetriever({
+            p: [_chunk(p, [1.0, 0.0])] for p in ("p1", "p2", "p3")
+        })
+        await retriever.get_project_matrix("p1")
+        await retriever.get_project_matrix("p2")
+        await retriever.get_project_matrix("p1")
+        await retriever.get_project_matrix("p3")
+
+        assert list(retriever._project_matrices) == ["p1", "p3"]
+
+    asyncio.run(main())
+
+
+def test_retrieve_batch_ranks_chunks_per_project(monkeypatch):
+    monkeypatch.setattr(settings, "VECTOR_DIMENSION", 2)
+    retriever = FakeRetriever({
+        "p1": [_chunk("x", [1.0, 0.0]), _chunk("y", [0.0, 1.0])],
+        "p2": [_chunk("z", [1.0, 1.0])],
+    })
+    queries = [
+        RetrievalQuery(
+            query="q", project_id=project, top_k=2, embedding=embedding
+        )
+        for project, embedding in [
+            ("p1", np.array([0.0, 1.0])),
+            ("p2", np.array([1.0, 0.0])),
+            ("p1", np.array([1.0, 0.1])),
+        ]
+    ]
+
+    results = asyncio.run(retriever.retrieve_batch(queries))
+
+    assert [r["id"] for r in results[0]] == ["y", "x"]
+    assert [r["id"] for r in results[1]] == ["z"]
+    assert [r["id"] for r in results[2]] == ["x", "y"]
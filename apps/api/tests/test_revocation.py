@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import asyncio
+
+from jose import jwt
+
+from api.services import revocation
+from api.services.revocation import RevocationFilter, token_id
+
+
+def _later(seconds):
+    return datetime.utcnow() + timedelta(seconds=seconds)
+
+
+def _session(token, expires_in=60, token_id=None, deleted_at=None):
+    return SimpleNamespace(
+        token=token,
+        tokenId=token_id,
+        expiresAt=_later(expires_in),
+        deleted=True,
+        deletedAt=deleted_at or datetime.utcnow(),
+    )
+
+
+class FakeSessions:
+    def __init__(self, sessions):
+        self.sessions = sessions
+        self.queries = []
+        self.error = None
+
+    async def find_many(self, where):
+        self.queries.append(where)
+        if self.error is not None:
+            raise self.error
+        if "deletedAt" in where:
+            since = where["deletedAt"]["gte"]
+            return [s for s in self.sessions if s.deletedAt >= since]
+        return [
+            s for s in self.sessions if s.expiresAt > where["expiresAt"]["gt"]
+        ]
+
+
+def test_token_id_prefers_the_jti_claim():
+    token = jwt.encode({"sub": "u", "jti": "abc"}, "secret")
+
+    assert token_id(token) == "abc"
+    assert token_id("not-a-jwt") == token_id("not-a-jwt")
+    assert token_id("not-a-jwt") != token_id("other")
+
+
+def test_first_sync_loads_unexpired_revocations():
+    revoked = []
+    sessions = FakeSessions([
+        _session("t1", token_id="j1"),
+        _session("t2"),
+        _session("expired", expires_in=-60),
+    ])
+    prisma = SimpleNamespace(usersession=sessions)
+    revocations = RevocationFilter(sync_seconds=60, on_revoke=revoked.append)
+
+    asyncio.run(revocations.sync(prisma))
+
+    assert revocations.is_revoked("j1")
+    assert revocations.is_revoked(token_id("t2"))
+    assert not revocations.is_revoked(token_id("expired"))
+    assert revoked == ["t1", "t2"]
+
+
+def test_later_syncs_only_read_new_revocations(monkeypatch):
+    clock = SimpleNamespace(now=1000.0, time=revocation.time.time)
+    clock.monotonic = lambda: clock.now
+    monkeypatch.setattr(revocation, "time", clock)
+    sessions = FakeSessions([])
+    prisma = SimpleNamespace(usersession=sessions)
+    revocations = RevocationFilter(sync_seconds=30)
+
+    asyncio.run(revocations.sync(prisma))
+    sessions.sessions.append(_session("t", token_id="j"))
+
+    # Within the sync interval nothing is read
+    asyncio.run(revocations.sync(prisma))
+    assert len(sessions.queries) == 1
+    assert not revocations.is_revoked("j")
+
+    clock.now += 31
+    asyncio.run(revocations.sync(prisma))
+    assert "deletedAt" in sessions.queries[-1]
+    assert revocations.is_revoked("j")
+
+
+def test_request_sync_skips_the_interval():
+    sessions = FakeSessions([])
+    prisma = SimpleNamespace(usersession=sessions)
+    revocations = RevocationFilter(sync_seconds=3600)
+
+    asyncio.run(revocations.sync(prisma))
+    revocations.request_sync()
+    asyncio.run(revocations.sync(prisma))
+
+    assert len(sessions.queries) == 2
+
+
+def test_failed_sync_keeps_known_revocations():
+    sessions = FakeSessions([])
+    sessions.error = ConnectionError("engine is gone")
+    prisma = SimpleNamespace(usersession=sessions)
+    revocations = RevocationFilter(sync_seconds=60)
+    revocations.revoke("j", _later(60).timestamp())
+
+    asyncio.run(revocations.sync(prisma))
+
+    assert revocations.is_revoked("j")
+
+
+def test_expired_ids_are_pruned_on_sync():
+    prisma = SimpleNamespace(usersession=FakeSessions([]))
+    revocations = RevocationFilter(sync_seconds=60)
+    revocations.revoke("live", _later(60).timestamp())
+    revocations.revoke("expired", _later(-60).timestamp())
+
+    asyncio.run(revocations.sync(prisma))
+
+    assert revocations.is_revoked("live")
+    assert not revocations.is_revoked("expired")
+    assert len(revocations) == 1
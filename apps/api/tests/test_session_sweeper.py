@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import asyncio
+
+from jose import jwt
+
+from api.services.revocation import token_id
+from api.services.session_sweeper import SessionSweeper
+
+
+def _matches(row, where):
+    for key, condition in where.items():
+        if key == "OR":
+            if not any(_matches(row, c) for c in condition):
+                return False
+            continue
+        value = getattr(row, key)
+        if not isinstance(condition, dict):
+            if value != condition:
+                return False
+            continue
+        for op, operand in condition.items():
+            if op == "lt" and not value < operand:
+                return False
+            if op == "gt" and not value > operand:
+                return False
+            if op == "not" and value == operand:
+                return False
+            if op == "in" and value not in operand:
+                return False
+    return True
+
+
+class FakeActions:
+    def __init__(self, rows):
+        self.rows = {row.id: row for row in rows}
+
+    async def find_many(self, where, take):
+        return [r for r in self.rows.values() if _matches(r, where)][:take]
+
+    async def delete_many(self, where):
+        ids = [r.id for r in self.rows.values() if _matches(r, where)]
+        for id in ids:
+            del self.rows[id]
+        return len(ids)
+
+    async def update(self, where, data):
+        row = self.rows[where["id"]]
+        for key, value in data.items():
+            setattr(row, key, value)
+        return row
+
+
+def _session(id, expires_in, token="token", token_id=None):
+    return SimpleNamespace(
+        id=id,
+        token=token,
+        tokenId=token_id,
+        expiresAt=datetime.utcnow() + timedelta(seconds=expires_in),
+    )
+
+
+def _reset_token(id, expires_in, used=False):
+    return SimpleNamespace(
+        id=id,
+        expiresAt=datetime.utcnow() + timedelta(seconds=expires_in),
+        usedAt=datetime.utcnow() if used else None,
+    )
+
+
+def test_sweep_purges_expired_rows_in_batches():
+    prisma = SimpleNamespace(
+        usersession=FakeActions(
+            [_session(f"s{i}", -60) for i in range(5)]
+            + [_session("live", 60)]
+        ),
+        passwordresettoken=FakeActions([
+            _reset_token("expired", -60),
+            _reset_token("used", 60, used=True),
+            _reset_token("pending", 60),
+        ]),
+    )
+    sweeper = SessionSweeper(prisma, batch_size=2)
+
+    assert asyncio.run(sweeper.sweep()) == 7
+    assert list(prisma.usersession.rows) == ["live"]
+    assert list(prisma.passwordresettoken.rows) == ["pending"]
+
+
+def test_backfill_token_ids_of_live_sessions():
+    token = jwt.encode({"sub": "user", "jti": "abc"}, "secret")
+    prisma = SimpleNamespace(
+        usersession=FakeActions([
+            _session("jti", 60, token=token),
+            _session("legacy", 60, token="legacy-token"),
+            _session("done", 60, token_id="kept"),
+            _session("expired", -60),
+        ]),
+    )
+    sweeper = SessionSweeper(prisma, batch_size=1)
+
+    assert asyncio.run(sweeper.backfill_token_ids()) == 2
+    rows = prisma.usersession.rows
+    assert rows["jti"].tokenId == "abc"
+    assert rows["legacy"].tokenId == token_id("legacy-token")
+    assert rows["done"].tokenId == "kept"
+    assert rows["expired"].tokenId is None
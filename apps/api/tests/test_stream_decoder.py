@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from db.client import _codec
+from db.client._codec import StdlibCodec
+from db.client._streaming import ResultStreamDecoder
+
+RECORDS = [
+    {"id": "a", "name": "café", "tags": ["x", "y"]},
+    {"id": "s", "text": 'brackets ]}[{ "quoted" \\ back\\slash \\"'},
+    "a top level string ]",
+    {"id": "b", "count": 12345678901234567890123},
+    {"id": "c", "nested": {"list": [1, 2.5, None, True]}},
+]
+
+
+def _decode(body, chunk_size):
+    data = body.encode()
+    decoder = ResultStreamDecoder()
+    records = []
+    for start in range(0, len(data), chunk_size):
+        records.extend(decoder.feed(data[start:start + chunk_size]))
+    return records, decoder.close()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+def test_records_are_decoded_across_chunk_boundaries(chunk_size):
+    body = json.dumps({"data": {"result": RECORDS}}, ensure_ascii=False)
+
+    assert _decode(body, chunk_size) == (RECORDS, None)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 4096])
+def test_scalar_and_empty_results(chunk_size):
+    assert _decode('{"data":{"result":[1, 22,333]}}', chunk_size) == (
+        [1, 22, 333], None
+    )
+    assert _decode('{"data": {"result": [ ]}}', chunk_size) == ([], None)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4096])
+def test_whitespace_and_sibling_keys_after_the_result(chunk_size):
+    body = (
+        '{ "data" : { "result" : [ {"id": "a"} ] } ,\n'
+        '  "extensions": {"traces": []} }\n'
+    )
+
+    assert _decode(body, chunk_size) == ([{"id": "a"}], None)
+
+
+def test_responses_without_a_list_result_are_returned_whole():
+    body = '{"errors": [{"error": "boom"}]}'
+    assert _decode(body, 3) == ([], body)
+
+    body = '{"data": {"result": {"id": "a"}}}'
+    assert _decode(body, 3) == ([], body)
+
+
+def test_truncated_response_is_an_error():
+    decoder = ResultStreamDecoder()
+    decoder.feed(b'{"data": {"result": [{"id": "a"}, {"id": ')
+
+    with pytest.raises(ValueError):
+        decoder.close()
+
+
+@pytest.mark.parametrize(
+    "tail", ["}", "}}}", "}} trailing", '}, "errors": [{"error": "boom"}]}']
+)
+def test_invalid_data_after_the_result_is_an_error(tail):
+    decoder = ResultStreamDecoder()
+    decoder.feed(b'{"data": {"result": []' + tail.encode())
+
+    with pytest.raises(ValueError):
+        decoder.close()
+
+
+@pytest.mark.parametrize("tail", ['{"a" 1}]}}', "tru, 1]}}", "1,]}}"])
+def test_malformed_records_are_an_error_once_complete(tail):
+    decoder = ResultStreamDecoder()
+
+    with pytest.raises(ValueError, match="Could not decode"):
+        decoder.feed(b'{"data": {"result": [' + tail.encode())
+
+
+class CountingCodec(StdlibCodec):
+    def __init__(self):
+        self.loads_calls = 0
+
+    def loads(self, data):
+        self.loads_calls += 1
+        return super().loads(data)
+
+
+def test_large_records_are_decoded_once(monkeypatch):
+    codec = CountingCodec()
+    monkeypatch.setattr(_codec, "_codec", codec)
+    record = {"id": "big", "content": "x]" * 50_000, "list": list(range(500))}
+    body = json.dumps({"data": {"result": [record]}})
+
+    assert _decode(body, 64) == ([record], None)
+    # the record and the rest of the response after the result
+    assert codec.loads_calls == 2
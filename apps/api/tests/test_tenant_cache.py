@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+import asyncio
+
+from api.services import tenant_cache
+from api.services.tenant_cache import TenantCache
+
+
+class FakeTenants:
+    def __init__(self, tenants):
+        self.tenants = tenants
+        self.lookups = 0
+
+    async def find_unique(self, where):
+        self.lookups += 1
+        return self.tenants.get(where["id"])
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def _setup(monkeypatch, **kwargs):
+    clock = Clock()
+    monkeypatch.setattr(tenant_cache, "time", clock)
+    tenants = FakeTenants({"t": SimpleNamespace(deleted=False)})
+    prisma = SimpleNamespace(tenant=tenants)
+    cache = TenantCache(ttl_seconds=60, negative_ttl_seconds=5, **kwargs)
+    return cache, prisma, clock
+
+
+def test_known_tenants_are_cached_until_the_ttl(monkeypatch):
+    cache, prisma, clock = _setup(monkeypatch)
+
+    assert asyncio.run(cache.exists(prisma, "t"))
+    assert asyncio.run(cache.exists(prisma, "t"))
+    assert prisma.tenant.lookups == 1
+
+    clock.now += 61
+    assert asyncio.run(cache.exists(prisma, "t"))
+    assert prisma.tenant.lookups == 2
+
+
+def test_unknown_tenants_expire_sooner(monkeypatch):
+    cache, prisma, clock = _setup(monkeypatch)
+
+    assert not asyncio.run(cache.exists(prisma, "new"))
+    prisma.tenant.tenants["new"] = SimpleNamespace(deleted=False)
+    assert not asyncio.run(cache.exists(prisma, "new"))
+
+    clock.now += 6
+    assert asyncio.run(cache.exists(prisma, "new"))
+
+
+def test_deleted_tenants_do_not_exist(monkeypatch):
+    cache, prisma, clock = _setup(monkeypatch)
+    prisma.tenant.tenants["gone"] = SimpleNamespace(deleted=True)
+
+    assert not asyncio.run(cache.exists(prisma, "gone"))
+
+
+def test_invalidate_forgets_a_tenant(monkeypatch):
+    cache, prisma, clock = _setup(monkeypatch)
+    asyncio.run(cache.exists(prisma, "t"))
+
+    prisma.tenant.tenants["t"].deleted = True
+    cache.invalidate("t")
+
+    assert not asyncio.run(cache.exists(prisma, "t"))
+
+
+def test_least_recently_used_tenants_are_evicted(monkeypatch):
+    cache, prisma, clock = _setup(monkeypatch, max_entries=2)
+    for tenant_id in ("a", "b", "a", "c"):
+        asyncio.run(cache.exists(prisma, tenant_id))
+
+    assert list(cache._entries) == ["a", "c"]
@@ -0,0 +1,67 @@
+import asyncio
+import threading
+
+from api.services import token_budget
+from api.services.token_budget import TokenBudgetPacker
+
+
+def test_tokenizer_is_loaded_on_first_count(monkeypatch):
+    loads = []
+
+    def get_encoder(model):
+        loads.append(model)
+        return len
+
+    monkeypatch.setattr(token_budget, "_get_encoder", get_encoder)
+
+    packer = TokenBudgetPacker("gpt-test")
+    assert loads == []
+
+    assert packer.count("abc") == 3
+    assert packer.count("abcd") == 4
+    assert loads == ["gpt-test"]
+
+
+def test_history_is_packed_newest_first(monkeypatch):
+    monkeypatch.setattr(token_budget, "_get_encoder", lambda model: len)
+    packer = TokenBudgetPacker("gpt-test", prompt_token_budget=50)
+    history = [{"role": "user", "content": f"{i}" * 10} for i in range(5)]
+
+    # Each message is 10 tokens plus the per-message overhead
+    _, packed = packer.pack([], [], history)
+
+    assert packed == history[2:]
+
+
+def test_load_counts_with_the_tokenizer(monkeypatch):
+    monkeypatch.setattr(token_budget, "_get_encoder", lambda model: len)
+    packer = TokenBudgetPacker("gpt-test")
+
+    asyncio.run(packer.load(timeout=1.0))
+
+    assert packer.count("abcd") == 4
+
+
+def test_load_estimates_until_a_slow_tokenizer_loads(monkeypatch):
+    release = threading.Event()
+
+    def get_encoder(model):
+        release.wait()
+        return len
+
+    monkeypatch.setattr(token_budget, "_get_encoder", get_encoder)
+    packer = TokenBudgetPacker("gpt-test")
+    text = "x" * 40
+
+    async def main():
+        await packer.load(timeout=0.01)
+        assert packer.count(text) == token_budget._estimate_tokens(text)
+
+        release.set()
+        for _ in range(100):
+            if packer.count(text) == len(text):
+                return
+            await asyncio.sleep(0.01)
+        raise AssertionError("the tokenizer never replaced the estimate")
+
+    asyncio.run(main())